@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from lilya.apps import Lilya
+from lilya.conf.global_settings import Settings
+from lilya.middleware import DefineMiddleware
+from lilya.middleware.compression import CompressionMiddleware
+
+routes = [...]
+
+middleware = [
+    DefineMiddleware(
+        CompressionMiddleware,
+        minimum_size=1000,
+        levels={"br": 5, "gzip": 6},
+    )
+]
+
+app = Lilya(routes=routes, middleware=middleware)
+
+
+# Option two - Using the settings module
+# Running the application with your custom settings -> LILYA_SETTINGS_MODULE
+class AppSettings(Settings):
+    @property
+    def middleware(self) -> list[DefineMiddleware]:
+        return [
+            DefineMiddleware(
+                CompressionMiddleware,
+                minimum_size=1000,
+                encodings=("br", "gzip"),
+                compressible_types=("text/*", "application/json"),
+            ),
+        ]
@@ -0,0 +1,20 @@
+from lilya.apps import Lilya
+from lilya.routing import Include
+from lilya.staticfiles import StaticFiles
+
+DEBUG = True
+
+routes = [
+    Include(
+        "/static",
+        app=StaticFiles(
+            directory="static",
+            index=True,
+            max_memory_file_size=64 * 1024,
+            watch=DEBUG,
+        ),
+        name="static",
+    ),
+]
+
+app = Lilya(routes=routes)
@@ -0,0 +1,13 @@
+from lilya.apps import Lilya
+from lilya.routing import Include
+from lilya.staticfiles import StaticFiles
+
+routes = [
+    Include(
+        "/static",
+        app=StaticFiles(directory="static", precompressed=True, manifest="manifest.json"),
+        name="static",
+    ),
+]
+
+app = Lilya(routes=routes)
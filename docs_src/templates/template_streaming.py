@@ -0,0 +1,16 @@
+from lilya.apps import Lilya
+from lilya.requests import Request
+from lilya.routing import Path
+from lilya.templating import Jinja2Template
+
+templates = Jinja2Template(directory="templates")
+
+
+async def report(request: Request):
+    rows = [{"id": index, "total": index * 10} for index in range(10_000)]
+    return templates.get_template_response(
+        request, "report.html", context={"rows": rows}, stream=True
+    )
+
+
+app = Lilya(routes=[Path("/report", report)])
@@ -53,6 +53,9 @@ class Encoder(Generic[T]):
     name: str | None = None
     __encode__: bool = True
     __type__: type | tuple[type, ...] | None = None
+    # Whether `is_type` only depends on the type of the value, allowing the resolved
+    # encoder to be cached per type. `None` means it is deduced (not overwriting `is_type`).
+    __cache_by_type__: bool | None = None
 
     def is_type(self, value: Any) -> bool:
         if self.__type__ is None:
@@ -67,6 +70,7 @@ class Encoder(Generic[T]):
 
 class DataclassEncoder(EncoderProtocol, MoldingProtocol):
     name: str = "DataclassEncoder"
+    __cache_by_type__: bool = True
 
     def is_type(self, value: Any) -> bool:
         return is_dataclass(value)
@@ -82,6 +86,7 @@ class DataclassEncoder(EncoderProtocol, MoldingProtocol):
 
 class NamedTupleEncoder(EncoderProtocol, MoldingProtocol):
     name: str = "NamedTupleEncoder"
+    __cache_by_type__: bool = True
 
     def is_type(self, value: Any) -> bool:
         return isinstance(value, tuple) and hasattr(value, "_asdict")
@@ -100,6 +105,7 @@ class NamedTupleEncoder(EncoderProtocol, MoldingProtocol):
 
 class ModelDumpEncoder(EncoderProtocol, MoldingProtocol):
     name: str = "ModelDumpEncoder"
+    __cache_by_type__: bool = True
     # e.g. pydantic
 
     def is_type(self, value: Any) -> bool:
@@ -276,6 +282,123 @@ def register_encoder(
     for element in remove_elements:
         encoder_types.remove(element)
     encoder_types.appendleft(encoder)
+    encoder_cache.clear()
+
+
+def is_type_cacheable(encoder: EncoderProtocol | MoldingProtocol) -> bool:
+    """
+    Checks if the `is_type` of an encoder only depends on the type of the value.
+
+    Encoders can declare it via `__cache_by_type__`, otherwise only the `Encoder`
+    subclasses relying on the default `is_type` (the `__type__`) are considered.
+    """
+    cache_by_type = getattr(encoder, "__cache_by_type__", None)
+    if cache_by_type is not None:
+        return bool(cache_by_type)
+    return isinstance(encoder, Encoder) and type(encoder).is_type is Encoder.is_type
+
+
+_UNCACHEABLE: Any = object()
+
+
+class EncoderCache:
+    """
+    Memoizes the encoder resolved per concrete type for a registry of encoders.
+
+    The cache is bound to one registry (the `deque` used by `register_encoder`) at a time
+    and it is bypassed for any other sequence of encoders, for instance the ones set by
+    `with_encoders`. Registering an encoder clears it.
+    """
+
+    __slots__ = ("registry", "size", "serializers", "molders", "encoders")
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.registry: Any = None
+        self.size: int = -1
+        self.serializers: dict[type, Any] = {}
+        self.molders: dict[Any, Any] = {}
+        self.encoders: tuple[tuple[EncoderProtocol, bool], ...] = ()
+
+    def is_active(self, encoder_types: Sequence[EncoderProtocol | MoldingProtocol]) -> bool:
+        """
+        Checks if the cache can be used for the given encoders, (re)binding it to the
+        registry when needed.
+        """
+        if encoder_types is self.registry and len(encoder_types) == self.size:
+            return True
+        if not isinstance(encoder_types, deque):
+            return False
+
+        self.clear()
+        self.registry = encoder_types
+        self.size = len(encoder_types)
+        self.encoders = tuple(
+            (encoder, is_type_cacheable(encoder))
+            for encoder in encoder_types
+            if hasattr(encoder, "serialize")
+        )
+        return True
+
+    def get_serializer(self, value: Any) -> EncoderProtocol | None:
+        """
+        Returns the encoder able to serialize the value, resolving it once per type.
+        """
+        value_type = type(value)
+        encoder = self.serializers.get(value_type, _UNCACHEABLE)
+        if encoder is not _UNCACHEABLE and not isinstance(value, type):
+            return cast(EncoderProtocol | None, encoder)
+
+        cacheable = not isinstance(value, type)
+        for candidate, type_cacheable in self.encoders:
+            if candidate.is_type(value):
+                encoder = candidate
+                cacheable = cacheable and type_cacheable
+                break
+            cacheable = cacheable and type_cacheable
+        else:
+            encoder = None
+
+        if cacheable:
+            self.serializers[value_type] = encoder
+        return encoder
+
+    def get_molder(self, structure: Any) -> Any:
+        """
+        Returns the encoder able to apply the structure, resolving it once per structure.
+        """
+        try:
+            return self.molders[structure]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable structures are not cached.
+            return resolve_molder(self.registry, structure)
+
+        molder = resolve_molder(self.registry, structure)
+        self.molders[structure] = molder
+        return molder
+
+
+encoder_cache = EncoderCache()
+
+
+def resolve_molder(
+    encoder_types: Iterable[EncoderProtocol | MoldingProtocol], structure: Any
+) -> Any:
+    """
+    Returns the first encoder able to apply the given structure or `None`.
+    """
+    for encoder in encoder_types:
+        if (
+            hasattr(encoder, "encode")
+            and hasattr(encoder, "is_type_structure")
+            and encoder.is_type_structure(structure)
+        ):
+            return encoder
+    return None
 
 
 def json_encode_default(
@@ -298,6 +421,12 @@ def json_encode_default(
     if encoder_types is None:
         raise ValueError(f"Object of type '{type(value).__name__}' is not JSON serializable.")
 
+    if encoder_cache.is_active(encoder_types):
+        encoder = encoder_cache.get_serializer(value)
+        if encoder is not None:
+            return encoder.serialize(value)
+        raise ValueError(f"Object of type '{type(value).__name__}' is not JSON serializable.")
+
     for encoder in encoder_types:
         if hasattr(encoder, "serialize") and encoder.is_type(value):
             return encoder.serialize(value)
@@ -379,6 +508,54 @@ def json_encode(
 json_encoder = json_encode
 
 
+def get_bytes_json_encode_fn() -> Callable[..., bytes] | None:
+    """
+    Returns the `dumps_bytes` of the bound serializer, if it provides one.
+    """
+    return cast(Callable[..., bytes] | None, getattr(serializer, "dumps_bytes", None))
+
+
+def json_encode_bytes(
+    value: Any,
+    *,
+    with_encoders: Sequence[EncoderProtocol | MoldingProtocol] | None = None,
+    exclude_none: bool = False,
+) -> bytes:
+    """
+    Encode a value to UTF-8 encoded JSON.
+
+    Uses the `dumps_bytes` of the bound serializer when available, so the result
+    never round-trips through `str`, otherwise encodes the result of `json_encode`.
+
+    Parameters:
+    value (Any): The value to encode.
+    with_encoders (Sequence[EncoderProtocol]): Overwrite the used encoders for this call only
+                                               by providing an own Sequence of encoders.
+    exclude_none (bool): If True, exclude keys with None values from the output.
+
+    Returns:
+    bytes: The JSON document.
+    """
+    json_encode_fn = get_bytes_json_encode_fn()
+    if json_encode_fn is None:
+        data = json_encode(
+            value, post_transform_fn=None, with_encoders=with_encoders, exclude_none=exclude_none
+        )
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        return cast(bytes, data)
+    return cast(
+        bytes,
+        json_encode(
+            value,
+            json_encode_fn=json_encode_fn,
+            post_transform_fn=None,
+            with_encoders=with_encoders,
+            exclude_none=exclude_none,
+        ),
+    )
+
+
 def apply_structure(
     structure: Any,
     value: Any,
@@ -406,16 +583,16 @@ def apply_structure(
         if encoder_types is None:
             return value
 
-        for encoder in encoder_types:
-            if (
-                hasattr(encoder, "encode")
-                and hasattr(encoder, "is_type_structure")
-                and encoder.is_type_structure(structure)
-            ):
-                if encoder.is_type(value):
-                    return value
-                return encoder.encode(structure, value)
-        return value
+        if encoder_cache.is_active(encoder_types):
+            encoder = encoder_cache.get_molder(structure)
+        else:
+            encoder = resolve_molder(encoder_types, structure)
+
+        if encoder is None:
+            return value
+        if encoder.is_type(value):
+            return value
+        return encoder.encode(structure, value)
     else:
         token = ENCODER_TYPES.set(with_encoders)
         try:
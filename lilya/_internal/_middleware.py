@@ -90,23 +90,43 @@ class ScopeIsolationMiddleware:
             self.sync_route_metadata(child_scope, scope)
 
 
+def preserves_scope(middleware: Any) -> bool:
+    """
+    Whether a middleware declares that it never mutates the scope it receives.
+
+    Middleware opt in by setting `__preserves_scope__ = True` on the class. Such a layer
+    cannot leak anything upstream, so the scope does not need to be copied before reaching it.
+    """
+    return getattr(middleware, "__preserves_scope__", False) is True
+
+
 def apply_asgi_stack(app: ASGIApp, stack: Sequence[Any] | None) -> ASGIApp:
     """
-    Compose ASGI middleware-like layers with scope isolation on both sides of each layer.
+    Compose ASGI middleware-like layers with scope isolation between each layer.
 
-    Each layer receives a copy of its parent's scope. The child application passed into that
-    layer also copies the layer's scope before continuing downstream. Downstream code still
+    Each layer receives a copy of its parent's scope and the child application passed into
+    the innermost layer copies the scope before continuing downstream. Downstream code still
     sees the layer's additions, but downstream mutations cannot leak back into the layer's
     response-side logic.
 
+    A single copy sits on each boundary between two layers, since it isolates both sides
+    of it. Layers declaring `__preserves_scope__` do not need the copy in front of them: the
+    copy below such a layer protects everything above it as well.
+
     Controller classes are passed directly to the first wrapping layer so Lilya's middleware
     and permission protocol metaclasses can keep their existing controller instantiation
     behavior. Once the controller is behind that first layer, normal ASGI isolation resumes.
     """
-    if stack is None:
+    if not stack:
         return app
 
+    isolate = not hasattr(app, "__is_controller__")
     for cls, args, options in reversed(stack):
-        child_app = app if hasattr(app, "__is_controller__") else ScopeIsolationMiddleware(app)
-        app = ScopeIsolationMiddleware(cls(child_app, *args, **options))
+        if isolate:
+            app = ScopeIsolationMiddleware(app)
+        app = cls(app, *args, **options)
+        isolate = not preserves_scope(cls)
+
+    if isolate:
+        app = ScopeIsolationMiddleware(app)
     return app
@@ -15,6 +15,7 @@ from lilya.contrib.multipart import parsers as multipart
 from lilya.contrib.multipart.utils import _decode_rfc5987, parse_options_header
 from lilya.datastructures import DataUpload, FormData, Header
 from lilya.enums import FormMessage
+from lilya.protocols.uploads import UploadSinkFactory, UploadSinkProtocol
 
 
 @lru_cache(1024)
@@ -44,6 +45,7 @@ class MultipartPart:
     field_name: str = ""
     data: bytes = b""
     file: DataUpload | None = None
+    sink: UploadSinkProtocol | None = None
     item_headers: list[tuple[bytes, bytes]] = field(default_factory=list)
 
 
@@ -193,7 +195,8 @@ class MultiPartParser:
     Multipart form data parser.
 
     This class parses the multipart stream and provides a structured representation
-    of form data, including files.
+    of form data, including files. The files are spooled into temporary files unless
+    an `upload_sink` factory provides their destination.
 
     Attributes:
         max_file_size (int): Maximum size for individual file parts.
@@ -208,6 +211,7 @@ class MultiPartParser:
         *,
         max_files: int | float = 1000,
         max_fields: int | float = 1000,
+        upload_sink: UploadSinkFactory | None = None,
     ) -> None:
         """
         Initialize the MultiPartParser.
@@ -217,6 +221,8 @@ class MultiPartParser:
             stream (AsyncGenerator[bytes, None]): Async generator yielding byte chunks of the request body.
             max_files (Union[int, float]): Maximum number of allowed files.
             max_fields (Union[int, float]): Maximum number of allowed fields.
+            upload_sink (UploadSinkFactory | None): Creates the sink of each uploaded file
+                from its field name, filename and headers, instead of a temporary file.
         """
         assert multipart is not None, (
             "The `python-multipart` library must be installed to use form parsing."
@@ -225,6 +231,7 @@ class MultiPartParser:
         self.stream = stream
         self.max_files = max_files
         self.max_fields = max_fields
+        self.upload_sink = upload_sink
         self.items: list[tuple[str, str | DataUpload]] = []
         self._current_files = 0
         self._current_fields = 0
@@ -251,11 +258,12 @@ class MultiPartParser:
             start (int): Start index of the data in the chunk.
             end (int): End index of the data in the chunk.
         """
-        message_bytes = data[start:end]
         if self._current_part.file is None:
-            self._current_part.data += message_bytes
+            self._current_part.data += data[start:end]
         else:
-            self._file_parts_to_write.append((self._current_part, message_bytes))
+            # The parser hands out slices of the immutable chunks, which can be kept
+            # without copying them until they are written.
+            self._file_parts_to_write.append((self._current_part, memoryview(data)[start:end]))
 
     def on_part_end(self) -> None:
         """
@@ -344,8 +352,11 @@ class MultiPartParser:
         elif b"filename*" in options:
             filename = _decode_rfc5987(options[b"filename*"], self._charset)
 
-        tempfile = self._create_temp_file()
-        self._current_part.file = self._create_upload_file(filename, tempfile)
+        if self.upload_sink is None:
+            file: Any = self._create_temp_file()
+        else:
+            file = self._create_sink(filename)
+        self._current_part.file = self._create_upload_file(filename, file)
 
     def _handle_no_filename(self) -> None:
         """
@@ -376,15 +387,34 @@ class MultiPartParser:
         self._files_to_close_on_error.push_async_callback(tempfile.aclose)
         return tempfile
 
+    def _create_sink(self, filename: str) -> UploadSinkProtocol:
+        """
+        Create the upload sink of a file part and add it to the cleanup list.
+
+        Args:
+            filename (str): Name of the file.
+
+        Returns:
+            UploadSinkProtocol: Created upload sink.
+        """
+        assert self.upload_sink is not None
+        sink = self.upload_sink(
+            self._current_part.field_name, filename, Header(self._current_part.item_headers)
+        )
+        self._files_to_close_on_error.push_async_callback(sink.aclose)
+        self._current_part.sink = sink
+        return sink
+
     def _create_upload_file(
-        self, filename: str, tempfile: SpooledTemporaryFile[bytes]
+        self, filename: str, tempfile: SpooledTemporaryFile[bytes] | UploadSinkProtocol
     ) -> DataUpload:
         """
         Create an DataUpload instance for a file part.
 
         Args:
             filename (str): Name of the file.
-            tempfile (SpooledTemporaryFile[bytes]): Temporary file.
+            tempfile (SpooledTemporaryFile[bytes] | UploadSinkProtocol): Temporary file
+                or upload sink.
 
         Returns:
             DataUpload: Created DataUpload instance.
@@ -429,11 +459,12 @@ class MultiPartParser:
             async for chunk in self.stream:
                 parser.write(chunk)
                 await self._write_file_data()
+            parser.finalize()
+            await self._write_file_data()
         except BaseException as exc:
             await self._close_files_on_error()
             raise exc
 
-        parser.finalize()
         return FormData(self.items)
 
     def _parse_content_type_header(self, params: Any) -> None:
@@ -515,7 +546,10 @@ class MultiPartParser:
 
         for part in self._file_parts_to_finish:
             assert part.file
-            await part.file.seek(0)
+            if part.sink is not None:
+                await part.sink.finish()
+            else:
+                await part.file.seek(0)
 
         self._file_parts_to_write.clear()
         self._file_parts_to_finish.clear()
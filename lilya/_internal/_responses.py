@@ -14,7 +14,7 @@ from typing import (
     get_type_hints,
 )
 
-from lilya._internal._encoders import apply_structure, json_encode
+from lilya._internal._encoders import apply_structure
 from lilya._internal._exception_handlers import (
     handle_exception,
     wrap_app_handling_exceptions,
@@ -29,6 +29,7 @@ from lilya.dependencies import (
     Resolve,
     Security,
     async_resolve_dependencies,
+    resolve_providers,
 )
 from lilya.enums import SignatureDefault
 from lilya.exceptions import (
@@ -606,9 +607,8 @@ class BaseHandler:
             await app(scope, receive, send)
         else:
             # If response is not an async callable, wrap it in an ASGI application and then await.
-            if app is not None:
-                app = json_encode(app)
-
+            # The `Ok` encodes the content straight to bytes (registered encoders and
+            # `RESPONSE_TRANSFORM_KWARGS` included), avoiding an intermediate encode/decode.
             response = Ok(app)
             await response(scope, receive, send)
 
@@ -1058,6 +1058,7 @@ class BaseHandler:
         data.update(json_data)
 
         # 4) RESOLVE exactly those—and error if any are missing
+        providers: dict[str, Provide] = {}
         for name, provider in requested.items():
             if provider is None:
                 hname = handler.__name__ if handler else "<unknown>"
@@ -1069,8 +1070,15 @@ class BaseHandler:
                     func=provider.dependency,
                 )
                 continue
+            if isinstance(provider, Provide):
+                # Independent providers are resolved together below
+                providers[name] = provider
+                continue
             data[name] = await provider.resolve(request, merged)
 
+        if providers:
+            data.update(await resolve_providers(request, providers, merged))
+
         # Return the dictionary of all extracted and resolved parameters.
         return data
 
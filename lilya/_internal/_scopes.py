@@ -4,6 +4,8 @@ import inspect
 from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
+import anyio
+
 from lilya.enums import Scope
 
 # Generic type variable for the dependency callable return type
@@ -33,10 +35,14 @@ class ScopeManager:
                         resolved instance value.
             _cleanup_callbacks: List of sync or async callables to run during the
                                 application's asynchronous close cycle (`aclose`).
+            _locks: Per-key locks held while an instance is being created, so concurrent
+                    resolutions of the same dependency create it once. A key keeps its
+                    lock for the lifetime of the manager.
             _cleared: Boolean flag (not explicitly used in the original code, but implied by class structure)
         """
         self._instances: dict[ScopeKey, Any] = {}
         self._cleanup_callbacks: list[CleanupCallback] = []
+        self._locks: dict[ScopeKey, anyio.Lock] = {}
 
     async def get_or_create(
         self,
@@ -67,9 +73,15 @@ class ScopeManager:
 
         # For GLOBAL and APP scopes, check the cache.
         if key not in self._instances:
-            # If not in cache, create the instance and store it.
-            value = await self._call(factory)
-            self._instances[key] = value
+            # If not in cache, create the instance and store it. Concurrent callers
+            # for the same key wait for the first one instead of creating their own.
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = anyio.Lock()
+            async with lock:
+                if key not in self._instances:
+                    value = await self._call(factory)
+                    self._instances[key] = value
 
         return self._instances[key]  # type: ignore
 
@@ -10,6 +10,7 @@ from lilya._internal._middleware import apply_asgi_stack, wrap_middleware  # noq
 from lilya._internal._permissions import wrap_permission  # noqa
 from lilya._utils import is_class_and_subclass
 from lilya.compat import import_string  # noqa
+from lilya.concurrency import configure_threadpool
 from lilya.conf import _monkay, settings as lilya_settings  # noqa
 from lilya.conf.exceptions import FieldException
 from lilya.conf.global_settings import Settings
@@ -32,7 +33,7 @@ from lilya.protocols.permissions import PermissionProtocol
 from lilya.requests import Request
 from lilya.responses import PlainText, Response
 from lilya.routing import BasePath, Include, Path, Router, RoutingMethodsMixin
-from lilya.serializers import SerializerConfig, setup_serializer
+from lilya.serializers import BUILTIN_SERIALIZER_CONFIGS, SerializerConfig, setup_serializer
 from lilya.types import (
     ApplicationType,
     ASGIApp,
@@ -95,6 +96,16 @@ class BaseLilya:
             return getattr(global_settings, value, None)
         return setting_value
 
+    def configure_threadpools(self) -> None:
+        """
+        Sizes the default and the named threadpools from the `threadpool_size` and
+        `threadpools` of the application.
+        """
+        if self.threadpool_size is not None:
+            configure_threadpool("default", size=self.threadpool_size)
+        for name, size in (self.threadpools or {}).items():
+            configure_threadpool(name, size=size)
+
     def path_for(self, name: str, /, **path_params: Any) -> URLPath:
         return self.router.url_path_for(name, **path_params)
 
@@ -1025,6 +1036,40 @@ class Lilya(RoutingMethodsMixin, BaseLilya):
                 """
             ),
         ] = None,
+        compile_routes: Annotated[
+            bool | None,
+            Doc(
+                """
+                Enable or disable the compiled route matcher.
+
+                When enabled, the routes of the application (and nested includes) are compiled
+                into a segment-level prefix tree, making the route lookup proportional to the
+                depth of the path instead of the number of routes.
+                """
+            ),
+        ] = None,
+        threadpool_size: Annotated[
+            int | None,
+            Doc(
+                """
+                The number of threads of the default threadpool, running the synchronous
+                handlers, hooks and dependencies of the application.
+                """
+            ),
+        ] = None,
+        threadpools: Annotated[
+            dict[str, int] | None,
+            Doc(
+                """
+                The named threadpools of the application, mapping the names to their number of
+                threads.
+
+                A `Path`, `WebSocketPath` or `Include` declared with `threadpool="<name>"`
+                runs its synchronous callables in the named pool instead of the default one,
+                so slow handlers cannot starve the rest of the application.
+                """
+            ),
+        ] = None,
         lifespan: Annotated[
             Lifespan[ApplicationType] | None,
             Doc(
@@ -1214,9 +1259,15 @@ class Lilya(RoutingMethodsMixin, BaseLilya):
         self.redirect_slashes = self.load_settings_value(
             "redirect_slashes", redirect_slashes, is_boolean=True
         )
+        self.compile_routes = self.load_settings_value(
+            "compile_routes", compile_routes, is_boolean=True
+        )
         self.include_in_schema = self.load_settings_value(
             "include_in_schema", include_in_schema, is_boolean=True
         )
+        self.threadpool_size = self.load_settings_value("threadpool_size", threadpool_size)
+        self.threadpools = self.load_settings_value("threadpools", threadpools)
+        self.configure_threadpools()
 
         _lifespan = self.load_settings_value("lifespan", lifespan)
         _on_startup = None
@@ -1247,6 +1298,7 @@ class Lilya(RoutingMethodsMixin, BaseLilya):
             self.router = self.router_class(
                 routes=routes,
                 redirect_slashes=self.redirect_slashes,
+                compile_routes=bool(self.compile_routes),
                 permissions=self.custom_permissions,
                 on_startup=_on_startup,
                 on_shutdown=_on_shutdown,
@@ -1260,7 +1312,9 @@ class Lilya(RoutingMethodsMixin, BaseLilya):
         if self.logging_config is not None:
             setup_logging(self.logging_config)
 
-        if self.serializer_config is None:
+        if self.serializer_config is None or isinstance(
+            self.serializer_config, BUILTIN_SERIALIZER_CONFIGS
+        ):
             setup_serializer(self.serializer_config)
 
         if self.enable_openapi:
@@ -1339,6 +1393,8 @@ class Lilya(RoutingMethodsMixin, BaseLilya):
         from lilya.contrib.openapi.config import OpenAPIConfig
 
         config_to_use = openapi_config or OpenAPIConfig()
+        # The cached schema belongs to the previous configuration
+        self.openapi_document = None
         config_to_use.enable(self)
 
     @property
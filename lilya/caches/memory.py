@@ -1,14 +1,47 @@
 from __future__ import annotations
 
+import heapq
+import threading
 import time
-from contextlib import suppress
-from typing import Any, cast
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
 
-from lilya._internal._encoders import json_encode
+from lilya._internal._encoders import json_encode_bytes
 from lilya.logging import logger
 from lilya.protocols.cache import CacheBackend
 from lilya.serializers import serializer
 
+EvictionPolicy = Literal["lru", "lfu"]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the counters of an `InMemoryCache`.
+
+    Attributes:
+        hits (int): Lookups that found a valid entry.
+        misses (int): Lookups that found no entry, or an expired one.
+        evictions (int): Entries removed to honour `max_entries` or `max_bytes`.
+        expirations (int): Expired entries removed, on lookup or by the sweeper.
+        entries (int): Entries currently stored.
+        size_bytes (int): Size of the stored keys and serialized values.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Ratio of lookups that were hits, `0.0` before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
 
 class InMemoryCache(CacheBackend):
     """Thread-safe in-memory cache with TTL support, matching RedisCache API.
@@ -17,15 +50,65 @@ class InMemoryCache(CacheBackend):
     It supports expiration (TTL) and provides both asynchronous and synchronous
     methods to interact with the cache.
 
+    The cache can be bounded by a number of entries and/or by the size of the stored
+    keys and serialized values, evicting the least recently used (`lru`) or the least
+    frequently used (`lfu`) entries when full. Expired entries are swept on writes,
+    so entries never read again do not accumulate.
+
     Attributes:
-        _store (dict[str, tuple[bytes, float | None]]):
+        _store (OrderedDict[str, tuple[bytes, float | None]]):
             Internal dictionary where keys are stored as strings and values
-            are tuples containing serialized data and an optional expiration timestamp.
+            are tuples containing serialized data and an optional expiration timestamp,
+            ordered from the least to the most recently used.
     """
 
-    def __init__(self) -> None:
-        """Initializes the in-memory cache."""
-        self._store: dict[str, tuple[bytes, float | None]] = {}
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction: EvictionPolicy = "lru",
+    ) -> None:
+        """Initializes the in-memory cache.
+
+        Args:
+            max_entries (int | None, optional): Maximum number of entries, unbounded if `None`.
+            max_bytes (int | None, optional): Maximum size of the stored keys and serialized
+                values, unbounded if `None`. Larger values are not stored.
+            eviction (str, optional): The eviction policy, `"lru"` (least recently used) or
+                `"lfu"` (least frequently used, the least recently used first among ties).
+
+        Raises:
+            ValueError: If a limit is lower than 1 or the eviction policy is unknown.
+        """
+        if (max_entries is not None and max_entries < 1) or (
+            max_bytes is not None and max_bytes < 1
+        ):
+            raise ValueError("`max_entries` and `max_bytes` must be at least 1.")
+        if eviction not in ("lru", "lfu"):
+            raise ValueError(f"Unknown eviction policy {eviction!r}, expected 'lru' or 'lfu'.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self._store: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._size = 0
+
+        # Expiration timestamps, swept from the earliest one
+        self._expiries: list[tuple[float, str]] = []
+
+        # LFU bookkeeping: access count per key and keys per access count
+        self._frequencies: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+
+        # Tag bookkeeping: keys per tag and tags per key
+        self._tags: dict[str, set[str]] = {}
+        self._key_tags: dict[str, set[str]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
 
     async def get(self, key: str) -> Any | None:
         """Retrieve a value from cache asynchronously.
@@ -82,16 +165,9 @@ class InMemoryCache(CacheBackend):
             Exception: If an unexpected error occurs while retrieving the value.
         """
         try:
-            data = self._store.get(key)
-            if not data:
-                return None
-
-            value, expiry = data
-            if expiry is not None and expiry < time.time():
-                self.sync_delete(key)
-                return None
-
-            return serializer.loads(value)
+            with self._lock:
+                value = self._lookup(key, time.time())
+            return serializer.loads(value) if value is not None else None
         except Exception as e:
             logger.exception(f"Cache get error: {e}")
             return None
@@ -100,7 +176,8 @@ class InMemoryCache(CacheBackend):
         """Store a value in cache synchronously with an optional TTL.
 
         The value is serialized using `json` and stored in `_store` along with
-        an expiration timestamp if TTL is provided.
+        an expiration timestamp if TTL is provided. Expired entries are swept and,
+        if the cache is full, entries are evicted according to the eviction policy.
 
         Args:
             key (str): The cache key.
@@ -111,11 +188,12 @@ class InMemoryCache(CacheBackend):
             Exception: If an error occurs while serializing or storing the value.
         """
         try:
-            data: bytes = json_encode(value, post_transform_fn=None)
-            with suppress(AttributeError):
-                data = cast(str, data).encode("utf-8")
-            expiry = time.time() + ttl if ttl else None
-            self._store[key] = (data, expiry)
+            data = json_encode_bytes(value)
+            now = time.time()
+
+            with self._lock:
+                self._sweep(now)
+                self._insert(key, data, now + ttl if ttl else None)
         except Exception as e:
             logger.exception(f"Cache set error: {e}")
 
@@ -131,6 +209,224 @@ class InMemoryCache(CacheBackend):
             Exception: If an error occurs while deleting the key.
         """
         try:
-            self._store.pop(key, None)
+            with self._lock:
+                if key in self._store:
+                    self._remove(key)
         except Exception as e:
             logger.exception(f"Cache delete error: {e}")
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Retrieve the values of several keys under a single lock acquisition.
+
+        Args:
+            keys (Iterable[str]): The cache keys.
+
+        Returns:
+            dict[str, Any]: The deserialized values of the keys found and not expired.
+        """
+        try:
+            now = time.time()
+            with self._lock:
+                found = [(key, self._lookup(key, now)) for key in keys]
+            return {key: serializer.loads(value) for key, value in found if value is not None}
+        except Exception as e:
+            logger.exception(f"Cache get error: {e}")
+            return {}
+
+    async def set_many(
+        self, mapping: Mapping[str, Any], ttl: int | None = None, *, tags: Iterable[str] = ()
+    ) -> None:
+        """Store several values under a single lock acquisition, optionally tagging them.
+
+        Args:
+            mapping (Mapping[str, Any]): The values to be cached, by key.
+            ttl (int | None, optional): Time-to-live in seconds. If `None`, the values never expire.
+            tags (Iterable[str], optional): Tags to attach to the keys, for `invalidate_tags`.
+        """
+        try:
+            encoded = [(key, json_encode_bytes(value)) for key, value in mapping.items()]
+            tags = list(tags)
+            now = time.time()
+            expiry = now + ttl if ttl else None
+
+            with self._lock:
+                self._sweep(now)
+                for key, data in encoded:
+                    self._insert(key, data, expiry)
+                    if tags and key in self._store:
+                        self._key_tags.setdefault(key, set()).update(tags)
+                        for tag in tags:
+                            self._tags.setdefault(tag, set()).add(key)
+        except Exception as e:
+            logger.exception(f"Cache set error: {e}")
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Remove several values under a single lock acquisition.
+
+        Args:
+            keys (Iterable[str]): The cache keys to delete.
+        """
+        with self._lock:
+            for key in keys:
+                if key in self._store:
+                    self._remove(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Remove every value whose key starts with `prefix`.
+
+        Args:
+            prefix (str): The prefix of the keys to delete.
+        """
+        with self._lock:
+            for key in [key for key in self._store if key.startswith(prefix)]:
+                self._remove(key)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Remove every value tagged with one of `tags`.
+
+        Args:
+            *tags (str): The tags to invalidate.
+        """
+        with self._lock:
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every value, keeping the counters."""
+        with self._lock:
+            self._store.clear()
+            self._expiries.clear()
+            self._frequencies.clear()
+            self._buckets.clear()
+            self._tags.clear()
+            self._key_tags.clear()
+            self._size = 0
+
+    def sweep(self) -> int:
+        """Remove the expired entries.
+
+        Expired entries are already swept on every write, this method allows
+        to reclaim their memory in caches that are rarely written.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock:
+            return self._sweep(time.time())
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache counters.
+
+        Returns:
+            CacheStats: The hits, misses, evictions, expirations and current size.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._store),
+                size_bytes=self._size,
+            )
+
+    def _lookup(self, key: str, now: float) -> bytes | None:
+        data = self._store.get(key)
+        if not data:
+            self._misses += 1
+            return None
+
+        value, expiry = data
+        if expiry is not None and expiry < now:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._touch(key)
+        self._hits += 1
+        return value
+
+    def _insert(self, key: str, data: bytes, expiry: float | None) -> None:
+        if key in self._store:
+            self._remove(key)
+
+        size = len(key) + len(data)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self._store[key] = (data, expiry)
+        self._size += size
+        if expiry is not None:
+            heapq.heappush(self._expiries, (expiry, key))
+        if self.eviction == "lfu":
+            self._frequencies[key] = 1
+            self._buckets.setdefault(1, OrderedDict())[key] = None
+
+        self._evict(keep=key)
+
+    def _sweep(self, now: float) -> int:
+        expiries = self._expiries
+        removed = 0
+        while expiries and expiries[0][0] < now:
+            expiry, key = heapq.heappop(expiries)
+            data = self._store.get(key)
+            # Skip the timestamps of entries overwritten or deleted since
+            if data is not None and data[1] == expiry:
+                self._remove(key)
+                self._expirations += 1
+                removed += 1
+
+        if len(expiries) > 2 * len(self._store) + 64:
+            self._expiries = [
+                (expiry, key) for key, (_, expiry) in self._store.items() if expiry is not None
+            ]
+            heapq.heapify(self._expiries)
+        return removed
+
+    def _evict(self, keep: str) -> None:
+        while len(self._store) > 1 and (
+            (self.max_entries is not None and len(self._store) > self.max_entries)
+            or (self.max_bytes is not None and self._size > self.max_bytes)
+        ):
+            victim = self._victim(keep)
+            self._remove(victim)
+            self._evictions += 1
+
+    def _victim(self, keep: str) -> str:
+        if self.eviction == "lru":
+            return next(key for key in self._store if key != keep)
+
+        lowest = min(self._buckets)
+        for key in self._buckets[lowest]:
+            if key != keep:
+                return key
+        # The entry being stored is the only one with the lowest frequency
+        return next(iter(self._buckets[min(f for f in self._buckets if f != lowest)]))
+
+    def _touch(self, key: str) -> None:
+        self._store.move_to_end(key)
+        if self.eviction == "lfu":
+            frequency = self._frequencies[key]
+            self._discard_from_bucket(key, frequency)
+            self._frequencies[key] = frequency + 1
+            self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def _remove(self, key: str) -> None:
+        data, _ = self._store.pop(key)
+        self._size -= len(key) + len(data)
+        if self.eviction == "lfu":
+            self._discard_from_bucket(key, self._frequencies.pop(key))
+        if self._key_tags:
+            for tag in self._key_tags.pop(key, ()):
+                keys = self._tags[tag]
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _discard_from_bucket(self, key: str, frequency: int) -> None:
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
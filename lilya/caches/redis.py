@@ -1,16 +1,35 @@
 from __future__ import annotations
 
 import asyncio
-from contextlib import suppress
-from typing import Any, cast
-
-import anyio
-import anyio.from_thread
-
-from lilya._internal._encoders import json_encode
-from lilya.protocols.cache import CacheBackend
+import math
+import re
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from lilya._internal._encoders import json_encode_bytes
+from lilya.protocols.cache import TAG_KEY_PREFIX, CacheBackend
 from lilya.serializers import serializer
 
+# Keys deleted per command by `delete_prefix`
+DELETE_BATCH_SIZE = 500
+
+# Adds keys to a tag index, a sorted set scored by the expiry of the keys, pruning the
+# expired ones and expiring the index with its last key (or never, for persistent keys).
+# KEYS[1]: the tag index, ARGV[1]: now, ARGV[2]: the expiry of the keys, ARGV[3...]: the keys.
+TAG_INDEX_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[1])
+for i = 3, #ARGV do
+    redis.call('ZADD', KEYS[1], ARGV[2], ARGV[i])
+end
+local last = redis.call('ZRANGE', KEYS[1], -1, -1, 'WITHSCORES')
+if last[2] == 'inf' then
+    redis.call('PERSIST', KEYS[1])
+else
+    redis.call('EXPIREAT', KEYS[1], last[2])
+end
+"""
+
 redis: Any
 
 try:
@@ -104,9 +123,7 @@ class RedisCache(CacheBackend):
             value (Any): The value to be cached.
             ttl (int | None, optional): Time-to-live in seconds. If `None`, the value never expires.
         """
-        data: bytes = json_encode(value, post_transform_fn=None)
-        with suppress(AttributeError):
-            data = cast(str, data).encode("utf-8")
+        data = json_encode_bytes(value)
 
         if ttl:
             await self.async_client.setex(key, ttl, data)
@@ -121,54 +138,114 @@ class RedisCache(CacheBackend):
         """
         await self.async_client.delete(key)
 
-    async def close(self) -> None:
-        """Closes all Redis client connections.
-
-        Ensures all event loop-specific Redis clients are properly shut down
-        and removed from the internal registry.
-        """
-        for client in self._async_clients.values():
-            await client.aclose()
-        self._async_clients.clear()
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Retrieves the values of several keys in a single `MGET` round-trip.
 
-    def sync_get(self, key: str) -> Any | None:
-        """Retrieves a value from the Redis cache synchronously.
+        Args:
+            keys (Iterable[str]): The cache keys.
 
-        This method wraps the asynchronous `get` method inside a thread-safe
-        AnyIO execution to allow usage in synchronous contexts.
+        Returns:
+            dict[str, Any]: The deserialized values of the keys found.
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        values = await self.async_client.mget(keys)
+        return {
+            key: serializer.loads(value)
+            for key, value in zip(keys, values, strict=True)
+            if value is not None
+        }
+
+    async def set_many(
+        self, mapping: Mapping[str, Any], ttl: int | None = None, *, tags: Iterable[str] = ()
+    ) -> None:
+        """Stores several values in a single pipelined round-trip, optionally tagging them.
+
+        The keys of a tag are kept in a Redis sorted set scored by their expiry, removed by
+        `invalidate_tags`. The expired keys are pruned on write and the set expires with
+        its last key, so the tags of expiring entries do not accumulate.
 
         Args:
-            key (str): The cache key.
+            mapping (Mapping[str, Any]): The values to be cached, by key.
+            ttl (int | None, optional): Time-to-live in seconds. If `None`, the values never expire.
+            tags (Iterable[str], optional): Tags to attach to the keys, for `invalidate_tags`.
+        """
+        if not mapping:
+            return
+
+        pipeline = self.async_client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            data = json_encode_bytes(value)
+            if ttl:
+                pipeline.setex(key, ttl, data)
+            else:
+                pipeline.set(key, data)
+        tags = list(tags)
+        if tags:
+            now = time.time()
+            expiry = math.ceil(now + ttl) if ttl else "+inf"
+            script = self.async_client.register_script(TAG_INDEX_SCRIPT)
+            for tag in tags:
+                await script(
+                    keys=[f"{TAG_KEY_PREFIX}{tag}"],
+                    args=[math.floor(now), expiry, *mapping],
+                    client=pipeline,
+                )
+        await pipeline.execute()
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Deletes several values with a single `DEL`.
 
-        Returns:
-            Any | None: The deserialized value if found, otherwise `None`.
+        Args:
+            keys (Iterable[str]): The cache keys to delete.
         """
-        with anyio.from_thread.start_blocking_portal() as portal:
-            return portal.call(self.get, key)
+        keys = list(keys)
+        if keys:
+            await self.async_client.delete(*keys)
 
-    def sync_set(self, key: str, value: Any, ttl: int | None = None) -> None:
-        """Stores a value in the Redis cache synchronously.
+    async def delete_prefix(self, prefix: str) -> None:
+        """Deletes every value whose key starts with `prefix`, scanning the keyspace
+        incrementally rather than blocking Redis with `KEYS`.
 
-        This method wraps the asynchronous `set` method inside a thread-safe
-        AnyIO execution to allow usage in synchronous contexts.
+        Args:
+            prefix (str): The prefix of the keys to delete.
+        """
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+        batch: list[bytes] = []
+        async for key in self.async_client.scan_iter(match=pattern, count=DELETE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= DELETE_BATCH_SIZE:
+                await self.async_client.delete(*batch)
+                batch.clear()
+        if batch:
+            await self.async_client.delete(*batch)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Deletes every value tagged with one of `tags`, and the tags themselves.
 
         Args:
-            key (str): The cache key.
-            value (Any): The value to be cached.
-            ttl (int | None, optional): Time-to-live in seconds. If `None`, the value never expires.
+            *tags (str): The tags to invalidate.
         """
-        with anyio.from_thread.start_blocking_portal() as portal:
-            portal.call(self.set, key, value, ttl)
+        if not tags:
+            return
 
-    def sync_delete(self, key: str) -> None:
-        """Deletes a value from the Redis cache synchronously and ensures it is removed.
+        indexes = [f"{TAG_KEY_PREFIX}{tag}" for tag in tags]
+        pipeline = self.async_client.pipeline(transaction=False)
+        for index in indexes:
+            pipeline.zrange(index, 0, -1)
+        members = await pipeline.execute()
 
-        This method wraps the asynchronous `delete` method inside a thread-safe
-        AnyIO execution to allow usage in synchronous contexts. It also ensures
-        that Redis has actually removed the key before proceeding.
+        keys = {key for keys in members for key in keys}
+        await self.async_client.delete(*keys, *indexes)
 
-        Args:
-            key (str): The cache key to delete.
+    async def close(self) -> None:
+        """Closes all Redis client connections.
+
+        Ensures all event loop-specific Redis clients are properly shut down
+        and removed from the internal registry.
         """
-        with anyio.from_thread.start_blocking_portal() as portal:
-            portal.call(self.delete, key)
+        for client in self._async_clients.values():
+            await client.aclose()
+        self._async_clients.clear()
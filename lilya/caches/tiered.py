@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from collections.abc import Iterable, Mapping
+from contextlib import AsyncExitStack
+from typing import Any
+
+import anyio
+from anyio.abc import TaskGroup, TaskStatus
+from anyio.from_thread import BlockingPortal
+
+from lilya._internal._encoders import json_encode_bytes
+from lilya.caches.memory import InMemoryCache
+from lilya.logging import logger
+from lilya.protocols.cache import CacheBackend
+from lilya.serializers import serializer
+
+
+class TieredCache(CacheBackend):
+    """Two-tier cache backend, keeping a small local cache in front of a shared one.
+
+    Reads are served from the local L1 (an `InMemoryCache` per worker) when possible,
+    falling back to the shared L2 (typically a `RedisCache`) and copying the value to
+    the L1. The L1 copies live at most `l1_ttl` seconds, which bounds how long a worker
+    can serve a value changed by another worker.
+
+    With a `pubsub` client, every `set` and `delete` is also published on a Redis
+    channel, and each worker evicts its L1 copy of the key as soon as it receives it.
+    The subscription runs between `start()` and `close()`, or within `async with`. A
+    lost subscription is resubscribed with an exponential backoff, clearing the L1 since
+    invalidations may have been missed in the meantime.
+
+    Attributes:
+        l1 (InMemoryCache): The local cache.
+        l2 (CacheBackend): The shared cache.
+    """
+
+    # Seconds before resubscribing to the invalidations, doubled up to the max
+    resubscribe_delay: float = 0.1
+    max_resubscribe_delay: float = 10.0
+
+    def __init__(
+        self,
+        l2: CacheBackend,
+        *,
+        l1: InMemoryCache | None = None,
+        l1_ttl: int = 5,
+        pubsub: Any = None,
+        channel: str = "lilya:cache:invalidate",
+    ) -> None:
+        """Initializes the two-tier cache.
+
+        Args:
+            l2 (CacheBackend): The shared cache, for instance a `RedisCache`.
+            l1 (InMemoryCache | None, optional): The local cache, defaults to an
+                `InMemoryCache` bounded to 1024 entries.
+            l1_ttl (int, optional): Maximum time-to-live in seconds of the local copies.
+            pubsub (Any, optional): A `redis.asyncio.Redis` client publishing and receiving
+                the invalidations of the local copies across workers.
+            channel (str, optional): The Redis pub/sub channel of the invalidations.
+
+        Raises:
+            ValueError: If `l1_ttl` is lower than 1.
+        """
+        if l1_ttl < 1:
+            raise ValueError("`l1_ttl` must be at least 1 second.")
+
+        self.l1 = l1 if l1 is not None else InMemoryCache(max_entries=1024)
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.pubsub = pubsub
+        self.channel = channel
+
+        self._origin = uuid.uuid4().hex
+        self._exit_stack: AsyncExitStack | None = None
+        self._task_group: TaskGroup | None = None
+        self._portal: BlockingPortal | None = None
+        self._thread_id: int | None = None
+
+    def _l1_ttl(self, ttl: int | None) -> int:
+        return min(ttl, self.l1_ttl) if ttl else self.l1_ttl
+
+    async def get(self, key: str) -> Any | None:
+        """Retrieve a value from the local cache, or else from the shared one.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any | None: The cached value if found, otherwise `None`.
+        """
+        value = self.l1.sync_get(key)
+        if value is not None:
+            return value
+
+        value = await self.l2.get(key)
+        if value is not None:
+            self.l1.sync_set(key, value, self.l1_ttl)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store a value in both caches and invalidate the local copies of other workers.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to be cached.
+            ttl (int | None, optional): Time-to-live in seconds. If `None`, the value never
+                expires from the shared cache.
+        """
+        await self.l2.set(key, value, ttl)
+        self.l1.sync_set(key, value, self._l1_ttl(ttl))
+        await self._publish({"keys": [key]})
+
+    async def delete(self, key: str) -> None:
+        """Remove a value from both caches and from the local caches of other workers.
+
+        Args:
+            key (str): The cache key to delete.
+        """
+        await self.l2.delete(key)
+        self.l1.sync_delete(key)
+        await self._publish({"keys": [key]})
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Retrieve several values, from the local cache when possible and else with a
+        single batch from the shared one.
+
+        Args:
+            keys (Iterable[str]): The cache keys.
+
+        Returns:
+            dict[str, Any]: The values of the keys found.
+        """
+        keys = list(keys)
+        values = await self.l1.get_many(keys)
+        missing = [key for key in keys if key not in values]
+        if missing:
+            found = await self.l2.get_many(missing)
+            if found:
+                await self.l1.set_many(found, self.l1_ttl)
+            values.update(found)
+        return values
+
+    async def set_many(
+        self, mapping: Mapping[str, Any], ttl: int | None = None, *, tags: Iterable[str] = ()
+    ) -> None:
+        """Store several values in both caches, the tags being kept by the shared one.
+
+        Args:
+            mapping (Mapping[str, Any]): The values to be cached, by key.
+            ttl (int | None, optional): Time-to-live in seconds.
+            tags (Iterable[str], optional): Tags to attach to the keys, for `invalidate_tags`.
+        """
+        await self.l2.set_many(mapping, ttl, tags=tags)
+        await self.l1.set_many(mapping, self._l1_ttl(ttl))
+        await self._publish({"keys": list(mapping)})
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """Remove several values from both caches and from the local caches of other workers.
+
+        Args:
+            keys (Iterable[str]): The cache keys to delete.
+        """
+        keys = list(keys)
+        await self.l2.delete_many(keys)
+        await self.l1.delete_many(keys)
+        await self._publish({"keys": keys})
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Remove every value whose key starts with `prefix`, on every worker.
+
+        Args:
+            prefix (str): The prefix of the keys to delete.
+        """
+        await self.l2.delete_prefix(prefix)
+        await self.l1.delete_prefix(prefix)
+        await self._publish({"prefix": prefix})
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Remove every value tagged with one of `tags`.
+
+        The local copies read from the shared cache do not know their tags, so the
+        local caches of every worker are cleared.
+
+        Args:
+            *tags (str): The tags to invalidate.
+        """
+        await self.l2.invalidate_tags(*tags)
+        self.l1.clear()
+        await self._publish({"clear": True})
+
+    def sync_get(self, key: str) -> Any | None:
+        """Retrieve a value synchronously, from the local cache or else from the shared one.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any | None: The cached value if found, otherwise `None`.
+        """
+        value = self.l1.sync_get(key)
+        if value is not None:
+            return value
+
+        value = self.l2.sync_get(key)
+        if value is not None:
+            self.l1.sync_set(key, value, self.l1_ttl)
+        return value
+
+    def sync_set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store a value synchronously in both caches.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to be cached.
+            ttl (int | None, optional): Time-to-live in seconds.
+        """
+        self.l2.sync_set(key, value, ttl)
+        self.l1.sync_set(key, value, self._l1_ttl(ttl))
+        self._publish_threadsafe({"keys": [key]})
+
+    def sync_delete(self, key: str) -> None:
+        """Remove a value synchronously from both caches.
+
+        Args:
+            key (str): The cache key to delete.
+        """
+        self.l2.sync_delete(key)
+        self.l1.sync_delete(key)
+        self._publish_threadsafe({"keys": [key]})
+
+    async def start(self) -> None:
+        """Subscribe to the invalidations published by the other workers.
+
+        Does nothing without a `pubsub` client or if already started.
+        """
+        if self.pubsub is None or self._exit_stack is not None:
+            return
+
+        async with AsyncExitStack() as stack:
+            # The portal publishes the invalidations of the synchronous methods called
+            # from other threads, in the event loop the client is bound to
+            self._portal = await stack.enter_async_context(BlockingPortal())
+            self._task_group = await stack.enter_async_context(anyio.create_task_group())
+            self._thread_id = threading.get_ident()
+            try:
+                await self._task_group.start(self._listen)
+            except BaseException:
+                self._task_group = self._portal = None
+                raise
+            self._exit_stack = stack.pop_all()
+
+    async def close(self) -> None:
+        """Stop receiving the invalidations of the other workers."""
+        exit_stack, self._exit_stack = self._exit_stack, None
+        task_group, self._task_group = self._task_group, None
+        self._portal = None
+        if exit_stack is not None:
+            assert task_group is not None
+            task_group.cancel_scope.cancel()
+            await exit_stack.aclose()
+
+    async def __aenter__(self) -> TieredCache:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _listen(self, *, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED) -> None:
+        started = False
+        delay = self.resubscribe_delay
+        while True:
+            pubsub = self.pubsub.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                if started:
+                    # The invalidations published while unsubscribed are lost
+                    self.l1.clear()
+                else:
+                    task_status.started()
+                    started = True
+                delay = self.resubscribe_delay
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = serializer.loads(message["data"])
+                    if data["origin"] != self._origin:
+                        await self._invalidate_locally(data)
+            except Exception as e:
+                if not started:
+                    raise
+                logger.error(f"Cache invalidation subscription failed: {e}", exc_info=True)
+            finally:
+                with anyio.CancelScope(shield=True):
+                    try:
+                        await pubsub.unsubscribe(self.channel)
+                        await pubsub.aclose()
+                    except Exception as e:
+                        logger.error(f"Cache invalidation unsubscribe failed: {e}")
+            await anyio.sleep(delay)
+            delay = min(delay * 2, self.max_resubscribe_delay)
+
+    async def _invalidate_locally(self, data: dict[str, Any]) -> None:
+        if "keys" in data:
+            await self.l1.delete_many(data["keys"])
+        elif "prefix" in data:
+            await self.l1.delete_prefix(data["prefix"])
+        else:
+            self.l1.clear()
+
+    async def _publish(self, invalidation: dict[str, Any]) -> None:
+        if self.pubsub is None:
+            return
+        try:
+            await self.pubsub.publish(
+                self.channel, json_encode_bytes({"origin": self._origin, **invalidation})
+            )
+        except Exception as e:
+            logger.error(f"Cache invalidation publish failed: {e}", exc_info=True)
+
+    def _publish_threadsafe(self, invalidation: dict[str, Any]) -> None:
+        """
+        Publish an invalidation from synchronous code, in the event loop the
+        subscription runs in (the client is bound to it).
+        """
+        task_group, portal = self._task_group, self._portal
+        if task_group is None or portal is None:
+            return
+
+        if threading.get_ident() == self._thread_id:
+            task_group.start_soon(self._publish, invalidation)
+        else:
+            portal.start_task_soon(self._publish, invalidation)
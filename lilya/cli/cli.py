@@ -15,6 +15,7 @@ from lilya.cli.directives.operations.createdeployment import (
 from lilya.cli.directives.operations.createproject import create_project as create_project  # noqa
 from lilya.cli.directives.operations.list import directives as directives  # noqa
 from lilya.cli.directives.operations.mail import mail as mail  # noqa
+from lilya.cli.directives.operations.precompress import precompress as precompress  # noqa
 from lilya.cli.directives.operations.run import run as run  # noqa
 from lilya.cli.directives.operations.runserver import runserver as runserver  # noqa
 from lilya.cli.directives.operations.shell import shell as shell  # noqa
@@ -73,6 +74,7 @@ lilya_cli.add_command(create_project)
 lilya_cli.add_command(create_app)
 lilya_cli.add_command(create_deployment)
 lilya_cli.add_command(shell)
+lilya_cli.add_command(precompress)
 lilya_cli.add_app("mail", mail)
 
 # Load custom directives if any
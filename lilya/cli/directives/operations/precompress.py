@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+from typing import Annotated
+
+from sayer import Argument, Option, command, error, success
+
+from lilya.middleware.compression import DEFAULT_ENCODINGS
+from lilya.staticfiles import DEFAULT_MANIFEST, precompress_directory
+
+
+@command
+def precompress(
+    directory: Annotated[str, Argument(help="The directory of the static files.")],
+    encodings: Annotated[
+        list[str],
+        Option(
+            list(DEFAULT_ENCODINGS),
+            "-e",
+            help="The content codings to precompress with. Can be used multiple times.",
+            multiple=True,
+            show_default=True,
+        ),
+    ],
+    minimum_size: Annotated[
+        int, Option(256, help="The files smaller than this are not precompressed.")
+    ],
+    no_hash: Annotated[
+        bool, Option(False, is_flag=True, help="Do not write the content-hashed copies.")
+    ],
+    manifest: Annotated[
+        str,
+        Option(DEFAULT_MANIFEST, help="The name of the manifest file.", show_default=True),
+    ],
+) -> None:
+    """Precompresses the static files of a directory and fingerprints them
+
+    Writes the `.zst`, `.br` and `.gz` siblings served by `StaticFiles(precompressed=True)`
+    and the content-hashed copies listed in the manifest read by `StaticFiles(manifest=...)`.
+
+    How to run: `lilya precompress <DIRECTORY>`
+
+    Example: `lilya precompress static -e br -e gzip`
+    """
+    if not os.path.isdir(directory):
+        error(f"Directory '{directory}' does not exist.")
+        return
+
+    try:
+        result = precompress_directory(
+            directory,
+            encodings=encodings,
+            minimum_size=minimum_size,
+            hash_files=not no_hash,
+            manifest_name=manifest,
+        )
+    except KeyError as e:
+        error(f"Unsupported encoding {e}.")
+        return
+
+    if no_hash:
+        success(f"Static files of '{directory}' precompressed.")
+    else:
+        success(
+            f"Static files of '{directory}' precompressed, {len(result.paths)} hashed in '{manifest}'."
+        )
@@ -1,22 +1,236 @@
-import functools
+from __future__ import annotations
+
+import os
+import threading
+import time
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
 import anyio.to_thread
-from anyio import create_task_group, get_cancelled_exc_class, to_thread
+from anyio import CapacityLimiter, create_task_group, get_cancelled_exc_class, to_thread
+from anyio.abc import TaskGroup
+from anyio.from_thread import BlockingPortal
+from anyio.lowlevel import RunVar
 
 from lilya.compat import is_async_callable
 
 T = TypeVar("T")
 
+DEFAULT_THREADPOOL_SIZE = 40
+"""The number of threads of a pool whose size was not configured."""
+
+
+@dataclass(frozen=True)
+class ThreadPoolStats:
+    """Snapshot of the counters of a `ThreadPool`.
+
+    Attributes:
+        name (str): The name of the pool.
+        size (int): The maximum number of threads running at once.
+        active (int): Calls currently running in a thread.
+        waiting (int): Calls currently waiting for a thread.
+        calls (int): Calls started since the pool was created.
+        wait_time (float): Total time, in seconds, the started calls waited for a thread.
+        max_wait_time (float): Longest time, in seconds, a call waited for a thread.
+    """
+
+    name: str
+    size: int
+    active: int
+    waiting: int
+    calls: int
+    wait_time: float
+    max_wait_time: float
+
+    @property
+    def average_wait_time(self) -> float:
+        """Average time, in seconds, the started calls waited for a thread."""
+        return self.wait_time / self.calls if self.calls else 0.0
+
+
+class ThreadPool:
+    """
+    A named, bounded set of threads running the synchronous callables.
+
+    The synchronous handlers, hooks and dependencies run through `run_in_threadpool` in the
+    pool of their route (see `Path(threadpool=...)` and `Include(threadpool=...)`), or in the
+    `default` pool, so slow endpoints given their own pool cannot starve the others.
+
+    The pool only bounds the number of threads used at once, the threads themselves being
+    the ones of AnyIO. The limiter is created per event loop.
+
+    Args:
+        name: The name of the pool.
+        size: The maximum number of threads running at once.
+        use_default_limiter: Whether the pool bounds the threads with the default thread
+            limiter of AnyIO, shared with the other users of `anyio.to_thread`, instead of
+            a limiter of its own. A size given to it is only applied once configured.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int = DEFAULT_THREADPOOL_SIZE,
+        *,
+        use_default_limiter: bool = False,
+    ) -> None:
+        self.name = name
+        self._size = size
+        self._configured = not use_default_limiter
+        self._use_default_limiter = use_default_limiter
+        self._limiter: RunVar[CapacityLimiter] = RunVar(f"lilya_threadpool_{name}")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._active = 0
+        self._calls = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @size.setter
+    def size(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("The size of a threadpool must be a positive number.")
+        self._size = size
+        self._configured = True
+        try:
+            self._limiter.get().total_tokens = size
+        except (LookupError, RuntimeError):
+            # No limiter in this event loop yet, or no event loop running
+            pass
+
+    @property
+    def limiter(self) -> CapacityLimiter:
+        """The capacity limiter of the pool, in the current event loop."""
+        try:
+            return self._limiter.get()
+        except LookupError:
+            if self._use_default_limiter:
+                limiter = to_thread.current_default_thread_limiter()
+                if self._configured:
+                    limiter.total_tokens = self._size
+            else:
+                limiter = CapacityLimiter(self._size)
+            self._limiter.set(limiter)
+            return limiter
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs a callable in a thread of the pool, waiting for one to be available.
+
+        Args:
+            func: The callable to run.
+            *args: The positional arguments of the callable.
+            **kwargs: The keyword arguments of the callable.
+
+        Returns:
+            The value returned by the callable.
+        """
+        limiter = self.limiter
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return await to_thread.run_sync(
+                self._call, func, args, kwargs, time.perf_counter(), limiter=limiter
+            )
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _call(
+        self, func: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any], queued: float
+    ) -> T:
+        waited = time.perf_counter() - queued
+        with self._lock:
+            self._active += 1
+            self._calls += 1
+            self._wait_time += waited
+            if waited > self._max_wait_time:
+                self._max_wait_time = waited
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def stats(self) -> ThreadPoolStats:
+        """Return a snapshot of the pool counters.
+
+        Returns:
+            ThreadPoolStats: The active and waiting calls and the time spent waiting.
+        """
+        try:
+            size = int(self._limiter.get().total_tokens)
+        except (LookupError, RuntimeError):
+            size = self._size
+        with self._lock:
+            return ThreadPoolStats(
+                name=self.name,
+                size=size,
+                active=self._active,
+                waiting=self._in_flight - self._active,
+                calls=self._calls,
+                wait_time=self._wait_time,
+                max_wait_time=self._max_wait_time,
+            )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name!r}, size={self._size!r})"
+
+
+threadpools: dict[str, ThreadPool] = {"default": ThreadPool("default", use_default_limiter=True)}
+
+current_threadpool: ContextVar[ThreadPool | None] = ContextVar("current_threadpool", default=None)
+"""The pool of the route being dispatched, if it has one."""
+
+
+def get_threadpool(name: str = "default") -> ThreadPool:
+    """
+    Returns the pool with the given name, creating it with the default size if needed.
+    """
+    pool = threadpools.get(name)
+    if pool is None:
+        pool = threadpools.setdefault(name, ThreadPool(name))
+    return pool
+
+
+def configure_threadpool(name: str = "default", size: int = DEFAULT_THREADPOOL_SIZE) -> ThreadPool:
+    """
+    Sets the size of the pool with the given name, creating it if needed.
+
+    Args:
+        name: The name of the pool, `default` being the pool of the routes without one.
+        size: The maximum number of threads running at once.
+
+    Returns:
+        ThreadPool: The pool.
+    """
+    pool = get_threadpool(name)
+    pool.size = size
+    return pool
+
+
+def threadpool_stats() -> dict[str, ThreadPoolStats]:
+    """
+    Returns the counters of every pool, by name.
+    """
+    return {name: pool.stats() for name, pool in list(threadpools.items())}
+
 
 async def run_in_threadpool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
     """
     Runs a callable in a threadpool.
     Make sure the callable is always async.
+
+    The callable runs in the pool of the current route, or in the `default` pool.
     """
-    def_func = AsyncCallable(func)
-    return await def_func(*args, **kwargs)
+    pool = current_threadpool.get() or threadpools["default"]
+    return await pool.run(func, *args, **kwargs)
 
 
 def enforce_async_callable(func: Callable[..., Any]) -> Callable[..., Awaitable[T]]:
@@ -38,10 +252,9 @@ class AsyncCallable:
         self.default_kwargs = kwargs
 
     def __call__(self, *args: Any, **kwargs: Any) -> Awaitable[T]:
-        combined_kwargs = {**self.default_kwargs, **kwargs}
-        return anyio.to_thread.run_sync(
-            functools.partial(self._callable, *args, **combined_kwargs)
-        )
+        if self.default_kwargs:
+            kwargs = {**self.default_kwargs, **kwargs}
+        return run_in_threadpool(self._callable, *args, **kwargs)
 
     async def run_in_threadpool(self, *args: Any, **kwargs: Any) -> T:
         return await self(*args, **kwargs)
@@ -59,3 +272,100 @@ async def iterate_in_threadpool(iterator: Iterable[T]) -> AsyncIterator[T]:
                 yield item
         except get_cancelled_exc_class():
             ...
+
+
+class LoopThread:
+    """
+    A long-lived event loop running in a daemon thread, to call coroutine functions
+    from synchronous code without starting an event loop per call.
+
+    The loop is started on the first call and again in forked processes.
+    """
+
+    def __init__(self, name: str = "lilya-loop-thread") -> None:
+        self.name = name
+        self._portal: BlockingPortal | None = None
+        self._task_group: TaskGroup | None = None
+        self._thread_id: int | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def portal(self) -> BlockingPortal:
+        portal = self._portal
+        if portal is not None and self._pid == os.getpid():
+            return portal
+
+        with self._lock:
+            if self._portal is None or self._pid != os.getpid():
+                self._portal, self._task_group, self._thread_id = self._start()
+                self._pid = os.getpid()
+            return self._portal
+
+    def _start(self) -> tuple[BlockingPortal, TaskGroup, int]:
+        ready = threading.Event()
+        started: list[tuple[BlockingPortal, TaskGroup, int]] = []
+        errors: list[BaseException] = []
+
+        async def run() -> None:
+            async with BlockingPortal() as portal, create_task_group() as task_group:
+                started.append((portal, task_group, threading.get_ident()))
+                ready.set()
+                await portal.sleep_until_stopped()
+                task_group.cancel_scope.cancel()
+
+        def target() -> None:
+            try:
+                anyio.run(run)
+            except BaseException as exc:
+                errors.append(exc)
+            finally:
+                # Never leave the caller waiting if the loop failed to start
+                ready.set()
+
+        threading.Thread(target=target, name=self.name, daemon=True).start()
+        ready.wait()
+        if not started:
+            raise errors[0]
+        return started[0]
+
+    def call(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        Calls a coroutine function in the loop thread and waits for its result.
+        """
+        return self.portal.call(func, *args)
+
+    def start_soon(self, func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        """
+        Starts a coroutine function in the loop thread without waiting for it.
+
+        The task belongs to the event loop of the thread, so it keeps running after the
+        caller returns, and it can be started from the loop thread itself.
+        """
+        portal = self.portal
+        if threading.get_ident() == self._thread_id and self._task_group is not None:
+            self._task_group.start_soon(func, *args)
+        else:
+            portal.start_task_soon(func, *args)
+
+    def stop(self) -> None:
+        """
+        Stops the event loop, a later call starting a new one.
+        """
+        with self._lock:
+            portal, self._portal = self._portal, None
+        if portal is not None and self._pid == os.getpid():
+            portal.call(portal.stop)
+
+
+loop_thread = LoopThread()
+
+
+def run_on_loop_thread(func: Callable[..., Awaitable[T]], *args: Any) -> T:
+    """
+    Calls a coroutine function from synchronous code in the shared `LoopThread`.
+
+    Unlike `anyio.run()`, the event loop (and the connections bound to it) is reused
+    across calls and threads.
+    """
+    return loop_thread.call(func, *args)
@@ -598,6 +598,34 @@ class Settings(Internal):
             """
         ),
     ] = True
+    compile_routes: Annotated[
+        bool,
+        Doc(
+            """
+            Enable or disable the compiled route matcher. When enabled, the routes of the
+            application are compiled into a segment-level prefix tree and only the routes
+            that can match the incoming path are searched.
+            """
+        ),
+    ] = False
+    threadpool_size: Annotated[
+        int | None,
+        Doc(
+            """
+            The number of threads of the default threadpool, running the synchronous handlers,
+            hooks and dependencies. When not set, the pool keeps its current size (40 by default).
+            """
+        ),
+    ] = None
+    threadpools: Annotated[
+        dict[str, int] | None,
+        Doc(
+            """
+            The named threadpools, mapping the names to their number of threads. The routes and
+            includes select a named pool with `threadpool="<name>"`.
+            """
+        ),
+    ] = None
     csrf_token_name: Annotated[
         str,
         Doc(
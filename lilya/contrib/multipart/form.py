@@ -293,7 +293,7 @@ class FormParser:
 
         def on_part_data(data: bytes, start: int, end: int) -> None:
             """Write data chunks into current file or field."""
-            chunk = data[start:end]
+            chunk = memoryview(data)[start:end]
             if self._current_file is not None:
                 self._current_file.write(chunk)
             elif self._current_field is not None:
@@ -230,6 +230,11 @@ class MultipartParser(BaseParser):
     """
     Streaming parser for ``multipart/form-data``.
 
+    The chunks are scanned in place: the data callbacks receive the chunk given to
+    ``write()`` with the offsets of the slice of interest, so the body of the parts is
+    never copied by the parser. Only an incomplete header line or the bytes which may be
+    the beginning of a boundary are kept until the next chunk.
+
     Callbacks:
         - ``on_part_begin()``
         - ``on_header_begin()``
@@ -244,6 +249,13 @@ class MultipartParser(BaseParser):
 
     CRLF = b"\r\n"
 
+    # Parser states
+    PREAMBLE = 0
+    HEADERS = 1
+    BODY = 2
+    BOUNDARY = 3
+    END = 4
+
     def __init__(self, boundary: bytes, *, max_size: float = float("inf")) -> None:
         super().__init__()
         if not boundary:
@@ -253,11 +265,12 @@ class MultipartParser(BaseParser):
 
         self._boundary = b"--" + boundary
         self._terminal_boundary = self._boundary + b"--"
+        # The boundary ending the body of a part
+        self._delimiter = self.CRLF + self._boundary
         self._max_size = max_size
         self._consumed_size = 0
         self._buffer = bytearray()
-        self._started = False
-        self._in_headers = False
+        self._state = self.PREAMBLE
         self._headers: dict[str, str] = {}
 
     def _emit_headers(self) -> None:
@@ -271,6 +284,21 @@ class MultipartParser(BaseParser):
             self.callback("header_end")
         self.callback("headers_finished")
 
+    def _body_end(self, data: bytes, start: int) -> int:
+        """
+        Returns the end of the body data which cannot be part of a delimiter.
+
+        The bytes after it are the beginning of the delimiter, split across two chunks,
+        and are kept until the next chunk.
+        """
+        length = len(data)
+        index = data.find(b"\r", max(start, length - len(self._delimiter) + 1))
+        while index != -1:
+            if self._delimiter.startswith(data[index:]):
+                return index
+            index = data.find(b"\r", index + 1)
+        return length
+
     def write(self, data: bytes) -> int:
         """Consume a chunk of multipart body data."""
         if not data:
@@ -281,75 +309,98 @@ class MultipartParser(BaseParser):
         if num_bytes <= 0:
             return 0
         self._consumed_size += num_bytes
-        self._buffer += data[:num_bytes]
 
-        # Initial boundary search
-        while not self._started:
-            index = self._buffer.find(self.CRLF)
-            if index == -1:
-                return num_bytes
-            line = bytes(self._buffer[: index + 2])
-            del self._buffer[: index + 2]
-            if line.startswith(self._boundary):
-                if line.startswith(self._terminal_boundary):
-                    self.callback("end")
-                    return num_bytes
-                self._started = True
-                self._in_headers = True
-                self.callback("part_begin")
-                break
+        if num_bytes < len(data) or not isinstance(data, bytes):
+            data = bytes(data[:num_bytes])
+        if self._buffer:
+            # Only happens when the previous chunk ended in the middle of a header line
+            # or of a delimiter.
+            self._buffer += data
+            data = bytes(self._buffer)
+            self._buffer.clear()
+
+        self._parse(data)
+        return num_bytes
+
+    def _parse(self, data: bytes) -> None:
+        """Parse a chunk, keeping its incomplete tail in the buffer."""
+        CRLF = self.CRLF
+        length = len(data)
+        position = 0
 
-        # Main parsing loop
-        while True:
-            if self._in_headers:
-                index = self._buffer.find(self.CRLF)
+        while position < length:
+            state = self._state
+
+            if state == self.BODY:
+                index = data.find(self._delimiter, position)
+                if index == -1:
+                    end = self._body_end(data, position)
+                    if end > position:
+                        self.callback("part_data", data, position, end)
+                    self._buffer += data[end:]
+                    return
+                if index > position:
+                    self.callback("part_data", data, position, index)
+                position = index + len(self._delimiter)
+                self._state = self.BOUNDARY
+
+            elif state == self.HEADERS:
+                index = data.find(CRLF, position)
                 if index == -1:
-                    return num_bytes
-                line = bytes(self._buffer[: index + 2])
-                del self._buffer[: index + 2]
-                if line == self.CRLF:
+                    self._buffer += data[position:]
+                    return
+                if index == position:
                     self._emit_headers()
-                    self._in_headers = False
+                    self._state = self.BODY
                 else:
                     try:
-                        name, val = line.decode("latin-1").split(":", 1)
+                        name, value = data[position:index].decode("latin-1").split(":", 1)
                     except ValueError:
                         raise MultipartParseError("Invalid header line") from None
-                    self._headers[name.strip().lower()] = val.strip()
-                continue
-
-            # Body mode
-            boundary_index = self._buffer.find(self.CRLF + self._boundary)
-            if boundary_index == -1:
-                if self._buffer:
-                    self.callback("part_data", bytes(self._buffer), 0, len(self._buffer))
-                    self._buffer.clear()
-                return num_bytes
-
-            if boundary_index:
-                self.callback("part_data", bytes(self._buffer[:boundary_index]), 0, boundary_index)
-            del self._buffer[: boundary_index + 2]
-
-            if self._buffer.startswith(self._terminal_boundary):
-                self.callback("part_end")
-                del self._buffer[: len(self._terminal_boundary)]
-                if self._buffer.startswith(self.CRLF):
-                    del self._buffer[:2]
-                self.callback("end")
-                return num_bytes
-
-            if self._buffer.startswith(self._boundary):
+                    self._headers[name.strip().lower()] = value.strip()
+                position = index + 2
+
+            elif state == self.BOUNDARY:
+                if length - position < 2:
+                    self._buffer += data[position:]
+                    return
+                if data.startswith(b"--", position):
+                    self.callback("part_end")
+                    self.callback("end")
+                    self._state = self.END
+                    return
+                # The boundary line ends with a CRLF, after an optional padding
+                index = data.find(CRLF, position)
+                if index == -1:
+                    self._buffer += data[position:]
+                    return
+                position = index + 2
                 self.callback("part_end")
-                del self._buffer[: len(self._boundary)]
-                if self._buffer.startswith(self.CRLF):
-                    del self._buffer[:2]
                 self._headers.clear()
-                self._in_headers = True
+                self._state = self.HEADERS
                 self.callback("part_begin")
-                continue
+
+            elif state == self.PREAMBLE:
+                index = data.find(CRLF, position)
+                if index == -1:
+                    self._buffer += data[position:]
+                    return
+                line_start, position = position, index + 2
+                if data.startswith(self._boundary, line_start, index):
+                    if data.startswith(self._terminal_boundary, line_start, index):
+                        self.callback("end")
+                        self._state = self.END
+                        return
+                    self._state = self.HEADERS
+                    self.callback("part_begin")
+
+            else:
+                # The epilogue after the terminal boundary is ignored
+                return
 
     def finalize(self) -> None:
         """Flush any remaining buffered body data and clear state."""
         if self._buffer:
-            self.callback("part_data", bytes(self._buffer), 0, len(self._buffer))
+            if self._state == self.BODY:
+                self.callback("part_data", bytes(self._buffer), 0, len(self._buffer))
             self._buffer.clear()
@@ -4,6 +4,7 @@ from typing import Annotated, Any
 from pydantic import AnyUrl, BaseModel
 
 from lilya import __version__
+from lilya.compat import md5_hexdigest
 from lilya.contrib.documentation import Doc
 from lilya.contrib.openapi.docs import (
     get_rapidoc_ui_html,
@@ -13,8 +14,53 @@ from lilya.contrib.openapi.docs import (
     get_swagger_ui_oauth2_redirect_html,
 )
 from lilya.contrib.openapi.utils import get_openapi
+from lilya.datastructures import Header
+from lilya.enums import MediaType
 from lilya.requests import Request
-from lilya.responses import HTMLResponse, JSONResponse
+from lilya.responses import HTMLResponse, JSONResponse, Response
+
+
+def get_routes_key(routes: Sequence[Any]) -> tuple[Any, ...]:
+    """
+    Returns a key changing whenever a route is added to the routes, or to the routes
+    of their includes and hosts.
+
+    Args:
+        routes (Sequence[Any]): The routes of the application.
+
+    Returns:
+        tuple[Any, ...]: The key of the routes.
+    """
+    key: list[Any] = [id(routes), len(routes)]
+    for route in routes:
+        child_routes = getattr(route, "routes", None)
+        if child_routes is not None:
+            key.append(get_routes_key(child_routes))
+    return tuple(key)
+
+
+class OpenAPIDocument:
+    """
+    A generated OpenAPI schema with its JSON body and ETag, serialized once.
+    """
+
+    __slots__ = ("schema", "body", "etag", "key")
+
+    def __init__(self, schema: dict[str, Any], key: tuple[Any, ...]) -> None:
+        self.schema = schema
+        self.body: bytes = JSONResponse(schema).body
+        self.etag = f'"{md5_hexdigest(self.body, usedforsecurity=False)}"'
+        self.key = key
+
+    def is_not_modified(self, request_headers: Header) -> bool:
+        """
+        Whether the `If-None-Match` header of a request matches the ETag of the document.
+        """
+        if_none_match = request_headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return self.etag in tags or "*" in tags
 
 
 class OpenAPIConfig(BaseModel):
@@ -357,9 +403,40 @@ class OpenAPIConfig(BaseModel):
             """
         ),
     ] = None
+    generate_on_startup: Annotated[
+        bool,
+        Doc(
+            """
+            Boolean flag indicating if the OpenAPI schema shall be generated on the
+            startup of the application instead of on the first request.
+            """
+        ),
+    ] = False
 
     def openapi(self, app: Any) -> dict[str, Any]:
         """Loads the OpenAPI routing schema"""
+        return self.get_document(app).schema
+
+    def get_document(self, app: Any) -> OpenAPIDocument:
+        """
+        Returns the OpenAPI document of the application, cached on the application.
+
+        The schema is only generated again when routes were added to the application
+        (or to its includes), or when the servers changed.
+        """
+        key = (
+            id(self),
+            get_routes_key(app.routes),
+            tuple(server.get("url") for server in self.servers),
+        )
+        document: OpenAPIDocument | None = getattr(app, "openapi_document", None)
+        if document is None or document.key != key:
+            document = OpenAPIDocument(self.generate(app), key)
+            app.openapi_document = document
+        return document
+
+    def generate(self, app: Any) -> dict[str, Any]:
+        """Generates the OpenAPI routing schema"""
         openapi_schema = get_openapi(
             app=app,
             title=self.title,
@@ -384,14 +461,18 @@ class OpenAPIConfig(BaseModel):
             urls = {server.get("url") for server in self.servers}
             server_urls = set(urls)
 
-            async def _openapi(request: Request) -> JSONResponse:
+            async def _openapi(request: Request) -> Response:
                 root_path = request.scope.get("root_path", "").rstrip("/")
 
                 if root_path not in server_urls:
                     if root_path and self.root_path_in_servers:
                         self.servers.insert(0, {"url": root_path})
                         server_urls.add(root_path)
-                return JSONResponse(self.openapi(app))
+                document = self.get_document(app)
+                headers = {"etag": document.etag}
+                if document.is_not_modified(request.headers):
+                    return Response(status_code=304, headers=headers)
+                return Response(document.body, headers=headers, media_type=MediaType.JSON)
 
             app.add_route(
                 path=self.openapi_url,
@@ -399,6 +480,9 @@ class OpenAPIConfig(BaseModel):
                 include_in_schema=False,
             )
 
+            if self.generate_on_startup:
+                app.add_event_handler("startup", lambda: self.get_document(app))
+
         if self.openapi_url and self.docs_url:
 
             async def swagger_ui_html(
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import itertools
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect
+from collections.abc import Sequence
+
+from lilya.compat import md5_hexdigest
+from lilya.contrib.proxy.circuit_breaker import CircuitBreaker
+from lilya.types import Scope
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError("httpx is required for lilya.contrib.proxy") from e
+
+
+class Upstream:
+    """
+    An upstream server of a `Relay` and its runtime state.
+
+    Attributes:
+        url: The base URL of the upstream (scheme+host+optional base path).
+        outstanding: The number of requests currently in flight.
+        failures: The number of consecutive failures.
+        ejected_until: The monotonic time until which the upstream is passively ejected.
+        healthy: The result of the last active health check.
+        breaker: The optional circuit breaker of the upstream.
+    """
+
+    __slots__ = ("url", "outstanding", "failures", "ejected_until", "healthy", "breaker")
+
+    def __init__(self, url: str | httpx.URL, breaker: CircuitBreaker | None = None) -> None:
+        self.url = httpx.URL(str(url).rstrip("/"))
+        self.outstanding: int = 0
+        self.failures: int = 0
+        self.ejected_until: float = 0.0
+        self.healthy: bool = True
+        self.breaker = breaker
+
+    def is_available(self, now: float | None = None) -> bool:
+        """
+        Checks if the upstream can receive requests (healthy, not ejected and
+        its circuit, if any, letting requests through).
+        """
+        if not self.healthy:
+            return False
+        now = time.monotonic() if now is None else now
+        if self.ejected_until > now:
+            return False
+        return self.breaker is None or self.breaker.allows_request(now)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(url={str(self.url)!r})"
+
+
+class LoadBalancer(ABC):
+    """
+    The strategy selecting the upstream of a request.
+    """
+
+    def setup(self, upstreams: Sequence[Upstream]) -> None:  # noqa: B027
+        """
+        Called once with all the upstreams of the pool.
+        """
+
+    @abstractmethod
+    def select(self, candidates: Sequence[Upstream], scope: Scope) -> Upstream:
+        """
+        Selects the upstream of the request.
+
+        Args:
+            candidates: The available upstreams, never empty.
+            scope: The ASGI scope of the request.
+
+        Returns:
+            One of the candidates.
+        """
+        raise NotImplementedError("`select()` must be implemented in subclasses.")
+
+
+class RoundRobinBalancer(LoadBalancer):
+    """
+    Cycles through the available upstreams.
+    """
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def select(self, candidates: Sequence[Upstream], scope: Scope) -> Upstream:
+        return candidates[next(self._counter) % len(candidates)]
+
+
+class LeastOutstandingBalancer(LoadBalancer):
+    """
+    Selects the upstream with the fewest requests in flight, rotating between ties.
+    """
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def select(self, candidates: Sequence[Upstream], scope: Scope) -> Upstream:
+        start = next(self._counter) % len(candidates)
+        rotated = itertools.chain(candidates[start:], candidates[:start])
+        return min(rotated, key=lambda upstream: upstream.outstanding)
+
+
+class ConsistentHashBalancer(LoadBalancer):
+    """
+    Selects the upstream by consistent hashing of a request header, so the same
+    header value keeps reaching the same upstream while it is available.
+
+    Requests without the header are balanced in round-robin.
+    """
+
+    def __init__(self, header: str, replicas: int = 100) -> None:
+        """
+        Args:
+            header: The name of the request header to hash (e.g. `x-user-id`).
+            replicas: The number of points of each upstream on the ring.
+        """
+        self.header = header.lower().encode("latin-1")
+        self.replicas = replicas
+        self._fallback = RoundRobinBalancer()
+        self._points: list[int] = []
+        self._ring: list[Upstream] = []
+
+    @staticmethod
+    def hash(value: bytes) -> int:
+        return int(md5_hexdigest(value, usedforsecurity=False)[:16], 16)
+
+    def setup(self, upstreams: Sequence[Upstream]) -> None:
+        ring = sorted(
+            (self.hash(f"{upstream.url}#{replica}".encode()), index)
+            for index, upstream in enumerate(upstreams)
+            for replica in range(self.replicas)
+        )
+        self._points = [point for point, _ in ring]
+        self._ring = [upstreams[index] for _, index in ring]
+
+    def select(self, candidates: Sequence[Upstream], scope: Scope) -> Upstream:
+        value = next(
+            (value for key, value in scope.get("headers", ()) if key.lower() == self.header),
+            None,
+        )
+        if value is None or not self._ring:
+            return self._fallback.select(candidates, scope)
+
+        total = len(self._ring)
+        start = bisect(self._points, self.hash(value))
+        for offset in range(total):
+            upstream = self._ring[(start + offset) % total]
+            if upstream in candidates:
+                return upstream
+        return self._fallback.select(candidates, scope)
+
+
+BALANCERS: dict[str, type[LoadBalancer]] = {
+    "round_robin": RoundRobinBalancer,
+    "least_outstanding": LeastOutstandingBalancer,
+    "consistent_hash": ConsistentHashBalancer,
+}
+
+
+class UpstreamPool:
+    """
+    The upstreams of a `Relay`, the balancing strategy and the passive ejection.
+
+    An upstream failing `max_failures` times in a row is ejected for `ejection_time`
+    seconds (`max_failures=0` disables the passive ejection).
+    """
+
+    def __init__(
+        self,
+        upstreams: Sequence[str | httpx.URL | Upstream],
+        *,
+        balancer: LoadBalancer | None = None,
+        max_failures: int = 0,
+        ejection_time: float = 30.0,
+    ) -> None:
+        if not upstreams:
+            raise ValueError("At least one upstream is required.")
+
+        self.upstreams: list[Upstream] = [
+            upstream if isinstance(upstream, Upstream) else Upstream(upstream)
+            for upstream in upstreams
+        ]
+        self.balancer = balancer or RoundRobinBalancer()
+        self.balancer.setup(self.upstreams)
+        self.max_failures = max_failures
+        self.ejection_time = ejection_time
+
+    def select(self, scope: Scope, exclude: Sequence[Upstream] = ()) -> Upstream | None:
+        """
+        Selects an available upstream, preferring the ones not in `exclude`
+        (for instance the upstreams already tried by a retry).
+
+        Returns:
+            The upstream, or `None` if no upstream is available.
+        """
+        now = time.monotonic()
+        available = [upstream for upstream in self.upstreams if upstream.is_available(now)]
+        if not available:
+            return None
+
+        candidates = [upstream for upstream in available if upstream not in exclude]
+        return self.balancer.select(candidates or available, scope)
+
+    def record_success(self, upstream: Upstream) -> None:
+        upstream.failures = 0
+
+    def record_failure(self, upstream: Upstream) -> bool:
+        """
+        Records a failure of the upstream, ejecting it when reaching `max_failures`.
+
+        Returns:
+            `True` if the upstream got ejected.
+        """
+        upstream.failures += 1
+        if self.max_failures and upstream.failures >= self.max_failures:
+            upstream.failures = 0
+            upstream.ejected_until = time.monotonic() + self.ejection_time
+            return True
+        return False
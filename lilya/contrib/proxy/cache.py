@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import base64
+import math
+import time
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import anyio
+
+from lilya.compat import md5_hexdigest
+from lilya.protocols.cache import CacheBackend
+from lilya.types import Message, Scope, Send
+
+Headers = list[tuple[str, str]]
+
+# Statuses cacheable by default (RFC 9110, section 15.1).
+CACHEABLE_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+
+# Headers of a stored response never updated by a 304 revalidation.
+NOT_UPDATED_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding"})
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """
+    Parse a `Cache-Control` header value into a `{directive: argument}` dictionary.
+
+    Example:
+        >>> parse_cache_control('public, max-age=60, no-cache="set-cookie"')
+        {'public': None, 'max-age': '60', 'no-cache': 'set-cookie'}
+    """
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def get_header(headers: Iterable[tuple[str, str]], name: str) -> str | None:
+    """
+    Get the comma-joined values of a header, `None` if absent.
+    """
+    values = [value for key, value in headers if key.lower() == name]
+    return ", ".join(values) if values else None
+
+
+def _seconds(value: str | None) -> int:
+    try:
+        return max(int(value or 0), 0)
+    except ValueError:
+        return 0
+
+
+def _http_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers: Headers, directives: dict[str, str | None]) -> float | None:
+    """
+    The freshness lifetime of a response in seconds, from its `s-maxage`, `max-age` or
+    `Expires` and `Date` headers, `None` if the response does not define one.
+    """
+    if "s-maxage" in directives:
+        return _seconds(directives["s-maxage"])
+    if "max-age" in directives:
+        return _seconds(directives["max-age"])
+
+    expires = get_header(headers, "expires")
+    if expires is None:
+        return None
+    expires_at = _http_date(expires)
+    date = _http_date(get_header(headers, "date")) or time.time()
+    return max(expires_at - date, 0) if expires_at is not None else 0
+
+
+class CachedResponse:
+    """
+    A response stored by a `RelayCache`.
+    """
+
+    __slots__ = ("status", "headers", "body", "stored_at", "fresh_until")
+
+    def __init__(
+        self, status: int, headers: Headers, body: bytes, stored_at: float, fresh_until: float
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        self.fresh_until = fresh_until
+
+    @property
+    def etag(self) -> str | None:
+        return get_header(self.headers, "etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return get_header(self.headers, "last-modified")
+
+    @property
+    def has_validators(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (time.time() if now is None else now) < self.fresh_until
+
+    def response_headers(self, now: float | None = None) -> Headers:
+        """
+        The stored headers, with the `Age` of the response.
+        """
+        age = int((time.time() if now is None else now) - self.stored_at)
+        headers = [(key, value) for key, value in self.headers if key.lower() != "age"]
+        headers.append(("age", str(max(age, 0))))
+        return headers
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "headers": self.headers,
+            "body": base64.b64encode(self.body).decode("ascii"),
+            "stored_at": self.stored_at,
+            "fresh_until": self.fresh_until,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedResponse:
+        return cls(
+            status=data["status"],
+            headers=[(key, value) for key, value in data["headers"]],
+            body=base64.b64decode(data["body"]),
+            stored_at=data["stored_at"],
+            fresh_until=data["fresh_until"],
+        )
+
+
+class ResponseRecorder:
+    """
+    An ASGI `send` wrapper recording the relayed response to store it.
+
+    When `intercept_not_modified` is set, a `304 Not Modified` response is recorded
+    but not sent, so the revalidated entry can be served instead.
+    """
+
+    def __init__(self, send: Send, *, max_body_size: int, intercept_not_modified: bool) -> None:
+        self.send = send
+        self.max_body_size = max_body_size
+        self.intercept_not_modified = intercept_not_modified
+        self.status: int | None = None
+        self.headers: Headers = []
+        self.complete = False
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._overflow = False
+
+    @property
+    def not_modified(self) -> bool:
+        return self.intercept_not_modified and self.status == 304
+
+    @property
+    def storable(self) -> bool:
+        return self.complete and not self._overflow
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(self._chunks)
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            self.headers = [
+                (key.decode("latin-1"), value.decode("latin-1"))
+                for key, value in message.get("headers", ())
+            ]
+            self._overflow = self.status not in CACHEABLE_STATUSES
+        elif message["type"] == "http.response.body":
+            if not message.get("more_body", False):
+                self.complete = True
+            body = message.get("body", b"")
+            if body and not self._overflow and not self.not_modified:
+                self._size += len(body)
+                if self._size > self.max_body_size:
+                    self._overflow = True
+                    self._chunks.clear()
+                else:
+                    self._chunks.append(body)
+
+        if not self.not_modified:
+            await self.send(message)
+
+
+class RelayCache:
+    """
+    An HTTP cache for the GET responses relayed by a `Relay`, stored in a `CacheBackend`.
+
+    It behaves as a shared cache (RFC 9111): the responses are keyed on the method,
+    the path, the query string and the request headers listed in their `Vary` header.
+    Fresh entries are served without contacting the upstream and stale entries with
+    an `ETag` or a `Last-Modified` are revalidated with a conditional request.
+    Concurrent misses of a key are coalesced into a single upstream request.
+
+    Responses are only stored with an explicit freshness (`s-maxage`, `max-age` or
+    `Expires`) or a validator, and never when marked `no-store` or `private`, when
+    setting cookies, or when answering a request with an `Authorization` header
+    (unless marked `public` or `s-maxage`).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        *,
+        key_prefix: str = "relay:",
+        max_body_size: int = 1024 * 1024,
+        stale_ttl: int = 3600,
+    ) -> None:
+        """
+        Args:
+            backend: The cache backend storing the responses.
+            key_prefix: The prefix of the cache keys, to share a backend between relays.
+            max_body_size: Responses with a larger body are not stored.
+            stale_ttl: Seconds a stale response with validators is kept for revalidation.
+        """
+        self.backend = backend
+        self.key_prefix = key_prefix
+        self.max_body_size = max_body_size
+        self.stale_ttl = stale_ttl
+        self._inflight: dict[str, anyio.Event] = {}
+
+    def _primary_key(self, scope: Scope) -> str:
+        raw_path: bytes = scope.get("raw_path") or scope["path"].encode("latin-1")
+        query_string: bytes = scope.get("query_string", b"")
+        target = b"%s %s?%s" % (scope["method"].encode("latin-1"), raw_path, query_string)
+        return f"{self.key_prefix}{md5_hexdigest(target, usedforsecurity=False)}"
+
+    @staticmethod
+    def _variant_key(primary: str, vary: list[str], scope: Scope) -> str:
+        headers = scope.get("headers", ())
+        values = []
+        for name in vary:
+            encoded = name.encode("latin-1")
+            values.append(
+                b"%s:%s" % (encoded, b",".join(v for k, v in headers if k.lower() == encoded))
+            )
+        digest = md5_hexdigest(b"\n".join(values), usedforsecurity=False)
+        return f"{primary}:{digest}"
+
+    async def lookup(self, scope: Scope) -> tuple[str, CachedResponse | None]:
+        """
+        Look up the stored response of a request.
+
+        Returns:
+            The cache key of the request and the stored response, if any.
+        """
+        primary = self._primary_key(scope)
+        index = await self.backend.get(primary)
+        if not index:
+            return primary, None
+        if "entry" in index:
+            return primary, CachedResponse.from_dict(index["entry"])
+
+        key = self._variant_key(primary, index["vary"], scope)
+        data = await self.backend.get(key)
+        return key, CachedResponse.from_dict(data) if data else None
+
+    async def store(
+        self, scope: Scope, status: int, headers: Headers, body: bytes
+    ) -> CachedResponse | None:
+        """
+        Store a response if the HTTP caching rules allow it.
+
+        Returns:
+            The stored response, `None` if it is not cacheable.
+        """
+        if status not in CACHEABLE_STATUSES or len(body) > self.max_body_size:
+            return None
+
+        directives = parse_cache_control(get_header(headers, "cache-control"))
+        if "no-store" in directives or "private" in directives:
+            return None
+        if get_header(headers, "set-cookie") is not None:
+            return None
+
+        vary = [
+            name.strip().lower()
+            for name in (get_header(headers, "vary") or "").split(",")
+            if name.strip()
+        ]
+        if "*" in vary:
+            return None
+
+        request_headers = scope.get("headers", ())
+        if any(key.lower() == b"authorization" for key, _ in request_headers) and not (
+            "public" in directives or "s-maxage" in directives
+        ):
+            return None
+
+        now = time.time()
+        lifetime = 0 if "no-cache" in directives else freshness_lifetime(headers, directives)
+        entry = CachedResponse(
+            status=status,
+            headers=[(key, value) for key, value in headers if key.lower() != "age"],
+            body=body,
+            stored_at=now - _seconds(get_header(headers, "age")),
+            fresh_until=0,
+        )
+        if lifetime is None and not entry.has_validators:
+            return None
+        entry.fresh_until = entry.stored_at + (lifetime or 0)
+
+        retention = max(entry.fresh_until - now, 0)
+        if entry.has_validators:
+            retention += self.stale_ttl
+        if retention <= 0:
+            return None
+        ttl = max(math.ceil(retention), 1)
+
+        primary = self._primary_key(scope)
+        if vary:
+            await self.backend.set(primary, {"vary": vary}, ttl=max(ttl, self.stale_ttl))
+            await self.backend.set(self._variant_key(primary, vary, scope), entry.to_dict(), ttl)
+        else:
+            await self.backend.set(primary, {"entry": entry.to_dict()}, ttl)
+        return entry
+
+    async def refresh(
+        self, scope: Scope, entry: CachedResponse, headers: Headers
+    ) -> CachedResponse:
+        """
+        Update a stored response with the headers of the `304 Not Modified` that
+        revalidated it.
+
+        Returns:
+            The updated response, served even if it can no longer be stored.
+        """
+        updated = {key.lower() for key, _ in headers} - NOT_UPDATED_HEADERS
+        merged = [(key, value) for key, value in entry.headers if key.lower() not in updated]
+        merged.extend((key, value) for key, value in headers if key.lower() in updated)
+
+        stored = await self.store(scope, entry.status, merged, entry.body)
+        if stored is not None:
+            return stored
+
+        now = time.time()
+        return CachedResponse(entry.status, merged, entry.body, stored_at=now, fresh_until=now)
+
+    @asynccontextmanager
+    async def coalesce(self, key: str) -> AsyncIterator[bool]:
+        """
+        Coalesce the upstream requests of a key.
+
+        Yields:
+            `True` for the request that must reach the upstream. The others wait for
+            it to complete and get `False`, then look the key up again.
+        """
+        event = self._inflight.get(key)
+        if event is not None:
+            await event.wait()
+            yield False
+            return
+
+        event = self._inflight[key] = anyio.Event()
+        try:
+            yield True
+        finally:
+            self._inflight.pop(key, None)
+            event.set()
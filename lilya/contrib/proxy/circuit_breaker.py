@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import time
+
+from lilya.conf.enums import StrEnum
+
+
+class CircuitState(StrEnum):
+    """
+    The states of a `CircuitBreaker`.
+
+    - `closed`: requests flow normally and failures are counted.
+    - `open`: requests are rejected until `recovery_time` elapses.
+    - `half_open`: a limited number of trial requests decide whether to close
+      the circuit again or to reopen it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker guarding an upstream of a `Relay`.
+
+    The circuit opens after `failure_threshold` consecutive failures, rejecting the
+    requests for `recovery_time` seconds. It then lets up to `half_open_max_calls`
+    trial requests through: the first success closes the circuit, a failure opens it
+    again.
+    """
+
+    __slots__ = (
+        "failure_threshold",
+        "recovery_time",
+        "half_open_max_calls",
+        "state",
+        "failures",
+        "opened_at",
+        "_trials",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        """
+        Args:
+            failure_threshold: Consecutive failures opening the circuit.
+            recovery_time: Seconds the circuit stays open before allowing trial requests.
+            half_open_max_calls: Concurrent trial requests allowed in the half-open state.
+
+        Raises:
+            ValueError: If `failure_threshold` or `half_open_max_calls` is lower than 1.
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("`failure_threshold` and `half_open_max_calls` must be at least 1.")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CircuitState.CLOSED
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self._trials: int = 0
+
+    def allows_request(self, now: float | None = None) -> bool:
+        """
+        Checks, without changing the state, if a request may go through the circuit.
+        """
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.OPEN:
+            now = time.monotonic() if now is None else now
+            return now - self.opened_at >= self.recovery_time
+        return self._trials < self.half_open_max_calls
+
+    def on_request(self, now: float | None = None) -> bool:
+        """
+        Registers a request going through the circuit, moving an open circuit whose
+        `recovery_time` elapsed to half-open.
+
+        Returns:
+            `True` if the request is a half-open trial, to be passed to `on_result`.
+        """
+        if self.state is CircuitState.OPEN and self.allows_request(now):
+            self.state = CircuitState.HALF_OPEN
+            self._trials = 0
+        if self.state is CircuitState.HALF_OPEN:
+            self._trials += 1
+            return True
+        return False
+
+    def on_result(self, success: bool | None, trial: bool, now: float | None = None) -> None:
+        """
+        Registers the outcome of a request.
+
+        Args:
+            success: `True` on success, `False` on failure and `None` if the outcome is
+                unknown (e.g. the request was cancelled), which only releases a trial.
+            trial: The value returned by `on_request` for this request.
+        """
+        if trial and self.state is CircuitState.HALF_OPEN:
+            self._trials = max(self._trials - 1, 0)
+            if success is True:
+                self.state = CircuitState.CLOSED
+                self.failures = 0
+            elif success is False:
+                self._open(now)
+            return
+
+        if success is True:
+            self.failures = 0
+        elif success is False and self.state is CircuitState.CLOSED:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self._open(now)
+
+    def _open(self, now: float | None) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic() if now is None else now
+        self.failures = 0
+        self._trials = 0
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
 from typing import Any, cast
 
 import anyio
 import websockets
-
+from anyio.abc import TaskGroup
+
+from lilya.contrib.proxy.balancing import (
+    BALANCERS,
+    ConsistentHashBalancer,
+    LoadBalancer,
+    Upstream,
+    UpstreamPool,
+)
+from lilya.contrib.proxy.cache import (
+    CachedResponse,
+    RelayCache,
+    ResponseRecorder,
+    get_header,
+    parse_cache_control,
+)
+from lilya.contrib.proxy.circuit_breaker import CircuitBreaker
+from lilya.protocols.cache import CacheBackend
 from lilya.types import Receive, Scope, Send
 
 try:
@@ -14,6 +34,12 @@ try:
 except ImportError as e:
     raise ImportError("httpx is required for lilya.contrib.proxy") from e
 
+# Methods safe to send twice, without a request body to replay.
+HEDGEABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Latencies to observe before hedging requests.
+HEDGE_MIN_SAMPLES = 10
+
 
 class Relay:
     """
@@ -32,6 +58,14 @@ class Relay:
       `Set-Cookie` headers via a callback.
     - **Retry policy**: supports retries on network exceptions or retryable
       status codes with exponential backoff.
+    - **Load balancing**: spreads the requests over a pool of upstreams
+      (round-robin, least outstanding requests or consistent hashing on a header),
+      ejects failing upstreams and optionally probes their health in the background.
+    - **Circuit breaking**: fails fast with 503 while the upstreams keep failing.
+    - **Hedged requests**: races a second attempt for idempotent requests slower
+      than a latency percentile.
+    - **Response caching**: optionally stores the GET responses in a cache backend,
+      following the HTTP caching rules.
     - **Structured logging**: emits one log entry per retry, timeout, or error
       with event type and key/value metadata.
 
@@ -54,7 +88,7 @@ class Relay:
 
     def __init__(
         self,
-        target_base_url: str,
+        target_base_url: str | Sequence[str],
         *,
         upstream_prefix: str = "/",
         preserve_host: bool = False,
@@ -73,10 +107,24 @@ class Relay:
         retry_statuses: Sequence[int] = (502, 503, 504),
         retry_exceptions: tuple[type[Exception], ...] = (httpx.ConnectError, httpx.ReadTimeout),
         logger: logging.Logger | None = None,
+        load_balancer: str | LoadBalancer = "round_robin",
+        hash_header: str | None = None,
+        max_failures: int = 0,
+        ejection_time: float = 30.0,
+        health_check_path: str | None = None,
+        health_check_interval: float = 10.0,
+        health_check_timeout: float = 2.0,
+        circuit_breaker_threshold: int = 0,
+        circuit_breaker_recovery_time: float = 30.0,
+        circuit_breaker_half_open_calls: int = 1,
+        hedge_percentile: float | None = None,
+        hedge_window: int = 100,
+        cache: RelayCache | CacheBackend | None = None,
     ) -> None:
         """
         Args:
-            target_base_url: Upstream base (scheme+host+optional base path).
+            target_base_url: Upstream base (scheme+host+optional base path), or a sequence
+                of them to balance the requests over a pool of upstreams.
             upstream_prefix: Path prefix prepended before forwarding to upstream.
             preserve_host: If True, keep original `Host` header; otherwise rewrite to upstream host.
             rewrite_set_cookie_domain: Callback to rewrite cookie Domain; return "" to drop Domain,
@@ -95,8 +143,56 @@ class Relay:
             retry_statuses: HTTP statuses that should be retried.
             retry_exceptions: Exception types that should be retried.
             logger: Optional logger for structured logs.
+            load_balancer: The balancing strategy, either a `LoadBalancer` instance or one of
+                "round_robin", "least_outstanding" and "consistent_hash".
+            hash_header: The request header hashed by the "consistent_hash" strategy.
+            max_failures: Consecutive failures ejecting an upstream (0 = never eject).
+            ejection_time: Seconds an ejected upstream stays out of the pool.
+            health_check_path: If provided, path probed on every upstream in the background
+                once started; upstreams not answering with 2xx/3xx are taken out of the pool.
+            health_check_interval: Seconds between two health checks.
+            health_check_timeout: Timeout in seconds of a health check request.
+            circuit_breaker_threshold: Consecutive failures opening the circuit of an upstream
+                (0 = no circuit breaker). Requests are rejected with 503 while it is open.
+            circuit_breaker_recovery_time: Seconds before an open circuit lets trial requests
+                through (half-open).
+            circuit_breaker_half_open_calls: Concurrent trial requests of a half-open circuit.
+            hedge_percentile: If provided, GET/HEAD/OPTIONS requests without a response after
+                this percentile (e.g. 95) of the observed latencies are sent to a second
+                upstream, relaying the first response to arrive.
+            hedge_window: Number of latencies the hedging percentile is computed over.
+            cache: If provided, a `RelayCache` (or a `CacheBackend` wrapped in a default one)
+                storing the GET responses, served while fresh and revalidated once stale.
+
+        Raises:
+            ValueError: If the load balancer or the hedging are misconfigured.
         """
-        self._base_url = httpx.URL(target_base_url.rstrip("/"))
+        if isinstance(target_base_url, str):
+            target_base_url = [target_base_url]
+        self._pool = UpstreamPool(
+            target_base_url,
+            balancer=self._build_load_balancer(load_balancer, hash_header),
+            max_failures=max_failures,
+            ejection_time=ejection_time,
+        )
+        self._base_url = self._pool.upstreams[0].url
+
+        if circuit_breaker_threshold:
+            for upstream in self._pool.upstreams:
+                upstream.breaker = CircuitBreaker(
+                    circuit_breaker_threshold,
+                    circuit_breaker_recovery_time,
+                    circuit_breaker_half_open_calls,
+                )
+
+        if hedge_percentile is not None and not 0 < hedge_percentile <= 100:
+            raise ValueError("`hedge_percentile` must be in the (0, 100] range.")
+        self._hedge_percentile = hedge_percentile
+        self._latencies: deque[float] | None = (
+            deque(maxlen=hedge_window) if hedge_percentile is not None else None
+        )
+
+        self._cache = RelayCache(cache) if isinstance(cache, CacheBackend) else cache
         self._upstream_prefix = upstream_prefix
         self._preserve_host = preserve_host
         self._rewrite_cookie_domain = rewrite_set_cookie_domain
@@ -117,6 +213,12 @@ class Relay:
         self._retry_statuses = set(retry_statuses)
         self._retry_exceptions = retry_exceptions
 
+        # Health checks
+        self._health_check_path = health_check_path
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._health_task_group: TaskGroup | None = None
+
         # Logging
         self._log = logger
 
@@ -132,6 +234,35 @@ class Relay:
             "upgrade",
         }
 
+    @staticmethod
+    def _build_load_balancer(
+        load_balancer: str | LoadBalancer, hash_header: str | None
+    ) -> LoadBalancer:
+        """
+        Resolve the `load_balancer` argument into a `LoadBalancer` instance.
+
+        Raises:
+            ValueError: If the strategy is unknown or "consistent_hash" has no `hash_header`.
+        """
+        if isinstance(load_balancer, LoadBalancer):
+            return load_balancer
+        if load_balancer not in BALANCERS:
+            raise ValueError(
+                f"Unknown load balancer {load_balancer!r}, expected one of {sorted(BALANCERS)}."
+            )
+        if load_balancer == "consistent_hash":
+            if not hash_header:
+                raise ValueError("`hash_header` is required by the 'consistent_hash' balancer.")
+            return ConsistentHashBalancer(hash_header)
+        return BALANCERS[load_balancer]()
+
+    @property
+    def upstreams(self) -> list[Upstream]:
+        """
+        The upstreams of the relay, with their runtime state.
+        """
+        return self._pool.upstreams
+
     async def startup(self) -> None:
         """
         Initialize the proxy's underlying HTTP client.
@@ -141,6 +272,10 @@ class Relay:
         a custom transport. This must be called before the proxy can
         forward any HTTP requests.
 
+        When `health_check_path` is set, the background health checks start as well.
+        They run until `shutdown()`, which must be awaited from the same task (as the
+        `on_startup`/`on_shutdown` events and the lifespan do).
+
         Typically, you register this in the application's
         `on_startup` event so the client is ready before handling traffic.
 
@@ -159,6 +294,12 @@ class Relay:
                 transport=self._transport,  # type: ignore
             )
 
+        if self._health_check_path is not None and self._health_task_group is None:
+            task_group = anyio.create_task_group()
+            await task_group.__aenter__()
+            task_group.start_soon(self._run_health_checks)
+            self._health_task_group = task_group
+
     async def shutdown(self) -> None:
         """
         Dispose of the underlying HTTP client.
@@ -171,6 +312,11 @@ class Relay:
         Typically, you register this in the application's
         `on_shutdown` event to ensure a clean shutdown.
         """
+        if self._health_task_group is not None:
+            task_group, self._health_task_group = self._health_task_group, None
+            task_group.cancel_scope.cancel()
+            await task_group.__aexit__(None, None, None)
+
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -207,7 +353,10 @@ class Relay:
         scope_type = scope["type"]
 
         if scope_type == "http":
-            await self._handle_http(scope, receive, send)
+            if self._cache is not None and scope["method"] == "GET":
+                await self._handle_cached(scope, receive, send)
+            else:
+                await self._handle_http(scope, receive, send)
         elif scope_type == "websocket":
             await self._handle_websocket(scope, receive, send)
         else:
@@ -215,14 +364,130 @@ class Relay:
 
         assert self._client is not None, "Relay not started. Call startup() first."
 
+    async def check_upstreams_health(self) -> None:
+        """
+        Probe `health_check_path` on every upstream concurrently.
+
+        Upstreams answering with a 2xx or 3xx status are marked healthy, the others
+        (including the ones failing or timing out) are taken out of the pool until a
+        later check succeeds. Called periodically once started with a `health_check_path`,
+        it can also be awaited directly.
+        """
+        assert self._client is not None, "Relay not started. Call startup() first."
+        assert self._health_check_path is not None, "No `health_check_path` configured."
+
+        async with anyio.create_task_group() as tg:
+            for upstream in self._pool.upstreams:
+                tg.start_soon(self._check_upstream_health, upstream)
+
+    async def _check_upstream_health(self, upstream: Upstream) -> None:
+        assert self._client is not None
+
+        # The health check path is relative to the base path of the upstream
+        health_check = httpx.URL(self._health_check_path or "/")
+        url = upstream.url.copy_with(
+            path=self._join_paths(upstream.url.path, health_check.path),
+            query=health_check.query or None,
+        )
+        try:
+            response = await self._client.get(url, timeout=self._health_check_timeout)
+            healthy = 200 <= response.status_code < 400
+        except httpx.HTTPError:
+            healthy = False
+
+        if healthy != upstream.healthy:
+            upstream.healthy = healthy
+            self._log_event(
+                "upstream_healthy" if healthy else "upstream_unhealthy", url=str(upstream.url)
+            )
+
+    async def _run_health_checks(self) -> None:
+        while True:
+            try:
+                await self.check_upstreams_health()
+            except Exception as exc:  # noqa: BLE001
+                # Keep checking, a failed round must not leave the upstreams as they are
+                self._log_event("health_check_error", error=repr(exc))
+            await anyio.sleep(self._health_check_interval)
+
+    def _acquire(self, upstream: Upstream) -> bool:
+        """
+        Account a request sent to an upstream.
+
+        Returns:
+            `True` if the request is a trial of a half-open circuit.
+        """
+        upstream.outstanding += 1
+        return upstream.breaker.on_request() if upstream.breaker is not None else False
+
+    def _release(self, upstream: Upstream, success: bool | None, trial: bool) -> None:
+        """
+        Account the outcome of a request sent to an upstream (`None` if unknown, e.g.
+        cancelled) in its circuit breaker and the passive ejection.
+        """
+        upstream.outstanding -= 1
+
+        breaker = upstream.breaker
+        if breaker is not None:
+            previous = breaker.state
+            breaker.on_result(success, trial)
+            if breaker.state is not previous:
+                self._log_event(f"circuit_{breaker.state}", url=str(upstream.url))
+
+        if success:
+            self._pool.record_success(upstream)
+        elif success is False and self._pool.record_failure(upstream):
+            self._log_event(
+                "upstream_ejected", url=str(upstream.url), seconds=self._pool.ejection_time
+            )
+
+    @contextmanager
+    def _track(self, upstream: Upstream) -> Iterator[None]:
+        """
+        Account a request sent to an upstream for the duration of the block, which
+        fails when raising an `httpx.HTTPError` or one of the `retry_exceptions`.
+        """
+        trial = self._acquire(upstream)
+        success: bool | None = None
+        try:
+            yield
+            success = True
+        except (httpx.HTTPError, *self._retry_exceptions):
+            success = False
+            raise
+        finally:
+            self._release(upstream, success, trial)
+
+    def _hedge_delay(self) -> float | None:
+        """
+        The delay after which a request is hedged, `None` when hedging is disabled or
+        not enough latencies were observed yet.
+        """
+        latencies = self._latencies
+        if latencies is None or len(latencies) < min(HEDGE_MIN_SAMPLES, latencies.maxlen or 1):
+            return None
+
+        ordered = sorted(latencies)
+        index = int(len(ordered) * cast(float, self._hedge_percentile) / 100)
+        return ordered[min(index, len(ordered) - 1)]
+
+    def _record_latency(self, seconds: float) -> None:
+        if self._latencies is not None:
+            self._latencies.append(seconds)
+
     async def _handle_http(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Forward an incoming HTTP request to the configured upstream.
+        Forward an incoming HTTP request to one of the configured upstreams.
 
-        This method builds the upstream URL and request headers from the ASGI
+        Every attempt selects an upstream from the pool, preferring the ones not tried
+        yet by the request, and answers 503 if none is available (e.g. all the circuits
+        are open). This method builds the upstream URL and request headers from the ASGI
         scope, streams the request body if present, and relays the response
         headers and body back to the client.
 
+        With hedging enabled, the attempts of idempotent requests are hedged (see
+        `_forward_hedged`).
+
         Retry behavior:
           - **Timeouts** are mapped to 504 Gateway Timeout.
           - **Retryable statuses** (e.g. 502, 503, 504) raise `HTTPStatusError`
@@ -242,21 +507,34 @@ class Relay:
         assert self._client is not None, "Relay not started. Call startup() first."
 
         method = scope["method"]
-        upstream_url = self._build_upstream_url(scope)
-        request_headers = self._prepare_request_headers(scope)
         request_body = (
             self._build_request_body_stream(receive)
             if method not in ("GET", "HEAD", "OPTIONS")
             else None
         )
+        hedge_delay = self._hedge_delay() if method in HEDGEABLE_METHODS else None
 
+        tried: list[Upstream] = []
         attempt = 0
         while True:
             attempt += 1
+            upstream = self._pool.select(scope, exclude=tried)
+            if upstream is None:
+                self._log_event("no_upstream_available", attempt=attempt)
+                await self._send_text(send, 503, "No upstream available")
+                return
+
+            tried.append(upstream)
+            upstream_url = self._build_upstream_url(scope, upstream.url)
             try:
-                await self._forward_to_upstream(
-                    method, upstream_url, request_headers, request_body, send
-                )
+                if hedge_delay is None:
+                    request_headers = self._prepare_request_headers(scope, upstream.url)
+                    with self._track(upstream):
+                        await self._forward_to_upstream(
+                            method, upstream_url, request_headers, request_body, send
+                        )
+                else:
+                    await self._forward_hedged(scope, method, upstream, tried, hedge_delay, send)
                 return
             except httpx.HTTPStatusError as exc:
                 self._log_event(
@@ -268,7 +546,12 @@ class Relay:
                 if attempt <= self._max_retries:
                     await anyio.sleep(self._retry_sleep_seconds(attempt))
                     continue
-                await self._send_text(send, exc.response.status_code, exc.response.text)
+                try:
+                    text = exc.response.text
+                except httpx.ResponseNotRead:
+                    # The streamed body was not read before the response got closed
+                    text = exc.response.reason_phrase
+                await self._send_text(send, exc.response.status_code, text)
                 return
             except httpx.TimeoutException as exc:
                 # Map timeouts to 504 Gateway Timeout
@@ -301,6 +584,238 @@ class Relay:
                 await self._send_text(send, 502, f"Upstream error: {exc}")
                 return
 
+    async def _handle_cached(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Serve a GET request through the response cache.
+
+        - A fresh stored response is served without contacting the upstream.
+        - Otherwise, the request is forwarded by `_handle_http`, conditionally
+          (`If-None-Match`/`If-Modified-Since`) if a stale response with validators
+          is stored, and the response is stored if cacheable.
+        - Concurrent requests of the same key wait for a single upstream request and
+          are served from its result.
+        - Requests with `Cache-Control: no-store` bypass the cache, and with
+          `no-cache` (or `max-age=0`) always reach the upstream.
+        """
+        cache = cast(RelayCache, self._cache)
+        request_headers = [
+            (key.decode("latin-1"), value.decode("latin-1"))
+            for key, value in scope.get("headers", ())
+        ]
+        directives = parse_cache_control(get_header(request_headers, "cache-control"))
+        if "no-store" in directives:
+            await self._handle_http(scope, receive, send)
+            return
+
+        key, entry = await cache.lookup(scope)
+        revalidate = "no-cache" in directives or directives.get("max-age") == "0"
+        if entry is not None and entry.is_fresh() and not revalidate:
+            await self._send_cached(request_headers, entry, send)
+            return
+
+        async with cache.coalesce(key) as leader:
+            if leader:
+                await self._fetch_and_cache(scope, receive, send, request_headers, entry)
+                return
+
+        # A concurrent request of the same key reached the upstream meanwhile
+        _, entry = await cache.lookup(scope)
+        if entry is not None and entry.is_fresh():
+            await self._send_cached(request_headers, entry, send)
+            return
+        await self._fetch_and_cache(scope, receive, send, request_headers, entry)
+
+    async def _fetch_and_cache(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        request_headers: list[tuple[str, str]],
+        entry: CachedResponse | None,
+    ) -> None:
+        """
+        Forward a request through `_handle_http`, revalidating the stale `entry` if it
+        has validators, and store the response.
+        """
+        cache = cast(RelayCache, self._cache)
+
+        conditional = [
+            (name, value)
+            for name, value in (
+                ("if-none-match", entry.etag if entry is not None else None),
+                ("if-modified-since", entry.last_modified if entry is not None else None),
+            )
+            if value is not None
+        ]
+        # Conditional requests of the client are answered by the upstream as they are
+        revalidating = bool(conditional) and not any(
+            key.lower() in ("if-none-match", "if-modified-since") for key, _ in request_headers
+        )
+        if revalidating:
+            scope = {
+                **scope,
+                "headers": [
+                    *scope.get("headers", ()),
+                    *((k.encode("latin-1"), v.encode("latin-1")) for k, v in conditional),
+                ],
+            }
+
+        recorder = ResponseRecorder(
+            send, max_body_size=cache.max_body_size, intercept_not_modified=revalidating
+        )
+        await self._handle_http(scope, receive, recorder)
+
+        if recorder.not_modified and entry is not None:
+            self._log_event("cache_revalidated", path=scope.get("path"))
+            entry = await cache.refresh(scope, entry, recorder.headers)
+            await self._send_cached(request_headers, entry, send)
+        elif recorder.storable and recorder.status is not None:
+            await cache.store(scope, recorder.status, recorder.headers, recorder.body)
+
+    async def _send_cached(
+        self, request_headers: list[tuple[str, str]], entry: CachedResponse, send: Send
+    ) -> None:
+        """
+        Send a stored response, or a `304 Not Modified` if it matches the
+        `If-None-Match` header of the request.
+        """
+        headers = entry.response_headers()
+        if_none_match = get_header(request_headers, "if-none-match")
+        etag = entry.etag
+
+        if if_none_match is not None and etag is not None:
+            candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+            if "*" in candidates or etag.removeprefix("W/") in candidates:
+                headers = [
+                    (key, value)
+                    for key, value in headers
+                    if key.lower() not in ("content-length", "content-type", "content-encoding")
+                ]
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": [
+                            (k.encode("latin-1"), v.encode("latin-1")) for k, v in headers
+                        ],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": entry.status,
+                "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+            }
+        )
+        await send({"type": "http.response.body", "body": entry.body})
+
+    async def _forward_hedged(
+        self,
+        scope: Scope,
+        method: str,
+        primary: Upstream,
+        tried: list[Upstream],
+        delay: float,
+        send: Send,
+    ) -> None:
+        """
+        Perform a hedged upstream request and relay the first response to arrive.
+
+        The request is sent to `primary` and, if no response arrived after `delay`
+        seconds, to a second upstream selected from the pool (possibly the same one if
+        no other is available). The first response wins and the other attempt is
+        cancelled. Only used for the `HEDGEABLE_METHODS`, without a body to replay.
+
+        Raises:
+            httpx.HTTPStatusError: If every attempt answered with a retryable status.
+            httpx.RequestError: If every attempt failed.
+        """
+        winner: httpx.Response | None = None
+        winner_track = ExitStack()
+        errors: list[Exception] = []
+        primary_done = anyio.Event()
+
+        async def attempt(upstream: Upstream) -> None:
+            nonlocal winner
+            try:
+                with ExitStack() as track:
+                    track.enter_context(self._track(upstream))
+                    response = await self._open_upstream(scope, method, upstream)
+                    if winner is None:
+                        # The winner stays accounted to its upstream until its body is relayed
+                        winner = response
+                        winner_track.enter_context(track.pop_all())
+                        tg.cancel_scope.cancel()
+                        return
+            except (httpx.HTTPError, *self._retry_exceptions) as exc:
+                errors.append(exc)
+                return
+
+            with anyio.CancelScope(shield=True):
+                await response.aclose()
+
+        async def attempt_primary() -> None:
+            try:
+                await attempt(primary)
+            finally:
+                primary_done.set()
+
+        with winner_track:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(attempt_primary)
+                with anyio.move_on_after(delay):
+                    await primary_done.wait()
+
+                if not primary_done.is_set():
+                    hedge = self._pool.select(scope, exclude=tried)
+                    if hedge is not None:
+                        tried.append(hedge)
+                        self._log_event("upstream_hedged", url=str(hedge.url), delay=delay)
+                        tg.start_soon(attempt, hedge)
+
+            if winner is None:
+                raise errors[-1]
+
+            try:
+                await self._relay_response(winner, send)
+            finally:
+                await winner.aclose()
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _open_upstream(
+        self, scope: Scope, method: str, upstream: Upstream
+    ) -> httpx.Response:
+        """
+        Send a body-less request to an upstream and return the streamed response,
+        which must be closed by the caller.
+
+        Raises:
+            httpx.HTTPStatusError: For retryable statuses.
+            httpx.RequestError: For network or protocol errors.
+        """
+        assert self._client is not None
+
+        request = self._client.build_request(
+            method,
+            self._build_upstream_url(scope, upstream.url),
+            headers=self._prepare_request_headers(scope, upstream.url),
+        )
+        started = time.monotonic()
+        response = await self._client.send(request, stream=True)
+        if response.status_code in self._retry_statuses:
+            await response.aread()
+            raise httpx.HTTPStatusError(
+                f"Retryable status: {response.status_code}",
+                request=request,
+                response=response,
+            )
+
+        self._record_latency(time.monotonic() - started)
+        return response
+
     def _retry_sleep_seconds(self, attempt: int) -> float:
         """
         Calculate the backoff delay before the next retry attempt.
@@ -345,7 +860,7 @@ class Relay:
             prefix += "/"
         return prefix + path.lstrip("/")
 
-    def _build_upstream_url(self, scope: Scope) -> httpx.URL:
+    def _build_upstream_url(self, scope: Scope, base_url: httpx.URL | None = None) -> httpx.URL:
         """
         Construct the full upstream URL for a given ASGI request.
 
@@ -362,6 +877,7 @@ class Relay:
 
         Args:
             scope: The ASGI connection scope containing request metadata.
+            base_url: The base URL of the selected upstream (defaults to the first one).
 
         Returns:
             An `httpx.URL` object representing the target upstream URL.
@@ -376,9 +892,11 @@ class Relay:
         query_string: bytes = scope.get("query_string", b"")
         path = raw_path.decode("latin-1")
         upstream_path = self._join_paths(self._upstream_prefix, path)
-        return self._base_url.join(upstream_path).copy_with(query=query_string)
+        return (base_url or self._base_url).join(upstream_path).copy_with(query=query_string)
 
-    def _prepare_request_headers(self, scope: Scope) -> dict[str, str]:
+    def _prepare_request_headers(
+        self, scope: Scope, base_url: httpx.URL | None = None
+    ) -> dict[str, str]:
         """
         Build the set of headers to forward to the upstream server.
 
@@ -400,6 +918,7 @@ class Relay:
 
         Args:
             scope: The ASGI connection scope for the incoming request.
+            base_url: The base URL of the selected upstream (defaults to the first one).
 
         Returns:
             A dictionary of header names and values safe to forward.
@@ -430,7 +949,9 @@ class Relay:
         request_headers.update(self._extra_request_headers)
 
         if not self._preserve_host:
-            request_headers["host"] = self._base_url.host or request_headers.get("host", "")
+            request_headers["host"] = (base_url or self._base_url).host or request_headers.get(
+                "host", ""
+            )
 
         # Add forwarding headers
         client_addr = scope.get("client")
@@ -518,6 +1039,7 @@ class Relay:
 
         assert self._client is not None
 
+        started = time.monotonic()
         async with self._client.stream(method, url, headers=headers, content=content) as resp:
             if resp.status_code in self._retry_statuses:
                 raise httpx.HTTPStatusError(
@@ -526,25 +1048,33 @@ class Relay:
                     response=resp,
                 )
 
-            response_headers = self._sanitize_response_headers(resp.headers.items())
+            self._record_latency(time.monotonic() - started)
+            await self._relay_response(resp, send)
 
-            if self._rewrite_cookie_domain is not None:
-                response_headers = self._rewrite_response_cookies(resp, response_headers)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
 
-            await send(
-                {
-                    "type": "http.response.start",
-                    "status": resp.status_code,
-                    "headers": [
-                        (k.encode("latin-1"), v.encode("latin-1")) for k, v in response_headers
-                    ],
-                }
-            )
+    async def _relay_response(self, resp: httpx.Response, send: Send) -> None:
+        """
+        Send the status, the sanitized headers and the streamed body chunks of an
+        upstream response downstream, without the final empty body message.
+        """
+        response_headers = self._sanitize_response_headers(resp.headers.items())
 
-            async for chunk in resp.aiter_bytes():
-                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        if self._rewrite_cookie_domain is not None:
+            response_headers = self._rewrite_response_cookies(resp, response_headers)
 
-        await send({"type": "http.response.body", "body": b"", "more_body": False})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": resp.status_code,
+                "headers": [
+                    (k.encode("latin-1"), v.encode("latin-1")) for k, v in response_headers
+                ],
+            }
+        )
+
+        async for chunk in resp.aiter_bytes():
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
 
     async def _handle_websocket(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
@@ -561,6 +1091,7 @@ class Relay:
             (server error, close).
           - On upstream timeout, closes with 1011 and reason "Upstream WS timeout".
           - On other errors, closes with 1011 and logs the exception.
+          - If no upstream is available, closes with 1013 (try again later).
 
         Args:
             scope: ASGI WebSocket scope.
@@ -571,11 +1102,17 @@ class Relay:
         # Accept downstream connection first
         await send({"type": "websocket.accept"})
 
+        upstream = self._pool.select(scope)
+        if upstream is None:
+            self._log_event("no_upstream_available", attempt=1)
+            await self._send_ws_close(send, 1013, "No upstream available")
+            return
+
         # Build upstream WS URL
-        ws_url = self._build_upstream_ws_url(scope)
+        ws_url = self._build_upstream_ws_url(scope, upstream.url)
 
         # Prepare headers (limited subset is typical for WS handshake)
-        request_headers = self._prepare_request_headers(scope)
+        request_headers = self._prepare_request_headers(scope, upstream.url)
 
         # Connect upstream
         try:
@@ -669,7 +1206,7 @@ class Relay:
             tg.start_soon(downstream_to_upstream)
             tg.start_soon(upstream_to_downstream)
 
-    def _build_upstream_ws_url(self, scope: Scope) -> httpx.URL:
+    def _build_upstream_ws_url(self, scope: Scope, base_url: httpx.URL | None = None) -> httpx.URL:
         """
         Build the upstream WebSocket URL from the ASGI scope.
 
@@ -681,6 +1218,7 @@ class Relay:
         Args:
             scope: The ASGI WebSocket scope containing the connection
                 details such as `scheme`, `path`, and `query_string`.
+            base_url: The base URL of the selected upstream (defaults to the first one).
 
         Returns:
             A fully-qualified `httpx.URL` pointing to the upstream WebSocket.
@@ -698,7 +1236,7 @@ class Relay:
 
         scheme = scope.get("scheme", "http")
         ws_scheme = "wss" if scheme == "https" else "ws"
-        http_equiv = self._build_upstream_url(scope)  # includes joined path + query
+        http_equiv = self._build_upstream_url(scope, base_url)  # includes joined path + query
         return http_equiv.copy_with(scheme=ws_scheme)
 
     async def _send_ws_close(self, send: Send, code: int, reason: str) -> None:
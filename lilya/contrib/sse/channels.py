@@ -7,15 +7,65 @@ from dataclasses import dataclass
 from typing import Any
 
 import anyio
-from anyio import ClosedResourceError, EndOfStream
-from anyio.abc import ObjectReceiveStream, ObjectSendStream
+from anyio import BrokenResourceError, CancelScope, ClosedResourceError, EndOfStream, WouldBlock
+from anyio.abc import ObjectReceiveStream, ObjectSendStream, TaskGroup, TaskStatus
+
+from lilya.conf.enums import StrEnum
+from lilya.contrib.sse.transports import ChannelTransport
+from lilya.logging import logger
+from lilya.responses import encode_sse_event
 
 # Define the type for the dictionary format expected by the channel/listener streams
 Eventdict = dict[str, Any]
 
+HEARTBEAT_EVENT: Eventdict = {"event": "heartbeat", "data": "💓"}
+HEARTBEAT_WIRE: bytes = encode_sse_event(HEARTBEAT_EVENT)
+
+
+class ChannelEvent:
+    """
+    A broadcast event shared by all the subscribers of a channel.
+
+    The SSE wire bytes are computed lazily and only once per broadcast and per
+    `(sep, retry)` pair, no matter how many subscribers consume them.
+    """
+
+    __slots__ = ("event", "_wires")
+
+    def __init__(self, event: Eventdict) -> None:
+        self.event = event
+        self._wires: dict[tuple[str, int | None], bytes] = {}
+
+    def encode(self, *, sep: str = "\n", retry: int | None = None) -> bytes:
+        """
+        Returns the SSE wire bytes of the event for the given separator and retry.
+        """
+        key = (sep, retry)
+        wire = self._wires.get(key)
+        if wire is None:
+            wire = self._wires[key] = encode_sse_event(self.event, sep=sep, retry=retry)
+        return wire
+
+
 # Define the exact stream type used internally
-ChannelSendStream = ObjectSendStream[Eventdict]
-ChannelReceiveStream = ObjectReceiveStream[Eventdict]
+ChannelSendStream = ObjectSendStream[ChannelEvent]
+ChannelReceiveStream = ObjectReceiveStream[ChannelEvent]
+
+_DISCONNECTED_ERRORS = (BrokenPipeError, BrokenResourceError, ClosedResourceError, EndOfStream)
+
+
+class OverflowPolicy(StrEnum):
+    """
+    What `SSEChannel.broadcast` does when the buffer of a subscriber is full.
+
+    - `BLOCK`: waits until the subscriber has room (the slowest subscriber sets the pace).
+    - `DROP_OLDEST`: discards the oldest buffered event of the subscriber.
+    - `DISCONNECT`: closes the subscriber, ending its `listen()` so the client reconnects.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
 
 
 @dataclass(slots=True)
@@ -69,21 +119,69 @@ class SSEChannel:
     This channel uses `anyio` memory streams to fan-out messages to multiple listeners.
     It manages the lifecycle of these streams, including cleanup of disconnected subscribers,
     and supports automatic heartbeat logic driven by receive timeouts.
+
+    With a `transport`, broadcasts are published through it and the local listeners are
+    served from a single upstream subscription, running in the task group of the channel
+    (`async with channel:`) or of its `SSEChannelManager` (`async with manager:`).
     """
 
-    def __init__(self, name: str) -> None:
+    # Seconds before resubscribing to a lost transport subscription, doubled up to the max
+    resubscribe_delay: float = 0.1
+    max_resubscribe_delay: float = 10.0
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_buffer_size: int = 0,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        transport: ChannelTransport | None = None,
+    ) -> None:
         """
         Initializes the SSE Channel.
 
         Args:
             name: A unique identifier for the channel (e.g., "global_updates").
+            max_buffer_size: The number of events buffered per subscriber.
+            overflow: What to do when the buffer of a subscriber is full. With
+                      `drop_oldest` and `disconnect` a broadcast never waits for
+                      a subscriber, which requires a `max_buffer_size` of at least 1.
+            transport: Carries the broadcasts across processes (e.g. `RedisTransport`).
+                       Without it, broadcasts only reach the listeners of this instance.
+
+        Raises:
+            ValueError: If a non-blocking overflow policy is used without a buffer.
         """
+        overflow = OverflowPolicy(overflow)
+        if overflow != OverflowPolicy.BLOCK and max_buffer_size < 1:
+            raise ValueError(
+                f"The '{overflow}' overflow policy requires a max_buffer_size of at least 1."
+            )
+
         self.name: str = name
-        # set of send streams for all currently active subscribers.
-        # The stream type is Eventdict, reflecting the internal data format.
-        self._subscribers: set[ChannelSendStream] = set()
-        # Lock to ensure thread-safe access to the _subscribers set
+        self.max_buffer_size: int = max_buffer_size
+        self.overflow: OverflowPolicy = overflow
+        # Send streams of all currently active subscribers mapped to their receive streams.
+        self._subscribers: dict[ChannelSendStream, ChannelReceiveStream] = {}
+        # Lock serializing the blocking broadcasts
         self._lock: anyio.Lock = anyio.Lock()
+        self.transport: ChannelTransport | None = transport
+        # Task group running the upstream subscription and its cancel scope, when running
+        self._task_group: TaskGroup | None = None
+        self._upstream: CancelScope | None = None
+        self._upstream_lock: anyio.Lock = anyio.Lock()
+
+    async def __aenter__(self) -> SSEChannel:
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool | None:
+        task_group, self._task_group = self._task_group, None
+        self._upstream = None
+        assert task_group is not None
+        task_group.cancel_scope.cancel()
+        return await task_group.__aexit__(*exc_info)
 
     async def broadcast(self, message: str | dict[str, Any] | SSEMessage) -> None:
         """
@@ -92,6 +190,10 @@ class SSEChannel:
         The message is first normalized into an `Eventdict` before being sent over
         the memory streams. Disconnected subscribers are automatically removed and closed.
 
+        With the `block` overflow policy, the broadcast waits for the subscribers with a
+        full buffer. With `drop_oldest` and `disconnect` it never waits, making its cost
+        independent of the slowest subscriber.
+
         Args:
             message: The content to broadcast.
                      - str: Treated as the 'data' payload with 'event' set to "message".
@@ -123,27 +225,141 @@ class SSEChannel:
         else:
             raise TypeError(f"Unsupported message type: {type(message)}")
 
-        async with self._lock:
-            dead: list[ChannelSendStream] = []
-            # Iterate over a copy to allow safe mutation of the main set outside the loop
-            for q in list(self._subscribers):
-                try:
-                    await q.send(msg_dict)
-                except (BrokenPipeError, ClosedResourceError, EndOfStream):
-                    # Connection error: mark subscriber for removal
-                    dead.append(q)
+        if self.transport is not None:
+            # Delivered to the local listeners by the upstream subscription
+            await self.transport.publish(self.name, msg_dict)
+            return
+
+        await self._deliver(ChannelEvent(msg_dict))
+
+    async def _deliver(self, item: ChannelEvent) -> None:
+        """
+        Delivers the event to the local subscribers, according to the overflow policy.
+        """
+        if self.overflow == OverflowPolicy.BLOCK:
+            async with self._lock:
+                await self._send_blocking(item)
+        else:
+            self._send_nowait(item)
+
+    async def _ensure_upstream(self) -> None:
+        """
+        Starts the upstream subscription of the channel, if not running yet.
+
+        Raises:
+            RuntimeError: If the channel (or its manager) is not running.
+        """
+        async with self._upstream_lock:
+            if self._upstream is not None:
+                return
+            if self._task_group is None:
+                raise RuntimeError(
+                    f"The channel '{self.name}' uses a transport and must be running, "
+                    "use `async with channel:` or `async with manager:`."
+                )
+            self._upstream = await self._task_group.start(self._run_upstream)
+
+    async def _run_upstream(self, *, task_status: TaskStatus[CancelScope]) -> None:
+        """
+        Forwards the events of the transport to the local subscribers until cancelled.
+
+        Once established, a lost subscription is logged and resubscribed with an
+        exponential backoff, so a transport error never reaches the task group.
+        """
+        assert self.transport is not None
+        with anyio.CancelScope() as scope:
+            try:
+                started = False
+                delay = self.resubscribe_delay
+                while True:
+                    try:
+                        async with self.transport.subscribe(self.name) as events:
+                            if not started:
+                                task_status.started(scope)
+                                started = True
+                            delay = self.resubscribe_delay
+                            async for event in events:
+                                await self._deliver(ChannelEvent(event))
+                    except Exception as e:
+                        if not started:
+                            raise
+                        logger.error(
+                            f"SSE channel '{self.name}' subscription failed: {e}", exc_info=True
+                        )
+                    await anyio.sleep(delay)
+                    delay = min(delay * 2, self.max_resubscribe_delay)
+            finally:
+                if self._upstream is scope:
+                    self._upstream = None
+
+    def _stop_upstream(self) -> None:
+        """
+        Releases the upstream subscription once the last local subscriber left.
+        """
+        if self._upstream is not None and not self._subscribers:
+            self._upstream.cancel()
+            self._upstream = None
 
-            # Cleanup disconnected subscribers
-            for q in dead:
-                self._subscribers.discard(q)
-                with anyio.move_on_after(0):
-                    await q.aclose()
+    async def _send_blocking(self, item: ChannelEvent) -> None:
+        """
+        Sends the event to every subscriber, waiting for the ones with a full buffer.
+        """
+        dead: list[ChannelSendStream] = []
+        # Iterate over a copy to allow safe mutation of the subscribers outside the loop
+        for q in list(self._subscribers):
+            try:
+                try:
+                    q.send_nowait(item)
+                except WouldBlock:
+                    await q.send(item)
+            except _DISCONNECTED_ERRORS:
+                # Connection error: mark subscriber for removal
+                dead.append(q)
+
+        # Cleanup disconnected subscribers
+        for q in dead:
+            self._disconnect(q)
+
+    def _send_nowait(self, item: ChannelEvent) -> None:
+        """
+        Sends the event to every subscriber without ever waiting, applying the
+        overflow policy to the subscribers with a full buffer.
+        """
+        dead: list[ChannelSendStream] = []
+        for q, recv in list(self._subscribers.items()):
+            try:
+                try:
+                    q.send_nowait(item)
+                except WouldBlock:
+                    if self.overflow == OverflowPolicy.DISCONNECT:
+                        dead.append(q)
+                        continue
+                    with contextlib.suppress(WouldBlock):
+                        recv.receive_nowait()
+                    q.send_nowait(item)
+            except (WouldBlock, *_DISCONNECTED_ERRORS):
+                dead.append(q)
+
+        for q in dead:
+            self._disconnect(q)
+
+    def _disconnect(self, send_stream: ChannelSendStream) -> None:
+        """
+        Removes a subscriber and closes its streams, ending its `listen()`.
+        """
+        recv = self._subscribers.pop(send_stream, None)
+        send_stream.close()
+        if recv is not None:
+            recv.close()
 
     async def listen(
         self,
         *,
         heartbeat_interval: float | None = 15.0,
-    ) -> AsyncGenerator[Eventdict, None]:
+        encoded: bool = False,
+        sep: str = "\n",
+        retry: int | None = None,
+    ) -> AsyncGenerator[Any, None]:
         """
         Subscribes a client to the channel, returning an asynchronous generator
         that yields `Eventdict` messages compatible with `EventStreamResponse`.
@@ -155,25 +371,46 @@ class SSEChannel:
             heartbeat_interval: The interval in seconds for sending a synthetic
                                 heartbeat event if no data is received. set to `None`
                                 to disable heartbeats. Defaults to 15.0s.
+            encoded: Yields the SSE wire bytes instead of the dictionaries. The bytes
+                     are encoded once per broadcast and shared by all the subscribers,
+                     and are sent as is by `EventStreamResponse`.
+            sep: The line separator of the wire bytes, which must match the `separator`
+                 of the `EventStreamResponse`. Only used with `encoded`.
+            retry: The default reconnect interval of the wire bytes, which must match the
+                   `retry` of the `EventStreamResponse`. Only used with `encoded`.
 
         Yields:
-            Eventdict: dictionary containing the SSE fields (e.g., {"event": "update", "data": ...}).
+            Eventdict: dictionary containing the SSE fields (e.g., {"event": "update", "data": ...}),
+                       or its wire bytes when `encoded` is set.
         """
-        # Create a zero-buffer memory stream for the current subscriber
+        if sep not in ("\r\n", "\r", "\n"):
+            raise ValueError(f"sep must be one of: \\r\\n, \\r, \\n, got: {sep}")
+        heartbeat_wire = (
+            HEARTBEAT_WIRE
+            if (sep, retry) == ("\n", None)
+            else encode_sse_event(HEARTBEAT_EVENT, sep=sep, retry=retry)
+        )
+
+        # Create the (bounded) memory stream for the current subscriber
         send_stream: ChannelSendStream
         recv_stream: ChannelReceiveStream
-        send_stream, recv_stream = anyio.create_memory_object_stream[Eventdict](max_buffer_size=0)
+        send_stream, recv_stream = anyio.create_memory_object_stream[ChannelEvent](
+            max_buffer_size=self.max_buffer_size
+        )
 
-        # Register the subscriber's send stream. Note: Lock isn't used here but is crucial
-        # in the original code's design for safety when removing streams in `broadcast`.
-        self._subscribers.add(send_stream)
+        # Register the subscriber, the receive stream is kept to apply the overflow policy
+        self._subscribers[send_stream] = recv_stream
 
         try:
+            if self.transport is not None:
+                await self._ensure_upstream()
+
             # Handle the case where no heartbeats are needed (simple forwarding)
             if heartbeat_interval is None:
-                async with recv_stream:
-                    async for item in recv_stream:
-                        yield item
+                with contextlib.suppress(ClosedResourceError):
+                    async with recv_stream:
+                        async for item in recv_stream:
+                            yield item.encode(sep=sep, retry=retry) if encoded else item.event
                 return
 
             # Handle heartbeats via receive timeout
@@ -186,10 +423,10 @@ class SSEChannel:
 
                         if scope.cancelled_caught:
                             # Timeout occurred: emit a heartbeat event
-                            yield {"event": "heartbeat", "data": "💓"}
+                            yield heartbeat_wire if encoded else dict(HEARTBEAT_EVENT)
                         else:
                             # Message received: yield the actual message
-                            yield item
+                            yield item.encode(sep=sep, retry=retry) if encoded else item.event
 
                     except (EndOfStream, ClosedResourceError, BrokenPipeError):
                         # Exit the loop on connection/stream errors
@@ -197,7 +434,9 @@ class SSEChannel:
 
         finally:
             # Cleanup logic executed upon generator exit or cancellation
-            self._subscribers.discard(send_stream)
+            self._subscribers.pop(send_stream, None)
+            if self.transport is not None:
+                self._stop_upstream()
             # Suppress exceptions during final close operations
             with contextlib.suppress(Exception):
                 await send_stream.aclose()
@@ -206,7 +445,7 @@ class SSEChannel:
 
 async def _stream_recv(
     recv: ChannelReceiveStream,
-) -> AsyncGenerator[Eventdict, None]:
+) -> AsyncGenerator[ChannelEvent, None]:
     """
     Internal helper to asynchronously iterate over an object stream and handle disconnection errors.
 
@@ -214,7 +453,7 @@ async def _stream_recv(
         recv: The receive stream of the memory channel.
 
     Yields:
-        Eventdict: Messages received from the stream.
+        ChannelEvent: Messages received from the stream.
     """
     try:
         # The async with statement handles closing the stream on successful iteration completion
@@ -236,12 +475,49 @@ class SSEChannelManager:
     until explicitly cleared.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_buffer_size: int = 0,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        transport: ChannelTransport | None = None,
+    ) -> None:
         """
         Initializes the manager with an empty dictionary for channels and an `anyio.Lock`.
+
+        Args:
+            max_buffer_size: The per-subscriber buffer size of the created channels.
+            overflow: The overflow policy of the created channels.
+            transport: The transport of the created channels. The manager must then be
+                       running (`async with manager:`, typically in the lifespan).
         """
         self._channels: dict[str, SSEChannel] = {}
         self._lock: anyio.Lock = anyio.Lock()
+        self.max_buffer_size: int = max_buffer_size
+        self.overflow: OverflowPolicy = OverflowPolicy(overflow)
+        self.transport: ChannelTransport | None = transport
+        self._task_group: TaskGroup | None = None
+
+    async def __aenter__(self) -> SSEChannelManager:
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        for channel in self._channels.values():
+            channel._task_group = self._task_group
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool | None:
+        task_group, self._task_group = self._task_group, None
+        assert task_group is not None
+        for channel in self._channels.values():
+            channel._task_group = None
+            channel._upstream = None
+        task_group.cancel_scope.cancel()
+        try:
+            return await task_group.__aexit__(*exc_info)
+        finally:
+            if self.transport is not None:
+                with anyio.CancelScope(shield=True):
+                    await self.transport.close()
 
     async def get_or_create(self, name: str) -> SSEChannel:
         """
@@ -256,7 +532,13 @@ class SSEChannelManager:
         async with self._lock:
             ch: SSEChannel | None = self._channels.get(name)
             if ch is None:
-                ch = SSEChannel(name)
+                ch = SSEChannel(
+                    name,
+                    max_buffer_size=self.max_buffer_size,
+                    overflow=self.overflow,
+                    transport=self.transport,
+                )
+                ch._task_group = self._task_group
                 self._channels[name] = ch
             return ch
 
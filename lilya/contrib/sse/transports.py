@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Any
+
+import anyio
+from anyio import BrokenResourceError, ClosedResourceError
+from anyio.streams.memory import MemoryObjectSendStream
+
+from lilya._internal._encoders import json_encode_bytes
+from lilya.serializers import serializer
+
+redis: Any
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # pragma: no cover
+    redis = None
+
+Eventdict = dict[str, Any]
+
+
+class ChannelTransport(ABC):
+    """
+    Carries the broadcasts of the SSE channels, possibly across processes.
+
+    A channel using a transport publishes its broadcasts through it and delivers to
+    its local subscribers the events received from a single upstream subscription,
+    shared by all the subscribers of the channel in the process.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, event: Eventdict) -> None:
+        """
+        Publishes an event to every subscription of the channel.
+
+        Args:
+            channel: The name of the channel.
+            event: The normalized event dictionary.
+        """
+        raise NotImplementedError("`publish()` must be implemented in subclasses.")
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> AbstractAsyncContextManager[AsyncIterator[Eventdict]]:
+        """
+        Subscribes to a channel.
+
+        The subscription is established when the context is entered and released when
+        it is exited.
+
+        Args:
+            channel: The name of the channel.
+
+        Returns:
+            An async context manager yielding an async iterator of the published events.
+        """
+        raise NotImplementedError("`subscribe()` must be implemented in subclasses.")
+
+    async def close(self) -> None:  # noqa: B027
+        """
+        Releases the resources of the transport.
+        """
+
+
+class InMemoryTransport(ChannelTransport):
+    """
+    A transport delivering the events within the current process only.
+    """
+
+    def __init__(self, max_buffer_size: int = 1024) -> None:
+        """
+        Args:
+            max_buffer_size: The number of events buffered per subscription.
+        """
+        self.max_buffer_size = max_buffer_size
+        self._subscriptions: dict[str, set[MemoryObjectSendStream[Eventdict]]] = {}
+
+    async def publish(self, channel: str, event: Eventdict) -> None:
+        for stream in list(self._subscriptions.get(channel, ())):
+            try:
+                await stream.send(event)
+            except (BrokenResourceError, ClosedResourceError):
+                self._subscriptions.get(channel, set()).discard(stream)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncGenerator[AsyncIterator[Eventdict], None]:
+        send_stream, recv_stream = anyio.create_memory_object_stream[Eventdict](
+            max_buffer_size=self.max_buffer_size
+        )
+        subscriptions = self._subscriptions.setdefault(channel, set())
+        subscriptions.add(send_stream)
+        try:
+            async with recv_stream:
+                yield recv_stream
+        finally:
+            subscriptions.discard(send_stream)
+            if not subscriptions:
+                self._subscriptions.pop(channel, None)
+            send_stream.close()
+
+
+class RedisTransport(ChannelTransport):
+    """
+    A transport using Redis pub/sub, delivering the events to every process
+    subscribed to the channel.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        *,
+        client: Any = None,
+        prefix: str = "lilya:sse:",
+    ) -> None:
+        """
+        Args:
+            redis_url: The Redis connection URL.
+            client: An existing `redis.asyncio.Redis` client, used instead of `redis_url`.
+                    The transport does not close a client it did not create.
+            prefix: The prefix of the Redis pub/sub channel names.
+
+        Raises:
+            ImportError: If the `redis` package is not installed.
+            ValueError: If neither `redis_url` nor `client` are provided.
+        """
+        # Only the clients created by the transport are closed by it
+        self._owns_client = client is None
+        if client is None:
+            if redis is None:
+                raise ImportError("You must install 'redis' to use the RedisTransport.")
+            if redis_url is None:
+                raise ValueError("Either `redis_url` or `client` must be provided.")
+            client = redis.Redis.from_url(redis_url, decode_responses=False)
+        self.client = client
+        self.prefix = prefix
+
+    async def publish(self, channel: str, event: Eventdict) -> None:
+        await self.client.publish(f"{self.prefix}{channel}", json_encode_bytes(event))
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncGenerator[AsyncIterator[Eventdict], None]:
+        name = f"{self.prefix}{channel}"
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(name)
+        try:
+            yield self._iterate(pubsub)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await pubsub.unsubscribe(name)
+                await pubsub.aclose()
+
+    @staticmethod
+    async def _iterate(pubsub: Any) -> AsyncGenerator[Eventdict, None]:
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                yield serializer.loads(message["data"])
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
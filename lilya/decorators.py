@@ -4,16 +4,20 @@ import hashlib
 import inspect
 import re
 import threading
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from functools import wraps
 from typing import Any
 
 import anyio
+import anyio.lowlevel
 from anyio.from_thread import start_blocking_portal
 
 from lilya._internal._encoders import json_encode  # noqa
 from lilya._internal._events import EventDispatcher  # noqa
 from lilya.compat import is_async_callable
+from lilya.concurrency import loop_thread
 from lilya.conf import _monkay  # noqa
 from lilya.logging import logger
 from lilya.protocols.cache import CacheBackend
@@ -131,8 +135,39 @@ def generate_cache_key(func: Callable, args: Any, kwargs: Any) -> str:
     return f"{key_base}:{key_hash}"
 
 
-# Lock for thread safety
-cache_lock = threading.Lock()
+# Sentinel for the absence of a stale value to fall back to
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheDecoratorStats:
+    """Snapshot of the counters of a `cache` decorator.
+
+    Attributes:
+        hits (int): Calls served with a fresh cached value.
+        misses (int): Calls that computed the value, or waited for another call computing it.
+        coalesced (int): Misses that waited for another call computing the same key.
+        stale (int): Calls served with a stale value, while a refresh runs or after it failed.
+    """
+
+    hits: int
+    misses: int
+    coalesced: int
+    stale: int
+
+
+class _Flight:
+    """
+    The computation of a key in progress, shared by the concurrent calls of that key.
+    """
+
+    __slots__ = ("event", "done", "result", "error")
+
+    def __init__(self, event: Any) -> None:
+        self.event = event
+        self.done = False
+        self.result: Any = None
+        self.error: BaseException | None = None
 
 
 class cache:  # noqa
@@ -143,6 +178,13 @@ class cache:  # noqa
     thread safety for cache operations. It prevents repeated expensive computations by caching the result
     of function calls and returning cached values when available.
 
+    Concurrent calls missing the same key are coalesced: a single call computes the value while
+    the others wait for its result, so an expiring hot key does not stampede the data source.
+
+    With `stale_while_revalidate`, an expired value keeps being served for that many seconds
+    while a single background call refreshes it. With `stale_if_error`, an expired value is
+    served for that many seconds when computing a new one raises an exception.
+
     If the cache backend fails, the function executes normally, and errors are logged without
     affecting the function's behavior.
 
@@ -151,23 +193,56 @@ class cache:  # noqa
             - If `None`, the cache entry never expires.
         backend (Optional[CacheBackend]): Custom cache backend to store the data.
             - Defaults to `settings.cache_backend` if not provided.
+        stale_while_revalidate (int): Seconds an expired value is served while it is refreshed.
+        stale_if_error (int): Seconds an expired value is served when refreshing it fails.
 
     Example:
-        >>> @cache(ttl=10)
+        >>> @cache(ttl=10, stale_while_revalidate=30)
         >>> async def get_data():
         >>>     return "expensive_computation"
     """
 
-    def __init__(self, ttl: int | None = None, backend: CacheBackend | None = None) -> None:
+    def __init__(
+        self,
+        ttl: int | None = None,
+        backend: CacheBackend | None = None,
+        *,
+        stale_while_revalidate: int = 0,
+        stale_if_error: int = 0,
+    ) -> None:
         """
         Initializes the caching decorator with optional TTL and a cache backend.
 
         Args:
             ttl (Optional[int]): Time in seconds before a cache entry expires.
             backend (Optional[CacheBackend]): The cache backend implementation.
+            stale_while_revalidate (int): Seconds an expired value is served while it is refreshed.
+            stale_if_error (int): Seconds an expired value is served when refreshing it fails.
+
+        Raises:
+            ValueError: If a stale window is negative.
         """
+        if stale_while_revalidate < 0 or stale_if_error < 0:
+            raise ValueError("`stale_while_revalidate` and `stale_if_error` cannot be negative.")
+
         self.ttl = ttl or _monkay.settings.cache_default_ttl
         self.backend = backend or _monkay.settings.cache_backend
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+
+        # Keyed by the event loop too, as its events cannot be awaited from another loop
+        self._flights: dict[tuple[Any, str], _Flight] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._stale = 0
+
+    @property
+    def _keeps_stale(self) -> bool:
+        return bool(self.ttl) and (self.stale_while_revalidate > 0 or self.stale_if_error > 0)
 
     def __call__(self, func: Callable) -> Any:
         """
@@ -177,9 +252,11 @@ class cache:  # noqa
         and applies the appropriate caching mechanism.
 
         - **For async functions**, it awaits the result and caches it.
-        - **For sync functions**, it uses `anyio.run()` to interact with the async cache backend.
+        - **For sync functions**, it uses the synchronous methods of the cache backend.
 
         If a cache backend failure occurs, the function runs as usual, and the error is logged.
+        The counters of the decorator are available through the `cache_stats()` attribute
+        of the wrapped function.
 
         Args:
             func (Callable): The function to be decorated.
@@ -206,24 +283,23 @@ class cache:  # noqa
                 """
                 key = generate_cache_key(func, args, kwargs)
 
-                async with anyio.Lock():  # Ensure async thread safety
-                    try:
-                        cached_value = await self.backend.get(key)
-                        if cached_value is not None:
-                            return cached_value
-                    except Exception as e:
-                        logger.error(f"Cache backend failure in get(): {e}", exc_info=True)
+                try:
+                    cached_value = await self.backend.get(key)
+                except Exception as e:
+                    logger.error(f"Cache backend failure in get(): {e}", exc_info=True)
+                    cached_value = None
 
-                    # Proceed with function execution if cache fails
-                    result = await func(*args, **kwargs)
+                value, action = self._classify(cached_value)
+                if action == "hit":
+                    return value
+                if action == "revalidate":
+                    self._refresh_async(key, func, args, kwargs)
+                    return value
 
-                    try:
-                        await self.backend.set(key, result, self.ttl)
-                    except Exception as e:
-                        logger.error(f"Cache backend failure in set(): {e}", exc_info=True)
-
-                    return result
+                # Proceed with function execution on a miss or if the cache fails
+                return await self._load_async(key, func, args, kwargs, fallback=value)
 
+            async_wrapper.cache_stats = self.stats  # type: ignore[attr-defined]
             return async_wrapper
 
         else:  # Handle sync functions with AnyIO for thread safety
@@ -233,7 +309,9 @@ class cache:  # noqa
                 """
                 Synchronous cache wrapper.
 
-                Uses `anyio.run()` to interact with the async cache backend safely.
+                Uses the synchronous methods of the cache backend (`sync_get`, `sync_set`),
+                which run the async ones in a shared event loop thread unless the backend
+                implements them natively.
 
                 Args:
                     *args: Positional arguments for the decorated function.
@@ -244,36 +322,218 @@ class cache:  # noqa
                 """
                 key = generate_cache_key(func, args, kwargs)
 
-                with cache_lock:  # Ensure sync thread safety
-                    try:
+                try:
+                    cached_value = self.backend.sync_get(key)
+                except Exception as e:
+                    logger.error(f"Cache backend failure in get(): {e}", exc_info=True)
+                    cached_value = None
 
-                        async def get_cached() -> Any:
-                            """Retrieve a cached value asynchronously inside a sync function."""
-                            return await self.backend.get(key)
+                value, action = self._classify(cached_value)
+                if action == "hit":
+                    return value
+                if action == "revalidate":
+                    self._refresh_sync(key, func, args, kwargs)
+                    return value
 
-                        cached_value = anyio.run(get_cached)
+                # Proceed with function execution on a miss or if the cache fails
+                return self._load_sync(key, func, args, kwargs, fallback=value)
 
-                        if cached_value is not None:
-                            return cached_value
-                    except Exception as e:
-                        logger.error(f"Cache backend failure in get(): {e}", exc_info=True)
+            sync_wrapper.cache_stats = self.stats  # type: ignore[attr-defined]
+            return sync_wrapper
 
-                    # Proceed with function execution if cache fails
-                    result = func(*args, **kwargs)
+    def stats(self) -> CacheDecoratorStats:
+        """
+        Returns a snapshot of the decorator counters.
 
-                    try:
+        Returns:
+            CacheDecoratorStats: The hits, misses, coalesced misses and stale values served.
+        """
+        with self._lock:
+            return CacheDecoratorStats(
+                hits=self._hits, misses=self._misses, coalesced=self._coalesced, stale=self._stale
+            )
 
-                        async def set_cache() -> None:
-                            """Store a computed value asynchronously inside a sync function."""
-                            await self.backend.set(key, result, self.ttl)
+    def _classify(self, cached_value: Any) -> tuple[Any, str]:
+        """
+        Unwraps a cached value and decides how to serve it.
 
-                        anyio.run(set_cache)
-                    except Exception as e:
-                        logger.error(f"Cache backend failure in set(): {e}", exc_info=True)
+        Returns:
+            The value and the action: `"hit"` to serve it, `"revalidate"` to serve it and
+            refresh it in the background, or `"miss"` to compute it, the value being the
+            stale value to fall back to on errors (`_MISSING` if none).
+        """
+        if cached_value is None:
+            self._increment("_misses")
+            return _MISSING, "miss"
+        if not self._keeps_stale or not (
+            isinstance(cached_value, dict) and cached_value.keys() == {"value", "expires_at"}
+        ):
+            self._increment("_hits")
+            return cached_value, "hit"
+
+        value, expires_at = cached_value["value"], cached_value["expires_at"]
+        overdue = time.time() - expires_at
+        if overdue <= 0:
+            self._increment("_hits")
+            return value, "hit"
+        if overdue <= self.stale_while_revalidate:
+            self._increment("_stale")
+            return value, "revalidate"
+
+        self._increment("_misses")
+        return (value if overdue <= self.stale_if_error else _MISSING), "miss"
+
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _entry(self, result: Any) -> tuple[Any, int | None]:
+        """
+        The value to store for a result and its time-to-live in the backend.
+        """
+        if not self._keeps_stale:
+            return result, self.ttl
+
+        ttl = self.ttl + max(self.stale_while_revalidate, self.stale_if_error)
+        return {"value": result, "expires_at": time.time() + self.ttl}, ttl
+
+    def _on_error(self, key: str, error: Exception, fallback: Any) -> Any:
+        if fallback is _MISSING:
+            raise error
+        logger.warning(f"Serving the stale value of {key}, computing it failed: {error}")
+        self._increment("_stale")
+        return fallback
+
+    async def _load_async(
+        self, key: str, func: Callable, args: Any, kwargs: Any, fallback: Any
+    ) -> Any:
+        """
+        Computes and stores the value of a key, or waits for the call of the running event
+        loop already computing it.
+        """
+        flight_key = (anyio.lowlevel.current_token(), key)
+        while True:
+            with self._lock:
+                flight = self._flights.get(flight_key)
+                if flight is None:
+                    flight = self._flights[flight_key] = _Flight(anyio.Event())
+                    break
+                self._coalesced += 1
+
+            await flight.event.wait()
+            if flight.done:
+                if flight.error is not None:
+                    return self._on_error(key, flight.error, fallback)  # type: ignore[arg-type]
+                return flight.result
+            # The computing call was cancelled, take over
+
+        try:
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                flight.error = e
+                flight.done = True
+                return self._on_error(key, e, fallback)
 
-                    return result
+            value, ttl = self._entry(result)
+            try:
+                await self.backend.set(key, value, ttl)
+            except Exception as e:
+                logger.error(f"Cache backend failure in set(): {e}", exc_info=True)
 
-            return sync_wrapper
+            flight.result = result
+            flight.done = True
+            return result
+        finally:
+            with self._lock:
+                del self._flights[flight_key]
+            flight.event.set()
+
+    def _refresh_async(self, key: str, func: Callable, args: Any, kwargs: Any) -> None:
+        """
+        Refreshes the value of a key in the shared loop thread, once at a time.
+        """
+        with self._lock:
+            if key in self._refreshing or (anyio.lowlevel.current_token(), key) in self._flights:
+                return
+            self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                await self._load_async(key, func, args, kwargs, fallback=_MISSING)
+            except Exception as e:
+                logger.error(f"Cache refresh of {key} failed: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        try:
+            loop_thread.start_soon(refresh)
+        except BaseException:
+            with self._lock:
+                self._refreshing.discard(key)
+            raise
+
+    def _load_sync(self, key: str, func: Callable, args: Any, kwargs: Any, fallback: Any) -> Any:
+        """
+        Computes and stores the value of a key, or waits for the thread already computing it.
+        """
+        flight_key = (None, key)
+        while True:
+            with self._lock:
+                flight = self._flights.get(flight_key)
+                if flight is None:
+                    flight = self._flights[flight_key] = _Flight(threading.Event())
+                    break
+                self._coalesced += 1
+
+            flight.event.wait()
+            if flight.done:
+                if flight.error is not None:
+                    return self._on_error(key, flight.error, fallback)  # type: ignore[arg-type]
+                return flight.result
+
+        try:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                flight.error = e
+                flight.done = True
+                return self._on_error(key, e, fallback)
+
+            value, ttl = self._entry(result)
+            try:
+                self.backend.sync_set(key, value, ttl)
+            except Exception as e:
+                logger.error(f"Cache backend failure in set(): {e}", exc_info=True)
+
+            flight.result = result
+            flight.done = True
+            return result
+        finally:
+            with self._lock:
+                del self._flights[flight_key]
+            flight.event.set()
+
+    def _refresh_sync(self, key: str, func: Callable, args: Any, kwargs: Any) -> None:
+        """
+        Refreshes the value of a key in a background thread, once at a time.
+        """
+        with self._lock:
+            if key in self._refreshing or (None, key) in self._flights:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._load_sync(key, func, args, kwargs, fallback=_MISSING)
+            except Exception as e:
+                logger.error(f"Cache refresh of {key} failed: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"cache-refresh-{key}", daemon=True).start()
 
     def invalidate(self, func: Callable, *args: Any, **kwargs: Any) -> None:
         """
@@ -296,13 +556,7 @@ class cache:  # noqa
         """
         key = generate_cache_key(func, args, kwargs)
 
-        with cache_lock:  # Prevent multiple threads from invalidating at the same time
-            try:
-
-                async def delete_cache() -> None:
-                    """Delete a cache entry asynchronously."""
-                    await self.backend.delete(key)
-
-                anyio.run(delete_cache)
-            except Exception as e:
-                logger.error(f"Cache backend failure in delete(): {e}", exc_info=True)
+        try:
+            self.backend.sync_delete(key)
+        except Exception as e:
+            logger.error(f"Cache backend failure in delete(): {e}", exc_info=True)
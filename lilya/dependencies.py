@@ -8,6 +8,8 @@ from functools import cached_property, lru_cache, wraps
 from types import GeneratorType
 from typing import Any, TypeVar, cast
 
+import anyio
+
 from lilya._internal._scopes import scope_manager
 from lilya.compat import is_async_callable, run_sync
 from lilya.enums import Scope, SignatureDefault
@@ -53,6 +55,68 @@ def wrap_dependency(
     return dependency
 
 
+class DependencyPlan:
+    """
+    The introspection of a dependency callable, computed once per `Provide`.
+
+    Holds everything `Provide` needs from the signature of the dependency so that
+    resolving it on every request does not inspect it again.
+    """
+
+    __slots__ = (
+        "parameters",
+        "parameter_names",
+        "marker_names",
+        "is_coroutine",
+        "is_generator",
+        "is_async",
+        "is_class",
+        "accepts_request",
+        "first_parameter",
+        "sole_positional",
+    )
+
+    def __init__(self, dependency: Callable[..., Any], signature: inspect.Signature) -> None:
+        params = signature.parameters
+
+        self.parameter_names: frozenset[str] = frozenset(params)
+        self.parameters: tuple[str, ...] = tuple(
+            name
+            for name, param in params.items()
+            if param.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        )
+        self.marker_names: frozenset[str] = frozenset(
+            name
+            for name in self.parameters
+            if isinstance(params[name].default, (Resolve, Security))
+        )
+        self.is_class: bool = inspect.isclass(dependency)
+        self.is_coroutine: bool = inspect.iscoroutinefunction(dependency) or is_async_callable(
+            dependency
+        )
+        self.is_generator: bool = inspect.isgeneratorfunction(
+            dependency
+        ) or inspect.isasyncgenfunction(dependency)
+        # Whether resolving the dependency awaits I/O, making it worth running concurrently.
+        # Generator dependencies are not: they are entered in the task resolving them and
+        # closed by the request cleanup, so they must stay in the calling task.
+        self.is_async: bool = self.is_coroutine and not self.is_generator
+        self.accepts_request: bool = "request" in params
+        self.first_parameter: str | None = next(iter(params), None)
+
+        # The name of the only parameter when the dependency takes exactly one
+        # positional parameter without a default, candidate for request injection.
+        self.sole_positional: str | None = None
+        if len(params) == 1:
+            param = next(iter(params.values()))
+            if (
+                param.kind
+                in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                and param.default is inspect.Parameter.empty
+            ):
+                self.sole_positional = param.name
+
+
 class Provide:
     """
     A request-aware dependency marker and wrapper.
@@ -104,6 +168,7 @@ class Provide:
         self.scope: Scope | None = scope
         self._cache: Any = None
         self._resolved: bool = False
+        self._cache_lock: anyio.Lock | None = None
         self.__dependency_signature__: inspect.Signature | None = None
 
     @cached_property
@@ -116,6 +181,14 @@ class Provide:
             self.__dependency_signature__ = inspect.signature(self.dependency)
         return self.__dependency_signature__
 
+    @cached_property
+    def plan(self) -> DependencyPlan:
+        """
+        The `DependencyPlan` of the dependency, compiled on first use and reused
+        by every later resolution.
+        """
+        return DependencyPlan(self.dependency, self.__signature__)
+
     async def resolve(
         self,
         request: Request,
@@ -135,9 +208,30 @@ class Provide:
             The fully resolved dependency instance.
         """
         # Return cached value if already resolved for this resolution call
-        if self.use_cache and self._resolved:
-            return self._cache
+        if self.use_cache:
+            if self._resolved:
+                return self._cache
+
+            # Concurrent resolutions of the same cached provider wait for the first one,
+            # the lock being kept for the lifetime of the provider
+            if self._cache_lock is None:
+                self._cache_lock = anyio.Lock()
+            async with self._cache_lock:
+                if self._resolved:
+                    return self._cache
+                return await self._resolve_scoped(request, dependencies_map)
 
+        return await self._resolve_scoped(request, dependencies_map)
+
+    async def _resolve_scoped(
+        self,
+        request: Request,
+        dependencies_map: dict[str, Self | Any],
+    ) -> Any:
+        """
+        Resolves the dependency through the `scope_manager` for the APP and GLOBAL
+        scopes, or directly for the REQUEST scope.
+        """
         if self.scope in (Scope.APP, Scope.GLOBAL):
 
             async def _factory() -> Any:
@@ -189,26 +283,26 @@ class Provide:
         Internal dependency resolution logic, executed when creating a new instance
         (used by resolve() and scope_manager).
         """
+        plan = self.plan
+
         # Try to update provided_kwargs with request data if relevant
-        if self.__signature__.parameters:
+        if plan.parameter_names:
             try:
                 # Attempt to parse request body data (JSON)
                 json_data = cast(dict[str, Any], await request.data()) or {}
             except Exception:
                 json_data = {}
 
-            param_names = self.__signature__.parameters.keys()
-
             # Map body data to unprovided parameters
             for key, value in json_data.items():
-                if key in param_names and key not in dependencies_map:
+                if key in plan.parameter_names and key not in dependencies_map:
                     self.provided_kwargs[key] = value
 
         # Direct Call Optimization
         # If explicit arguments were provided or dependency is a class, call directly,
         # bypassing nested dependency resolution (since inspection isn't needed).
-        if self.provided_args or self.provided_kwargs or inspect.isclass(self.dependency):
-            if inspect.iscoroutinefunction(self.dependency) or is_async_callable(self.dependency):
+        if self.provided_args or self.provided_kwargs or plan.is_class:
+            if plan.is_coroutine:
                 result = await self.dependency(*self.provided_args, **self.provided_kwargs)
             else:
                 result = self.dependency(*self.provided_args, **self.provided_kwargs)
@@ -219,16 +313,13 @@ class Provide:
             return result
 
         # Nested Dependency Resolution ---
-        sig = inspect.signature(self.dependency)
         kwargs: dict[str, Any] = {}
+        providers: dict[str, Provide] = {}
 
         # Resolve each parameter of this dependency function
-        for name, param in sig.parameters.items():
-            if param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
-                continue
-
+        for name in plan.parameters:
             # If default is a marker (Resolve, Security), resolve the whole tree
-            if isinstance(param.default, (Resolve, Security)):
+            if name in plan.marker_names:
                 # Note: This recursive call logic seems to resolve all dependencies for the *parent* function again
                 kwargs[name] = await async_resolve_dependencies(
                     request=request,
@@ -240,8 +331,8 @@ class Provide:
                 dep = dependencies_map[name]
 
                 if isinstance(dep, Provide):
-                    # Recursive resolution for nested Provide instances
-                    kwargs[name] = await dep.resolve(request, dependencies_map)
+                    # Nested Provide instances are resolved together below
+                    providers[name] = dep
                 elif hasattr(dep, "resolve"):
                     # Resolve generic dependency objects (like Security or custom types)
                     try:
@@ -274,37 +365,30 @@ class Provide:
                     # Direct value injection
                     kwargs[name] = dep
 
-        call_kwargs = {**self.provided_kwargs, **kwargs}
+        if providers:
+            kwargs.update(await resolve_providers(request, providers, dependencies_map))
 
-        dep_sig = inspect.signature(self.dependency)
-        dep_params = dep_sig.parameters
+        call_kwargs = {**self.provided_kwargs, **kwargs}
 
         # Automatic Request/Connection Injection Logic
-        should_inject_request = False
-
-        if len(dep_params) > 0:
-            # Case 1: explicit "request" param
-            if "request" in dep_params and "request" not in call_kwargs:
-                should_inject_request = True
-            # Case 2: exactly one positional argument, no defaults, and no args/kwargs provided
-            elif (
-                len(dep_params) == 1
-                and next(iter(dep_params.values())).kind
-                in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-                and next(iter(dep_params.values())).default is inspect._empty
-                and not self.provided_args
-                and not self.provided_kwargs
-                and next(iter(dep_params.keys())) not in call_kwargs
-            ):
-                should_inject_request = True
-
-        if should_inject_request:
-            # Get the name of the first/target parameter
-            param_name = next(iter(dep_params.keys()))
-            call_kwargs[param_name] = request
+        # Case 1: explicit "request" param
+        # Case 2: exactly one positional argument, no defaults, and no args/kwargs provided
+        request_param: str | None = None
+        if plan.accepts_request and "request" not in call_kwargs:
+            request_param = plan.first_parameter
+        elif (
+            plan.sole_positional is not None
+            and not self.provided_args
+            and not self.provided_kwargs
+            and plan.sole_positional not in call_kwargs
+        ):
+            request_param = plan.sole_positional
+
+        if request_param is not None:
+            call_kwargs[request_param] = request
 
         # Final Dependency Call
-        if inspect.iscoroutinefunction(self.dependency) or is_async_callable(self.dependency):
+        if plan.is_coroutine:
             result = await self.dependency(*self.provided_args, **call_kwargs)
         else:
             result = self.dependency(*self.provided_args, **call_kwargs)
@@ -399,6 +483,116 @@ class Security(Provide):
         self.scopes: Sequence[str] = scopes or []
 
 
+def _is_concurrent(
+    provider: Provide, dependencies_map: dict[str, Any], seen: set[int] | None = None
+) -> bool:
+    """
+    Whether a provider can be resolved in a child task.
+
+    Only coroutine dependencies qualify, and only when none of the dependencies they
+    resolve in turn is a generator, which would otherwise be entered in the child task
+    and closed in another one.
+    """
+    plan = provider.plan
+    if not plan.is_async or plan.marker_names:
+        return False
+    if provider.provided_args or provider.provided_kwargs or plan.is_class:
+        return True
+
+    seen = seen if seen is not None else set()
+    seen.add(id(provider))
+    for name in plan.parameters:
+        dep = dependencies_map.get(name)
+        if not isinstance(dep, Provide) or id(dep) in seen:
+            continue
+        if dep.plan.is_generator or dep.plan.marker_names:
+            return False
+        if dep.plan.is_async and not _is_concurrent(dep, dependencies_map, seen):
+            return False
+    return True
+
+
+async def resolve_providers(
+    request: Request | WebSocket,
+    providers: dict[str, Provide],
+    dependencies_map: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Resolves sibling `Provide` instances, running the asynchronous ones concurrently.
+
+    The providers are resolved in declaration order. When two or more consecutive
+    providers are coroutine dependencies, they run in a task group so the caller waits
+    for the slowest of them instead of the sum of their latencies. Synchronous and
+    generator dependencies are resolved in the calling task, between those groups.
+    Providers shared between siblings with `use_cache`, and the APP/GLOBAL scoped ones,
+    are still created once.
+
+    Args:
+        request: The current connection object (Request or WebSocket).
+        providers: The providers to resolve, by parameter name.
+        dependencies_map: The merged dependencies available for nested resolution.
+
+    Returns:
+        The resolved values, by parameter name.
+    """
+    resolved: dict[str, Any] = {}
+    batch: dict[str, Provide] = {}
+
+    for name, provider in providers.items():
+        if _is_concurrent(provider, dependencies_map):
+            batch[name] = provider
+            continue
+        if batch:
+            await _resolve_concurrently(request, batch, dependencies_map, resolved)
+            batch = {}
+        resolved[name] = await provider.resolve(request, dependencies_map)  # type: ignore[arg-type]
+
+    if batch:
+        await _resolve_concurrently(request, batch, dependencies_map, resolved)
+
+    # Keep the declaration order of the parameters
+    return {name: resolved[name] for name in providers}
+
+
+async def _resolve_concurrently(
+    request: Request | WebSocket,
+    providers: dict[str, Provide],
+    dependencies_map: dict[str, Any],
+    resolved: dict[str, Any],
+) -> None:
+    """
+    Resolves coroutine providers in a task group, storing the values in `resolved`.
+    """
+    if len(providers) == 1:
+        for name, provider in providers.items():
+            resolved[name] = await provider.resolve(request, dependencies_map)  # type: ignore[arg-type]
+        return
+
+    # The body is read once up front, the concurrent resolutions then share the
+    # parsed payload instead of racing on the receive channel.
+    if any(provider.plan.parameter_names for provider in providers.values()):
+        with contextlib.suppress(Exception):
+            await request.data()  # type: ignore[union-attr]
+
+    async def _resolve(name: str, provider: Provide) -> None:
+        resolved[name] = await provider.resolve(request, dependencies_map)  # type: ignore[arg-type]
+
+    try:
+        async with anyio.create_task_group() as tg:
+            for name, provider in providers.items():
+                tg.start_soon(_resolve, name, provider)
+    except BaseException as exc:
+        # Surface the error of a single failing dependency (e.g. an HTTPException)
+        # rather than the exception group wrapping it. When several dependencies
+        # failed, the group is raised with all of them.
+        error = exc
+        while len(getattr(error, "exceptions", ())) == 1:
+            error = error.exceptions[0]  # type: ignore[attr-defined]
+        if error is exc:
+            raise
+        raise error from None
+
+
 async def async_resolve_dependencies(
     request: Request | WebSocket,
     func: Callable[..., Any],
@@ -5,6 +5,7 @@ from lilya._internal._encoders import (
     MoldingProtocol,
     apply_structure,
     json_encode,
+    json_encode_bytes,
     register_encoder,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "EncoderProtocol",
     "MoldingProtocol",
     "json_encode",
+    "json_encode_bytes",
     "apply_structure",
 ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import ClassVar
+
 from lilya.conf import settings
 from lilya.datastructures import Header
 from lilya.protocols.middleware import MiddlewareProtocol
@@ -7,6 +9,8 @@ from lilya.types import ASGIApp, Message, Receive, Scope, Send
 
 
 class XFrameOptionsMiddleware(MiddlewareProtocol):
+    __preserves_scope__: ClassVar[bool] = True
+
     def __init__(self, app: ASGIApp):
         self.app = app
 
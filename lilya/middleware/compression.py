@@ -1,89 +1,439 @@
 from __future__ import annotations
 
 import gzip
-import io
-from functools import cached_property
-from typing import NoReturn
-
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+from fnmatch import fnmatchcase
+from typing import Any, ClassVar, NoReturn
+
+from lilya.concurrency import run_in_threadpool
 from lilya.datastructures import Header
 from lilya.protocols.middleware import MiddlewareProtocol
 from lilya.types import ASGIApp, Message, Receive, Scope, Send
 
+brotli: Any
+zstandard: Any
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    try:
+        import brotlicffi as brotli  # ty: ignore[unresolved-import]
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+DEFAULT_ENCODINGS: tuple[str, ...] = ("zstd", "br", "gzip")
+"""The encodings offered by `CompressionMiddleware`, in order of preference."""
+
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+"""The size from which the bodies are compressed in a worker thread."""
+
+DEFAULT_COMPRESSIBLE_TYPES: tuple[str, ...] = (
+    "text/*",
+    "application/json",
+    "application/*+json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/*+xml",
+    "application/javascript",
+    "application/x-javascript",
+    "application/graphql-response+json",
+    "application/wasm",
+    "image/svg+xml",
+    "image/x-icon",
+    "font/ttf",
+    "font/otf",
+)
+"""
+The media types compressed by default. Images, audio, video, archives and the
+other already compressed formats are left alone.
+"""
+
+
+class Compressor(ABC):
+    """
+    The incremental compressor of a single response body.
 
-class GZipMiddleware(MiddlewareProtocol):
+    `flush()` makes everything written so far decodable by the client without
+    ending the stream, `finish()` ends it.
     """
-    Middleware to compress responses with GZip.
+
+    encoding: ClassVar[str]
+    default_level: ClassVar[int]
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Whether the library implementing the encoding is installed.
+        """
+        return True
+
+    @abstractmethod
+    def __init__(self, level: int) -> None: ...
+
+    @classmethod
+    @abstractmethod
+    def compress_body(cls, data: bytes, level: int) -> bytes:
+        """
+        Compresses a whole body in one call, without building an incremental compressor.
+        """
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes: ...
+
+    @abstractmethod
+    def flush(self) -> bytes: ...
+
+    @abstractmethod
+    def finish(self) -> bytes: ...
+
+
+class GZipCompressor(Compressor):
+    encoding = "gzip"
+    default_level = 6
+
+    @classmethod
+    def compress_body(cls, data: bytes, level: int) -> bytes:
+        return gzip.compress(data, compresslevel=level, mtime=0)
+
+    def __init__(self, level: int) -> None:
+        # wbits=31 writes the gzip header and trailer around the deflate stream
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor(Compressor):
+    encoding = "br"
+    default_level = 4
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return brotli is not None
+
+    @classmethod
+    def compress_body(cls, data: bytes, level: int) -> bytes:
+        return brotli.compress(data, quality=level)
+
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor(Compressor):
+    encoding = "zstd"
+    default_level = 3
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return zstandard is not None
+
+    # The compression contexts of each thread by level. A context is not thread safe
+    # but can compress any number of bodies one after the other.
+    _contexts = threading.local()
+
+    @classmethod
+    def compress_body(cls, data: bytes, level: int) -> bytes:
+        contexts: dict[int, Any] | None = getattr(cls._contexts, "by_level", None)
+        if contexts is None:
+            contexts = cls._contexts.by_level = {}
+        context = contexts.get(level)
+        if context is None:
+            context = contexts[level] = zstandard.ZstdCompressor(level=level)
+        return context.compress(data)
+
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+COMPRESSORS: dict[str, type[Compressor]] = {
+    compressor.encoding: compressor
+    for compressor in (ZstdCompressor, BrotliCompressor, GZipCompressor)
+}
+"""The compressors by content coding name."""
+
+
+def parse_accept_encoding(value: str) -> dict[str, float]:
+    """
+    Parses an `Accept-Encoding` header into the quality value of each coding.
+
+    Codings with an invalid quality value are ignored.
+
+    Args:
+        value: The raw header value, e.g. `"gzip;q=0.8, br, *;q=0"`.
+
+    Returns:
+        The quality values by lowercased coding name.
+    """
+    qualities: dict[str, float] = {}
+    for item in value.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, param_value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = -1.0
+        if 0.0 <= quality <= 1.0:
+            qualities[coding] = quality
+    return qualities
+
+
+def matches_media_type(media_type: str, patterns: Sequence[str]) -> bool:
+    """
+    Whether a media type matches one of the `fnmatch` patterns, e.g. `text/*`.
+
+    Args:
+        media_type: The lowercased media type, without parameters.
+        patterns: The patterns of the compressible media types.
+    """
+    return any(fnmatchcase(media_type, pattern) for pattern in patterns)
+
+
+def accepted_encodings(accept_encoding: str, encodings: Sequence[str]) -> list[str]:
+    """
+    Orders the codings a server can produce by the preference of the client.
+
+    The codings are sorted by decreasing quality value in `Accept-Encoding`, ties
+    keeping the order of `encodings`. `*` stands for the codings not listed and the
+    refused ones (`q=0`) are left out.
+
+    Args:
+        accept_encoding: The `Accept-Encoding` header of the request.
+        encodings: The codings the server can produce, in order of preference.
+
+    Returns:
+        The acceptable codings, the best first.
+    """
+    qualities = parse_accept_encoding(accept_encoding)
+    wildcard = qualities.get("*", 0.0)
+
+    ranked = [(qualities.get(encoding, wildcard), encoding) for encoding in encodings]
+    # sorted() is stable, so equal qualities keep the server preference
+    return [
+        encoding
+        for quality, encoding in sorted(ranked, key=lambda item: -item[0])
+        if quality > 0.0
+    ]
+
+
+def negotiate_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """
+    Picks the content coding of a response from the `Accept-Encoding` of the request.
+
+    The coding with the highest quality value wins, ties going to the first one in
+    `encodings`. `*` stands for the codings not listed and `q=0` refuses a coding.
+
+    Args:
+        accept_encoding: The `Accept-Encoding` header of the request.
+        encodings: The codings the server can produce, in order of preference.
+
+    Returns:
+        The chosen coding, or None if the response should not be compressed.
+    """
+    accepted = accepted_encodings(accept_encoding, encodings)
+    return accepted[0] if accepted else None
+
+
+class CompressionMiddleware(MiddlewareProtocol):
+    """
+    Middleware compressing the responses with the best content coding accepted by the client.
+
+    The codings are negotiated from the quality values of `Accept-Encoding` among
+    zstd, brotli and gzip, the first two being offered only when `zstandard` and
+    `brotli` (or `brotlicffi`) are installed.
 
     Args:
         app: The 'next' ASGI app to call.
         minimum_size: Minimum response size to trigger compression.
-        compresslevel: GZip compression level (0 to 9).
+        encodings: The codings to offer, in order of preference.
+        levels: The compression level by coding, overriding the defaults (zstd 3, br 4, gzip 6).
+        compressible_types: The media types to compress, supporting `fnmatch` patterns such as
+            `text/*` or `application/*+json`. None compresses every media type.
+        offload_threshold: The size from which a body (or a streamed chunk) is compressed in a
+            worker thread instead of the event loop. None always compresses in the event loop.
     """
 
-    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9) -> None:
+    __preserves_scope__: ClassVar[bool] = True
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        encodings: Sequence[str] = DEFAULT_ENCODINGS,
+        levels: Mapping[str, int] | None = None,
+        compressible_types: Sequence[str] | None = DEFAULT_COMPRESSIBLE_TYPES,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
         """
-        Initialize GZipMiddleware.
+        Initialize CompressionMiddleware.
 
         Args:
             app: The 'next' ASGI app to call.
             minimum_size: Minimum response size to trigger compression.
-            compresslevel: GZip compression level (0 to 9).
+            encodings: The codings to offer, in order of preference.
+            levels: The compression level by coding.
+            compressible_types: The media types to compress, None compresses every media type.
+            offload_threshold: The size from which a body is compressed in a worker thread.
+
+        Raises:
+            ValueError: If an encoding is not supported.
         """
+        for encoding in encodings:
+            if encoding not in COMPRESSORS:
+                raise ValueError(
+                    f"Unsupported encoding '{encoding}'. Use one of: {list(COMPRESSORS)}"
+                )
+
         self.app = app
         self.minimum_size = minimum_size
-        self.compresslevel = compresslevel
+        self.encodings = tuple(
+            encoding for encoding in encodings if COMPRESSORS[encoding].is_available()
+        )
+        self.levels = {
+            encoding: COMPRESSORS[encoding].default_level for encoding in self.encodings
+        }
+        self.levels.update(levels or {})
+        self.compressible_types = (
+            tuple(compressible_types) if compressible_types is not None else None
+        )
+        self.offload_threshold = offload_threshold
+        self._compressible_cache: dict[str, bool] = {}
+
+    def is_compressible(self, content_type: str | None) -> bool:
+        """
+        Whether a response of the given `Content-Type` should be compressed.
+
+        Responses without a `Content-Type` are compressed.
+        """
+        if self.compressible_types is None or not content_type:
+            return True
+
+        media_type = content_type.partition(";")[0].strip().lower()
+        compressible = self._compressible_cache.get(media_type)
+        if compressible is None:
+            compressible = matches_media_type(media_type, self.compressible_types)
+            self._compressible_cache[media_type] = compressible
+        return compressible
+
+    def get_responder(self, encoding: str) -> CompressionResponder:
+        """
+        Builds the responder compressing a single response with the given coding.
+        """
+        return CompressionResponder(
+            self.app,
+            self.minimum_size,
+            compressor_class=COMPRESSORS[encoding],
+            level=self.levels[encoding],
+            is_compressible=self.is_compressible,
+            offload_threshold=self.offload_threshold,
+        )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Handles incoming requests, checks for GZip support, and processes the response accordingly.
+        Handles incoming requests, negotiates the content coding and processes the response accordingly.
 
         Args:
             scope: The ASGI scope.
             receive: The ASGI receive function.
             send: The ASGI send function.
         """
-        if scope["type"] == "http":
-            headers = Header.ensure_header_instance(scope=scope)
-            if "gzip" in headers.get("Accept-Encoding", ""):
-                responder = GZipResponder(
-                    self.app, self.minimum_size, compresslevel=self.compresslevel
-                )
-                await responder(scope, receive, send)
-                return
+        if scope["type"] == "http" and self.encodings:
+            headers = Header.from_scope(scope=scope)
+            accept_encoding = headers.get("Accept-Encoding", "")
+            if accept_encoding:
+                encoding = negotiate_encoding(accept_encoding, self.encodings)
+                if encoding is not None:
+                    await self.get_responder(encoding)(scope, receive, send)
+                    return
         await self.app(scope, receive, send)
 
 
-class GZipResponder:
+class CompressionResponder:
     """
-    ASGI middleware for compressing response bodies using GZip.
+    ASGI middleware compressing the body of a single response.
+
+    Responses that already have a `Content-Encoding`, whose media type is not
+    compressible or whose whole body is smaller than `minimum_size` are sent as they
+    are. Streamed bodies are flushed after every chunk, so each one reaches the
+    client as soon as it is produced.
 
     Args:
         app (ASGIApp): The ASGI application to wrap.
-        minimum_size (int): The minimum size of the response body to apply GZip compression.
-        compresslevel (int, optional): The compression level for GZip (default is 9).
+        minimum_size (int): The minimum size of the response body to apply compression.
+        compressor_class (type[Compressor]): The compressor of the negotiated coding.
+        level (int): The compression level.
+        is_compressible (Callable | None): Tells whether a `Content-Type` should be compressed.
+        offload_threshold (int | None): The size from which the compression runs in a worker thread.
     """
 
-    def __init__(self, app: ASGIApp, minimum_size: int, compresslevel: int = 9) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        compressor_class: type[Compressor],
+        level: int,
+        is_compressible: Callable[[str | None], bool] | None = None,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
         """
-        Initializes the GZipResponder.
+        Initializes the CompressionResponder.
 
         Args:
             app (ASGIApp): The ASGI application to wrap.
-            minimum_size (int): The minimum size of the response body to apply GZip compression.
-            compresslevel (int, optional): The compression level for GZip (default is 9).
+            minimum_size (int): The minimum size of the response body to apply compression.
+            compressor_class (type[Compressor]): The compressor of the negotiated coding.
+            level (int): The compression level.
+            is_compressible (Callable | None): Tells whether a `Content-Type` should be compressed.
+            offload_threshold (int | None): The size from which the compression runs in a worker thread.
         """
         self.app = app
         self.minimum_size = minimum_size
-        self.compresslevel = compresslevel
+        self.compressor_class = compressor_class
+        self.level = level
+        self.is_compressible = is_compressible
+        self.offload_threshold = offload_threshold
         self.send: Send = self.unattached_send
         self.initial_message: Message = {}
         self.started = False
-        self.content_encoding_set = False
-        self.gzip_buffer = io.BytesIO()
-
-    @cached_property
-    def gzip_file(self) -> gzip.GzipFile:
-        return gzip.GzipFile(mode="wb", fileobj=self.gzip_buffer, compresslevel=self.compresslevel)
+        self.passthrough = False
+        self.compressor: Compressor | None = None
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
@@ -95,16 +445,11 @@ class GZipResponder:
             send (Send): The send channel.
         """
         self.send = send
-        try:
-            await self.app(scope, receive, self.send_with_gzip)
-        finally:
-            # ensure cleanup if file is initialized
-            if "gzip_file" in self.__dict__ and not self.gzip_file.closed:
-                self.gzip_file.close()
+        await self.app(scope, receive, self.send_with_compression)
 
-    async def send_with_gzip(self, message: Message) -> None:
+    async def send_with_compression(self, message: Message) -> None:
         """
-        ASGI interface method to handle outgoing responses with GZip compression.
+        ASGI interface method to handle outgoing responses with compression.
 
         Args:
             message (Message): The outgoing message.
@@ -113,11 +458,13 @@ class GZipResponder:
 
         if message_type == "http.response.start":
             await self.handle_message_start(message)
-        elif message_type == "http.response.body" and self.content_encoding_set:
-            await self.handle_response_body_with_encoding(message)
-        elif message_type == "http.response.body" and not self.started:
-            await self.handle_response_body_without_encoding(message)
-        elif message_type == "http.response.body":
+        elif message_type != "http.response.body":
+            await self.handle_response_body_passthrough(message)
+        elif self.passthrough:
+            await self.handle_response_body_passthrough(message)
+        elif not self.started:
+            await self.handle_first_body(message)
+        else:
             await self.handle_body(message)
 
     async def handle_message_start(self, message: Message) -> None:
@@ -129,11 +476,14 @@ class GZipResponder:
         """
         self.initial_message = message
         headers = Header.ensure_header_instance(self.initial_message)
-        self.content_encoding_set = "content-encoding" in headers
+        self.passthrough = "content-encoding" in headers or (
+            self.is_compressible is not None
+            and not self.is_compressible(headers.get("content-type"))
+        )
 
-    async def handle_response_body_with_encoding(self, message: Message) -> None:
+    async def handle_response_body_passthrough(self, message: Message) -> None:
         """
-        Handles 'http.response.body' when content encoding is set.
+        Handles the messages of a response that is not compressed.
 
         Args:
             message (Message): The outgoing message.
@@ -143,9 +493,9 @@ class GZipResponder:
             await self.send(self.initial_message)
         await self.send(message)
 
-    async def handle_response_body_without_encoding(self, message: Message) -> None:
+    async def handle_first_body(self, message: Message) -> None:
         """
-        Handles 'http.response.body' when content encoding is not set.
+        Handles the first 'http.response.body' of a compressible response.
 
         Args:
             message (Message): The outgoing message.
@@ -158,24 +508,58 @@ class GZipResponder:
             await self.send(self.initial_message)
             await self.send(message)
         elif not more_body:
-            await self.handle_standard_gzip_response(body, message)
+            await self.handle_standard_response(body, message)
         else:
-            await self.handle_streaming_gzip_response(body, message)
+            await self.handle_streaming_response(body, message)
+
+    def create_compressor(self) -> Compressor:
+        """
+        Creates the compressor of a streamed response.
+        """
+        return self.compressor_class(self.level)
+
+    def should_offload(self, size: int) -> bool:
+        """
+        Whether compressing `size` bytes should happen in a worker thread.
 
-    async def handle_standard_gzip_response(self, body: bytes, message: Message) -> None:
+        zlib, brotli and zstd release the GIL while compressing, so large bodies do
+        not hold the event loop and the other requests of the worker.
         """
-        Handles standard GZip response.
+        return self.offload_threshold is not None and size >= self.offload_threshold
+
+    async def compress_body(self, body: bytes) -> bytes:
+        """
+        Compresses a whole body.
+        """
+        if self.should_offload(len(body)):
+            return await run_in_threadpool(self.compressor_class.compress_body, body, self.level)
+        return self.compressor_class.compress_body(body, self.level)
+
+    async def compress_chunk(self, compressor: Compressor, chunk: bytes, more_body: bool) -> bytes:
+        """
+        Compresses a chunk of a streamed body, flushing it or ending the stream.
+        """
+        if self.should_offload(len(chunk)):
+            return await run_in_threadpool(self._compress_chunk, compressor, chunk, more_body)
+        return self._compress_chunk(compressor, chunk, more_body)
+
+    @staticmethod
+    def _compress_chunk(compressor: Compressor, chunk: bytes, more_body: bool) -> bytes:
+        data = compressor.compress(chunk)
+        return data + (compressor.flush() if more_body else compressor.finish())
+
+    async def handle_standard_response(self, body: bytes, message: Message) -> None:
+        """
+        Handles a response whose whole body is sent in a single message.
 
         Args:
             body (bytes): The response body.
             message (Message): The outgoing message.
         """
-        self.gzip_file.write(body)
-        self.gzip_file.close()
-        body = self.gzip_buffer.getvalue()
+        body = await self.compress_body(body)
 
         headers = Header.ensure_header_instance(self.initial_message)
-        headers["Content-Encoding"] = "gzip"
+        headers["Content-Encoding"] = self.compressor_class.encoding
         headers["Content-Length"] = str(len(body))
         headers.add_vary_header("Accept-Encoding")
         message["body"] = body
@@ -183,31 +567,29 @@ class GZipResponder:
         await self.send(self.initial_message)
         await self.send(message)
 
-    async def handle_streaming_gzip_response(self, body: bytes, message: Message) -> None:
+    async def handle_streaming_response(self, body: bytes, message: Message) -> None:
         """
-        Handles streaming GZip response.
+        Handles the first chunk of a streamed response.
 
         Args:
             body (bytes): The response body.
             message (Message): The outgoing message.
         """
         headers = Header.ensure_header_instance(self.initial_message)
-        headers["Content-Encoding"] = "gzip"
+        headers["Content-Encoding"] = self.compressor_class.encoding
         headers.add_vary_header("Accept-Encoding")
 
         headers.pop("Content-Length", None)
 
-        self.gzip_file.write(body)
-        message["body"] = self.gzip_buffer.getvalue()
-        self.gzip_buffer.seek(0)
-        self.gzip_buffer.truncate()
+        self.compressor = self.create_compressor()
+        message["body"] = await self.compress_chunk(self.compressor, body, more_body=True)
 
         await self.send(self.initial_message)
         await self.send(message)
 
     async def handle_body(self, message: Message) -> None:
         """
-        Handles remaining body in streaming GZip response.
+        Handles the remaining chunks of a streamed response.
 
         Args:
             message (Message): The outgoing message.
@@ -215,13 +597,12 @@ class GZipResponder:
         body = message.get("body", b"")
         more_body = message.get("more_body", False)
 
-        self.gzip_file.write(body)
-        if not more_body:
-            self.gzip_file.close()
+        if self.compressor is None:
+            # The response was sent uncompressed.
+            await self.send(message)
+            return
 
-        message["body"] = self.gzip_buffer.getvalue()
-        self.gzip_buffer.seek(0)
-        self.gzip_buffer.truncate()
+        message["body"] = await self.compress_chunk(self.compressor, body, more_body)
 
         await self.send(message)
 
@@ -233,3 +614,86 @@ class GZipResponder:
             message (Message): The outgoing message.
         """
         raise RuntimeError("send awaitable not set")
+
+
+class GZipMiddleware(CompressionMiddleware):
+    """
+    Middleware to compress responses with GZip.
+
+    Args:
+        app: The 'next' ASGI app to call.
+        minimum_size: Minimum response size to trigger compression.
+        compresslevel: GZip compression level (0 to 9).
+        offload_threshold: The size from which a body is compressed in a worker thread.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
+        """
+        Initialize GZipMiddleware.
+
+        Args:
+            app: The 'next' ASGI app to call.
+            minimum_size: Minimum response size to trigger compression.
+            compresslevel: GZip compression level (0 to 9).
+            offload_threshold: The size from which a body is compressed in a worker thread.
+        """
+        super().__init__(
+            app,
+            minimum_size=minimum_size,
+            encodings=("gzip",),
+            levels={"gzip": compresslevel},
+            compressible_types=None,
+            offload_threshold=offload_threshold,
+        )
+        self.compresslevel = compresslevel
+
+    def get_responder(self, encoding: str) -> CompressionResponder:
+        return GZipResponder(
+            self.app,
+            self.minimum_size,
+            compresslevel=self.compresslevel,
+            offload_threshold=self.offload_threshold,
+        )
+
+
+class GZipResponder(CompressionResponder):
+    """
+    ASGI middleware for compressing response bodies using GZip.
+
+    Args:
+        app (ASGIApp): The ASGI application to wrap.
+        minimum_size (int): The minimum size of the response body to apply GZip compression.
+        compresslevel (int, optional): The compression level for GZip (default is 9).
+        offload_threshold (int | None): The size from which the compression runs in a worker thread.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int,
+        compresslevel: int = 9,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+    ) -> None:
+        """
+        Initializes the GZipResponder.
+
+        Args:
+            app (ASGIApp): The ASGI application to wrap.
+            minimum_size (int): The minimum size of the response body to apply GZip compression.
+            compresslevel (int, optional): The compression level for GZip (default is 9).
+            offload_threshold (int | None): The size from which the compression runs in a worker thread.
+        """
+        super().__init__(
+            app,
+            minimum_size,
+            compressor_class=GZipCompressor,
+            level=compresslevel,
+            offload_threshold=offload_threshold,
+        )
+        self.compresslevel = compresslevel
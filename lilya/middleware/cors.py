@@ -3,7 +3,7 @@ from __future__ import annotations
 import functools
 import re
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, ClassVar
 
 from lilya.datastructures import Header
 from lilya.enums import HeaderEnum, HTTPCorsEnum
@@ -13,6 +13,8 @@ from lilya.types import ASGIApp, Message, Receive, Scope, Send
 
 
 class CORSMiddleware(MiddlewareProtocol):
+    __preserves_scope__: ClassVar[bool] = True
+
     def __init__(
         self,
         app: ASGIApp,
@@ -95,7 +97,7 @@ class CORSMiddleware(MiddlewareProtocol):
             return
 
         method = scope["method"]
-        headers = Header.ensure_header_instance(scope=scope)
+        headers = Header.from_scope(scope=scope)
         origin = headers.get("origin")
 
         if origin is None:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import ClassVar
+
 from lilya.datastructures import URL
 from lilya.enums import ScopeType
 from lilya.protocols.middleware import MiddlewareProtocol
@@ -8,6 +10,8 @@ from lilya.types import ASGIApp, Receive, Scope, Send
 
 
 class HTTPSRedirectMiddleware(MiddlewareProtocol):
+    __preserves_scope__: ClassVar[bool] = True
+
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
 
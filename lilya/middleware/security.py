@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import cast
+from typing import ClassVar, cast
 
 from lilya.datastructures import Header
 from lilya.protocols.middleware import MiddlewareProtocol
@@ -59,6 +59,8 @@ class SecurityMiddleware(MiddlewareProtocol):
     Middleware for handling security-related tasks.
     """
 
+    __preserves_scope__: ClassVar[bool] = True
+
     def __init__(
         self,
         app: ASGIApp,
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import math
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Mapping
+from contextlib import asynccontextmanager
 from typing import Any
 
+import anyio
+
+from lilya.concurrency import run_on_loop_thread
+
+# Prefix of the keys holding the tag indexes of the default `set_many` implementation.
+TAG_KEY_PREFIX = "lilya:tag:"
+
 
 class CacheBackend(ABC):
     """
@@ -11,6 +22,16 @@ class CacheBackend(ABC):
     This protocol ensures that any cache backend implementation used with
     the caching decorator (or similar components) adheres to a consistent
     API for basic cache operations: get, set, and delete.
+
+    The batch operations (`get_many`, `set_many`, `delete_many`) and the tag
+    invalidation default to one call per key, and backends able to batch them
+    natively should override them. `delete_prefix` requires a backend able to
+    enumerate its keys.
+
+    The synchronous `sync_get`, `sync_set` and `sync_delete` counterparts, used by the
+    caching decorator for synchronous functions, run the asynchronous methods in a shared
+    long-lived event loop thread. Backends able to operate without an event loop should
+    override them with a native implementation.
     """
 
     @abstractmethod
@@ -69,3 +90,145 @@ class CacheBackend(ABC):
             NotImplementedError: If the concrete cache backend does not implement this method.
         """
         raise NotImplementedError("Cache backend must implement delete method.")
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Asynchronously retrieves the cached values of several keys.
+
+        Args:
+            keys (Iterable[str]): The keys to retrieve.
+
+        Returns:
+            dict[str, Any]: The values of the keys found in the cache.
+        """
+        values = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    async def set_many(
+        self, mapping: Mapping[str, Any], ttl: int | None = None, *, tags: Iterable[str] = ()
+    ) -> None:
+        """
+        Asynchronously stores several values, optionally tagging them.
+
+        The keys of a tag are indexed with their expiry: the expired keys are pruned on
+        write and the index expires with its last key (or never, for persistent keys).
+
+        The read-modify-write of an index is serialised per tag within the process
+        only. Backends shared by several processes must override `set_many` and
+        `invalidate_tags` with an atomic update of the index, as `RedisCache` does.
+
+        Args:
+            mapping (Mapping[str, Any]): The values to store, by key.
+            ttl (int | None, optional): The time in seconds after which the items should
+                                        expire. `None` for no explicit expiration.
+            tags (Iterable[str], optional): Tags to attach to the keys, to invalidate them
+                                            together with `invalidate_tags`.
+        """
+        for key, value in mapping.items():
+            await self.set(key, value, ttl)
+
+        now = time.time()
+        expiry = now + ttl if ttl else None
+        for tag in tags:
+            index = f"{TAG_KEY_PREFIX}{tag}"
+            async with self._lock_tag(tag):
+                keys: dict[str, float | None] = {
+                    key: expires
+                    for key, expires in (await self.get(index) or {}).items()
+                    if expires is None or expires > now
+                }
+                keys.update(dict.fromkeys(mapping, expiry))
+                expiries = keys.values()
+                index_ttl = None if None in expiries else math.ceil(max(expiries) - now)
+                await self.set(index, keys, index_ttl)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """
+        Asynchronously removes several values from the cache.
+
+        Args:
+            keys (Iterable[str]): The keys to remove.
+        """
+        for key in keys:
+            await self.delete(key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """
+        Asynchronously removes every value whose key starts with `prefix`.
+
+        Args:
+            prefix (str): The prefix of the keys to remove.
+
+        Raises:
+            NotImplementedError: If the backend cannot enumerate its keys.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support delete_prefix.")
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """
+        Asynchronously removes every value tagged with one of `tags` by `set_many`.
+
+        Args:
+            *tags (str): The tags to invalidate.
+        """
+        for tag in tags:
+            index = f"{TAG_KEY_PREFIX}{tag}"
+            async with self._lock_tag(tag):
+                await self.delete_many([*(await self.get(index) or ()), index])
+
+    @asynccontextmanager
+    async def _lock_tag(self, tag: str) -> AsyncIterator[None]:
+        """
+        Holds the lock of the index of a tag, the lock being dropped once unused.
+        """
+        locks: dict[str, anyio.Lock] = self.__dict__.setdefault("_tag_locks", {})
+        lock = locks.get(tag)
+        if lock is None:
+            lock = locks[tag] = anyio.Lock()
+        try:
+            async with lock:
+                yield
+        finally:
+            if (
+                locks.get(tag) is lock
+                and not lock.locked()
+                and not lock.statistics().tasks_waiting
+            ):
+                del locks[tag]
+
+    def sync_get(self, key: str) -> Any | None:
+        """
+        Synchronously retrieves a cached value associated with the given key.
+
+        Args:
+            key (str): The unique identifier for the cached item.
+
+        Returns:
+            Any | None: The cached value if found and valid, otherwise `None`.
+        """
+        return run_on_loop_thread(self.get, key)
+
+    def sync_set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """
+        Synchronously stores a value in the cache under the specified key.
+
+        Args:
+            key (str): The unique identifier for the item to cache.
+            value (Any): The data to be cached.
+            ttl (int | None, optional): The time in seconds after which the cached item
+                                        should expire. `None` for no explicit expiration.
+        """
+        run_on_loop_thread(self.set, key, value, ttl)
+
+    def sync_delete(self, key: str) -> None:
+        """
+        Synchronously removes a value from the cache associated with the given key.
+
+        Args:
+            key (str): The unique identifier of the item to remove from the cache.
+        """
+        run_on_loop_thread(self.delete, key)
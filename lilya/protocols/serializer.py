@@ -10,3 +10,15 @@ class SerializerProtocol(Protocol):  # pragma: no cover
     def load(self, *args: Any, **kwargs: Any) -> Any: ...
 
     def loads(self, *args: Any, **kwargs: Any) -> Any: ...
+
+
+@runtime_checkable
+class BytesSerializerProtocol(SerializerProtocol, Protocol):  # pragma: no cover
+    """
+    A serializer able to produce UTF-8 encoded JSON directly.
+
+    When the bound serializer implements it, responses and caches use `dumps_bytes`
+    instead of encoding the result of `dumps`.
+    """
+
+    def dumps_bytes(self, *args: Any, **kwargs: Any) -> bytes: ...
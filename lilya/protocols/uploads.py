@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Protocol, runtime_checkable
+
+from lilya.datastructures import Header
+
+
+@runtime_checkable
+class UploadSinkProtocol(Protocol):  # pragma: no cover
+    """
+    The destination of the data of an uploaded file.
+
+    By default, the uploaded files are spooled into temporary files. An upload sink
+    receives the data of a file part instead, as it is parsed from the request body, and
+    is given to the handler as the `file` of the `DataUpload`.
+    """
+
+    async def write(self, data: bytes | memoryview) -> Any:
+        """Writes a chunk of the file. The data is only valid during the call."""
+        ...
+
+    async def finish(self) -> None:
+        """Called once all the data of the file was written."""
+        ...
+
+    async def read(self, size: int = -1) -> bytes:
+        """Reads the file back, if the sink supports it."""
+        ...
+
+    async def seek(self, offset: int) -> Any:
+        """Moves to a position of the file, if the sink supports it."""
+        ...
+
+    async def aclose(self) -> None:
+        """Releases the resources of the sink."""
+        ...
+
+
+UploadSinkFactory = Callable[[str, str, Header], UploadSinkProtocol]
+"""
+Creates the sink of an uploaded file from its field name, its filename and its headers.
+"""
@@ -19,6 +19,7 @@ from lilya.contrib.multipart.utils import parse_options_header
 from lilya.datastructures import FormData
 from lilya.enums import Event, MediaType, ScopeType
 from lilya.exceptions import HTTPException
+from lilya.protocols.uploads import UploadSinkFactory
 from lilya.serializers import serializer
 from lilya.types import Empty, Message, Receive, Scope, Send
 
@@ -268,6 +269,7 @@ class Request(Connection):
         *,
         max_files: int | float = 1000,
         max_fields: int | float = 1000,
+        upload_sink: UploadSinkFactory | None = None,
     ) -> FormData:
         """
         Parse and return form data from the request.
@@ -277,6 +279,9 @@ class Request(Connection):
                 in the form data.
             max_fields (Union[int, float]): Maximum number of fields allowed
                 in the form data.
+            upload_sink (UploadSinkFactory | None): Creates the sink receiving each
+                uploaded file, from its field name, filename and headers, instead of
+                spooling it into a temporary file.
 
         Returns:
             FormData: The parsed form data.
@@ -293,6 +298,7 @@ class Request(Connection):
                         self.stream(),
                         max_files=max_files,
                         max_fields=max_fields,
+                        upload_sink=upload_sink,
                     )
                     self._form = await multipart_parser.parse()
                 except MultiPartException as exc:
@@ -311,6 +317,7 @@ class Request(Connection):
         *,
         max_files: int | float = 1000,
         max_fields: int | float = 1000,
+        upload_sink: UploadSinkFactory | None = None,
     ) -> AsyncResourceHandler[FormData]:
         """
         Get the form data from the request.
@@ -320,12 +327,17 @@ class Request(Connection):
                 in the form data.
             max_fields (Union[int, float]): Maximum number of fields allowed
                 in the form data.
+            upload_sink (UploadSinkFactory | None): Creates the sink receiving each
+                uploaded file, from its field name, filename and headers, instead of
+                spooling it into a temporary file. Ignored once the form was parsed.
 
         Returns:
             AsyncResourceHandler[FormData]: Awaiting or using this object will
             return the parsed form data.
         """
-        return AsyncResourceHandler(self._get_form(max_files=max_files, max_fields=max_fields))
+        return AsyncResourceHandler(
+            self._get_form(max_files=max_files, max_fields=max_fields, upload_sink=upload_sink)
+        )
 
     async def close(self) -> None:
         """
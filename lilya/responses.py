@@ -11,11 +11,13 @@ import typing
 import warnings
 from collections.abc import (
     AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
     Generator,
     Iterable,
+    Iterator,
     Mapping,
     Sequence,
 )
@@ -31,10 +33,11 @@ from urllib.parse import quote
 import anyio
 
 from lilya import status
+from lilya._internal._encoders import get_bytes_json_encode_fn
 from lilya._internal._helpers import HeaderHelper
 from lilya.background import Task
 from lilya.compat import md5_hexdigest
-from lilya.concurrency import iterate_in_threadpool
+from lilya.concurrency import iterate_in_threadpool, run_in_threadpool
 from lilya.datastructures import URL, Header
 from lilya.encoders import ENCODER_TYPES, EncoderProtocol, MoldingProtocol, json_encode
 from lilya.enums import Event, HTTPMethod, MediaType
@@ -466,6 +469,10 @@ class JSONResponse(Response):
         else:
             new_params = {}
         new_params["post_transform_fn"] = None
+        if "json_encode_fn" not in new_params and self.charset.lower() in ("utf-8", "utf8"):
+            json_encode_fn = get_bytes_json_encode_fn()
+            if json_encode_fn is not None:
+                new_params["json_encode_fn"] = json_encode_fn
         if self.encoders:
             new_params["with_encoders"] = (*self.encoders, *(ENCODER_TYPES.get() or ()))
         content = json_encode(content, **new_params)
@@ -587,6 +594,53 @@ class StreamingResponse(Response):
         )
 
 
+def encode_sse_event(
+    event: dict[str, Any] | bytes, *, sep: str = "\n", retry: int | None = None
+) -> bytes:
+    """
+    Encode a single event dictionary into the text/event-stream format.
+
+    Args:
+        event: A mapping containing optional fields:
+            ``id``, ``event``, ``data``, ``retry``, or ``:`` for comments.
+        sep: Line separator used between event fields.
+        retry: Default reconnect interval in milliseconds, used when the event has none.
+
+    Returns:
+        Encoded UTF-8 bytes ready to send to the client.
+    """
+    if isinstance(event, bytes):
+        return event
+
+    lines: list[bytes] = []
+
+    if ":" in event:
+        lines.append(f": {event[':']}".encode())
+
+    if "id" in event:
+        lines.append(f"id: {event['id']}".encode())
+    if "event" in event:
+        lines.append(f"event: {event['event']}".encode())
+    if "data" in event:
+        data = event["data"]
+        if isinstance(data, (dict, list)):
+            dumps_bytes = get_bytes_json_encode_fn()
+            if dumps_bytes is not None:
+                # Compact, the whitespace of the JSON payload does not matter to the clients
+                lines.append(b"data: " + dumps_bytes(data))
+            else:
+                lines.append(f"data: {serializer.dumps(data, separators=(', ', ': '))}".encode())
+        else:
+            lines.append(f"data: {data}".encode())
+    if "retry" in event or retry:
+        retry = event.get("retry", retry)
+        if retry is not None:
+            lines.append(f"retry: {retry}".encode())
+
+    separator = sep.encode()
+    return separator.join(lines) + separator * 2
+
+
 class EventStreamResponse(Response):
     """
     A fully AnyIO-native Server-Sent Events (SSE) streaming response for Lilya.
@@ -938,29 +992,7 @@ class EventStreamResponse(Response):
         Returns:
             Encoded UTF-8 bytes ready to send to the client.
         """
-        if isinstance(event, bytes):
-            return event
-
-        lines: list[str] = []
-
-        if ":" in event:
-            lines.append(f": {event[':']}")
-
-        if "id" in event:
-            lines.append(f"id: {event['id']}")
-        if "event" in event:
-            lines.append(f"event: {event['event']}")
-        if "data" in event:
-            data = event["data"]
-            if isinstance(data, (dict, list)):
-                data = serializer.dumps(data, separators=(", ", ": "))
-            lines.append(f"data: {data}")
-        if "retry" in event or self.retry:
-            retry = event.get("retry", self.retry)
-            if retry is not None:
-                lines.append(f"retry: {retry}")
-
-        return (self.sep.join(lines) + self.sep * 2).encode("utf-8")
+        return encode_sse_event(event, sep=self.sep, retry=self.retry)
 
 
 class FileResponse(DispositionResponse):
@@ -1370,6 +1402,113 @@ class TemplateResponse(HTMLResponse):
         await super().__call__(scope, receive, send)
 
 
+def _join_fragments(fragments: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """
+    Joins the fragments of a rendered template into chunks of at least `chunk_size` characters.
+    """
+    buffer: list[str] = []
+    length = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        length += len(fragment)
+        if length >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+async def _join_fragments_async(
+    fragments: AsyncIterable[str], chunk_size: int
+) -> AsyncIterator[str]:
+    buffer: list[str] = []
+    length = 0
+    async for fragment in fragments:
+        buffer.append(fragment)
+        length += len(fragment)
+        if length >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+class StreamingTemplateResponse(StreamingResponse):
+    """
+    A template response sending the template in chunks as it is rendered.
+
+    The template is rendered with `generate_async` for the async environments, or with
+    `generate` in a worker thread, instead of being rendered as a whole in the constructor.
+    The fragments are joined into chunks of at least `chunk_size` characters, each sent
+    as soon as it is complete.
+    """
+
+    render_function_name: str = "generate"
+    chunk_size: int = 4096
+
+    def __init__(
+        self,
+        template: Any,
+        status_code: int = status.HTTP_200_OK,
+        context: dict[str, Any] | None = None,
+        background: Task | None = None,
+        headers: dict[str, Any] | None = None,
+        media_type: MediaType | str = MediaType.HTML,
+        encoders: Sequence[Encoder | type[Encoder]] | None = None,
+        render_function_name: str | None = None,
+        chunk_size: int | None = None,
+    ):
+        if render_function_name:
+            self.render_function_name = render_function_name
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+        self.template = template
+        self.context = context or {}
+        super().__init__(
+            content=self.render(),
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+            encoders=encoders,
+        )
+
+    async def render(self) -> AsyncIterator[str]:
+        fragments = getattr(self.template, self.render_function_name)(self.context)
+        if isinstance(fragments, AsyncIterable):
+            async for chunk in _join_fragments_async(fragments, self.chunk_size):
+                yield chunk
+            return
+
+        # One thread hop per chunk, the rendering happens in `next`
+        chunks = _join_fragments(fragments, self.chunk_size)
+        while (chunk := await run_in_threadpool(next, chunks, None)) is not None:
+            yield chunk
+
+    async def stream(self, send: Send) -> None:
+        # Unlike `StreamingResponse`, every chunk is sent right away, so that the start of
+        # the page reaches the client while the rest is rendered.
+        async for chunk in self.body_iterator:
+            if not isinstance(chunk, bytes):
+                chunk = chunk.encode(self.charset)
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        request = self.context.get("request", {})
+        extensions = request.get("extensions", {})
+        if "http.response.debug" in extensions:
+            await send(
+                {
+                    "type": "http.response.debug",
+                    "info": {"template": self.template, "context": self.context},
+                }
+            )
+        await super().__call__(scope, receive, send)
+
+
 class CSVResponse(StreamingResponse):
     media_type = "text/csv"
     body_iterator: AsyncIterable[Mapping[str, Any]]  # type: ignore
@@ -1543,6 +1682,10 @@ class NDJSONResponse(StreamingResponse):
         else:
             new_params = {}
         new_params["post_transform_fn"] = None
+        if "json_encode_fn" not in new_params and self.charset.lower() in ("utf-8", "utf8"):
+            json_encode_fn = get_bytes_json_encode_fn()
+            if json_encode_fn is not None:
+                new_params["json_encode_fn"] = json_encode_fn
         if self.encoders:
             new_params["with_encoders"] = (*self.encoders, *(ENCODER_TYPES.get() or ()))
         async for row in self.body_iterator:
@@ -20,6 +20,7 @@ from lilya.permissions.base import DefinePermission
 from lilya.types import ASGIApp, Dependencies, ExceptionHandler, Receive, Scope, Send
 
 from .base import BasePath
+from .reverse import get_reverse_index
 from .types import NoMatchFound
 
 
@@ -299,7 +300,7 @@ class Host(BasePath):
             self.host_format, self.param_convertors, path_params, is_host=True
         )
 
-        for route in self.routes or []:
+        for route in get_reverse_index(self, self.routes or []).candidates(remaining_name):
             try:
                 url = route.url_path_for(remaining_name, **remaining_params)
                 return URLPath(path=str(url), protocol=url.protocol, host=host)
@@ -16,7 +16,12 @@ from lilya._internal._path import clean_path, compile_path, get_route_path, repl
 from lilya._internal._permissions import wrap_permission
 from lilya._internal._urls import include
 from lilya.compat import import_string, is_async_callable
-from lilya.concurrency import run_in_threadpool
+from lilya.concurrency import (
+    ThreadPool,
+    current_threadpool,
+    get_threadpool,
+    run_in_threadpool,
+)
 from lilya.datastructures import URLPath
 from lilya.dependencies import wrap_dependency
 from lilya.enums import Match, ScopeType
@@ -26,6 +31,7 @@ from lilya.permissions.base import DefinePermission
 from lilya.types import ASGIApp, Dependencies, ExceptionHandler, Receive, Scope, Send
 
 from .base import BasePath
+from .reverse import get_reverse_index
 from .types import NoMatchFound
 
 # TYPE_CHECKING guard for Router (avoids circular import at runtime)
@@ -51,6 +57,7 @@ class Include(BasePath):
         "before_request",
         "after_request",
         "dependencies",
+        "threadpool",
     )
 
     def __init__(
@@ -71,6 +78,7 @@ class Include(BasePath):
         include_in_schema: bool = True,
         deprecated: bool = False,
         redirect_slashes: bool = True,
+        threadpool: str | ThreadPool | None = None,
     ) -> None:
         """
         Initialize the router with specified parameters.
@@ -88,6 +96,8 @@ class Include(BasePath):
             dependencies (Dependencies | None): Dependencies to inject.
             include_in_schema (bool): Flag to include in the schema.
             redirect_slashes (bool): (Only namespace or routes) Redirect slashes on mismatch.
+            threadpool (str | ThreadPool | None): The threadpool, or its name, running the
+                synchronous handlers, hooks and dependencies of the routes.
 
         Returns:
             None
@@ -160,6 +170,7 @@ class Include(BasePath):
         self.name = name
         self.include_in_schema = include_in_schema
         self.deprecated = deprecated
+        self.threadpool = get_threadpool(threadpool) if isinstance(threadpool, str) else threadpool
 
         self.path_regex, self.path_format, self.param_convertors, self.path_start = compile_path(
             clean_path(self.path + "/{path:path}")
@@ -251,7 +262,8 @@ class Include(BasePath):
 
     async def handle_dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Handles the dispatch of the request to the appropriate handler.
+        Handles the dispatch of the request to the appropriate handler, running the
+        synchronous callables in the threadpool of the included routes, if it has one.
 
         Args:
             scope (Scope): The request scope.
@@ -261,6 +273,18 @@ class Include(BasePath):
         Returns:
             None
         """
+        if self.threadpool is None:
+            await self._handle_dispatch(scope, receive, send)
+            return
+
+        token = current_threadpool.set(self.threadpool)
+        try:
+            await self._handle_dispatch(scope, receive, send)
+        finally:
+            current_threadpool.reset(token)
+
+    async def _handle_dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Dispatches the request, see `handle_dispatch`."""
         try:
             for before_request in self.before_request:
                 if inspect.isclass(before_request):
@@ -354,7 +378,7 @@ class Include(BasePath):
         if path_kwarg is not None:
             remaining_params["path"] = path_kwarg
 
-        for route in self.routes or []:
+        for route in get_reverse_index(self, self.routes or []).candidates(remaining_name):
             try:
                 url = route.url_path_for(remaining_name, **remaining_params)
                 return URLPath(path=path_prefix.rstrip("/") + str(url), protocol=url.protocol)
@@ -0,0 +1,198 @@
+"""
+Compiled route matching.
+
+This module contains the `RouteMatcher`, a segment-level prefix tree built from
+the routes of a router. It is used to narrow down, in O(path depth), which routes
+can possibly match an incoming path so the router only runs the (regex based)
+`search` of those candidates instead of every declared route.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from re import Pattern
+from typing import Any
+
+from lilya._internal._path_transformers import (
+    FloatTransformer,
+    IntegerTransformer,
+    StringTransformer,
+    Transformer,
+    UUIDTransformer,
+)
+
+from .base import BasePath
+
+# Transformers whose regex can never match a `/`, meaning they are always
+# contained in a single path segment and can be compiled into a tree node.
+SEGMENT_TRANSFORMERS: tuple[type[Transformer], ...] = (
+    StringTransformer,
+    IntegerTransformer,
+    FloatTransformer,
+    UUIDTransformer,
+)
+
+PLACEHOLDER_REGEX = re.compile(r"\{([a-zA-Z_]\w*)\}")
+
+
+class RouteNode:
+    """
+    A node of the compiled route tree.
+
+    Attributes:
+        static: Children keyed by the literal value of the next segment.
+        dynamic: Children keyed by the segment pattern (typed path parameters).
+        terminal: Indexes of the routes ending exactly at this node.
+        catch_all: Indexes of the routes matching any remainder from this node
+            (for instance `{path:path}` parameters and `Include` prefixes).
+    """
+
+    __slots__ = ("static", "dynamic", "terminal", "catch_all")
+
+    def __init__(self) -> None:
+        self.static: dict[str, RouteNode] = {}
+        self.dynamic: dict[str, tuple[Pattern[str], RouteNode]] = {}
+        self.terminal: list[int] = []
+        self.catch_all: list[int] = []
+
+
+class RouteMatcher:
+    """
+    A compiled, segment-level prefix tree of the routes of a router.
+
+    The matcher does not replace the `search` of each route, it only selects the
+    candidates for a given path, preserving the declaration order. This keeps the
+    exact same `Match.FULL`/`Match.PARTIAL` semantics, fall-through routing,
+    `redirect_slashes` and `405` handling of the linear lookup.
+
+    Routes that cannot be compiled into the tree (for example `Host`, custom
+    `BasePath` implementations or routes with custom transformers) are always
+    returned as candidates.
+    """
+
+    __slots__ = ("routes", "root", "always")
+
+    def __init__(self, routes: Sequence[BasePath]) -> None:
+        self.routes = routes
+        self.root = RouteNode()
+        self.always: list[int] = []
+
+        for index, route in enumerate(routes):
+            self.add(index, route)
+
+    def add(self, index: int, route: BasePath) -> None:
+        """
+        Compiles a route into the tree.
+
+        Args:
+            index (int): The position of the route in the router.
+            route (BasePath): The route to compile.
+        """
+        path_format: str | None = getattr(route, "path_format", None)
+        param_convertors: dict[str, Transformer[Any]] | None = getattr(
+            route, "param_convertors", None
+        )
+        path_regex: Pattern[str] | None = getattr(route, "path_regex", None)
+
+        if (
+            path_format is None
+            or param_convertors is None
+            or path_regex is None
+            or not path_format.startswith("/")
+            or path_regex.pattern != self.build_regex(path_format, param_convertors)
+        ):
+            self.always.append(index)
+            return
+
+        node = self.root
+        for segment in path_format[1:].split("/"):
+            names = PLACEHOLDER_REGEX.findall(segment)
+            if not names:
+                node = node.static.setdefault(segment, RouteNode())
+                continue
+
+            if not all(type(param_convertors[name]) in SEGMENT_TRANSFORMERS for name in names):
+                node.catch_all.append(index)
+                return
+
+            pattern = self.build_regex(segment, param_convertors, anchored=False)
+            if pattern not in node.dynamic:
+                node.dynamic[pattern] = (re.compile(pattern), RouteNode())
+            node = node.dynamic[pattern][1]
+
+        node.terminal.append(index)
+
+    @staticmethod
+    def build_regex(
+        path_format: str, param_convertors: dict[str, Transformer[Any]], anchored: bool = True
+    ) -> str:
+        """
+        Rebuilds the regex of a path format the same way `compile_path` does.
+
+        Args:
+            path_format (str): The path format, for example `/users/{user_id}`.
+            param_convertors (dict[str, Transformer[Any]]): The transformers of the parameters.
+            anchored (bool): Wraps the regex with `^` and `$`.
+
+        Returns:
+            str: The regex pattern.
+        """
+        regex, index = "", 0
+        for match in PLACEHOLDER_REGEX.finditer(path_format):
+            name = match.group(1)
+            if name not in param_convertors:
+                return ""
+            regex += re.escape(path_format[index : match.start()])
+            regex += f"(?P<{name}>{param_convertors[name].regex})"
+            index = match.end()
+        regex += re.escape(path_format[index:])
+
+        if anchored:
+            return f"^{regex}$"
+        return regex
+
+    def candidates(self, route_path: str) -> Sequence[BasePath]:
+        """
+        Returns the routes that can possibly match the given path, in declaration order.
+
+        Args:
+            route_path (str): The path relative to the router (see `get_route_path`).
+
+        Returns:
+            Sequence[BasePath]: The candidate routes.
+        """
+        if not route_path.startswith("/") or "\n" in route_path:
+            # Leave the unusual paths to the regular linear lookup.
+            return self.routes
+
+        segments = route_path[1:].split("/")
+        total = len(segments)
+        found: list[int] = list(self.always)
+        stack: list[tuple[RouteNode, int]] = [(self.root, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            if depth == total:
+                found.extend(node.terminal)
+                continue
+
+            if node.catch_all:
+                found.extend(node.catch_all)
+
+            segment = segments[depth]
+            child = node.static.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1))
+
+            for pattern, dynamic_child in node.dynamic.values():
+                if pattern.fullmatch(segment):
+                    stack.append((dynamic_child, depth + 1))
+
+        if not found:
+            return ()
+        if len(found) == 1:
+            return (self.routes[found[0]],)
+
+        routes = self.routes
+        return [routes[index] for index in sorted(set(found))]
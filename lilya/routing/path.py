@@ -22,7 +22,12 @@ from lilya._internal._path import (
 from lilya._internal._permissions import wrap_permission
 from lilya._internal._responses import BaseHandler
 from lilya.compat import import_string, is_async_callable
-from lilya.concurrency import run_in_threadpool
+from lilya.concurrency import (
+    ThreadPool,
+    current_threadpool,
+    get_threadpool,
+    run_in_threadpool,
+)
 from lilya.conf import _monkay
 from lilya.datastructures import URLPath
 from lilya.dependencies import wrap_dependency
@@ -72,6 +77,7 @@ class Path(BaseHandler, BasePath):
         "_has_after",
         "_has_exception_handlers",
         "_is_controller",
+        "threadpool",
     )
 
     def __init__(
@@ -89,6 +95,7 @@ class Path(BaseHandler, BasePath):
         before_request: Sequence[Callable[..., Any]] | None = None,
         after_request: Sequence[Callable[..., Any]] | None = None,
         deprecated: bool = False,
+        threadpool: str | ThreadPool | None = None,
     ) -> None:
         assert path.startswith("/"), "Paths must start with '/'"
         self.path = clean_path(path)
@@ -99,6 +106,7 @@ class Path(BaseHandler, BasePath):
         self.include_in_schema = include_in_schema
         self.methods: list[str] | None = methods
         self.deprecated = deprecated
+        self.threadpool = get_threadpool(threadpool) if isinstance(threadpool, str) else threadpool
 
         # Wrap dependencies
         _dependencies = dependencies if dependencies is not None else {}
@@ -365,7 +373,8 @@ class Path(BaseHandler, BasePath):
 
     async def handle_dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Handles the dispatch of the request to the appropriate handler.
+        Handles the dispatch of the request to the appropriate handler, running the
+        synchronous callables in the threadpool of the path, if it has one.
 
         Args:
             scope (Scope): The request scope.
@@ -375,6 +384,18 @@ class Path(BaseHandler, BasePath):
         Returns:
             None
         """
+        if self.threadpool is None:
+            await self._handle_dispatch(scope, receive, send)
+            return
+
+        token = current_threadpool.set(self.threadpool)
+        try:
+            await self._handle_dispatch(scope, receive, send)
+        finally:
+            current_threadpool.reset(token)
+
+    async def _handle_dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Dispatches the request, see `handle_dispatch`."""
         if self.methods and scope["method"] not in self.methods:
             headers = {"Allow": ", ".join(self.methods)}
             if "app" in scope:
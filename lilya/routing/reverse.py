@@ -0,0 +1,111 @@
+"""
+Reverse routing index.
+
+This module contains the `ReverseIndex`, mapping the route names to the routes that
+can build a URL for them, so that `url_path_for` only asks those routes instead of
+trying every declared route (and every nested router) in turn.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from .base import BasePath
+
+MAX_CACHED_NAMES = 4096
+"""The maximum number of names whose candidates are kept by an index."""
+
+
+class ReverseIndex:
+    """
+    The routes of a router indexed by the names they can build a URL for.
+
+    Like the `RouteMatcher`, the index does not replace the `url_path_for` of each
+    route, it only selects the candidates for a given name, preserving the declaration
+    order, so the parameters are still validated and formatted by the routes.
+
+    `Path` and `WebSocketPath` are indexed by their name, a named `Include` or `Host`
+    by its name and by its `name:` prefix. The routes whose names cannot be known
+    upfront (unnamed `Include` and `Host`, custom `BasePath` implementations) are always
+    returned as candidates. A nested router is indexed on its own, which keeps each
+    index valid when routes are added to the nested routers.
+    """
+
+    __slots__ = ("routes", "key", "names", "prefixes", "always", "cache")
+
+    def __init__(self, routes: Sequence[BasePath]) -> None:
+        self.routes = routes
+        self.key = (id(routes), len(routes))
+        self.names: dict[str, list[int]] = {}
+        self.prefixes: dict[str, list[int]] = {}
+        self.always: list[int] = []
+        self.cache: dict[str, Sequence[BasePath]] = {}
+
+        # Late import to avoid circular dependency
+        from .host import Host
+        from .include import Include
+        from .path import Path
+        from .websocket import WebSocketPath
+
+        named = {Path.url_path_for, WebSocketPath.url_path_for}
+        prefixed = {Include.url_path_for, Host.url_path_for}
+
+        for index, route in enumerate(routes):
+            url_path_for = getattr(type(route), "url_path_for", None)
+            name: str | None = getattr(route, "name", None)
+            if url_path_for in named:
+                if name is not None:
+                    self.names.setdefault(name, []).append(index)
+            elif url_path_for in prefixed and name is not None:
+                self.names.setdefault(name, []).append(index)
+                self.prefixes.setdefault(name, []).append(index)
+            else:
+                self.always.append(index)
+
+    def candidates(self, name: str) -> Sequence[BasePath]:
+        """
+        Returns the routes that can possibly build a URL for the given name, in declaration order.
+
+        Args:
+            name (str): The name of the route, e.g. `users:detail`.
+
+        Returns:
+            Sequence[BasePath]: The candidate routes.
+        """
+        candidates = self.cache.get(name)
+        if candidates is not None:
+            return candidates
+
+        found: list[int] = [*self.always, *self.names.get(name, ())]
+        if self.prefixes:
+            position = name.find(":")
+            while position != -1:
+                found.extend(self.prefixes.get(name[:position], ()))
+                position = name.find(":", position + 1)
+
+        routes = self.routes
+        candidates = [routes[index] for index in sorted(set(found))]
+        if len(self.cache) < MAX_CACHED_NAMES:
+            self.cache[name] = candidates
+        return candidates
+
+
+def get_reverse_index(owner: Any, routes: Sequence[BasePath]) -> ReverseIndex:
+    """
+    Returns the reverse index of the routes of a router, `Include` or `Host`.
+
+    The index is stored on the owner and built again whenever its routes changed.
+
+    Args:
+        owner (Any): The object owning the routes.
+        routes (Sequence[BasePath]): The routes to index.
+
+    Returns:
+        ReverseIndex: The index of the routes.
+    """
+    index: ReverseIndex | None = getattr(owner, "_reverse_index", None)
+    if index is None or index.key != (id(routes), len(routes)):
+        index = ReverseIndex(routes)
+        owner._reverse_index = index
+    return index
@@ -7,7 +7,11 @@ from contextlib import nullcontext
 from typing import TYPE_CHECKING, Annotated, Any
 
 from lilya import status
-from lilya._internal._events import AsyncLifespan, handle_lifespan_events
+from lilya._internal._events import (
+    AsyncLifespan,
+    AsyncLifespanContextManager,
+    handle_lifespan_events,
+)
 from lilya._internal._middleware import apply_asgi_stack, wrap_middleware
 from lilya._internal._path import get_route_path
 from lilya._internal._permissions import wrap_permission
@@ -37,7 +41,9 @@ from lilya.types import (
 from lilya.websockets import WebSocket, WebSocketClose
 
 from .base import BasePath
+from .matcher import RouteMatcher
 from .mixins import RoutingMethodsMixin
+from .reverse import ReverseIndex, get_reverse_index
 from .types import (
     NoMatchFound,
     PassPartialMatches,
@@ -76,6 +82,10 @@ class BaseRouter:
         "wrapped_permissions",
         "_fast_path_len",
         "_fast_path_route",
+        "compile_routes",
+        "_route_matcher",
+        "_route_matcher_key",
+        "_reverse_index",
     )
 
     def __init__(
@@ -107,6 +117,19 @@ class BaseRouter:
         include_in_schema: bool = True,
         deprecated: bool = False,
         is_sub_router: bool = False,
+        compile_routes: Annotated[
+            bool,
+            Doc(
+                """
+                Builds a compiled, segment-level prefix tree of the routes (including the ones
+                of nested `Include` routers) used to select the routes that can match a path
+                instead of searching every route in order.
+
+                The matching semantics (route priority, fall-through, partial matches,
+                `redirect_slashes`) remain exactly the same.
+                """
+            ),
+        ] = False,
     ) -> None:
         assert lifespan is None or (on_startup is None and on_shutdown is None), (
             "Use either 'lifespan' or 'on_startup'/'on_shutdown', not both."
@@ -172,6 +195,11 @@ class BaseRouter:
         self._fast_path_len = -1
         self._fast_path_route: BasePath | None = None
 
+        self.compile_routes = compile_routes
+        self._route_matcher: RouteMatcher | None = None
+        self._route_matcher_key: tuple[int, int] = (-1, -1)
+        self._reverse_index: ReverseIndex | None = None
+
     def _apply_middleware(self, middleware: Sequence[DefineMiddleware] | None) -> None:
         """
         Apply middleware to the app.
@@ -200,7 +228,7 @@ class BaseRouter:
         return self.url_path_for(name, **path_params)
 
     def url_path_for(self, name: str, /, **path_params: Any) -> URLPath:
-        for route in self.routes:
+        for route in get_reverse_index(self, self.routes).candidates(name):
             try:
                 return route.url_path_for(name, **path_params)
             except NoMatchFound:
@@ -211,6 +239,9 @@ class BaseRouter:
         """
         Runs the the events on startup.
         """
+        if self.compile_routes:
+            self.build_route_matcher()
+
         for handler in self.on_startup:
             if is_async_callable(handler):
                 await handler()
@@ -239,6 +270,51 @@ class BaseRouter:
 
         return route
 
+    def build_route_matcher(self) -> RouteMatcher:
+        """
+        Compiles the routes of the router into a `RouteMatcher`.
+
+        The compiled routes are propagated to the routers of the `Include` and `Host`
+        declared in this router, compiling the whole tree.
+
+        Returns:
+            RouteMatcher: The compiled matcher.
+        """
+        routes = self.routes
+        for route in routes:
+            base_app = getattr(route, "__base_app__", None)
+            if isinstance(base_app, BaseRouter) and not base_app.compile_routes:
+                base_app.compile_routes = True
+                base_app.build_route_matcher()
+
+        self._route_matcher = RouteMatcher(routes)
+        self._route_matcher_key = (id(routes), len(routes))
+        return self._route_matcher
+
+    def get_route_candidates(self, scope: Scope) -> Sequence[BasePath]:
+        """
+        Returns the routes that can match the given scope, in declaration order.
+
+        Without `compile_routes` all the routes are returned.
+
+        Args:
+            scope (Scope): The ASGI scope.
+
+        Returns:
+            Sequence[BasePath]: The candidate routes.
+        """
+        routes = self.routes
+        if not self.compile_routes or scope["type"] not in (
+            ScopeType.HTTP,
+            ScopeType.WEBSOCKET,
+        ):
+            return routes
+
+        matcher = self._route_matcher
+        if matcher is None or self._route_matcher_key != (id(routes), len(routes)):
+            matcher = self.build_route_matcher()
+        return matcher.candidates(get_route_path(scope))
+
     async def handle_route(self, route: BasePath, path_handler: PathHandler) -> None:
         """
         Handle a route match.
@@ -420,7 +496,7 @@ class BaseRouter:
         partial_matches: list[tuple[BaseRouter, BasePath, PathHandler]] = []
         had_match = False
 
-        for route in self.routes:
+        for route in self.get_route_candidates(scope):
             # we cannot continue when the sniffer detects a sent
             if sniffer.sent:
                 return
@@ -454,7 +530,7 @@ class BaseRouter:
                 else:
                     redirect_scope["path"] = redirect_scope["path"] + "/"
 
-                for route in self.routes:
+                for route in self.get_route_candidates(redirect_scope):
                     match, child_scope = route.search(redirect_scope)
                     if match != Match.NONE:
                         redirect_url = URL.build_from_scope(scope=redirect_scope)
@@ -628,10 +704,19 @@ class BaseRouter:
             EventType.SHUTDOWN,
         )
 
+        # A router created with handlers runs them from its own lifespan context
+        lifespan_context = self.lifespan_context
+        if not isinstance(lifespan_context, AsyncLifespanContextManager):
+            lifespan_context = None
+
         if event_type in (EventType.ON_STARTUP, EventType.STARTUP):
             self.on_startup.append(func)
+            if lifespan_context is not None:
+                lifespan_context.on_startup.append(func)
         else:
             self.on_shutdown.append(func)
+            if lifespan_context is not None:
+                lifespan_context.on_shutdown.append(func)
 
     def on_event(self, event_type: str) -> Callable:
         def wrapper(func: Callable) -> Callable:
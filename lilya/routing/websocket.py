@@ -11,7 +11,12 @@ from lilya._internal._path import clean_path, compile_path, get_route_path, repl
 from lilya._internal._permissions import wrap_permission
 from lilya._internal._responses import BaseHandler
 from lilya.compat import import_string, is_async_callable
-from lilya.concurrency import run_in_threadpool
+from lilya.concurrency import (
+    ThreadPool,
+    current_threadpool,
+    get_threadpool,
+    run_in_threadpool,
+)
 from lilya.conf import _monkay
 from lilya.datastructures import URLPath
 from lilya.dependencies import wrap_dependency
@@ -39,6 +44,7 @@ class WebSocketPath(BaseHandler, BasePath):
         "__handler_app__",
         "_signature",
         "dependencies",
+        "threadpool",
     )
 
     def __init__(
@@ -54,6 +60,7 @@ class WebSocketPath(BaseHandler, BasePath):
         dependencies: Dependencies | None = None,
         before_request: Sequence[Callable[..., Any]] | None = None,
         after_request: Sequence[Callable[..., Any]] | None = None,
+        threadpool: str | ThreadPool | None = None,
     ) -> None:
         assert path.startswith("/"), "Paths must start with '/'"
         self.path = clean_path(path)
@@ -63,6 +70,7 @@ class WebSocketPath(BaseHandler, BasePath):
 
         self.name = get_name(handler) if name is None else name
         self.include_in_schema = include_in_schema
+        self.threadpool = get_threadpool(threadpool) if isinstance(threadpool, str) else threadpool
 
         # Wrap dependencies
         _dependencies = dependencies if dependencies is not None else {}
@@ -225,7 +233,8 @@ class WebSocketPath(BaseHandler, BasePath):
 
     async def handle_dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Handles the dispatch of the request to the appropriate handler.
+        Handles the dispatch of the request to the appropriate handler, running the
+        synchronous callables in the threadpool of the path, if it has one.
 
         Args:
             scope (Scope): The request scope.
@@ -235,6 +244,18 @@ class WebSocketPath(BaseHandler, BasePath):
         Returns:
             None
         """
+        if self.threadpool is None:
+            await self._handle_dispatch(scope, receive, send)
+            return
+
+        token = current_threadpool.set(self.threadpool)
+        try:
+            await self._handle_dispatch(scope, receive, send)
+        finally:
+            current_threadpool.reset(token)
+
+    async def _handle_dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Dispatches the request, see `handle_dispatch`."""
         try:
             for before_request in self.before_request:
                 if inspect.isclass(before_request):
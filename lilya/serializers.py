@@ -7,6 +7,22 @@ from typing import Any, cast
 
 from lilya.protocols.serializer import SerializerProtocol
 
+orjson: Any
+msgspec: Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+# Encoders kept by `MsgspecSerializer`, one per `default` and `sort_keys` pair
+MAX_CACHED_ENCODERS = 64
+
 
 class SerializerProxy:
     """
@@ -104,15 +120,122 @@ class CompactSerializer:
     loads = json.loads
 
     @staticmethod
-    def dump(obj: Any, **kwargs: Any) -> None:
+    def dump(obj: Any, fp: Any, **kwargs: Any) -> None:
         kwargs = _handle_default_kwargs(**kwargs)
-        json.dump(obj, **kwargs)
+        json.dump(obj, fp, **kwargs)
 
     @staticmethod
     def dumps(obj: Any, **kwargs: Any) -> str:
         kwargs = _handle_default_kwargs(**kwargs)
         return json.dumps(obj, **kwargs)
 
+    @staticmethod
+    def dumps_bytes(obj: Any, **kwargs: Any) -> bytes:
+        kwargs = _handle_default_kwargs(**kwargs)
+        return json.dumps(obj, **kwargs).encode("utf-8")
+
+
+def _is_compact_utf8(kwargs: dict[str, Any]) -> bool:
+    """
+    Whether the `json` keyword arguments ask for the compact UTF-8 output of orjson
+    and msgspec, the other `separators` and `ensure_ascii` requiring the `json` module.
+    """
+    separators = kwargs.get("separators")
+    return not kwargs.get("ensure_ascii") and (
+        separators is None or tuple(separators) == (",", ":")
+    )
+
+
+class ORJSONSerializer:
+    """
+    Serializer backed by [orjson](https://github.com/ijl/orjson).
+
+    The `json` keyword arguments used across Lilya are translated into orjson options:
+    `indent` and `sort_keys` are honoured and `allow_nan` is ignored. orjson always
+    produces compact UTF-8 output, so other `separators` or `ensure_ascii` fall back to
+    the `json` module. When a `default` is given, dataclasses and datetimes are passed
+    through to it so the registered encoders keep precedence over the native orjson
+    serialization.
+    """
+
+    @staticmethod
+    def dumps_bytes(obj: Any, *, default: Any = None, **kwargs: Any) -> bytes:
+        if not _is_compact_utf8(kwargs):
+            return CompactSerializer.dumps_bytes(obj, default=default, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        return cast(bytes, orjson.dumps(obj, default=default, option=option))
+
+    @classmethod
+    def dumps(cls, obj: Any, **kwargs: Any) -> str:
+        return cls.dumps_bytes(obj, **kwargs).decode("utf-8")
+
+    @classmethod
+    def dump(cls, obj: Any, fp: Any, **kwargs: Any) -> None:
+        fp.write(cls.dumps(obj, **kwargs))
+
+    @staticmethod
+    def loads(obj: str | bytes | bytearray | memoryview, **kwargs: Any) -> Any:
+        return orjson.loads(obj)
+
+    @classmethod
+    def load(cls, fp: Any, **kwargs: Any) -> Any:
+        return cls.loads(fp.read())
+
+
+class MsgspecSerializer:
+    """
+    Serializer backed by [msgspec](https://jcristharif.com/msgspec/).
+
+    The `default` keyword argument is used as the msgspec `enc_hook`, `indent` and
+    `sort_keys` are honoured and `allow_nan` is ignored. msgspec always produces compact
+    UTF-8 output, so other `separators` or `ensure_ascii` fall back to the `json` module.
+    """
+
+    _encoders: dict[tuple[Any, bool], Any] = {}
+
+    @classmethod
+    def get_encoder(cls, default: Any = None, sort_keys: bool = False) -> Any:
+        key = (default, sort_keys)
+        encoder = cls._encoders.get(key)
+        if encoder is None:
+            encoder = msgspec.json.Encoder(enc_hook=default, order="sorted" if sort_keys else None)
+            # Bounded, as each `default` (e.g. a new closure per call) is another key
+            if len(cls._encoders) < MAX_CACHED_ENCODERS:
+                cls._encoders[key] = encoder
+        return encoder
+
+    @classmethod
+    def dumps_bytes(cls, obj: Any, *, default: Any = None, **kwargs: Any) -> bytes:
+        if not _is_compact_utf8(kwargs):
+            return CompactSerializer.dumps_bytes(obj, default=default, **kwargs)
+        data = cls.get_encoder(default, bool(kwargs.get("sort_keys"))).encode(obj)
+        indent = kwargs.get("indent")
+        if indent:
+            data = msgspec.json.format(data, indent=indent if isinstance(indent, int) else 2)
+        return cast(bytes, data)
+
+    @classmethod
+    def dumps(cls, obj: Any, **kwargs: Any) -> str:
+        return cls.dumps_bytes(obj, **kwargs).decode("utf-8")
+
+    @classmethod
+    def dump(cls, obj: Any, fp: Any, **kwargs: Any) -> None:
+        fp.write(cls.dumps(obj, **kwargs))
+
+    @staticmethod
+    def loads(obj: str | bytes | bytearray | memoryview, **kwargs: Any) -> Any:
+        return msgspec.json.decode(obj)
+
+    @classmethod
+    def load(cls, fp: Any, **kwargs: Any) -> Any:
+        return cls.loads(fp.read())
+
 
 class StandardSerializerConfig(SerializerConfig):
     def __init__(self, **kwargs: Any) -> None:
@@ -124,6 +247,73 @@ class StandardSerializerConfig(SerializerConfig):
         return CompactSerializer
 
 
+class ORJSONSerializerConfig(SerializerConfig):
+    """
+    Uses `orjson` as the serializer backend.
+
+    Raises:
+        ImportError: If `orjson` is not installed.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        if orjson is None:
+            raise ImportError("You must install 'orjson' to use the ORJSONSerializerConfig.")
+        super().__init__(**kwargs)
+
+    def configure(self) -> None: ...
+
+    def get_serializer(self) -> Any:
+        return ORJSONSerializer
+
+
+class MsgspecSerializerConfig(SerializerConfig):
+    """
+    Uses `msgspec` as the serializer backend.
+
+    Raises:
+        ImportError: If `msgspec` is not installed.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        if msgspec is None:
+            raise ImportError("You must install 'msgspec' to use the MsgspecSerializerConfig.")
+        super().__init__(**kwargs)
+
+    def configure(self) -> None: ...
+
+    def get_serializer(self) -> Any:
+        return MsgspecSerializer
+
+
+class AutoSerializerConfig(SerializerConfig):
+    """
+    Uses the fastest serializer backend installed.
+
+    `orjson` is preferred, then `msgspec`, falling back to the standard `json`.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+    def configure(self) -> None: ...
+
+    def get_serializer(self) -> Any:
+        if orjson is not None:
+            return ORJSONSerializer
+        if msgspec is not None:
+            return MsgspecSerializer
+        return CompactSerializer
+
+
+# Configs whose serializers accept the `json` keyword arguments used across Lilya
+# and are therefore bound by the application when passed as `serializer_config`.
+BUILTIN_SERIALIZER_CONFIGS: tuple[type[SerializerConfig], ...] = (
+    ORJSONSerializerConfig,
+    MsgspecSerializerConfig,
+    AutoSerializerConfig,
+)
+
+
 def setup_serializer(serializer_config: SerializerConfig | None = None) -> None:
     """
     Sets up the serializer system for the application.
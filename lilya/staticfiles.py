@@ -1,22 +1,105 @@
 from __future__ import annotations
 
 import importlib.util
+import json
+import mimetypes
 import os
 import posixpath
+import shutil
 import stat
-from email.utils import parsedate
+import time
+from collections.abc import Mapping, Sequence
+from email.utils import formatdate, parsedate
 
 import anyio
 import anyio.to_thread
 
 from lilya._internal._path import get_route_path
+from lilya.compat import md5_hexdigest
 from lilya.datastructures import URL, Header
+from lilya.enums import MediaType
 from lilya.exceptions import ContinueRouting, HTTPException
+from lilya.middleware.compression import (
+    COMPRESSORS,
+    DEFAULT_COMPRESSIBLE_TYPES,
+    DEFAULT_ENCODINGS,
+    accepted_encodings,
+    matches_media_type,
+)
 from lilya.responses import FileResponse, RedirectResponse, Response
 from lilya.types import Receive, Scope, Send
 
 PathLike = str | os.PathLike[str]
 
+ENCODING_SUFFIXES: dict[str, str] = {"zstd": ".zst", "br": ".br", "gzip": ".gz"}
+"""The suffix of the precompressed sibling of a file, by content coding."""
+
+PRECOMPRESS_LEVELS: dict[str, int] = {"zstd": 19, "br": 11, "gzip": 9}
+"""The compression levels of `precompress_directory`, the highest as it runs at build time."""
+
+DEFAULT_MANIFEST = "manifest.json"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+DEFAULT_MAX_MEMORY_SIZE = 32 * 1024 * 1024
+
+
+class StaticManifest:
+    """
+    The mapping of the static files to their content-hashed copies.
+
+    Written by `precompress_directory` (and the `lilya precompress` directive) as
+    `{"version": 1, "paths": {"css/app.css": "css/app.1a2b3c4d5e6f.css"}}`. The
+    hashed paths change whenever the content does, so they can be cached forever.
+    """
+
+    def __init__(self, paths: Mapping[str, str] | None = None) -> None:
+        self.paths: dict[str, str] = dict(paths or {})
+        self.hashed_paths: frozenset[str] = frozenset(self.paths.values())
+
+    @classmethod
+    def load(cls, path: PathLike) -> StaticManifest:
+        """
+        Reads a manifest file.
+
+        Args:
+            path (PathLike): The path of the manifest.
+
+        Returns:
+            StaticManifest: The manifest, empty if the file does not exist.
+        """
+        try:
+            with open(path, encoding="utf-8") as manifest_file:
+                data = json.load(manifest_file)
+        except FileNotFoundError:
+            return cls()
+        return cls(data.get("paths", {}))
+
+    def dump(self, path: PathLike) -> None:
+        """
+        Writes the manifest file.
+
+        Args:
+            path (PathLike): The path of the manifest.
+        """
+        with open(path, "w", encoding="utf-8") as manifest_file:
+            json.dump({"version": 1, "paths": self.paths}, manifest_file, indent=2, sort_keys=True)
+
+    def get_path(self, path: str) -> str:
+        """
+        Returns the hashed path of a file, or the path itself if it was not hashed.
+
+        Args:
+            path (str): The path of the file, relative to the static directory.
+        """
+        return self.paths.get(path.lstrip("/"), path)
+
+    def is_hashed(self, path: str) -> bool:
+        """
+        Whether a path, relative to the static directory, is a content-hashed copy.
+        """
+        return path in self.hashed_paths
+
 
 class StaticResponse(Response):
     NOT_MODIFIED_HEADERS: tuple[str, ...] = (
@@ -28,7 +111,7 @@ class StaticResponse(Response):
         "vary",
     )
 
-    def __init__(self, headers: Header):
+    def __init__(self, headers: Mapping[str, str]):
         super().__init__(
             status_code=304,
             headers={
@@ -37,6 +120,38 @@ class StaticResponse(Response):
         )
 
 
+class StaticIndexEntry:
+    """
+    A file of the index of `StaticFiles`, with the headers computed once from its stat result.
+    """
+
+    __slots__ = ("full_path", "stat_result", "media_type", "headers", "body")
+
+    def __init__(self, full_path: str, stat_result: os.stat_result) -> None:
+        self.full_path = full_path
+        self.stat_result = stat_result
+        self.media_type: str = mimetypes.guess_type(full_path)[0] or MediaType.OCTET
+        etag_base = str(stat_result.st_mtime) + "-" + str(stat_result.st_size)
+        # The same headers as `FileResponse.set_stat_headers`
+        self.headers: dict[str, str] = {
+            "content-length": str(stat_result.st_size),
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "etag": md5_hexdigest(etag_base.encode(), usedforsecurity=False),
+            "accept-ranges": "bytes",
+        }
+        self.body: bytes | None = None
+
+    def is_unchanged(self, stat_result: os.stat_result) -> bool:
+        """
+        Whether a new stat result of the file describes the same content.
+        """
+        return (
+            self.stat_result.st_mtime_ns == stat_result.st_mtime_ns
+            and self.stat_result.st_size == stat_result.st_size
+            and self.stat_result.st_ino == stat_result.st_ino
+        )
+
+
 class StaticFiles:
     def __init__(
         self,
@@ -47,6 +162,14 @@ class StaticFiles:
         check_dir: bool = True,
         follow_symlink: bool = False,
         fall_through: bool = False,
+        precompressed: bool = False,
+        encodings: Sequence[str] = DEFAULT_ENCODINGS,
+        manifest: str | StaticManifest | None = None,
+        index: bool = False,
+        max_memory_file_size: int = 0,
+        max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE,
+        watch: bool = False,
+        watch_interval: float = 1.0,
     ) -> None:
         """
         Initialize StaticFiles middleware.
@@ -57,6 +180,18 @@ class StaticFiles:
             html (bool): Flag to enable HTML file handling for directories.
             check_dir (bool): Flag to check if the directory exists.
             follow_symlink (bool): Flag to follow symlinks.
+            precompressed (bool): Serve the `.zst`, `.br` or `.gz` sibling of a file when the client accepts it.
+            encodings (Sequence[str]): The codings of the precompressed siblings, in order of preference.
+            manifest (str | StaticManifest | None): The manifest of the content-hashed files, or the
+                name of its file in the static directories. The hashed files are served with a
+                one-year immutable `Cache-Control`.
+            index (bool): Index the files of the directories with their stat result and headers
+                on the first request, serving them without a thread hop per request.
+            max_memory_file_size (int): With `index`, the files up to this size are kept in
+                memory once requested.
+            max_memory_size (int): With `index`, the total size of the files kept in memory.
+            watch (bool): With `index`, rescan the directories for changes, for development.
+            watch_interval (float): The minimal interval between two rescans, in seconds.
         """
 
         if directory:
@@ -70,6 +205,17 @@ class StaticFiles:
         self.fall_through = fall_through
         self.config_checked = False
         self.follow_symlink = follow_symlink
+        self.precompressed = precompressed
+        self.encodings = tuple(encodings)
+        self._manifest = manifest
+        self.index = index
+        self.max_memory_file_size = max_memory_file_size
+        self.max_memory_size = max_memory_size
+        self.watch = watch
+        self.watch_interval = watch_interval
+        self.entries: dict[str, StaticIndexEntry] = {}
+        self.memory_size = 0
+        self._index_expires = 0.0
         if check_dir and directory is not None:
             for _dir in directory:
                 if not os.path.isdir(_dir):
@@ -170,6 +316,16 @@ class StaticFiles:
         """
         if scope["method"] not in ("GET", "HEAD"):
             raise HTTPException(status_code=405)
+
+        if self.index:
+            if self.watch and time.monotonic() >= self._index_expires:
+                await self.refresh_index()
+            entry = self.entries.get(path)
+            if entry is not None:
+                response = await self.index_response(path, entry, scope)
+                if response is not None:
+                    return response
+
         try:
             full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
         except PermissionError:
@@ -178,7 +334,12 @@ class StaticFiles:
             raise
 
         if stat_result and stat.S_ISREG(stat_result.st_mode):
-            return self.file_response(full_path, stat_result, scope)
+            response = await self.precompressed_response(full_path, scope)
+            if response is None:
+                response = self.file_response(full_path, stat_result, scope)
+            if self.manifest.is_hashed(path.replace(os.sep, "/")):
+                response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+            return response
 
         elif stat_result and stat.S_ISDIR(stat_result.st_mode) and self.html:
             index_path = os.path.join(path, "index.html")
@@ -198,6 +359,219 @@ class StaticFiles:
                 return FileResponse(full_path, stat_result=stat_result, status_code=404)
         raise HTTPException(status_code=404)
 
+    async def refresh_index(self) -> None:
+        """
+        Rebuilds the index of the files in a worker thread.
+        """
+        # Set before the rebuild, so that concurrent requests do not start another one
+        self._index_expires = time.monotonic() + self.watch_interval
+        await anyio.to_thread.run_sync(self.build_index)
+
+    def build_index(self) -> None:
+        """
+        Indexes the regular files of the directories, the first directory winning.
+
+        The entries of the unchanged files are kept, with their content in memory.
+        """
+        entries: dict[str, StaticIndexEntry] = {}
+        memory_size = 0
+        for directory in self.all_directories:
+            for root, _, names in os.walk(directory, followlinks=self.follow_symlink):
+                for name in names:
+                    path = os.path.relpath(os.path.join(root, name), directory)
+                    if path in entries:
+                        continue
+                    full_path = self.get_full_path(directory, path)
+                    stat_result = self.get_stat_result(full_path)
+                    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                        continue
+
+                    entry = self.entries.get(path)
+                    if (
+                        entry is None
+                        or entry.full_path != full_path
+                        or not entry.is_unchanged(stat_result)
+                    ):
+                        entry = StaticIndexEntry(full_path, stat_result)
+                    elif entry.body is not None:
+                        memory_size += len(entry.body)
+                    entries[path] = entry
+
+        self.entries = entries
+        self.memory_size = memory_size
+
+    async def index_response(
+        self, path: str, entry: StaticIndexEntry, scope: Scope
+    ) -> Response | None:
+        """
+        Returns the response of an indexed file, without a thread hop for the `304 Not Modified`
+        responses and the files kept in memory.
+
+        Args:
+            path (str): Path to the static file.
+            entry (StaticIndexEntry): The entry of the file.
+            scope (Scope): ASGI scope.
+
+        Returns:
+            Response | None: HTTP response, or None if the file changed or was removed since
+                it was indexed, its entry being dropped so the file is looked up instead.
+        """
+        request_headers = Header.ensure_header_instance(scope=scope)
+        media_type = entry.media_type
+        headers = dict(entry.headers)
+        entry_path = path
+
+        if self.precompressed:
+            headers["vary"] = "Accept-Encoding"
+            accept_encoding = request_headers.get("accept-encoding", "")
+            for encoding in accepted_encodings(accept_encoding, self.encodings):
+                encoded_path = path + ENCODING_SUFFIXES[encoding]
+                sibling = self.entries.get(encoded_path)
+                if (
+                    sibling is not None
+                    and sibling.full_path == entry.full_path + ENCODING_SUFFIXES[encoding]
+                ):
+                    entry_path, entry = encoded_path, sibling
+                    headers = {
+                        **sibling.headers,
+                        "content-encoding": encoding,
+                        "vary": "Accept-Encoding",
+                    }
+                    break
+
+        if self.manifest.is_hashed(path.replace(os.sep, "/")):
+            headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+
+        if self.is_not_modified(headers, request_headers):
+            return StaticResponse(headers)
+
+        # Ranges are served from the file
+        if "range" not in request_headers:
+            body = entry.body
+            if body is None and self.should_keep_in_memory(entry):
+                body = await anyio.to_thread.run_sync(self.read_entry, entry)
+                if body is not None and entry.body is None:
+                    entry.body = body
+                    self.memory_size += len(body)
+            if body is not None:
+                return Response(body, headers=headers, media_type=media_type)
+
+        # The headers of the entry must describe the file that is sent
+        stat_result = await anyio.to_thread.run_sync(self.get_stat_result, entry.full_path)
+        if stat_result is None or not entry.is_unchanged(stat_result):
+            self.drop_entry(entry_path, entry)
+            return None
+
+        return FileResponse(
+            entry.full_path,
+            headers=headers,
+            media_type=media_type,
+            stat_result=entry.stat_result,
+        )
+
+    def drop_entry(self, path: str, entry: StaticIndexEntry) -> None:
+        """
+        Removes an outdated entry from the index, until the next rebuild.
+        """
+        if self.entries.get(path) is entry:
+            del self.entries[path]
+            if entry.body is not None:
+                self.memory_size -= len(entry.body)
+
+    def should_keep_in_memory(self, entry: StaticIndexEntry) -> bool:
+        """
+        Whether the content of an indexed file fits in memory.
+        """
+        size = entry.stat_result.st_size
+        return (
+            size <= self.max_memory_file_size and self.memory_size + size <= self.max_memory_size
+        )
+
+    def read_entry(self, entry: StaticIndexEntry) -> bytes | None:
+        """
+        Reads the content of an indexed file.
+
+        Returns:
+            bytes | None: The content, or None if the file changed since it was indexed.
+        """
+        try:
+            with open(entry.full_path, "rb") as indexed_file:
+                body = indexed_file.read()
+        except FileNotFoundError:
+            return None
+        if len(body) != entry.stat_result.st_size:
+            return None
+        return body
+
+    @property
+    def manifest(self) -> StaticManifest:
+        """
+        The manifest of the content-hashed files, loaded on first access.
+        """
+        if not isinstance(self._manifest, StaticManifest):
+            manifest = StaticManifest()
+            if self._manifest is not None:
+                for directory in self.all_directories:
+                    manifest = StaticManifest.load(os.path.join(directory, self._manifest))
+                    if manifest.paths:
+                        break
+            self._manifest = manifest
+        return self._manifest
+
+    async def precompressed_response(self, full_path: str, scope: Scope) -> Response | None:
+        """
+        Returns the response of the precompressed sibling of a file accepted by the client.
+
+        Args:
+            full_path (str): Full path to the file.
+            scope (Scope): ASGI scope.
+
+        Returns:
+            Response | None: The response, or None to serve the file itself.
+        """
+        if not self.precompressed:
+            return None
+
+        request_headers = Header.ensure_header_instance(scope=scope)
+        encodings = accepted_encodings(request_headers.get("accept-encoding", ""), self.encodings)
+        if not encodings:
+            return None
+
+        encoding, encoded_path, stat_result = await anyio.to_thread.run_sync(
+            self.lookup_precompressed, full_path, encodings
+        )
+        if stat_result is None:
+            return None
+
+        return self.file_response(
+            encoded_path,
+            stat_result,
+            scope,
+            headers={"content-encoding": encoding, "vary": "Accept-Encoding"},
+            media_type=mimetypes.guess_type(full_path)[0] or MediaType.OCTET,
+        )
+
+    def lookup_precompressed(
+        self, full_path: str, encodings: Sequence[str]
+    ) -> tuple[str, str, os.stat_result | None]:
+        """
+        Look up the first existing precompressed sibling of a file.
+
+        Args:
+            full_path (str): Full path to the file.
+            encodings (Sequence[str]): The acceptable codings, the preferred first.
+
+        Returns:
+            Tuple[str, str, os.stat_result | None]: The coding, the path and the stat result
+                of the sibling (or None if there is none).
+        """
+        for encoding in encodings:
+            encoded_path = full_path + ENCODING_SUFFIXES[encoding]
+            stat_result = self.get_stat_result(encoded_path)
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                return encoding, encoded_path, stat_result
+        return "", "", None
+
     def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
         """
         Look up the full path and stat result for a given path.
@@ -252,6 +626,8 @@ class StaticFiles:
         stat_result: os.stat_result,
         scope: Scope,
         status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
     ) -> Response:
         """
         Generate a file response.
@@ -261,6 +637,8 @@ class StaticFiles:
             stat_result (os.stat_result): Stat result for the file.
             scope (Scope): ASGI scope.
             status_code (int): HTTP status code.
+            headers (Mapping[str, str] | None): Additional response headers.
+            media_type (str | None): The media type, guessed from the path when not given.
 
         Returns:
             Response: File response.
@@ -268,7 +646,17 @@ class StaticFiles:
         # no headers are no issue
         request_headers = Header.ensure_header_instance(scope=scope)
 
-        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        if headers is None and self.precompressed:
+            # The representation depends on Accept-Encoding even when not compressed
+            headers = {"vary": "Accept-Encoding"}
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            stat_result=stat_result,
+        )
         if self.is_not_modified(response.headers, request_headers):
             return StaticResponse(response.headers)
         return response
@@ -291,17 +679,20 @@ class StaticFiles:
         pointed at a directory, so that we can raise loud errors rather than
         just returning 404 responses.
         """
-        if self.directory is None:
-            return
-        await anyio.to_thread.run_sync(self._check_dirs)
-
-    def is_not_modified(self, response_headers: Header, request_headers: Header) -> bool:
+        if self.directory is not None:
+            await anyio.to_thread.run_sync(self._check_dirs)
+        if self.index:
+            await self.refresh_index()
+
+    def is_not_modified(
+        self, response_headers: Mapping[str, str], request_headers: Header
+    ) -> bool:
         """
         Given the request and response headers, return `True` if an HTTP
         "Not Modified" response could be returned instead.
 
         Args:
-            response_headers (Header): Response headers.
+            response_headers (Mapping[str, str]): Response headers.
             request_headers (Header): Request headers.
 
         Returns:
@@ -328,3 +719,102 @@ class StaticFiles:
             pass
 
         return False
+
+
+def precompress_directory(
+    directory: PathLike,
+    *,
+    encodings: Sequence[str] = DEFAULT_ENCODINGS,
+    levels: Mapping[str, int] | None = None,
+    minimum_size: int = 256,
+    compressible_types: Sequence[str] = DEFAULT_COMPRESSIBLE_TYPES,
+    hash_files: bool = True,
+    manifest_name: str = DEFAULT_MANIFEST,
+) -> StaticManifest:
+    """
+    Writes the precompressed siblings and the content-hashed copies of the files of a directory.
+
+    Every compressible file gets a `.zst`, `.br` and `.gz` sibling (for the codings
+    whose library is installed) when it is smaller than the file. With `hash_files`,
+    every file is also copied to a name carrying a hash of its content, e.g.
+    `app.css` to `app.1a2b3c4d5e6f.css`, and the mapping is written to the manifest
+    read by `StaticFiles(manifest=...)`. Running it again only refreshes what changed.
+
+    Args:
+        directory (PathLike): The directory of the static files.
+        encodings (Sequence[str]): The codings to precompress with.
+        levels (Mapping[str, int] | None): The compression level by coding, the highest by default.
+        minimum_size (int): The files smaller than this are not precompressed.
+        compressible_types (Sequence[str]): The media types to precompress, as `fnmatch` patterns.
+        hash_files (bool): Whether to write the content-hashed copies and the manifest.
+        manifest_name (str): The name of the manifest file in the directory.
+
+    Returns:
+        StaticManifest: The manifest of the content-hashed copies.
+    """
+    compressors = {
+        encoding: COMPRESSORS[encoding]
+        for encoding in encodings
+        if COMPRESSORS[encoding].is_available()
+    }
+    compression_levels = {**PRECOMPRESS_LEVELS, **(levels or {})}
+    manifest_path = os.path.join(directory, manifest_name)
+
+    # The hashed copies of a previous run are outputs, not sources.
+    previous = StaticManifest.load(manifest_path)
+    suffixes = tuple(ENCODING_SUFFIXES.values())
+    sources = sorted(
+        os.path.relpath(os.path.join(root, name), directory).replace(os.sep, "/")
+        for root, _, names in os.walk(directory)
+        for name in names
+        if not name.endswith(suffixes) and name != manifest_name
+    )
+
+    paths: dict[str, str] = {}
+    for source in sources:
+        if previous.is_hashed(source):
+            continue
+
+        full_path = os.path.join(directory, source)
+        with open(full_path, "rb") as source_file:
+            data = source_file.read()
+
+        targets = [full_path]
+        if hash_files:
+            stem, extension = posixpath.splitext(source)
+            digest = md5_hexdigest(data, usedforsecurity=False)[:12]
+            hashed = f"{stem}.{digest}{extension}"
+            paths[source] = hashed
+            hashed_path = os.path.join(directory, hashed)
+            if not os.path.exists(hashed_path):
+                shutil.copy2(full_path, hashed_path)
+            targets.append(hashed_path)
+
+        media_type = mimetypes.guess_type(source)[0] or MediaType.OCTET
+        encoded: dict[str, bytes] = {}
+        if len(data) >= minimum_size and matches_media_type(media_type, compressible_types):
+            for encoding, compressor in compressors.items():
+                compressed = compressor.compress_body(data, compression_levels[encoding])
+                if len(compressed) < len(data):
+                    encoded[encoding] = compressed
+
+        for target in targets:
+            for encoding, suffix in ENCODING_SUFFIXES.items():
+                encoded_path = target + suffix
+                if encoding in encoded:
+                    with open(encoded_path, "wb") as encoded_file:
+                        encoded_file.write(encoded[encoding])
+                elif os.path.exists(encoded_path):
+                    # A stale sibling would be served in place of the file
+                    os.remove(encoded_path)
+
+    manifest = StaticManifest(paths)
+    if hash_files:
+        # Drop the hashed copies whose source changed or disappeared
+        for stale in previous.hashed_paths - manifest.hashed_paths:
+            for path in (stale, *(stale + suffix for suffix in suffixes)):
+                stale_path = os.path.join(directory, path)
+                if os.path.exists(stale_path):
+                    os.remove(stale_path)
+        manifest.dump(manifest_path)
+    return manifest
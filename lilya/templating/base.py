@@ -6,7 +6,7 @@ from typing import Any, Generic, TypeVar
 from lilya import status
 from lilya.background import Task
 from lilya.requests import Request
-from lilya.responses import TemplateResponse
+from lilya.responses import StreamingTemplateResponse, TemplateResponse
 
 T = TypeVar("T")
 
@@ -45,3 +45,25 @@ class BaseTemplateRenderer(Generic[T]):
             background=background,
             render_function_name=self.render_function_name,
         )
+
+    def prepare_streaming_response(
+        self,
+        request: Request,
+        name: str,
+        context: dict,
+        status_code: int = status.HTTP_200_OK,
+        headers: dict[str, Any] | None = None,
+        media_type: str | None = None,
+        background: Task | None = None,
+    ) -> StreamingTemplateResponse:
+        context.setdefault("request", request)
+        template = self.get_template(name)
+        return StreamingTemplateResponse(
+            template=template,
+            context=context,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type or "text/html",
+            background=background,
+            render_function_name=self.render_function_name,
+        )
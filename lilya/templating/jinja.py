@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import os
 from collections.abc import Sequence
-from typing import Any, Generic
+from typing import Any, Generic, Literal, overload
 
 from lilya import status
 from lilya.exceptions import MissingDependency, TemplateNotFound
 from lilya.requests import Request
-from lilya.responses import TemplateResponse
+from lilya.responses import StreamingTemplateResponse, TemplateResponse
 from lilya.templating.base import BaseTemplateRenderer
 
 try:
@@ -53,6 +53,33 @@ class TemplateRenderer(BaseTemplateRenderer, Generic[P]):
         Returns:
             TemplateResponse: The rendered template response.
         """
+        template_response = self.prepare_response(*self._prepare(*args, **kwargs))
+        return template_response
+
+    def stream(self, *args: Any, **kwargs: Any) -> StreamingTemplateResponse:
+        """
+        Render a template in chunks, as it is sent, based on the provided arguments.
+
+        Args:
+            *args: Positional arguments.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            StreamingTemplateResponse: The streamed template response.
+        """
+        return self.prepare_streaming_response(*self._prepare(*args, **kwargs))
+
+    def _prepare(self, *args: Any, **kwargs: Any) -> tuple:
+        """
+        Parse the arguments and apply the context processors of the template.
+
+        Args:
+            *args: Positional arguments.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            tuple: The arguments of `prepare_response`.
+        """
         request, name, context, status_code, headers, media_type, background = self._parse_args(
             *args, **kwargs
         )
@@ -61,10 +88,7 @@ class TemplateRenderer(BaseTemplateRenderer, Generic[P]):
             for context_processor in self.template.context_processors:
                 context.update(context_processor(request))
 
-        template_response = self.prepare_response(
-            request, name, context, status_code, headers, media_type, background
-        )
-        return template_response
+        return request, name, context, status_code, headers, media_type, background
 
     def _parse_args(self, *args: P.args, **kwargs: P.kwargs) -> tuple:
         """
@@ -224,7 +248,24 @@ class Jinja2Template:
         except JinjaTemplateNotFound as e:
             raise TemplateNotFound(name=name) from e
 
-    def get_template_response(self, *args: Any, **kwargs: Any) -> TemplateResponse:
+    @overload
+    def get_template_response(
+        self, *args: Any, stream: Literal[False] = False, **kwargs: Any
+    ) -> TemplateResponse: ...
+
+    @overload
+    def get_template_response(
+        self, *args: Any, stream: Literal[True], **kwargs: Any
+    ) -> StreamingTemplateResponse: ...
+
+    @overload
+    def get_template_response(
+        self, *args: Any, stream: bool, **kwargs: Any
+    ) -> TemplateResponse | StreamingTemplateResponse: ...
+
+    def get_template_response(
+        self, *args: Any, stream: bool = False, **kwargs: Any
+    ) -> TemplateResponse | StreamingTemplateResponse:
         """
         Get a TemplateResponse using the provided arguments.
 
@@ -238,12 +279,22 @@ class Jinja2Template:
             request (required): The HTTP request object.
             name (required): The name of the template to render.
             *args (Any): Positional arguments.
+            stream (bool): Send the template in chunks as it is rendered, with a
+                `StreamingTemplateResponse`, instead of rendering it as a whole first.
             **kwargs (Any): Keyword arguments.
 
         Returns:
-            TemplateResponse: The rendered template response.
+            TemplateResponse | StreamingTemplateResponse: The rendered template response,
+                a `StreamingTemplateResponse` when `stream` is set.
         """
-        template_renderer: TemplateRenderer = TemplateRenderer(
+        if stream:
+            template_renderer: TemplateRenderer = TemplateRenderer(
+                template=self,
+                render_function_name="generate_async" if self.env.is_async else "generate",
+            )
+            return template_renderer.stream(*args, **kwargs)
+
+        template_renderer = TemplateRenderer(
             template=self,
             render_function_name="render_async" if self.env.is_async else "render",
         )
@@ -0,0 +1,117 @@
+"""
+Upload sinks streaming the uploaded files to their destination.
+
+The sinks are given to `Request.form(upload_sink=...)` through a factory called for each
+uploaded file, so the files are written as the request body is parsed, instead of being
+spooled into temporary files first.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import anyio
+
+from lilya.protocols.uploads import UploadSinkProtocol
+
+
+class FileSink(UploadSinkProtocol):
+    """
+    Writes an uploaded file to a path or an open file descriptor.
+
+    A path is created (or truncated) on the first write and can be read back from the
+    `DataUpload` once the form was parsed. A file descriptor is only written to, from its
+    current position.
+
+    Args:
+        destination: The path of the file or a file descriptor open for writing.
+        closefd: Whether to close the file descriptor with the sink.
+    """
+
+    def __init__(self, destination: str | os.PathLike[str] | int, *, closefd: bool = True) -> None:
+        self.destination = destination
+        self.closefd = closefd
+        self.file: anyio.AsyncFile[bytes] | None = None
+        self.closed = False
+
+    async def open(self) -> anyio.AsyncFile[bytes]:
+        """Opens the destination, once."""
+        if self.file is None:
+            if isinstance(self.destination, int):
+                self.file = anyio.wrap_file(
+                    os.fdopen(self.destination, "wb", closefd=self.closefd)
+                )
+            else:
+                self.file = await anyio.open_file(self.destination, "w+b")
+        return self.file
+
+    async def write(self, data: bytes | memoryview) -> None:
+        file = await self.open()
+        await file.write(data)
+
+    async def finish(self) -> None:
+        file = await self.open()
+        await file.flush()
+        if file.readable():
+            await file.seek(0)
+
+    async def read(self, size: int = -1) -> bytes:
+        file = await self.open()
+        return await file.read(size)
+
+    async def seek(self, offset: int) -> int:
+        file = await self.open()
+        return await file.seek(offset)
+
+    async def aclose(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self.file is not None:
+            await self.file.aclose()
+        elif isinstance(self.destination, int) and self.closefd:
+            os.close(self.destination)
+
+
+class StreamSink(UploadSinkProtocol):
+    """
+    Passes an uploaded file to an asynchronous writer, chunk by chunk.
+
+    The chunks are `memoryview` slices of the request body, only valid during the call,
+    and the file cannot be read back from the `DataUpload`.
+
+    Args:
+        write: Awaitable callable receiving each chunk.
+        close: Optional awaitable callable called when the sink is closed.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[memoryview], Awaitable[Any]],
+        *,
+        close: Callable[[], Awaitable[Any]] | None = None,
+    ) -> None:
+        self._write = write
+        self._close = close
+        self.closed = False
+
+    async def write(self, data: bytes | memoryview) -> None:
+        await self._write(memoryview(data))
+
+    async def finish(self) -> None: ...
+
+    async def read(self, size: int = -1) -> bytes:
+        raise io.UnsupportedOperation("The file was streamed and cannot be read back.")
+
+    async def seek(self, offset: int) -> int:
+        raise io.UnsupportedOperation("The file was streamed and cannot be read back.")
+
+    async def aclose(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        if self._close is not None:
+            await self._close()
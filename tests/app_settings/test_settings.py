@@ -89,6 +89,9 @@ def test_dict_default():
         "root_path_in_servers": True,
         "root_path": "",
         "redirect_slashes": True,
+        "compile_routes": False,
+        "threadpool_size": None,
+        "threadpools": None,
         "csrf_token_name": "csrf_token",
         "port": 8000,
         "host": "localhost",
@@ -0,0 +1,81 @@
+"""
+Middleware stack benchmarks.
+
+Benchmarks measure the per-request overhead of a middleware stack against its number of
+layers, for middleware mutating the scope and for middleware declaring `__preserves_scope__`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from lilya._internal._middleware import apply_asgi_stack
+from lilya.middleware import DefineMiddleware
+from lilya.types import ASGIApp, Receive, Scope, Send
+
+
+class ScopeWritingMiddleware:
+    """Middleware adding a key to the scope."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        scope["layer"] = self
+        await self.app(scope, receive, send)
+
+
+class ScopePreservingMiddleware:
+    """Middleware only passing the scope along."""
+
+    __preserves_scope__ = True
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+
+
+async def simple_app(scope: Scope, receive: Receive, send: Send) -> None:
+    """Application sending an empty response."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _request_runner(middleware: type, count: int):
+    """Returns a function running one request through `count` layers of middleware."""
+    app = apply_asgi_stack(simple_app, [DefineMiddleware(middleware)] * count)
+    headers = [(f"x-header-{i}".encode(), b"value") for i in range(16)]
+    loop = asyncio.new_event_loop()
+
+    async def send(message):
+        pass
+
+    def run():
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": headers}
+        loop.run_until_complete(app(scope, receive, send))
+
+    return run, loop
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [1, 4, 8])
+@pytest.mark.parametrize(
+    "middleware",
+    [ScopeWritingMiddleware, ScopePreservingMiddleware],
+    ids=["writing", "preserving"],
+)
+def test_middleware_stack_overhead(benchmark, middleware, count):
+    """Benchmark a request through a stack of middleware."""
+    run, loop = _request_runner(middleware, count)
+    try:
+        benchmark(run)
+    finally:
+        loop.close()
@@ -0,0 +1,52 @@
+"""
+Multipart parsing benchmarks.
+
+Benchmarks measure the parsing of large uploads by the streaming `MultipartParser`, fed
+with the chunks of the size an ASGI server typically delivers.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from lilya.contrib.multipart import MultipartParser
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _multipart_body(size: int) -> bytes:
+    """A multipart body holding a single file of the given size."""
+    return (
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="upload.bin"\r\n'
+        b"Content-Type: application/octet-stream\r\n"
+        b"\r\n" + os.urandom(size) + b"\r\n--boundary--\r\n"
+    )
+
+
+def _parse(chunks: list[bytes]) -> int:
+    """Parse the chunks, returning the size of the file."""
+    received = 0
+
+    def on_part_data(data: bytes, start: int, end: int) -> None:
+        nonlocal received
+        received += end - start
+
+    parser = MultipartParser(b"boundary")
+    parser.set_callback("part_data", on_part_data)
+    for chunk in chunks:
+        parser.write(chunk)
+    parser.finalize()
+    return received
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", [1024 * 1024, 32 * 1024 * 1024], ids=["1MiB", "32MiB"])
+def test_multipart_large_upload(benchmark, size):
+    """Benchmark parsing an upload in 64 KiB chunks."""
+    body = _multipart_body(size)
+    chunks = [body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+    assert benchmark(_parse, chunks) == size
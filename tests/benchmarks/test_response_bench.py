@@ -5,9 +5,14 @@ Benchmark response creation and serialization overhead across different response
 and payload sizes. These benchmarks measure in-memory operations only (no I/O).
 """
 
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
 import pytest
 
 from lilya.background import Task
+from lilya.encoders import json_encode
 from lilya.responses import JSONResponse, Ok, StreamingResponse
 
 
@@ -162,3 +167,40 @@ def test_ok_response_mixed_types(benchmark):
     assert result.status_code == 200
     assert b"test" in result.body
     assert b"3.14159" in result.body
+
+
+@dataclass
+class Row:
+    id: UUID
+    name: str
+    created_at: date
+    tags: list[str]
+
+
+def _large_payload() -> list[Row]:
+    return [
+        Row(id=UUID(int=i), name=f"Row {i}", created_at=date(2024, 1, 1), tags=["a", "b", "c"])
+        for i in range(10_000)
+    ]
+
+
+@pytest.mark.benchmark
+def test_handler_return_large_payload_two_pass(benchmark):
+    """Benchmark the previous handler return path: encode/decode first, then Ok() (10k rows)."""
+    data = _large_payload()
+
+    result = benchmark(lambda: Ok(json_encode(data)))
+
+    assert result.status_code == 200
+    assert b"Row 9999" in result.body
+
+
+@pytest.mark.benchmark
+def test_handler_return_large_payload_single_pass(benchmark):
+    """Benchmark the handler return path encoding straight to bytes with Ok() (10k rows)."""
+    data = _large_payload()
+
+    result = benchmark(Ok, data)
+
+    assert result.status_code == 200
+    assert b"Row 9999" in result.body
@@ -0,0 +1,78 @@
+"""
+Reverse routing benchmarks for Lilya.
+
+Benchmarks measure `url_path_for` over a large application, as done per link when
+rendering templates with `path_for`.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from lilya.responses import PlainText
+from lilya.routing import Include, NoMatchFound, Path, Router
+
+
+async def simple_handler():
+    """Static handler for the routes."""
+    return PlainText("OK")
+
+
+def _many_named_routes() -> list:
+    """600 named routes spread over 20 named Includes."""
+    includes = []
+    for i in range(20):
+        routes = []
+        for j in range(15):
+            routes.append(Path(f"/resource{j:02d}", handler=simple_handler, name=f"list{j:02d}"))
+            routes.append(
+                Path(
+                    f"/resource{j:02d}/{{item_id:int}}",
+                    handler=simple_handler,
+                    name=f"detail{j:02d}",
+                )
+            )
+        includes.append(Include(f"/service{i:02d}", routes=routes, name=f"service{i:02d}"))
+    return includes
+
+
+@pytest.fixture
+def many_named_routes_router():
+    """Router with 600 named routes over named Includes."""
+    return Router(routes=_many_named_routes())
+
+
+def _linear_url_path_for(routes: list, name: str, **path_params):
+    """The lookup trying every route in order, as before the reverse index."""
+    for route in routes:
+        if isinstance(route, Include):
+            if not name.startswith(route.name + ":"):
+                continue
+            try:
+                url = _linear_url_path_for(
+                    route.routes, name[len(route.name) + 1 :], **path_params
+                )
+            except NoMatchFound:
+                continue
+            return route.path.rstrip("/") + url
+        try:
+            return str(route.url_path_for(name, **path_params))
+        except NoMatchFound:
+            pass
+    raise NoMatchFound(name, path_params)
+
+
+@pytest.mark.benchmark
+def test_reverse_routing_600_routes_linear(benchmark, many_named_routes_router):
+    """Benchmark the linear reverse lookup: 600 routes, the last route."""
+    url = benchmark(
+        _linear_url_path_for, many_named_routes_router.routes, "service19:detail14", item_id=42
+    )
+    assert url == "/service19/resource14/42"
+
+
+@pytest.mark.benchmark
+def test_reverse_routing_600_routes_indexed(benchmark, many_named_routes_router):
+    """Benchmark the indexed reverse lookup: 600 routes, the last route."""
+    url = benchmark(many_named_routes_router.url_path_for, "service19:detail14", item_id=42)
+    assert url == "/service19/resource14/42"
@@ -232,3 +232,70 @@ def test_routing_worst_case_100_routes(benchmark, large_router):
 
     # Benchmark the dispatch operation
     benchmark(dispatch)
+
+
+def _many_routes() -> list:
+    """600 routes spread over 20 Includes, with a mix of static and typed parameters."""
+    includes = []
+    for i in range(20):
+        routes = []
+        for j in range(15):
+            routes.append(Path(f"/resource{j:02d}", handler=simple_handler))
+            routes.append(Path(f"/resource{j:02d}/{{item_id:int}}", handler=simple_handler))
+        includes.append(Include(f"/service{i:02d}", routes=routes))
+    return includes
+
+
+@pytest.fixture
+def many_routes_router():
+    """Router with 600 routes over nested Includes."""
+    return Router(routes=_many_routes())
+
+
+@pytest.fixture
+def compiled_many_routes_router():
+    """Router with 600 routes over nested Includes using the compiled matcher."""
+    router = Router(routes=_many_routes(), compile_routes=True)
+    router.build_route_matcher()
+    return router
+
+
+def _search(router: Router, scope: dict):
+    for route in router.get_route_candidates(scope):
+        match, child_scope = route.search(scope)
+        if match != Match.NONE:
+            sub_router = route.app
+            sub_scope = {**scope, **child_scope}
+            for sub_route in sub_router.get_route_candidates(sub_scope):
+                match, child_scope = sub_route.search(sub_scope)
+                if match != Match.NONE:
+                    return match, child_scope
+    return Match.NONE, {}
+
+
+@pytest.mark.benchmark
+def test_routing_600_routes_linear(benchmark, many_routes_router):
+    """Benchmark the linear lookup: 600 routes, match the last route."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/service19/resource14/42",
+        "root_path": "",
+    }
+
+    match, _ = benchmark(_search, many_routes_router, scope)
+    assert match == Match.FULL
+
+
+@pytest.mark.benchmark
+def test_routing_600_routes_compiled(benchmark, compiled_many_routes_router):
+    """Benchmark the compiled matcher: 600 routes, match the last route."""
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/service19/resource14/42",
+        "root_path": "",
+    }
+
+    match, _ = benchmark(_search, compiled_many_routes_router, scope)
+    assert match == Match.FULL
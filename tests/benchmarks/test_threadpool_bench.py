@@ -0,0 +1,42 @@
+"""
+Threadpool benchmarks.
+
+Benchmarks measure the overhead of running a synchronous callable through
+`run_in_threadpool`, against calling `anyio.to_thread.run_sync` with a `functools.partial`.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import anyio
+import pytest
+
+from lilya.concurrency import run_in_threadpool
+
+
+def add(a: int, b: int = 0) -> int:
+    """Trivial synchronous callable."""
+    return a + b
+
+
+def _runner(call):
+    """Returns a function running 100 calls in a single event loop."""
+
+    async def calls():
+        for i in range(100):
+            await call(i)
+
+    return lambda: anyio.run(calls)
+
+
+@pytest.mark.benchmark
+def test_threadpool_partial(benchmark):
+    """Benchmark `to_thread.run_sync` with a partial per call."""
+    benchmark(_runner(lambda i: anyio.to_thread.run_sync(functools.partial(add, i, b=1))))
+
+
+@pytest.mark.benchmark
+def test_threadpool_run_in_threadpool(benchmark):
+    """Benchmark `run_in_threadpool` with its queue wait and active threads counters."""
+    benchmark(_runner(lambda i: run_in_threadpool(add, i, b=1)))
@@ -45,6 +45,26 @@ class NamespacedRedisCache(RedisCache):
     async def delete(self, key: str) -> None:
         await super().delete(self._key(key))
 
+    async def get_many(self, keys):
+        values = await super().get_many([self._key(key) for key in keys])
+        return {key.removeprefix(f"{self.namespace}:"): value for key, value in values.items()}
+
+    async def set_many(self, mapping, ttl=None, *, tags=()):
+        await super().set_many(
+            {self._key(key): value for key, value in mapping.items()},
+            ttl,
+            tags=[self._key(tag) for tag in tags],
+        )
+
+    async def delete_many(self, keys) -> None:
+        await super().delete_many([self._key(key) for key in keys])
+
+    async def delete_prefix(self, prefix: str) -> None:
+        await super().delete_prefix(self._key(prefix))
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        await super().invalidate_tags(*[self._key(tag) for tag in tags])
+
     def sync_get(self, key: str) -> Any | None:
         return super().sync_get(self._key(key))
 
@@ -0,0 +1,220 @@
+import time
+from typing import Any
+
+import anyio
+import pytest
+
+from lilya.caches.memory import InMemoryCache
+from lilya.caches.tiered import TieredCache
+from lilya.protocols.cache import TAG_KEY_PREFIX, CacheBackend
+
+
+class DictCache(CacheBackend):
+    """
+    A backend implementing only the single-key methods, counting the calls.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.calls = 0
+
+    async def get(self, key: str) -> Any | None:
+        self.calls += 1
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.calls += 1
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key: str) -> None:
+        self.calls += 1
+        self.store.pop(key, None)
+
+
+class CountingCache(InMemoryCache):
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+
+    async def get_many(self, keys):
+        self.batches += 1
+        return await super().get_many(keys)
+
+
+@pytest.fixture(params=["memory", "default"])
+def backend(request):
+    return InMemoryCache() if request.param == "memory" else DictCache()
+
+
+async def test_get_set_and_delete_many(backend):
+    await backend.set_many({"a": 1, "b": {"nested": True}, "c": [3]}, ttl=60)
+
+    assert await backend.get_many(["a", "b", "missing"]) == {"a": 1, "b": {"nested": True}}
+
+    await backend.delete_many(["a", "c"])
+
+    assert await backend.get_many(["a", "b", "c"]) == {"b": {"nested": True}}
+    assert await backend.get_many([]) == {}
+
+
+async def test_invalidate_tags(backend):
+    await backend.set_many({"user:1": "ann", "user:2": "bob"}, tags=["users"])
+    await backend.set_many({"team:1": "core"}, tags=["teams", "users"])
+    await backend.set("other", "kept")
+
+    await backend.invalidate_tags("users")
+
+    assert await backend.get_many(["user:1", "user:2", "team:1", "other"]) == {"other": "kept"}
+
+    # Invalidating an unknown or already invalidated tag is a no-op
+    await backend.invalidate_tags("users", "unknown")
+
+
+async def test_default_tag_index_expires_with_its_keys():
+    backend = DictCache()
+    index = f"{TAG_KEY_PREFIX}letters"
+
+    await backend.set_many({"a": 1}, ttl=60, tags=["letters"])
+    await backend.set_many({"b": 2}, ttl=10, tags=["letters"])
+    assert backend.ttls[index] in (60, 61)
+
+    # The expired keys are pruned on write
+    backend.store[index]["a"] = time.time() - 1
+    await backend.set_many({"c": 3}, ttl=10, tags=["letters"])
+    assert set(backend.store[index]) == {"b", "c"}
+    assert backend.ttls[index] in (10, 11)
+
+    # A persistent key keeps the index
+    await backend.set_many({"d": 4}, tags=["letters"])
+    assert backend.ttls[index] is None
+
+
+async def test_default_tag_index_keeps_concurrent_writes():
+    class SlowDictCache(DictCache):
+        async def get(self, key: str) -> Any | None:
+            value = await super().get(key)
+            await anyio.sleep(0.01)
+            return value
+
+    backend = SlowDictCache()
+
+    async with anyio.create_task_group() as tg:
+        for number in range(5):
+            tg.start_soon(lambda n=number: backend.set_many({f"k{n}": n}, tags=["numbers"]))
+
+    assert set(backend.store[f"{TAG_KEY_PREFIX}numbers"]) == {f"k{n}" for n in range(5)}
+    assert backend._tag_locks == {}
+
+    await backend.invalidate_tags("numbers")
+    assert backend.store == {}
+
+
+async def test_delete_prefix_memory():
+    backend = InMemoryCache()
+    await backend.set_many({"user:1": 1, "user:2": 2, "users": 3, "team:1": 4})
+
+    await backend.delete_prefix("user:")
+
+    assert await backend.get_many(["user:1", "user:2", "users", "team:1"]) == {
+        "users": 3,
+        "team:1": 4,
+    }
+
+
+async def test_delete_prefix_requires_native_support():
+    with pytest.raises(NotImplementedError):
+        await DictCache().delete_prefix("user:")
+
+
+async def test_memory_tags_follow_the_entries():
+    backend = InMemoryCache(max_entries=2)
+    await backend.set_many({"a": 1, "b": 2}, tags=["letters"])
+    await backend.set("c", 3)
+
+    # The evicted entry is no longer tracked by its tag
+    assert backend._tags == {"letters": {"b"}}
+
+    # Overwriting an entry without tags detaches it from its tags
+    await backend.set("b", 20)
+    assert backend._tags == {}
+    await backend.invalidate_tags("letters")
+    assert await backend.get("b") == 20
+
+
+async def test_tiered_batches_read_the_shared_cache_once():
+    shared = CountingCache()
+    tiered = TieredCache(shared)
+    await shared.set_many({"a": 1, "b": 2})
+    await tiered.get("a")
+
+    assert await tiered.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+    assert shared.batches == 1
+    assert await tiered.get_many(["a", "b"]) == {"a": 1, "b": 2}
+    assert shared.batches == 1
+
+
+async def test_tiered_tag_and_prefix_invalidation():
+    shared = InMemoryCache()
+    tiered = TieredCache(shared)
+    await tiered.set_many({"user:1": 1, "user:2": 2}, tags=["users"])
+    await tiered.set_many({"team:1": 3, "team:2": 4})
+
+    await tiered.invalidate_tags("users")
+    assert await tiered.get_many(["user:1", "user:2", "team:1"]) == {"team:1": 3}
+
+    await tiered.delete_prefix("team:")
+    assert await tiered.get_many(["team:1", "team:2"]) == {}
+    assert await shared.get_many(["team:1", "team:2"]) == {}
+
+
+async def test_batch_operations_redis(redis_cache):
+    await redis_cache.set_many({"a": 1, "b": [2]}, ttl=60)
+    await redis_cache.set_many({"c": 3})
+
+    assert await redis_cache.get_many(["a", "b", "c", "missing"]) == {"a": 1, "b": [2], "c": 3}
+
+    await redis_cache.delete_many(["a", "b"])
+    assert await redis_cache.get_many(["a", "b", "c"]) == {"c": 3}
+
+
+async def test_invalidate_tags_redis(redis_cache):
+    await redis_cache.set_many({"user:1": "ann", "user:2": "bob"}, ttl=60, tags=["users"])
+    await redis_cache.set("other", "kept")
+
+    await redis_cache.invalidate_tags("users")
+
+    assert await redis_cache.get_many(["user:1", "user:2", "other"]) == {"other": "kept"}
+
+
+async def test_redis_tag_index_expires_with_its_keys(redis_cache):
+    client = redis_cache.async_client
+    index = f"{TAG_KEY_PREFIX}{redis_cache._key('users')}"
+
+    await redis_cache.set_many({"user:1": "ann"}, ttl=60, tags=["users"])
+    await redis_cache.set_many({"user:2": "bob"}, ttl=10, tags=["users"])
+    assert 50 < await client.ttl(index) <= 61
+
+    # The expired keys are pruned on write
+    await client.zadd(index, {"expired": 1})
+    await redis_cache.set_many({"user:3": "cid"}, ttl=10, tags=["users"])
+    assert await client.zscore(index, "expired") is None
+
+    # A persistent key keeps the index
+    await redis_cache.set_many({"user:4": "dan"}, tags=["users"])
+    assert await client.ttl(index) == -1
+
+    await redis_cache.invalidate_tags("users")
+    assert await redis_cache.get_many(["user:1", "user:2", "user:3", "user:4"]) == {}
+
+
+async def test_delete_prefix_redis(redis_cache):
+    await redis_cache.set_many({"user:1": 1, "user:2": 2, "user*": 3, "team:1": 4})
+
+    await redis_cache.delete_prefix("user:")
+
+    assert await redis_cache.get_many(["user:1", "user:2", "user*", "team:1"]) == {
+        "user*": 3,
+        "team:1": 4,
+    }
@@ -0,0 +1,207 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import pytest
+
+from lilya.decorators import cache, generate_cache_key
+
+
+async def test_concurrent_misses_are_coalesced(memory_cache):
+    calls = []
+
+    @cache(backend=memory_cache, ttl=10)
+    async def load(value: int) -> int:
+        calls.append(value)
+        await anyio.sleep(0.05)
+        return value * 2
+
+    results = []
+
+    async def call():
+        results.append(await load(21))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(call)
+
+    assert results == [42] * 5
+    assert calls == [21]
+
+    stats = load.cache_stats()
+    assert (stats.misses, stats.coalesced, stats.hits) == (5, 4, 0)
+
+    assert await load(21) == 42
+    assert load.cache_stats().hits == 1
+
+
+async def test_coalesced_calls_share_the_error(memory_cache):
+    calls = []
+
+    @cache(backend=memory_cache, ttl=10)
+    async def load() -> int:
+        calls.append(1)
+        await anyio.sleep(0.05)
+        raise RuntimeError("database down")
+
+    errors = []
+
+    async def call():
+        try:
+            await load()
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(call)
+
+    assert errors == ["database down"] * 3
+    assert calls == [1]
+
+
+async def test_different_keys_are_not_coalesced(memory_cache):
+    calls = []
+
+    @cache(backend=memory_cache, ttl=10)
+    async def load(value: int) -> int:
+        calls.append(value)
+        await anyio.sleep(0.01)
+        return value
+
+    async with anyio.create_task_group() as tg:
+        for value in range(3):
+            tg.start_soon(load, value)
+
+    assert sorted(calls) == [0, 1, 2]
+    assert load.cache_stats().coalesced == 0
+
+
+@pytest.mark.anyio
+async def test_stale_while_revalidate(memory_cache, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    version = {"value": 1}
+    refreshes = []
+    release = threading.Event()
+
+    @cache(backend=memory_cache, ttl=10, stale_while_revalidate=30)
+    async def load() -> int:
+        if version["value"] > 1:
+            refreshes.append(1)
+            await anyio.to_thread.run_sync(release.wait, 1)
+        return version["value"]
+
+    assert await load() == 1
+
+    version["value"] = 2
+    monkeypatch.setattr(time, "time", lambda: now + 15)
+
+    # The stale value is served while a single refresh runs in the background
+    assert await load() == 1
+    assert await load() == 1
+    release.set()
+
+    key = generate_cache_key(load.__wrapped__, (), {})
+    with anyio.fail_after(1):
+        while memory_cache.sync_get(key)["value"] != 2:
+            await anyio.sleep(0.01)
+
+    assert await load() == 2
+    assert refreshes == [1]
+    stats = load.cache_stats()
+    assert (stats.hits, stats.misses, stats.stale) == (1, 1, 2)
+
+
+async def test_values_past_the_stale_window_are_recomputed(memory_cache, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    version = {"value": 1}
+
+    @cache(backend=memory_cache, ttl=10, stale_while_revalidate=5)
+    async def load() -> int:
+        return version["value"]
+
+    await load()
+    version["value"] = 2
+    monkeypatch.setattr(time, "time", lambda: now + 20)
+
+    assert await load() == 2
+
+
+async def test_stale_if_error(memory_cache, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    failing = {"value": False}
+
+    @cache(backend=memory_cache, ttl=10, stale_if_error=60)
+    async def load() -> str:
+        if failing["value"]:
+            raise RuntimeError("upstream down")
+        return "value"
+
+    await load()
+    failing["value"] = True
+
+    monkeypatch.setattr(time, "time", lambda: now + 30)
+    assert await load() == "value"
+    assert load.cache_stats().stale == 1
+
+    monkeypatch.setattr(time, "time", lambda: now + 100)
+    with pytest.raises(RuntimeError):
+        await load()
+
+
+def test_sync_concurrent_misses_are_coalesced(memory_cache):
+    calls = []
+    started = threading.Event()
+
+    @cache(backend=memory_cache, ttl=10)
+    def load(value: int) -> int:
+        calls.append(value)
+        started.set()
+        time.sleep(0.1)
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(load, 21)
+        started.wait(1)
+        others = [pool.submit(load, 21) for _ in range(3)]
+        results = [first.result()] + [future.result() for future in others]
+
+    assert results == [42] * 4
+    assert calls == [21]
+    assert load.cache_stats().coalesced == 3
+
+
+def test_sync_stale_while_revalidate(memory_cache):
+    refreshed = threading.Event()
+    version = {"value": 1}
+
+    @cache(backend=memory_cache, ttl=10, stale_while_revalidate=30)
+    def load() -> int:
+        if version["value"] > 1:
+            refreshed.set()
+        return version["value"]
+
+    assert load() == 1
+
+    # Expire the stored value while keeping it within the stale window
+    key = generate_cache_key(load.__wrapped__, (), {})
+    entry = memory_cache.sync_get(key)
+    memory_cache.sync_set(key, {**entry, "expires_at": time.time() - 1}, ttl=30)
+    version["value"] = 2
+
+    assert load() == 1
+    assert refreshed.wait(1)
+
+    deadline = time.time() + 1
+    while load() != 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert load() == 2
+
+
+def test_negative_stale_windows_are_rejected(memory_cache):
+    with pytest.raises(ValueError):
+        cache(backend=memory_cache, stale_while_revalidate=-1)
@@ -0,0 +1,117 @@
+import time
+
+import pytest
+
+from lilya.caches.memory import InMemoryCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = InMemoryCache(max_entries=3)
+
+    for key in ("a", "b", "c"):
+        cache.sync_set(key, key)
+    cache.sync_get("a")
+    cache.sync_set("d", "d")
+
+    assert list(cache._store) == ["c", "a", "d"]
+    assert cache.sync_get("b") is None
+    assert cache.stats().evictions == 1
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = InMemoryCache(max_entries=3, eviction="lfu")
+
+    for key in ("a", "b", "c"):
+        cache.sync_set(key, key)
+    for _ in range(3):
+        cache.sync_get("a")
+    cache.sync_get("b")
+    cache.sync_get("c")
+    cache.sync_get("c")
+
+    cache.sync_set("d", "d")
+    assert cache.sync_get("b") is None
+
+    # The new entry is the least frequently used one, but is never evicted on insertion
+    cache.sync_set("e", "e")
+    assert cache.sync_get("d") is None
+    assert cache.sync_get("e") == "e"
+    assert sorted(cache._store) == ["a", "c", "e"]
+
+
+def test_max_bytes_bounds_the_stored_size():
+    cache = InMemoryCache(max_bytes=100)
+
+    for index in range(10):
+        cache.sync_set(f"key-{index}", "x" * 20)
+
+    stats = cache.stats()
+    assert stats.size_bytes <= 100
+    assert stats.entries == 3
+    assert stats.evictions == 7
+    assert cache.sync_get("key-9") == "x" * 20
+
+    # A value larger than the cache is not stored and replaces nothing
+    cache.sync_set("key-9", "x" * 200)
+    assert cache.sync_get("key-9") is None
+
+
+def test_size_accounting_follows_overwrites_and_deletes():
+    cache = InMemoryCache()
+
+    cache.sync_set("key", "short")
+    cache.sync_set("key", "a much longer value")
+    assert cache.stats().size_bytes == len("key") + len('"a much longer value"')
+
+    cache.sync_delete("key")
+    assert cache.stats().size_bytes == 0
+    assert cache.stats().entries == 0
+
+
+def test_expired_entries_are_swept_on_write(monkeypatch):
+    cache = InMemoryCache()
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    for index in range(5):
+        cache.sync_set(f"short-{index}", index, ttl=1)
+    cache.sync_set("long", "value", ttl=100)
+
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+    cache.sync_set("other", "value")
+
+    assert sorted(cache._store) == ["long", "other"]
+    assert cache.stats().expirations == 5
+
+
+def test_sweep_ignores_overwritten_entries(monkeypatch):
+    cache = InMemoryCache()
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    cache.sync_set("key", "old", ttl=1)
+    cache.sync_set("key", "new", ttl=100)
+
+    monkeypatch.setattr(time, "time", lambda: now + 10)
+
+    assert cache.sweep() == 0
+    assert cache.sync_get("key") == "new"
+
+
+def test_stats_count_hits_and_misses():
+    cache = InMemoryCache()
+    cache.sync_set("key", "value")
+
+    cache.sync_get("key")
+    cache.sync_get("key")
+    cache.sync_get("missing")
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 1)
+    assert stats.hit_ratio == pytest.approx(2 / 3)
+
+
+@pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"max_bytes": 0}, {"eviction": "random"}])
+def test_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        InMemoryCache(**kwargs)
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from lilya import concurrency
+from lilya.caches.memory import InMemoryCache
+from lilya.concurrency import LoopThread
+from lilya.decorators import cache
+from lilya.protocols.cache import CacheBackend
+
+
+class AsyncOnlyCache(CacheBackend):
+    """
+    A backend implementing only the asynchronous methods, recording their event loops.
+    """
+
+    def __init__(self):
+        self.store = {}
+        self.loops = set()
+
+    async def get(self, key: str) -> Any | None:
+        self.loops.add(id(asyncio.get_running_loop()))
+        return self.store.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.store[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.store.pop(key, None)
+
+
+def test_async_only_backends_reuse_a_single_loop():
+    backend = AsyncOnlyCache()
+
+    @cache(backend=backend, ttl=10)
+    def double(value: int) -> int:
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(double, [1, 2, 3, 1, 2, 3]))
+
+    assert results == [2, 4, 6, 2, 4, 6]
+    assert len(backend.store) == 3
+    assert len(backend.loops) == 1
+
+    cache(backend=backend).invalidate(double, 1)
+    assert len(backend.store) == 2
+
+
+def test_native_sync_methods_are_used_directly(monkeypatch):
+    backend = InMemoryCache()
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("The async methods should not be used")
+
+    monkeypatch.setattr(backend, "get", fail)
+    monkeypatch.setattr(backend, "set", fail)
+
+    @cache(backend=backend, ttl=10)
+    def double(value: int) -> int:
+        return value * 2
+
+    assert double(4) == 8
+    assert double(4) == 8
+    assert double.cache_stats().hits == 1
+
+
+def test_sync_functions_can_be_called_from_a_running_loop():
+    backend = AsyncOnlyCache()
+
+    @cache(backend=backend, ttl=10)
+    def double(value: int) -> int:
+        return value * 2
+
+    async def main():
+        return double(5), double(5)
+
+    assert asyncio.run(main()) == (10, 10)
+    assert double.cache_stats().hits == 1
+
+
+def test_loop_thread_can_be_restarted():
+    loop_thread = LoopThread(name="test-loop-thread")
+
+    async def current_thread():
+        return threading.current_thread().name
+
+    assert loop_thread.call(current_thread) == "test-loop-thread"
+    loop_thread.stop()
+    assert loop_thread.call(current_thread) == "test-loop-thread"
+    loop_thread.stop()
+
+
+def test_loop_thread_startup_errors_reach_the_caller(monkeypatch):
+    loop_thread = LoopThread(name="test-loop-thread")
+
+    def failing_portal():
+        raise OSError("No event loop")
+
+    async def current_thread():
+        return threading.current_thread().name
+
+    monkeypatch.setattr(concurrency, "BlockingPortal", failing_portal)
+    with pytest.raises(OSError, match="No event loop"):
+        loop_thread.call(current_thread)
+
+    # The next call starts the loop again
+    monkeypatch.undo()
+    assert loop_thread.call(current_thread) == "test-loop-thread"
+    loop_thread.stop()
+
+
+def test_loop_thread_starts_tasks_soon():
+    loop_thread = LoopThread(name="test-loop-thread")
+    threads = []
+    done = threading.Event()
+
+    async def record():
+        threads.append(threading.current_thread().name)
+        if len(threads) == 2:
+            done.set()
+
+    async def start_from_the_loop_thread():
+        loop_thread.start_soon(record)
+
+    loop_thread.start_soon(record)
+    loop_thread.call(start_from_the_loop_thread)
+
+    assert done.wait(1)
+    assert threads == ["test-loop-thread"] * 2
+    loop_thread.stop()
@@ -0,0 +1,151 @@
+import time
+
+import anyio
+import pytest
+
+from lilya._internal._encoders import json_encode_bytes
+from lilya.caches.memory import InMemoryCache
+from lilya.caches.tiered import TieredCache
+from lilya.decorators import cache, generate_cache_key
+from tests.fake_redis import FakeRedis
+
+
+class CountingCache(InMemoryCache):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    async def get(self, key):
+        self.reads += 1
+        return await super().get(key)
+
+
+async def wait_until(predicate):
+    with anyio.fail_after(1):
+        while not predicate():
+            await anyio.sleep(0.001)
+
+
+async def test_reads_are_served_from_the_local_cache():
+    shared = CountingCache()
+    tiered = TieredCache(shared)
+
+    await shared.set("key", "value")
+
+    assert await tiered.get("key") == "value"
+    assert await tiered.get("key") == "value"
+    assert await tiered.get("missing") is None
+    assert shared.reads == 2
+
+
+async def test_local_copies_expire_after_l1_ttl(monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+    shared = InMemoryCache()
+    tiered = TieredCache(shared, l1_ttl=2)
+
+    await tiered.set("key", "old", ttl=60)
+    await shared.set("key", "new", ttl=60)
+    assert await tiered.get("key") == "old"
+
+    monkeypatch.setattr(time, "time", lambda: now + 3)
+    assert await tiered.get("key") == "new"
+
+
+async def test_writes_evict_the_local_copies_of_other_workers():
+    shared = InMemoryCache()
+    server = FakeRedis()
+
+    async with TieredCache(shared, pubsub=server, l1_ttl=60) as worker_a:
+        async with TieredCache(shared, pubsub=server, l1_ttl=60) as worker_b:
+            await worker_a.set("key", "old")
+            assert await worker_b.get("key") == "old"
+
+            await worker_a.set("key", "new")
+            await wait_until(lambda: worker_b.l1.sync_get("key") is None)
+            assert await worker_b.get("key") == "new"
+
+            # A worker ignores its own invalidations and keeps its fresh copy
+            assert worker_a.l1.sync_get("key") == "new"
+
+            await worker_b.delete("key")
+            await wait_until(lambda: worker_a.l1.sync_get("key") is None)
+            assert await worker_a.get("key") is None
+
+    assert server.subscriptions["lilya:cache:invalidate"] == set()
+
+
+async def test_decorator_invalidation_reaches_every_worker():
+    shared = InMemoryCache()
+    server = FakeRedis()
+    calls = []
+
+    async with TieredCache(shared, pubsub=server) as worker_a:
+        async with TieredCache(shared, pubsub=server) as worker_b:
+
+            @cache(backend=worker_a, ttl=60)
+            async def load(value: int) -> int:
+                calls.append(value)
+                return value
+
+            await load(1)
+            key = generate_cache_key(load.__wrapped__, (1,), {})
+            assert await worker_b.get(key) == 1
+
+            cache(backend=worker_a).invalidate(load.__wrapped__, 1)
+            await wait_until(lambda: worker_b.l1.sync_get(key) is None)
+
+            await load(1)
+            assert calls == [1, 1]
+
+
+async def test_lost_subscription_is_resubscribed(monkeypatch):
+    monkeypatch.setattr(TieredCache, "resubscribe_delay", 0.001)
+    server = FakeRedis(failures=1)
+
+    async with TieredCache(InMemoryCache(), pubsub=server, l1_ttl=60) as tiered:
+        await tiered.set("key", "value")
+
+        # The local copies are dropped, as invalidations may have been missed
+        await wait_until(lambda: tiered.l1.sync_get("key") is None)
+        await wait_until(lambda: server.subscriptions["lilya:cache:invalidate"])
+
+        tiered.l1.sync_set("key", "value", 60)
+        await server.publish(
+            "lilya:cache:invalidate", json_encode_bytes({"origin": "other", "keys": ["key"]})
+        )
+        await wait_until(lambda: tiered.l1.sync_get("key") is None)
+
+
+@pytest.mark.anyio
+async def test_sync_writes_publish_from_any_thread():
+    shared = InMemoryCache()
+    server = FakeRedis()
+
+    async with TieredCache(shared, pubsub=server, l1_ttl=60) as worker_a:
+        async with TieredCache(shared, pubsub=server, l1_ttl=60) as worker_b:
+            worker_b.l1.sync_set("key", "old", 60)
+            worker_a.sync_set("key", "new")
+            await wait_until(lambda: worker_b.l1.sync_get("key") is None)
+
+            worker_b.l1.sync_set("key", "new", 60)
+            await anyio.to_thread.run_sync(worker_a.sync_delete, "key")
+            await wait_until(lambda: worker_b.l1.sync_get("key") is None)
+
+
+def test_sync_methods_use_both_tiers():
+    shared = InMemoryCache()
+    tiered = TieredCache(shared)
+
+    tiered.sync_set("key", "value", ttl=60)
+    assert shared.sync_get("key") == "value"
+    assert tiered.l1.sync_get("key") == "value"
+
+    tiered.sync_delete("key")
+    assert tiered.sync_get("key") is None
+    assert shared.sync_get("key") is None
+
+
+def test_l1_ttl_is_validated():
+    with pytest.raises(ValueError):
+        TieredCache(InMemoryCache(), l1_ttl=0)
@@ -0,0 +1,28 @@
+import json
+import sys
+
+import pytest
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="requires python 3.11 or higher")
+def test_precompress_directive(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["lilya", "precompress", str(tmp_path)])
+    (tmp_path / "app.js").write_text("console.log('lilya');\n" * 100)
+
+    result = client.invoke(["precompress", str(tmp_path), "-e", "gzip"])
+
+    assert result.exit_code == 0, result.output
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    hashed = manifest["paths"]["app.js"]
+    assert (tmp_path / hashed).exists()
+    assert (tmp_path / "app.js.gz").exists()
+    assert (tmp_path / f"{hashed}.gz").exists()
+    assert not (tmp_path / "app.js.br").exists()
+
+
+def test_precompress_directive_missing_directory(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["lilya", "precompress"])
+
+    result = client.invoke(["precompress", str(tmp_path / "missing")])
+
+    assert "does not exist" in " ".join(result.output.split())
@@ -1,5 +1,6 @@
 import asyncio
 import json
+from contextlib import asynccontextmanager
 
 import httpx
 import pytest
@@ -179,3 +180,28 @@ async def client(proxy_and_app):
         yield client
 
     await proxy.shutdown()
+
+
+@asynccontextmanager
+async def relay_clients(upstream_app, upstreams=("http://upstream.local",)):
+    """
+    Yields a factory of `(relay, client)` pairs forwarding to `upstream_app`, the factory
+    taking the `Relay` options (and other `upstreams`). The relays are started when created
+    and shut down on exit, so the lifecycle runs in the test itself.
+    """
+    clients = []
+
+    async def factory(upstreams=upstreams, **kwargs):
+        proxy = Relay(list(upstreams), transport=httpx.ASGITransport(app=upstream_app), **kwargs)
+        await proxy.startup()
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=proxy), base_url="http://testserver"
+        )
+        clients.append((proxy, client))
+        return proxy, client
+
+    yield factory
+
+    for proxy, client in clients:
+        await client.aclose()
+        await proxy.shutdown()
@@ -0,0 +1,255 @@
+import json
+import logging
+
+import anyio
+import httpx
+import pytest
+
+from lilya.contrib.proxy.balancing import (
+    ConsistentHashBalancer,
+    LeastOutstandingBalancer,
+    Upstream,
+    UpstreamPool,
+)
+from lilya.contrib.proxy.relay import Relay
+from tests.contrib.proxy.conftest import relay_clients
+
+pytestmark = pytest.mark.anyio
+
+UPSTREAMS = ["http://a.local", "http://b.local", "http://c.local"]
+
+
+class HostsUpstream:
+    """
+    One ASGI app standing for several upstreams, told apart by the rewritten Host header.
+
+    The hosts in `failing` answer 503 and the ones in `unhealthy` fail their health check.
+    """
+
+    def __init__(self):
+        self.failing = set()
+        self.unhealthy = set()
+        self.hits = []
+
+    async def __call__(self, scope, receive, send):
+        host = dict(scope["headers"])[b"host"].decode("latin-1")
+
+        if scope["path"] == "/health":
+            status = 500 if host in self.unhealthy else 200
+        else:
+            self.hits.append(host)
+            status = 503 if host in self.failing else 200
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": json.dumps({"host": host}).encode()})
+
+
+@pytest.fixture
+def upstream_app():
+    return HostsUpstream()
+
+
+async def test_round_robin_spreads_requests(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        _, client = await make_client()
+
+        hosts = [(await client.get("/item")).json()["host"] for _ in range(6)]
+
+        assert hosts == ["a.local", "b.local", "c.local"] * 2
+
+
+async def test_consistent_hash_pins_header_values(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        _, client = await make_client(load_balancer="consistent_hash", hash_header="x-user")
+
+        for user in ("alice", "bob", "carol"):
+            hosts = {
+                (await client.get("/item", headers={"x-user": user})).json()["host"]
+                for _ in range(5)
+            }
+            assert len(hosts) == 1
+
+
+def test_consistent_hash_remaps_only_the_lost_upstream():
+    balancer = ConsistentHashBalancer("x-user")
+    pool = UpstreamPool(UPSTREAMS, balancer=balancer)
+    keys = [f"user-{index}".encode() for index in range(200)]
+
+    def assign():
+        return {key: pool.select({"headers": [(b"x-user", key)]}).url.host for key in keys}
+
+    before = assign()
+    pool.upstreams[1].healthy = False
+    after = assign()
+
+    moved = {key for key in keys if before[key] != after[key]}
+    assert moved == {key for key in keys if before[key] == "b.local"}
+    assert "b.local" not in after.values()
+
+
+def test_least_outstanding_prefers_idle_upstreams():
+    pool = UpstreamPool(UPSTREAMS, balancer=LeastOutstandingBalancer())
+    pool.upstreams[0].outstanding = 3
+    pool.upstreams[1].outstanding = 1
+    pool.upstreams[2].outstanding = 2
+
+    assert pool.select({}) is pool.upstreams[1]
+
+    pool.upstreams[2].outstanding = 1
+    assert {pool.select({}).url.host for _ in range(4)} == {"b.local", "c.local"}
+
+
+async def test_retries_move_to_another_upstream(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        upstream_app.failing = {"a.local"}
+        _, client = await make_client(max_retries=2, retry_backoff_factor=0)
+
+        response = await client.get("/item")
+
+        assert response.status_code == 200
+        assert response.json()["host"] != "a.local"
+        assert upstream_app.hits[0] == "a.local"
+        assert len(upstream_app.hits) == 2
+
+
+async def test_failing_upstream_is_ejected(upstream_app, caplog):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        upstream_app.failing = {"b.local"}
+        proxy, client = await make_client(
+            max_failures=2, ejection_time=60, logger=logging.getLogger("relay.test")
+        )
+
+        with caplog.at_level(logging.INFO, logger="relay.test"):
+            statuses = [(await client.get("/item")).status_code for _ in range(6)]
+
+        assert statuses.count(503) == 2
+        assert not proxy.upstreams[1].is_available()
+        assert "reverse_proxy.upstream_ejected" in caplog.text
+
+        upstream_app.hits.clear()
+        for _ in range(4):
+            assert (await client.get("/item")).status_code == 200
+        assert "b.local" not in upstream_app.hits
+
+
+async def test_no_available_upstream_answers_503(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        proxy, client = await make_client()
+        for upstream in proxy.upstreams:
+            upstream.healthy = False
+
+        response = await client.get("/item")
+
+        assert response.status_code == 503
+        assert response.text == "No upstream available"
+
+
+async def test_health_checks_take_upstreams_out_and_back(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        upstream_app.unhealthy = {"a.local", "c.local"}
+        proxy, client = await make_client(health_check_path="/health", health_check_interval=60)
+        await proxy.check_upstreams_health()
+
+        assert [upstream.healthy for upstream in proxy.upstreams] == [False, True, False]
+        hosts = {(await client.get("/item")).json()["host"] for _ in range(3)}
+        assert hosts == {"b.local"}
+
+        upstream_app.unhealthy = set()
+        await proxy.check_upstreams_health()
+
+        assert all(upstream.healthy for upstream in proxy.upstreams)
+
+        await proxy.shutdown()
+
+
+async def test_startup_runs_background_health_checks(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        upstream_app.unhealthy = {"a.local"}
+        proxy, _ = await make_client(health_check_path="/health", health_check_interval=60)
+
+        assert proxy._health_task_group is not None
+        with anyio.fail_after(1):
+            while proxy.upstreams[0].healthy:
+                await anyio.sleep(0.001)
+
+        await proxy.shutdown()
+
+        assert proxy._health_task_group is None
+
+
+async def test_health_check_path_is_relative_to_the_upstream_path():
+    paths = []
+
+    async def upstream(scope, receive, send):
+        paths.append((scope["path"], scope["query_string"]))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    proxy = Relay(
+        ["http://a.local/api", "http://b.local/api/"],
+        transport=httpx.ASGITransport(app=upstream),
+        health_check_path="/health?deep=1",
+        health_check_interval=60,
+    )
+    await proxy.startup()
+    try:
+        await proxy.check_upstreams_health()
+    finally:
+        await proxy.shutdown()
+
+    assert paths
+    assert set(paths) == {("/api/health", b"deep=1")}
+
+
+async def test_health_checks_survive_unexpected_errors(upstream_app, monkeypatch):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        rounds = []
+        done = anyio.Event()
+
+        async def check_upstreams_health():
+            rounds.append(1)
+            if len(rounds) == 1:
+                raise RuntimeError("boom")
+            done.set()
+
+        proxy, _ = await make_client(health_check_path="/health", health_check_interval=0.001)
+        monkeypatch.setattr(proxy, "check_upstreams_health", check_upstreams_health)
+
+        with anyio.fail_after(1):
+            await done.wait()
+
+        assert len(rounds) >= 2
+
+
+def test_single_upstream_keeps_base_url():
+    proxy = Relay("http://auth.local/")
+
+    assert [upstream.url for upstream in proxy.upstreams] == [httpx.URL("http://auth.local")]
+    assert proxy._base_url == httpx.URL("http://auth.local")
+
+
+def test_invalid_load_balancer_configuration():
+    with pytest.raises(ValueError):
+        Relay(UPSTREAMS, load_balancer="random")
+
+    with pytest.raises(ValueError):
+        Relay(UPSTREAMS, load_balancer="consistent_hash")
+
+    with pytest.raises(ValueError):
+        UpstreamPool([])
+
+
+def test_upstream_availability():
+    upstream = Upstream("http://a.local/")
+
+    assert upstream.is_available()
+
+    upstream.ejected_until = 10.0
+    assert not upstream.is_available(now=5.0)
+    assert upstream.is_available(now=10.0)
@@ -0,0 +1,201 @@
+import json
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+
+from lilya.caches.memory import InMemoryCache
+from lilya.contrib.proxy.cache import RelayCache, parse_cache_control
+from tests.contrib.proxy.conftest import relay_clients
+
+pytestmark = pytest.mark.anyio
+
+
+class CatalogUpstream:
+    """
+    Upstream answering with the caching headers configured per path.
+    """
+
+    def __init__(self):
+        self.hits = []
+        self.conditional = []
+        self.etag = '"v1"'
+        self.routes = {
+            "/fresh": [("cache-control", "max-age=60")],
+            "/validated": [("cache-control", "no-cache"), ("etag", self.etag)],
+            "/vary": [("cache-control", "max-age=60"), ("vary", "accept-language")],
+            "/private": [("cache-control", "private, max-age=60")],
+            "/cookie": [("cache-control", "max-age=60"), ("set-cookie", "a=b")],
+            "/plain": [],
+            "/slow": [("cache-control", "max-age=60")],
+        }
+
+    async def __call__(self, scope, receive, send):
+        path = scope["path"]
+        headers = dict(scope["headers"])
+        self.hits.append(path)
+
+        if path == "/slow":
+            await anyio.sleep(0.05)
+
+        response_headers = [(b"content-type", b"application/json")] + [
+            (key.encode(), value.encode()) for key, value in self.routes.get(path, [])
+        ]
+
+        if_none_match = headers.get(b"if-none-match")
+        if if_none_match is not None:
+            self.conditional.append(if_none_match.decode())
+            if if_none_match.decode() == self.etag:
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": [(b"etag", self.etag.encode()), (b"x-revalidated", b"yes")],
+                    }
+                )
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        body = {
+            "path": path,
+            "hit": len(self.hits),
+            "lang": headers.get(b"accept-language", b"").decode(),
+        }
+        await send({"type": "http.response.start", "status": 200, "headers": response_headers})
+        await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+
+
+@pytest.fixture
+def upstream_app():
+    return CatalogUpstream()
+
+
+@asynccontextmanager
+async def relay_client(upstream_app):
+    async with relay_clients(upstream_app, ["http://catalog.local"]) as make_client:
+        _, client = await make_client(cache=InMemoryCache())
+        yield client
+
+
+def test_parse_cache_control():
+    assert parse_cache_control('Public, max-age=60, no-cache="set-cookie"') == {
+        "public": None,
+        "max-age": "60",
+        "no-cache": "set-cookie",
+    }
+    assert parse_cache_control(None) == {}
+
+
+async def test_fresh_responses_are_served_from_cache(upstream_app):
+    async with relay_client(upstream_app) as client:
+        first = await client.get("/fresh?page=1")
+        second = await client.get("/fresh?page=1")
+
+        assert first.json() == second.json()
+        assert upstream_app.hits == ["/fresh"]
+        assert second.headers["age"] == "0"
+        assert second.headers["cache-control"] == "max-age=60"
+
+        # The query string is part of the key
+        await client.get("/fresh?page=2")
+        assert upstream_app.hits == ["/fresh", "/fresh"]
+
+
+async def test_stale_responses_are_revalidated(upstream_app):
+    async with relay_client(upstream_app) as client:
+        first = await client.get("/validated")
+        second = await client.get("/validated")
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["x-revalidated"] == "yes"
+        assert upstream_app.conditional == ['"v1"']
+
+        # A changed resource is fetched and stored again
+        upstream_app.etag = '"v2"'
+        third = await client.get("/validated")
+
+        assert third.json()["hit"] == 3
+        assert upstream_app.conditional == ['"v1"', '"v1"']
+
+
+async def test_client_conditional_requests(upstream_app):
+    async with relay_client(upstream_app) as client:
+        await client.get("/fresh")
+
+        response = await client.get("/fresh", headers={"if-none-match": '"other"'})
+        assert response.status_code == 200
+
+        upstream_app.routes["/fresh"].append(("etag", '"v1"'))
+        await client.get("/fresh", headers={"cache-control": "no-cache"})
+
+        response = await client.get("/fresh", headers={"if-none-match": 'W/"v1"'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert upstream_app.hits == ["/fresh", "/fresh"]
+
+
+async def test_vary_headers_are_part_of_the_key(upstream_app):
+    async with relay_client(upstream_app) as client:
+        english = await client.get("/vary", headers={"accept-language": "en"})
+        french = await client.get("/vary", headers={"accept-language": "fr"})
+        english_again = await client.get("/vary", headers={"accept-language": "en"})
+
+        assert english.json()["lang"] == "en"
+        assert french.json()["lang"] == "fr"
+        assert english_again.json() == english.json()
+        assert upstream_app.hits == ["/vary", "/vary"]
+
+
+@pytest.mark.parametrize("path", ["/private", "/cookie", "/plain"])
+async def test_uncacheable_responses_are_not_stored(upstream_app, path):
+    async with relay_client(upstream_app) as client:
+        await client.get(path)
+        await client.get(path)
+
+        assert upstream_app.hits == [path, path]
+
+
+async def test_request_directives(upstream_app):
+    async with relay_client(upstream_app) as client:
+        await client.get("/fresh", headers={"cache-control": "no-store"})
+        await client.get("/fresh")
+        await client.get("/fresh", headers={"cache-control": "no-cache"})
+        await client.get("/fresh")
+
+        assert upstream_app.hits == ["/fresh", "/fresh", "/fresh"]
+
+
+async def test_authorized_requests_are_not_stored(upstream_app):
+    async with relay_client(upstream_app) as client:
+        await client.get("/fresh", headers={"authorization": "Bearer token"})
+        await client.get("/fresh", headers={"authorization": "Bearer token"})
+
+        assert upstream_app.hits == ["/fresh", "/fresh"]
+
+
+async def test_concurrent_misses_are_coalesced(upstream_app):
+    async with relay_client(upstream_app) as client:
+        responses = []
+
+        async def fetch():
+            responses.append(await client.get("/slow"))
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(fetch)
+
+        assert upstream_app.hits == ["/slow"]
+        assert [response.status_code for response in responses] == [200] * 5
+        assert len({response.json()["hit"] for response in responses}) == 1
+
+
+async def test_large_responses_are_not_stored(upstream_app):
+    async with relay_clients(upstream_app, ["http://catalog.local"]) as make_client:
+        _, client = await make_client(cache=RelayCache(InMemoryCache(), max_body_size=10))
+        first = await client.get("/fresh")
+        await client.get("/fresh")
+
+    assert first.status_code == 200
+    assert upstream_app.hits == ["/fresh", "/fresh"]
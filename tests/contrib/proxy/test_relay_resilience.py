@@ -0,0 +1,224 @@
+import json
+import logging
+
+import anyio
+import pytest
+
+from lilya.contrib.proxy.circuit_breaker import CircuitBreaker, CircuitState
+from lilya.contrib.proxy.relay import Relay
+from tests.contrib.proxy.conftest import relay_clients
+
+pytestmark = pytest.mark.anyio
+
+UPSTREAMS = ["http://a.local", "http://b.local"]
+
+
+class ScriptedUpstream:
+    """
+    One ASGI app standing for several upstreams, told apart by the rewritten Host header.
+
+    The hosts in `failing` answer 503 and the ones in `delays` wait before answering.
+    """
+
+    def __init__(self):
+        self.failing = set()
+        self.delays = {}
+        self.hits = []
+        self.cancelled = []
+
+    async def __call__(self, scope, receive, send):
+        host = dict(scope["headers"])[b"host"].decode("latin-1")
+        self.hits.append(host)
+
+        try:
+            await anyio.sleep(self.delays.get(host, 0))
+        except anyio.get_cancelled_exc_class():
+            self.cancelled.append(host)
+            raise
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503 if host in self.failing else 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": json.dumps({"host": host}).encode()})
+
+
+@pytest.fixture
+def upstream_app():
+    return ScriptedUpstream()
+
+
+def test_circuit_breaker_state_machine():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=10, half_open_max_calls=1)
+
+    breaker.on_result(False, breaker.on_request(now=0), now=0)
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.on_result(False, breaker.on_request(now=1), now=1)
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allows_request(now=5)
+
+    # After the recovery time, a single trial goes through
+    assert breaker.allows_request(now=11)
+    trial = breaker.on_request(now=11)
+    assert trial is True
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert not breaker.allows_request(now=11)
+
+    # A failed trial opens the circuit again
+    breaker.on_result(False, trial, now=12)
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allows_request(now=20)
+
+    trial = breaker.on_request(now=23)
+    breaker.on_result(True, trial, now=23)
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failures == 0
+
+
+def test_circuit_breaker_releases_cancelled_trials():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_time=0)
+    breaker.on_result(False, breaker.on_request(now=0), now=0)
+
+    trial = breaker.on_request(now=1)
+    assert not breaker.allows_request(now=1)
+
+    breaker.on_result(None, trial, now=1)
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allows_request(now=1)
+
+
+def test_circuit_breaker_validates_thresholds():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
+
+
+async def test_open_circuit_fails_fast(upstream_app, caplog):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        upstream_app.failing = {"a.local"}
+        proxy, client = await make_client(
+            upstreams=["http://a.local"],
+            circuit_breaker_threshold=2,
+            circuit_breaker_recovery_time=60,
+            logger=logging.getLogger("relay.test"),
+        )
+
+        with caplog.at_level(logging.INFO, logger="relay.test"):
+            assert (await client.get("/item")).status_code == 503
+            assert (await client.get("/item")).status_code == 503
+
+        assert proxy.upstreams[0].breaker.state is CircuitState.OPEN
+        assert "reverse_proxy.circuit_open" in caplog.text
+
+        response = await client.get("/item")
+
+        assert response.status_code == 503
+        assert response.text == "No upstream available"
+        assert len(upstream_app.hits) == 2
+
+
+async def test_half_open_trial_closes_the_circuit(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        upstream_app.failing = {"a.local"}
+        proxy, client = await make_client(
+            upstreams=["http://a.local"],
+            circuit_breaker_threshold=1,
+            circuit_breaker_recovery_time=60,
+        )
+        breaker = proxy.upstreams[0].breaker
+
+        await client.get("/item")
+        assert breaker.state is CircuitState.OPEN
+
+        # Pretend the recovery time elapsed and the upstream recovered
+        breaker.opened_at -= 60
+        upstream_app.failing = set()
+
+        response = await client.get("/item")
+
+        assert response.status_code == 200
+        assert breaker.state is CircuitState.CLOSED
+
+
+async def test_open_circuit_routes_to_other_upstreams(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        upstream_app.failing = {"a.local"}
+        proxy, client = await make_client(
+            circuit_breaker_threshold=1, circuit_breaker_recovery_time=60, max_retries=1
+        )
+
+        for _ in range(4):
+            response = await client.get("/item")
+            assert response.status_code == 200
+            assert response.json()["host"] == "b.local"
+
+        assert upstream_app.hits.count("a.local") == 1
+
+
+async def test_slow_requests_are_hedged(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        proxy, client = await make_client(hedge_percentile=90)
+
+        # Warm up the latency window
+        for _ in range(10):
+            assert (await client.get("/item")).status_code == 200
+        assert proxy._hedge_delay() is not None
+
+        upstream_app.hits.clear()
+        upstream_app.delays = {"a.local": 5}
+
+        with anyio.fail_after(2):
+            response = await client.get("/item")
+
+        assert response.status_code == 200
+        assert response.json()["host"] == "b.local"
+        assert upstream_app.hits == ["a.local", "b.local"]
+        assert upstream_app.cancelled == ["a.local"]
+        assert all(upstream.outstanding == 0 for upstream in proxy.upstreams)
+
+
+async def test_hedged_winner_is_tracked_until_its_body_is_relayed(upstream_app, monkeypatch):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        proxy, client = await make_client(hedge_percentile=90)
+        for _ in range(10):
+            assert (await client.get("/item")).status_code == 200
+
+        upstream_app.delays = {"a.local": 5}
+        relay_response = proxy._relay_response
+        outstanding = []
+
+        async def tracking_relay_response(resp, send):
+            outstanding.append(
+                {str(upstream.url): upstream.outstanding for upstream in proxy.upstreams}
+            )
+            await relay_response(resp, send)
+
+        monkeypatch.setattr(proxy, "_relay_response", tracking_relay_response)
+
+        with anyio.fail_after(2):
+            response = await client.get("/item")
+
+        assert response.json()["host"] == "b.local"
+        assert outstanding == [{"http://a.local": 0, "http://b.local": 1}]
+        assert all(upstream.outstanding == 0 for upstream in proxy.upstreams)
+
+
+async def test_requests_with_body_are_not_hedged(upstream_app):
+    async with relay_clients(upstream_app, UPSTREAMS) as make_client:
+        proxy, client = await make_client(hedge_percentile=50)
+        proxy._latencies.extend([0.0] * 10)
+        upstream_app.delays = {"a.local": 0.05}
+
+        response = await client.post("/item", content=b"payload")
+
+        assert response.json()["host"] == "a.local"
+        assert upstream_app.hits == ["a.local"]
+
+
+def test_hedge_percentile_is_validated():
+    with pytest.raises(ValueError):
+        Relay("http://a.local", hedge_percentile=0)
@@ -1,9 +1,11 @@
+import functools
+
 import anyio
 import pytest
 
 from lilya.apps import Lilya
-from lilya.contrib.sse.channels import SSEChannel, SSEChannelManager, sse_manager
-from lilya.responses import EventStreamResponse
+from lilya.contrib.sse.channels import OverflowPolicy, SSEChannel, SSEChannelManager, sse_manager
+from lilya.responses import EventStreamResponse, encode_sse_event
 from lilya.routing import Path
 from lilya.testclient import TestClient
 
@@ -227,3 +229,134 @@ def test_broadcast_reaches_client_stream(tmp_path):
     assert "event: notice" in text
     assert "data: works" in text
     assert "text/event-stream" in resp.headers["content-type"]
+
+
+async def test_non_blocking_policy_requires_a_buffer():
+    with pytest.raises(ValueError):
+        SSEChannel("invalid", overflow="drop_oldest")
+
+
+async def test_drop_oldest_keeps_latest_events_without_blocking():
+    channel = SSEChannel("drop", max_buffer_size=2, overflow=OverflowPolicy.DROP_OLDEST)
+    received = []
+
+    async def slow_listener(started, release):
+        async for msg in channel.listen(heartbeat_interval=None):
+            if not received:
+                started.set()
+                await release.wait()
+            received.append(msg["data"])
+            if len(received) == 3:
+                break
+
+    started, release = anyio.Event(), anyio.Event()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(slow_listener, started, release)
+        await anyio.sleep(0.01)
+        await channel.broadcast({"data": 0})
+        await started.wait()
+
+        with anyio.fail_after(1):
+            for i in range(1, 6):
+                await channel.broadcast({"data": i})
+
+        release.set()
+
+    assert received == [0, 4, 5]
+
+
+async def test_disconnect_drops_slow_subscribers_only():
+    channel = SSEChannel("disconnect", max_buffer_size=1, overflow="disconnect")
+    fast_received = []
+    slow_finished = anyio.Event()
+
+    async def fast_listener():
+        async for msg in channel.listen(heartbeat_interval=None):
+            fast_received.append(msg["data"])
+            if len(fast_received) == 3:
+                break
+
+    async def slow_listener(started, release):
+        async for _ in channel.listen(heartbeat_interval=None):
+            started.set()
+            await release.wait()
+        slow_finished.set()
+
+    started, release = anyio.Event(), anyio.Event()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(fast_listener)
+        tg.start_soon(slow_listener, started, release)
+        await anyio.sleep(0.01)
+
+        for i in range(3):
+            with anyio.fail_after(1):
+                await channel.broadcast({"data": i})
+            await anyio.sleep(0.01)
+
+        release.set()
+        with anyio.fail_after(1):
+            await slow_finished.wait()
+
+    assert fast_received == [0, 1, 2]
+    assert len(channel._subscribers) == 0
+
+
+async def test_encoded_listen_shares_wire_bytes_between_subscribers():
+    channel = SSEChannel("encoded")
+    received = []
+
+    async def listener():
+        async for chunk in channel.listen(heartbeat_interval=None, encoded=True):
+            received.append(chunk)
+            break
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(listener)
+        tg.start_soon(listener)
+        await anyio.sleep(0.01)
+        await channel.broadcast({"event": "update", "data": {"a": 1}})
+
+    assert received[0] == b'event: update\ndata: {"a":1}\n\n'
+    assert received[0] is received[1]
+
+
+async def test_encoded_listen_heartbeat():
+    channel = SSEChannel("encoded-heartbeat")
+
+    async for chunk in channel.listen(heartbeat_interval=0.01, encoded=True):
+        assert chunk == encode_sse_event({"event": "heartbeat", "data": "💓"})
+        break
+
+
+async def test_encoded_listen_uses_the_separator_and_retry():
+    channel = SSEChannel("encoded-options")
+    received = []
+
+    async def listener(**options):
+        async for chunk in channel.listen(heartbeat_interval=None, encoded=True, **options):
+            received.append(chunk)
+            break
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(listener)
+        tg.start_soon(functools.partial(listener, sep="\r\n", retry=1000))
+        await anyio.sleep(0.01)
+        await channel.broadcast({"event": "update", "data": "x"})
+
+    assert sorted(received) == [
+        b"event: update\ndata: x\n\n",
+        b"event: update\r\ndata: x\r\nretry: 1000\r\n\r\n",
+    ]
+
+    async for chunk in channel.listen(heartbeat_interval=0.01, encoded=True, sep="\r"):
+        assert chunk == encode_sse_event({"event": "heartbeat", "data": "💓"}, sep="\r")
+        break
+
+
+async def test_manager_creates_channels_with_its_options():
+    manager = SSEChannelManager(max_buffer_size=8, overflow="drop_oldest")
+
+    channel = await manager.get_or_create("configured")
+
+    assert channel.max_buffer_size == 8
+    assert channel.overflow == OverflowPolicy.DROP_OLDEST
@@ -0,0 +1,168 @@
+from contextlib import aclosing, asynccontextmanager
+
+import anyio
+import pytest
+
+from lilya.contrib.sse.channels import SSEChannel, SSEChannelManager
+from lilya.contrib.sse.transports import InMemoryTransport, RedisTransport
+from tests.fake_redis import FakeRedis
+
+pytestmark = pytest.mark.anyio
+
+
+class CountingTransport(InMemoryTransport):
+    def __init__(self):
+        super().__init__()
+        self.subscribe_calls = 0
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        self.subscribe_calls += 1
+        async with super().subscribe(channel) as events:
+            yield events
+
+
+async def collect(channel, received, name, count):
+    async with aclosing(channel.listen(heartbeat_interval=None)) as events:
+        async for event in events:
+            received.append((name, event["data"]))
+            count -= 1
+            if not count:
+                break
+
+
+async def wait_for_subscribers(channel, count):
+    with anyio.fail_after(1):
+        while len(channel._subscribers) < count or channel._upstream is None:
+            await anyio.sleep(0.001)
+
+
+async def test_broadcast_reaches_every_worker():
+    transport = InMemoryTransport()
+    received = []
+
+    async with SSEChannelManager(transport=transport) as worker_a:
+        async with SSEChannelManager(transport=transport) as worker_b:
+            channel_a = await worker_a.get_or_create("news")
+            channel_b = await worker_b.get_or_create("news")
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(collect, channel_a, received, "a", 1)
+                tg.start_soon(collect, channel_b, received, "b", 1)
+                await wait_for_subscribers(channel_a, 1)
+                await wait_for_subscribers(channel_b, 1)
+
+                with anyio.fail_after(1):
+                    await channel_a.broadcast({"event": "notice", "data": "hello"})
+
+    assert sorted(received) == [("a", "hello"), ("b", "hello")]
+
+
+async def test_local_subscribers_share_one_upstream_subscription():
+    transport = CountingTransport()
+    received = []
+
+    async with SSEChannelManager(transport=transport) as manager:
+        channel = await manager.get_or_create("shared")
+
+        async with anyio.create_task_group() as tg:
+            for index in range(3):
+                tg.start_soon(collect, channel, received, index, 1)
+            await wait_for_subscribers(channel, 3)
+
+            await channel.broadcast("ping")
+
+        assert transport.subscribe_calls == 1
+        assert len(received) == 3
+
+        # The upstream subscription is released with the last local subscriber
+        assert channel._upstream is None
+        with anyio.fail_after(1):
+            while transport._subscriptions:
+                await anyio.sleep(0.001)
+
+
+async def test_channel_with_transport_must_be_running():
+    channel = SSEChannel("idle", transport=InMemoryTransport())
+
+    with pytest.raises(RuntimeError):
+        async for _ in channel.listen(heartbeat_interval=None):
+            pass  # pragma: no cover
+
+
+async def test_channel_can_run_its_own_upstream():
+    received = []
+
+    async with SSEChannel("standalone", transport=InMemoryTransport()) as channel:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(collect, channel, received, "a", 2)
+            await wait_for_subscribers(channel, 1)
+            await channel.broadcast("one")
+            await channel.broadcast({"event": "update", "data": {"two": 2}})
+
+    assert received == [("a", "one"), ("a", {"two": 2})]
+
+
+async def test_lost_subscription_is_resubscribed(monkeypatch):
+    monkeypatch.setattr(SSEChannel, "resubscribe_delay", 0.001)
+    server = FakeRedis(failures=1)
+    received = []
+
+    async with SSEChannel("flaky", transport=RedisTransport(client=server)) as channel:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(collect, channel, received, "a", 1)
+            await wait_for_subscribers(channel, 1)
+
+            await channel.broadcast("lost")
+            with anyio.fail_after(1):
+                while server.failures or not server.subscriptions["lilya:sse:flaky"]:
+                    await anyio.sleep(0.001)
+            await channel.broadcast("delivered")
+
+    assert received == [("a", "delivered")]
+
+
+async def test_redis_transport_fans_out_across_workers():
+    server = FakeRedis()
+    received = []
+
+    async with SSEChannelManager(transport=RedisTransport(client=server)) as worker_a:
+        async with SSEChannelManager(transport=RedisTransport(client=server)) as worker_b:
+            channel_a = await worker_a.get_or_create("orders")
+            channel_b = await worker_b.get_or_create("orders")
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(collect, channel_a, received, "a", 1)
+                tg.start_soon(collect, channel_b, received, "b", 1)
+                await wait_for_subscribers(channel_a, 1)
+                await wait_for_subscribers(channel_b, 1)
+
+                assert len(server.subscriptions["lilya:sse:orders"]) == 2
+
+                with anyio.fail_after(1):
+                    await channel_b.broadcast({"event": "created", "data": {"id": 1}})
+
+        assert server.unsubscribed == ["lilya:sse:orders", "lilya:sse:orders"]
+
+    assert sorted(received, key=lambda item: item[0]) == [("a", {"id": 1}), ("b", {"id": 1})]
+    # The client was given to the transports, which leave it open
+    assert server.closed is False
+
+
+async def test_redis_transport_closes_the_client_it_created():
+    pytest.importorskip("redis")
+    transport = RedisTransport("redis://localhost:6379/0")
+    closed = []
+
+    async def aclose():
+        closed.append(True)
+
+    transport.client.aclose = aclose
+    await transport.close()
+
+    assert closed == [True]
+
+
+def test_redis_transport_requires_url_or_client():
+    with pytest.raises(ValueError):
+        RedisTransport()
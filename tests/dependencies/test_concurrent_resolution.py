@@ -0,0 +1,303 @@
+import anyio
+import pytest
+
+from lilya._internal._scopes import ScopeManager
+from lilya.apps import Lilya
+from lilya.dependencies import Provide, Provides, resolve_providers
+from lilya.enums import Scope
+from lilya.exceptions import HTTPException
+from lilya.routing import Path
+from lilya.testclient import TestClient
+
+pytestmark = pytest.mark.anyio
+
+
+def test_independent_async_dependencies_run_concurrently():
+    # Each dependency waits for the other one, which only completes when both run at once.
+    user_ready = anyio.Event()
+    tenant_ready = anyio.Event()
+
+    async def get_user():
+        user_ready.set()
+        with anyio.fail_after(2):
+            await tenant_ready.wait()
+        return "alice"
+
+    async def get_tenant():
+        tenant_ready.set()
+        with anyio.fail_after(2):
+            await user_ready.wait()
+        return "acme"
+
+    async def handler(user=Provides(), tenant=Provides()):
+        return {"user": user, "tenant": tenant}
+
+    app = Lilya(
+        routes=[
+            Path(
+                "/",
+                handler,
+                dependencies={"user": Provide(get_user), "tenant": Provide(get_tenant)},
+            )
+        ]
+    )
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 200
+    assert response.json() == {"user": "alice", "tenant": "acme"}
+
+
+def test_nested_async_dependencies_run_concurrently():
+    flags_ready = anyio.Event()
+    config_ready = anyio.Event()
+
+    async def get_flags():
+        flags_ready.set()
+        with anyio.fail_after(2):
+            await config_ready.wait()
+        return ["beta"]
+
+    async def get_config():
+        config_ready.set()
+        with anyio.fail_after(2):
+            await flags_ready.wait()
+        return {"region": "eu"}
+
+    async def get_settings(flags, config):
+        return {"flags": flags, **config}
+
+    async def handler(settings=Provides()):
+        return settings
+
+    app = Lilya(
+        routes=[Path("/", handler)],
+        dependencies={
+            "settings": Provide(get_settings),
+            "flags": Provide(get_flags),
+            "config": Provide(get_config),
+        },
+    )
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 200
+    assert response.json() == {"flags": ["beta"], "region": "eu"}
+
+
+def test_errors_of_concurrent_dependencies_are_not_wrapped():
+    async def get_user():
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    async def get_tenant():
+        await anyio.sleep(0)
+        return "acme"
+
+    async def handler(user=Provides(), tenant=Provides()):
+        return {"user": user, "tenant": tenant}
+
+    app = Lilya(
+        routes=[Path("/", handler)],
+        dependencies={"user": Provide(get_user), "tenant": Provide(get_tenant)},
+    )
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 401
+
+
+async def test_shared_cached_dependency_is_created_once():
+    calls = []
+
+    async def get_db():
+        calls.append(1)
+        await anyio.sleep(0.01)
+        return "db"
+
+    async def get_users(db):
+        return f"users@{db}"
+
+    async def get_orders(db):
+        return f"orders@{db}"
+
+    dependencies = {
+        "db": Provide(get_db, use_cache=True),
+        "users": Provide(get_users),
+        "orders": Provide(get_orders),
+    }
+
+    resolved = await resolve_providers(
+        object(),
+        {"users": dependencies["users"], "orders": dependencies["orders"]},
+        dependencies,
+    )
+
+    assert resolved == {"users": "users@db", "orders": "orders@db"}
+    assert calls == [1]
+
+
+async def test_app_scoped_dependency_is_created_once():
+    calls = []
+
+    async def get_client():
+        calls.append(1)
+        await anyio.sleep(0.01)
+        return "client"
+
+    providers = {
+        "first": Provide(get_client, scope=Scope.GLOBAL),
+        "second": Provide(get_client, scope=Scope.GLOBAL),
+    }
+
+    resolved = await resolve_providers(object(), providers, providers)
+
+    assert resolved == {"first": "client", "second": "client"}
+    assert calls == [1]
+
+
+async def test_scoped_dependency_is_not_created_concurrently_after_a_failure():
+    manager = ScopeManager()
+    calls = []
+    running = []
+
+    async def create_client():
+        calls.append(1)
+        running.append(1)
+        await anyio.sleep(0.02)
+        assert running == [1]
+        running.pop()
+        if len(calls) == 1:
+            raise RuntimeError("Connection refused")
+        return "client"
+
+    async def get_client():
+        try:
+            return await manager.get_or_create(Scope.GLOBAL, create_client, create_client)
+        except RuntimeError:
+            return None
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(get_client)
+        tg.start_soon(get_client)
+        # Arrives while the second caller retries the creation
+        await anyio.sleep(0.03)
+        tg.start_soon(get_client)
+
+    assert calls == [1, 1]
+
+
+def test_dependency_plan_is_compiled_once():
+    async def get_user(request):
+        return request.url.path
+
+    provider = Provide(get_user)
+
+    async def handler(user=Provides()):
+        return {"user": user}
+
+    app = Lilya(routes=[Path("/", handler, dependencies={"user": provider})])
+    client = TestClient(app)
+
+    assert client.get("/").json() == {"user": "/"}
+    plan = provider.plan
+    assert client.get("/").json() == {"user": "/"}
+
+    assert provider.plan is plan
+    assert plan.is_async
+    assert plan.sole_positional == "request"
+
+
+def test_generator_dependencies_are_entered_in_the_calling_task():
+    # A generator dependency opening a cancel scope must be entered in the task
+    # running the handler, not in a task of the group resolving its siblings.
+    tasks = {}
+
+    async def session():
+        tasks["session"] = anyio.get_current_task().id
+        yield "s"
+
+    async def get_flags():
+        await anyio.sleep(0)
+        return ["beta"]
+
+    async def get_user(session):
+        tasks["user"] = anyio.get_current_task().id
+        await anyio.sleep(0)
+        return f"user@{session}"
+
+    async def handler(s=Provides(), f=Provides(), user=Provides()):
+        tasks["handler"] = anyio.get_current_task().id
+        return {"s": s, "f": f, "user": user}
+
+    app = Lilya(
+        routes=[
+            Path(
+                "/",
+                handler,
+                dependencies={
+                    "s": Provide(session),
+                    "f": Provide(get_flags),
+                    "user": Provide(get_user),
+                    "session": Provide(session),
+                },
+            )
+        ]
+    )
+
+    response = TestClient(app).get("/")
+
+    assert response.status_code == 200
+    assert response.json() == {"s": "s", "f": ["beta"], "user": "user@s"}
+    # A coroutine depending on a generator dependency stays in the calling task too
+    assert tasks["session"] == tasks["user"] == tasks["handler"]
+
+
+async def test_dependencies_are_resolved_in_declaration_order():
+    events = []
+
+    def make_sync(name):
+        def dependency():
+            events.append(name)
+            return name
+
+        return dependency
+
+    def make_async(name):
+        async def dependency():
+            events.append(name)
+            await anyio.sleep(0.01)
+            events.append(f"{name} done")
+            return name
+
+        return dependency
+
+    providers = {
+        "first": Provide(make_sync("first")),
+        "users": Provide(make_async("users")),
+        "orders": Provide(make_async("orders")),
+        "last": Provide(make_sync("last")),
+    }
+
+    resolved = await resolve_providers(object(), providers, providers)
+
+    assert list(resolved) == ["first", "users", "orders", "last"]
+    assert events[0] == "first"
+    # Both coroutines ran at once, before the next declared dependency
+    assert set(events[1:3]) == {"users", "orders"}
+    assert events[-1] == "last"
+
+
+async def test_errors_of_several_concurrent_dependencies_are_kept():
+    async def get_user():
+        raise ValueError("user")
+
+    async def get_tenant():
+        raise KeyError("tenant")
+
+    providers = {"user": Provide(get_user), "tenant": Provide(get_tenant)}
+
+    with pytest.raises(Exception) as info:
+        await resolve_providers(object(), providers, providers)
+
+    errors = {type(error) for error in info.value.exceptions}
+    assert errors == {ValueError, KeyError}
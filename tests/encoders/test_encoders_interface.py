@@ -7,7 +7,13 @@ import pytest
 from pydantic import BaseModel
 
 from lilya._internal._encoders import DataclassEncoder
-from lilya.encoders import ENCODER_TYPES, apply_structure, json_encode, register_encoder
+from lilya.encoders import (
+    ENCODER_TYPES,
+    Encoder,
+    apply_structure,
+    json_encode,
+    register_encoder,
+)
 
 
 def test_overwrite():
@@ -91,3 +97,119 @@ def test_memoryview(json_encode_kwargs):
 
 def test_dont_crash_on_strings():
     apply_structure("test", {})
+
+
+class Point:
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+
+@pytest.fixture
+def encoders():
+    _new_encoders = deque(ENCODER_TYPES.get())
+    token = ENCODER_TYPES.set(_new_encoders)
+    try:
+        yield _new_encoders
+    finally:
+        ENCODER_TYPES.reset(token)
+
+
+def test_encoder_resolved_once_per_type(encoders):
+    calls = []
+
+    class PointEncoder(Encoder):
+        __cache_by_type__ = True
+
+        def is_type(self, value):
+            calls.append(value)
+            return isinstance(value, Point)
+
+        def serialize(self, value):
+            return value.x
+
+    register_encoder(PointEncoder)
+
+    assert json_encode([Point(i) for i in range(100)]) == list(range(100))
+    assert len(calls) == 1
+
+
+def test_encoder_cache_invalidated_on_register(encoders):
+    class PointEncoder(Encoder):
+        __type__ = Point
+
+        def serialize(self, value):
+            return value.x
+
+    class PointAsDictEncoder(Encoder):
+        __type__ = Point
+
+        def serialize(self, value):
+            return {"x": value.x}
+
+    register_encoder(PointEncoder)
+    assert json_encode(Point(1)) == 1
+
+    register_encoder(PointAsDictEncoder)
+    assert json_encode(Point(1)) == {"x": 1}
+
+
+def test_value_dependent_encoder_is_not_cached(encoders):
+    class PositivePointEncoder(Encoder):
+        def is_type(self, value):
+            return isinstance(value, Point) and value.x >= 0
+
+        def serialize(self, value):
+            return value.x
+
+    register_encoder(PositivePointEncoder)
+
+    assert json_encode(Point(1)) == 1
+    with pytest.raises(ValueError):
+        json_encode(Point(-1))
+    assert json_encode(Point(2)) == 2
+
+
+def test_encoder_cache_bypassed_with_encoders(encoders):
+    class PointEncoder(Encoder):
+        __type__ = Point
+
+        def serialize(self, value):
+            return value.x
+
+    class PointAsStrEncoder(Encoder):
+        __type__ = Point
+
+        def serialize(self, value):
+            return str(value.x)
+
+    register_encoder(PointEncoder)
+
+    assert json_encode(Point(1)) == 1
+    assert json_encode(Point(1), with_encoders=[PointAsStrEncoder()]) == "1"
+    assert json_encode(Point(1)) == 1
+
+
+def test_apply_structure_cache_invalidated_on_register(encoders):
+    class PointEncoder(Encoder):
+        __type__ = Point
+
+        def serialize(self, value):
+            return value.x
+
+        def encode(self, structure, value):
+            return structure(value)
+
+    class PointFromDictEncoder(Encoder):
+        __type__ = Point
+
+        def serialize(self, value):
+            return {"x": value.x}
+
+        def encode(self, structure, value):
+            return structure(value["x"])
+
+    register_encoder(PointEncoder)
+    assert apply_structure(Point, 1).x == 1
+
+    register_encoder(PointFromDictEncoder)
+    assert apply_structure(Point, {"x": 2}).x == 2
@@ -0,0 +1,54 @@
+import anyio
+
+
+class FakePubSub:
+    def __init__(self, server):
+        self.server = server
+        self.send_stream, self.receive_stream = anyio.create_memory_object_stream(100)
+
+    async def subscribe(self, *names):
+        for name in names:
+            self.server.subscriptions.setdefault(name, set()).add(self)
+            await self.send_stream.send({"type": "subscribe", "channel": name, "data": 1})
+
+    async def unsubscribe(self, *names):
+        for name in names:
+            self.server.subscriptions.get(name, set()).discard(self)
+            self.server.unsubscribed.append(name)
+
+    async def listen(self):
+        async for message in self.receive_stream:
+            if message["type"] == "message" and self.server.failures:
+                self.server.failures -= 1
+                raise ConnectionError("Connection lost")
+            yield message
+
+    async def aclose(self):
+        self.send_stream.close()
+        self.receive_stream.close()
+
+
+class FakeRedis:
+    """
+    A local stand-in for the pub/sub of a Redis server, shared by the "workers" of a test.
+
+    The first `failures` messages received by the subscriptions break them instead.
+    """
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.subscriptions = {}
+        self.unsubscribed = []
+        self.closed = False
+
+    async def publish(self, channel, data):
+        subscribers = list(self.subscriptions.get(channel, ()))
+        for pubsub in subscribers:
+            await pubsub.send_stream.send({"type": "message", "channel": channel, "data": data})
+        return len(subscribers)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def aclose(self):
+        self.closed = True
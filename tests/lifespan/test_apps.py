@@ -334,6 +334,21 @@ def test_app_add_event_handler(test_client_factory):
     assert cleanup_complete
 
 
+def test_app_add_event_handler_with_existing_handlers(test_client_factory):
+    events = []
+
+    app = Lilya(
+        on_startup=[lambda: events.append("startup")],
+        on_shutdown=[lambda: events.append("shutdown")],
+    )
+    app.add_event_handler("startup", lambda: events.append("added startup"))
+    app.add_event_handler("shutdown", lambda: events.append("added shutdown"))
+
+    with test_client_factory(app):
+        assert events == ["startup", "added startup"]
+    assert events == ["startup", "added startup", "shutdown", "added shutdown"]
+
+
 def test_app_async_cm_lifespan(test_client_factory):
     startup_complete = False
     cleanup_complete = False
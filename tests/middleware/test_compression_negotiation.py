@@ -0,0 +1,206 @@
+import zlib
+
+import anyio
+import pytest
+
+from lilya.apps import Lilya
+from lilya.datastructures import Header
+from lilya.middleware import DefineMiddleware, compression
+from lilya.middleware.compression import (
+    CompressionMiddleware,
+    GZipMiddleware,
+    negotiate_encoding,
+    parse_accept_encoding,
+)
+from lilya.responses import PlainText, Response, StreamingResponse
+from lilya.routing import Path
+
+brotli = pytest.importorskip("brotli")
+zstandard = pytest.importorskip("zstandard")
+
+
+def create_app(handler, **options):
+    return Lilya(
+        routes=[Path("/", handler=handler)],
+        middleware=[DefineMiddleware(CompressionMiddleware, **options)],
+    )
+
+
+def large_text():
+    return PlainText("x" * 4000)
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip;q=0.8, BR, zstd;q=0, *;q=0.1, deflate;q=abc") == {
+        "gzip": 0.8,
+        "br": 1.0,
+        "zstd": 0.0,
+        "*": 0.1,
+    }
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("zstd;q=0, br;q=0, gzip", "gzip"),
+        ("*", "zstd"),
+        ("*;q=0.5, br", "br"),
+        ("gzip;q=0", None),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ("zstd", "br", "gzip")) == expected
+
+
+@pytest.mark.parametrize("encoding", ["zstd", "br", "gzip"])
+def test_compresses_with_the_negotiated_encoding(test_client_factory, encoding):
+    client = test_client_factory(create_app(large_text))
+
+    response = client.get("/", headers={"accept-encoding": encoding})
+
+    assert response.status_code == 200
+    assert response.text == "x" * 4000
+    assert response.headers["Content-Encoding"] == encoding
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < 4000
+
+
+def test_levels_and_encodings_are_configurable(test_client_factory):
+    app = create_app(large_text, encodings=("gzip",), levels={"gzip": 1})
+    client = test_client_factory(app)
+
+    response = client.get("/", headers={"accept-encoding": "zstd, br, gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.text == "x" * 4000
+
+
+def test_unknown_encoding_is_rejected():
+    with pytest.raises(ValueError):
+        CompressionMiddleware(large_text, encodings=("deflate",))
+
+
+def test_already_compressed_media_is_skipped(test_client_factory):
+    def image():
+        return Response(b"\x89PNG" + b"x" * 4000, media_type="image/png")
+
+    client = test_client_factory(create_app(image))
+
+    response = client.get("/", headers={"accept-encoding": "gzip, br"})
+
+    assert "Content-Encoding" not in response.headers
+    assert int(response.headers["Content-Length"]) == 4004
+
+
+def test_compressible_types_are_configurable(test_client_factory):
+    def image():
+        return Response(b"x" * 4000, media_type="image/png")
+
+    client = test_client_factory(create_app(image, compressible_types=("image/*",)))
+
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.content == b"x" * 4000
+
+
+@pytest.mark.anyio
+async def test_streaming_chunks_are_flushed():
+    async def generator():
+        for index in range(5):
+            yield f"data: {index}\n\n" * 100
+
+    middleware = CompressionMiddleware(
+        StreamingResponse(generator(), media_type="text/event-stream")
+    )
+    messages = []
+
+    async def receive():
+        await anyio.sleep_forever()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    await middleware(scope, receive, send)
+
+    start, *bodies = messages
+    headers = Header.ensure_header_instance(start)
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+
+    decompressor = zlib.decompressobj(31)
+    # Every chunk is decodable on its own, without waiting for the end of the stream.
+    for index, message in enumerate(bodies[:5]):
+        assert decompressor.decompress(message["body"]) == f"data: {index}\n\n".encode() * 100
+    assert not bodies[-1]["more_body"]
+
+
+def test_gzip_middleware_honours_q_values(test_client_factory):
+    app = Lilya(
+        routes=[Path("/", handler=large_text)],
+        middleware=[DefineMiddleware(GZipMiddleware)],
+    )
+    client = test_client_factory(app)
+
+    response = client.get("/", headers={"accept-encoding": "br, gzip;q=0"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+@pytest.mark.parametrize("encoding", ["zstd", "br", "gzip"])
+def test_large_bodies_are_compressed_in_a_worker_thread(
+    test_client_factory, monkeypatch, encoding
+):
+    offloaded = []
+
+    async def run_in_threadpool(func, *args, **kwargs):
+        offloaded.append(func)
+        return func(*args, **kwargs)
+
+    monkeypatch.setattr(compression, "run_in_threadpool", run_in_threadpool)
+
+    def homepage():
+        return PlainText("x" * 2000 if len(offloaded) else "y" * 8000)
+
+    client = test_client_factory(create_app(homepage, offload_threshold=4000))
+
+    response = client.get("/", headers={"accept-encoding": encoding})
+    assert response.text == "y" * 8000
+    assert len(offloaded) == 1
+
+    response = client.get("/", headers={"accept-encoding": encoding})
+    assert response.text == "x" * 2000
+    assert len(offloaded) == 1
+
+
+def test_offloading_can_be_disabled(test_client_factory, monkeypatch):
+    async def run_in_threadpool(func, *args, **kwargs):  # pragma: no cover
+        raise AssertionError("Should not offload")
+
+    monkeypatch.setattr(compression, "run_in_threadpool", run_in_threadpool)
+    client = test_client_factory(create_app(large_text, offload_threshold=None))
+
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+
+    assert response.text == "x" * 4000
+
+
+def test_zstd_contexts_are_reused():
+    first = compression.ZstdCompressor.compress_body(b"x" * 1000, 3)
+    second = compression.ZstdCompressor.compress_body(b"y" * 1000, 3)
+
+    assert compression.ZstdCompressor._contexts.by_level.keys() == {3}
+    decompressor = zstandard.ZstdDecompressor()
+    assert decompressor.decompress(first) == b"x" * 1000
+    assert decompressor.decompress(second) == b"y" * 1000
@@ -12,14 +12,19 @@ from starlette.requests import Request as StarletteRequest
 from starlette.responses import JSONResponse as StarletteJSONResponse
 from starlette.routing import Route
 
-from lilya._internal._middleware import ScopeIsolationMiddleware
+from lilya._internal._middleware import ScopeIsolationMiddleware, apply_asgi_stack
 from lilya.apps import ChildLilya, Lilya
 from lilya.authentication import AuthCredentials, AuthenticationBackend, BasicUser
 from lilya.middleware import DefineMiddleware
 from lilya.middleware.asyncexit import AsyncExitStackMiddleware
 from lilya.middleware.authentication import AuthenticationMiddleware
+from lilya.middleware.clickjacking import XFrameOptionsMiddleware
 from lilya.middleware.clientip import ClientIPMiddleware, ClientIPScopeOnlyMiddleware
+from lilya.middleware.compression import CompressionMiddleware
+from lilya.middleware.cors import CORSMiddleware
 from lilya.middleware.exceptions import ExceptionMiddleware
+from lilya.middleware.httpsredirect import HTTPSRedirectMiddleware
+from lilya.middleware.security import SecurityMiddleware
 from lilya.middleware.sessions import SessionMiddleware
 from lilya.middleware.trustedhost import TrustedHostMiddleware
 from lilya.middleware.trustedreferrer import TrustedReferrerMiddleware
@@ -519,3 +524,131 @@ def test_clientip_header_middleware_does_not_leak_header_to_upstream_scope(
 
     assert response.json()["x_real_ip"] == "203.0.113.10"
     assert response.headers["x-upstream-header"] == MISSING
+
+
+class ScopePreservingMiddleware:
+    __preserves_scope__ = True
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+
+
+def _count_isolation_layers(app: Any) -> int:
+    count = 0
+    while app is not None:
+        count += isinstance(app, ScopeIsolationMiddleware)
+        app = getattr(app, "app", None)
+    return count
+
+
+async def _noop_app(scope: Scope, receive: Receive, send: Send) -> None: ...
+
+
+@pytest.mark.parametrize(
+    ("stack", "expected"),
+    [
+        ([], 0),
+        ([DefineMiddleware(PositionalScopeMiddleware, "key", "value")], 2),
+        ([DefineMiddleware(PositionalScopeMiddleware, "key", "value")] * 8, 9),
+        ([DefineMiddleware(ScopePreservingMiddleware)] * 8, 1),
+        (
+            [
+                DefineMiddleware(ScopePreservingMiddleware),
+                DefineMiddleware(PositionalScopeMiddleware, "key", "value"),
+                DefineMiddleware(ScopePreservingMiddleware),
+            ],
+            2,
+        ),
+    ],
+)
+def test_scope_is_copied_once_per_boundary(stack: list[DefineMiddleware], expected: int) -> None:
+    assert _count_isolation_layers(apply_asgi_stack(_noop_app, stack)) == expected
+
+
+def test_scope_preserving_middlewares_keep_the_isolation(
+    test_client_factory: TestClientFactory,
+) -> None:
+    app = Lilya(
+        routes=[Path("/", scope_echo)],
+        middleware=[
+            DefineMiddleware(OuterScopeObserverMiddleware, key="user"),
+            DefineMiddleware(ScopePreservingMiddleware),
+            DefineMiddleware(CORSMiddleware, allow_origins=["*"]),
+            DefineMiddleware(AuthenticationMiddleware, backend=[FixedAuthBackend()]),
+            DefineMiddleware(ScopePreservingMiddleware),
+            DefineMiddleware(RouteTemplateSnapshotMiddleware),
+        ],
+    )
+    client = test_client_factory(app)
+
+    response = client.get("/", headers={"origin": "https://example.org"})
+
+    assert response.json()["user"] == "scoped-user"
+    assert response.headers["access-control-allow-origin"] == "*"
+    assert response.headers["x-upstream-scope"] == MISSING
+    assert response.headers["x-route-template"] == "/"
+
+
+async def scope_echo_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await JSONResponse({"ok": True})(scope, receive, send)
+
+
+class RawHeadersObserverMiddleware:
+    """Reads the raw scope headers of its own scope once the inner layers are done."""
+
+    def __init__(self, app: ASGIApp, seen: list[Any]) -> None:
+        self.app = app
+        self.seen = seen
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.app(scope, receive, send)
+        self.seen.append(scope["headers"])
+
+
+@pytest.mark.parametrize(
+    "middleware",
+    [
+        DefineMiddleware(CORSMiddleware, allow_origins=["*"]),
+        DefineMiddleware(CompressionMiddleware, minimum_size=1),
+        DefineMiddleware(SecurityMiddleware, content_policy="default-src 'self'"),
+        DefineMiddleware(XFrameOptionsMiddleware),
+        DefineMiddleware(HTTPSRedirectMiddleware),
+    ],
+    ids=["cors", "compression", "security", "xframe", "httpsredirect"],
+)
+def test_scope_preserving_middlewares_do_not_write_the_scope(middleware: DefineMiddleware) -> None:
+    seen: list[Any] = []
+    app = apply_asgi_stack(
+        scope_echo_app,
+        [DefineMiddleware(RawHeadersObserverMiddleware, seen=seen), middleware],
+    )
+    headers = [
+        (b"user-agent", b"x"),
+        (b"origin", b"https://example.org"),
+        (b"accept-encoding", b"gzip"),
+    ]
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None: ...
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "scheme": "https",
+        "path": "/",
+        "raw_path": b"/",
+        "query_string": b"",
+        "root_path": "",
+        "server": ("testserver", 443),
+        "headers": headers,
+    }
+    asyncio.run(app(scope, receive, send))
+
+    assert seen == [headers]
+    assert isinstance(seen[0], list)
+    assert dict(seen[0]).get(b"user-agent") == b"x"
@@ -0,0 +1,105 @@
+import pytest
+
+from lilya.apps import Lilya
+from lilya.contrib.openapi import config as openapi_config
+from lilya.contrib.openapi.config import OpenAPIConfig
+from lilya.contrib.openapi.decorator import openapi
+from lilya.routing import Include, Path
+from lilya.testclient import TestClient
+
+
+@openapi(summary="Users")
+async def users() -> list[str]:
+    return []
+
+
+@openapi(summary="Orders")
+async def orders() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def generations(monkeypatch):
+    calls = []
+    get_openapi = openapi_config.get_openapi
+
+    def counting_get_openapi(**kwargs):
+        calls.append(kwargs["title"])
+        return get_openapi(**kwargs)
+
+    monkeypatch.setattr(openapi_config, "get_openapi", counting_get_openapi)
+    return calls
+
+
+def create_app(**options):
+    return Lilya(
+        routes=[
+            Path("/users", users),
+            Include("/api", routes=[Path("/orders", orders)]),
+        ],
+        enable_openapi=True,
+        **options,
+    )
+
+
+def test_schema_is_generated_once(generations):
+    client = TestClient(create_app())
+
+    first = client.get("/openapi.json")
+    second = client.get("/openapi.json")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert set(first.json()["paths"]) == {"/users", "/api/orders"}
+    assert first.headers["content-type"] == "application/json"
+    assert first.headers["etag"] == second.headers["etag"]
+    assert len(generations) == 1
+
+
+def test_if_none_match_returns_not_modified(generations):
+    client = TestClient(create_app())
+    etag = client.get("/openapi.json").headers["etag"]
+
+    response = client.get("/openapi.json", headers={"if-none-match": f'W/{etag}, "other"'})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert client.get("/openapi.json", headers={"if-none-match": '"other"'}).status_code == 200
+
+
+def test_added_routes_invalidate_the_schema(generations):
+    app = create_app()
+    client = TestClient(app)
+    etag = client.get("/openapi.json").headers["etag"]
+
+    app.add_route("/items", users)
+    response = client.get("/openapi.json")
+    assert "/items" in response.json()["paths"]
+    assert response.headers["etag"] != etag
+
+    # Routes added to an include are seen as well
+    app.routes[1].routes.append(Path("/invoices", orders))
+    assert "/api/invoices" in client.get("/openapi.json").json()["paths"]
+    assert len(generations) == 3
+
+
+def test_configure_openapi_invalidates_the_schema(generations):
+    app = create_app()
+    client = TestClient(app)
+    client.get("/openapi.json")
+
+    app.configure_openapi(OpenAPIConfig(title="Shop", openapi_url="/schema.json"))
+
+    assert client.get("/schema.json").json()["info"]["title"] == "Shop"
+    assert generations == ["Lilya", "Shop"]
+
+
+def test_schema_can_be_generated_on_startup(generations):
+    app = create_app(openapi_config=OpenAPIConfig(generate_on_startup=True))
+
+    with TestClient(app) as client:
+        assert generations == ["Lilya"]
+        assert client.get("/openapi.json").status_code == 200
+
+    assert generations == ["Lilya"]
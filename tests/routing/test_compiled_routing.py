@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from lilya.apps import Lilya
+from lilya.exceptions import ContinueRouting
+from lilya.responses import PlainText
+from lilya.routing import Host, Include, Path, Router, WebSocketPath
+from lilya.routing.matcher import RouteMatcher
+from lilya.websockets import WebSocket
+
+
+def homepage():
+    return PlainText("home")
+
+
+def users():
+    return PlainText("users")
+
+
+def user(username: str):
+    return PlainText(f"user {username}")
+
+
+def user_me():
+    return PlainText("me")
+
+
+def item(item_id: int):
+    return PlainText(f"item int {item_id}")
+
+
+def item_uuid(item_id: uuid.UUID):
+    return PlainText(f"item uuid {item_id}")
+
+
+def report(name: str):
+    return PlainText(f"report {name}")
+
+
+def files(path: str):
+    return PlainText(f"files {path}")
+
+
+def create_user():
+    return PlainText("created")
+
+
+def skip():
+    raise ContinueRouting()
+
+
+def fallback(rest: str):
+    return PlainText(f"fallback {rest}")
+
+
+async def websocket_room(websocket: WebSocket):
+    await websocket.accept()
+    await websocket.send_text(websocket.path_params["room"])
+    await websocket.close()
+
+
+def create_routes() -> list:
+    return [
+        Path("/", homepage),
+        Path("/users", users),
+        Path("/users/me", user_me),
+        Path("/users/{username}", user),
+        Path("/users", create_user, methods=["POST"]),
+        Path("/items/{item_id:int}", item),
+        Path("/items/{item_id:uuid}", item_uuid),
+        Path("/reports/{name}.csv", report),
+        Path("/files/{path:path}", files),
+        Path("/skip", skip),
+        Path("/skip", homepage),
+        WebSocketPath("/ws/{room}", websocket_room),
+        Include(
+            "/api",
+            routes=[
+                Path("/users/{username}", user),
+                Include("/v1", routes=[Path("/items/{item_id:int}", item)]),
+            ],
+        ),
+        Host("{subdomain}.example.org", app=Router(routes=[Path("/host", homepage)])),
+        Path("/{rest:path}", fallback, methods=["PUT"]),
+    ]
+
+
+REQUESTS = [
+    ("GET", "/"),
+    ("GET", "/users"),
+    ("GET", "/users/"),
+    ("POST", "/users"),
+    ("DELETE", "/users"),
+    ("GET", "/users/me"),
+    ("GET", "/users/lilya"),
+    ("GET", "/items/1"),
+    ("GET", f"/items/{uuid.UUID(int=1)}"),
+    ("GET", "/items/not-a-number"),
+    ("GET", "/reports/monthly.csv"),
+    ("GET", "/reports/monthly.txt"),
+    ("GET", "/files/a/b/c.txt"),
+    ("GET", "/files/"),
+    ("GET", "/skip"),
+    ("GET", "/api/users/lilya"),
+    ("GET", "/api/users/lilya/"),
+    ("GET", "/api/v1/items/10"),
+    ("POST", "/api/v1/items/10"),
+    ("GET", "/api"),
+    ("GET", "/host"),
+    ("PUT", "/anything/else"),
+    ("GET", "/does/not/exist"),
+]
+
+
+@pytest.mark.parametrize("method,path", REQUESTS)
+def test_compiled_routing_matches_linear_routing(test_client_factory, method, path):
+    linear = test_client_factory(Lilya(routes=create_routes()), base_url="http://www.example.org")
+    compiled = test_client_factory(
+        Lilya(routes=create_routes(), compile_routes=True), base_url="http://www.example.org"
+    )
+
+    expected = linear.request(method, path, follow_redirects=False)
+    response = compiled.request(method, path, follow_redirects=False)
+
+    assert response.status_code == expected.status_code
+    assert response.text == expected.text
+    assert response.headers.get("allow") == expected.headers.get("allow")
+    assert response.headers.get("location") == expected.headers.get("location")
+
+
+def test_compiled_routing_websocket(test_client_factory):
+    app = Lilya(routes=create_routes(), compile_routes=True)
+    client = test_client_factory(app)
+
+    with client.websocket_connect("/ws/lobby") as session:
+        assert session.receive_text() == "lobby"
+
+
+def test_compiled_routing_propagates_to_includes():
+    app = Lilya(routes=create_routes(), compile_routes=True)
+    app.router.build_route_matcher()
+
+    include = next(route for route in app.routes if isinstance(route, Include))
+
+    assert include.app.compile_routes is True
+    assert include.app._route_matcher is not None
+
+
+def test_compiled_routing_rebuilds_on_new_routes(test_client_factory):
+    app = Lilya(routes=[Path("/", homepage)], compile_routes=True)
+    client = test_client_factory(app)
+
+    assert client.get("/users").status_code == 404
+
+    app.add_route("/users", users)
+
+    response = client.get("/users")
+
+    assert response.status_code == 200
+    assert response.text == "users"
+
+
+def test_route_matcher_candidates_keep_declaration_order():
+    routes = create_routes()
+    matcher = RouteMatcher(routes)
+
+    candidates = matcher.candidates("/users")
+
+    assert list(candidates) == [
+        routes[1],
+        routes[4],
+        routes[13],
+        routes[14],
+    ]
+
+
+def test_route_matcher_prunes_typed_segments():
+    routes = create_routes()
+    matcher = RouteMatcher(routes)
+
+    assert routes[5] in matcher.candidates("/items/10")
+    assert routes[6] not in matcher.candidates("/items/10")
+    assert routes[5] not in matcher.candidates(f"/items/{uuid.UUID(int=1)}")
+    assert routes[6] in matcher.candidates(f"/items/{uuid.UUID(int=1)}")
@@ -0,0 +1,118 @@
+import pytest
+
+from lilya.responses import PlainText
+from lilya.routing import Host, Include, NoMatchFound, Path, Router, WebSocketPath
+from lilya.routing.base import BasePath
+from lilya.routing.reverse import ReverseIndex
+
+
+def handler():
+    return PlainText("ok")
+
+
+async def websocket_handler(websocket): ...
+
+
+def create_router():
+    return Router(
+        routes=[
+            Path("/", handler, name="home"),
+            Include(
+                "/users",
+                name="users",
+                routes=[
+                    Path("/", handler, name="list"),
+                    Path("/{user_id:int}", handler, name="detail"),
+                    Include(
+                        "/{user_id:int}/posts",
+                        name="posts",
+                        routes=[
+                            Path("/{slug}", handler, name="detail"),
+                        ],
+                    ),
+                ],
+            ),
+            Include("/api", routes=[Path("/status", handler, name="status")]),
+            WebSocketPath("/ws", websocket_handler, name="ws"),
+            Host(
+                "{subdomain}.example.org",
+                name="sub",
+                app=Router([Path("/", handler, name="index")]),
+            ),
+        ]
+    )
+
+
+def test_index_selects_the_candidates():
+    router = create_router()
+    index = ReverseIndex(router.routes)
+    home, users, api, ws, host = router.routes
+
+    # Unnamed includes can build any name
+    assert index.candidates("home") == [home, api]
+    assert index.candidates("users:posts:detail") == [users, api]
+    assert index.candidates("users") == [users, api]
+    assert index.candidates("ws") == [api, ws]
+    assert index.candidates("sub:index") == [api, host]
+    assert index.candidates("unknown") == [api]
+
+
+def test_url_path_for_with_the_index():
+    router = create_router()
+
+    assert router.url_path_for("home") == "/"
+    assert router.url_path_for("users:list") == "/users/"
+    assert router.url_path_for("users:detail", user_id=1) == "/users/1"
+    assert (
+        router.url_path_for("users:posts:detail", user_id=1, slug="hello")
+        == "/users/1/posts/hello"
+    )
+    assert router.url_path_for("users", path="/anything") == "/users/anything"
+    assert router.url_path_for("status") == "/api/status"
+    assert router.url_path_for("ws").protocol == "websocket"
+    assert router.url_path_for("sub:index", subdomain="docs").host == "docs.example.org"
+
+    with pytest.raises(NoMatchFound):
+        router.url_path_for("users:detail")
+    with pytest.raises(NoMatchFound):
+        router.url_path_for("unknown")
+
+
+def test_the_first_declared_route_wins():
+    router = Router(
+        routes=[
+            Include("/v1", routes=[Path("/items", handler, name="items")]),
+            Path("/items", handler, name="items"),
+        ]
+    )
+
+    assert router.url_path_for("items") == "/v1/items"
+
+
+def test_index_is_invalidated_when_routes_are_added():
+    router = create_router()
+    assert router.url_path_for("home") == "/"
+
+    with pytest.raises(NoMatchFound):
+        router.url_path_for("about")
+    router.add_route("/about", handler, name="about")
+    assert router.url_path_for("about") == "/about"
+
+    # Routes added to nested routers are seen as well
+    router.routes[1].routes.append(Path("/me", handler, name="me"))
+    assert router.url_path_for("users:me") == "/users/me"
+
+
+def test_custom_routes_are_always_candidates():
+    class Redirect(BasePath):
+        name = "legacy"
+
+        def url_path_for(self, name, /, **path_params):
+            if name != self.name:
+                raise NoMatchFound(name, path_params)
+            return "/legacy"
+
+    router = Router(routes=[Redirect(), Path("/", handler, name="home")])
+
+    assert router.url_path_for("legacy") == "/legacy"
+    assert router.url_path_for("home") == "/"
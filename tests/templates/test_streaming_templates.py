@@ -0,0 +1,101 @@
+import threading
+
+import anyio
+import jinja2
+import pytest
+
+from lilya.apps import Lilya
+from lilya.responses import StreamingTemplateResponse
+from lilya.routing import Path
+from lilya.templating.jinja import Jinja2Template
+
+
+def test_streaming_templates(tmpdir, test_client_factory):
+    (tmpdir / "report.html").write_text(
+        "<ul>{% for row in rows %}<li>{{ row }}</li>{% endfor %}</ul>", encoding="utf-8"
+    )
+    templates = Jinja2Template(directory=str(tmpdir))
+
+    async def report(request):
+        return templates.get_template_response(
+            request, "report.html", context={"rows": range(3)}, stream=True
+        )
+
+    client = test_client_factory(Lilya(routes=[Path("/", handler=report)]))
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert "content-length" not in response.headers
+    assert response.text == "<ul><li>0</li><li>1</li><li>2</li></ul>"
+    assert response.template.name == "report.html"
+    assert set(response.context.keys()) == {"request", "rows"}
+
+
+def test_streaming_async_templates(tmpdir, test_client_factory):
+    (tmpdir / "index.html").write_text("<html>Hello {{ async_fn() }}</html>", encoding="utf-8")
+    templates = Jinja2Template(directory=str(tmpdir), enable_async=True)
+
+    async def async_fn():
+        return "world"
+
+    async def homepage(request):
+        return templates.get_template_response(
+            request, "index.html", context={"async_fn": async_fn}, stream=True
+        )
+
+    client = test_client_factory(Lilya(routes=[Path("/", handler=homepage)]))
+
+    assert client.get("/").text == "<html>Hello world</html>"
+
+
+def test_sync_templates_are_rendered_in_a_thread(test_client_factory):
+    threads = []
+
+    def current_thread():
+        threads.append(threading.get_ident())
+        return ""
+
+    template = jinja2.Template("<p>{{ current_thread() }}</p>")
+    response = StreamingTemplateResponse(template, context={"current_thread": current_thread})
+    # Nothing is rendered before the response is sent
+    assert threads == []
+
+    client = test_client_factory(response)
+
+    assert client.get("/").text == "<p></p>"
+    assert threads and threads[0] != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_chunks_are_sent_as_they_are_rendered():
+    head_sent = anyio.Event()
+
+    async def wait_for_head():
+        with anyio.fail_after(2):
+            await head_sent.wait()
+        return "<main>report</main>"
+
+    env = jinja2.Environment(enable_async=True)
+    template = env.from_string("<head>{{ title }}</head>{{ wait_for_head() }}")
+    response = StreamingTemplateResponse(
+        template,
+        context={"title": "Report", "wait_for_head": wait_for_head},
+        render_function_name="generate_async",
+        chunk_size=16,
+    )
+    messages = []
+
+    async def receive():
+        await anyio.sleep_forever()
+
+    async def send(message):
+        messages.append(message)
+        if message.get("body", b"").startswith(b"<head>"):
+            head_sent.set()
+
+    await response({"type": "http", "method": "GET", "headers": []}, receive, send)
+
+    bodies = [message["body"] for message in messages[1:]]
+    assert bodies == [b"<head>Report</head>", b"<main>report</main>", b""]
+    assert not messages[-1]["more_body"]
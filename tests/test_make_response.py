@@ -9,6 +9,7 @@ from msgspec import Struct
 from pydantic import BaseModel
 
 from lilya.encoders import Encoder, apply_structure
+from lilya.middleware import DefineMiddleware
 from lilya.responses import Response, make_response
 from lilya.routing import Path
 from lilya.testclient import create_client
@@ -279,3 +280,45 @@ def test_custom_molding_only_encoder_response(json_encode_kwargs):
         assert response.json() == {"a": 3}
         result = apply_structure(Foo, response.json(), with_encoders=[FooEncoder()])
         assert result == Foo(3)
+
+
+class Money:
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+
+
+class MoneyEncoder(Encoder):
+    __type__ = Money
+
+    def serialize(self, obj: Money) -> str:
+        return f"{obj.amount} EUR"
+
+
+def test_handler_return_value_is_encoded_once_with_transform_kwargs():
+    calls = []
+
+    def dumps(obj, **kwargs):
+        calls.append(obj)
+        return orjson.dumps(obj, default=kwargs["default"])
+
+    class TransformKwargsMiddleware:
+        def __init__(self, app):
+            self.app = app
+
+        async def __call__(self, scope, receive, send):
+            with Response.with_transform_kwargs(
+                {"json_encode_fn": dumps, "with_encoders": [MoneyEncoder()]}
+            ):
+                await self.app(scope, receive, send)
+
+    def home() -> dict:
+        return {"total": Money(10)}
+
+    with create_client(
+        routes=[Path("/", home)], middleware=[DefineMiddleware(TransformKwargsMiddleware)]
+    ) as client:
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.json() == {"total": "10 EUR"}
+        assert len(calls) == 1
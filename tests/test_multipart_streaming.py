@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import io
+import os
+import typing
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from lilya.contrib.multipart import MultipartParser
+from lilya.datastructures import DataUpload, Header
+from lilya.requests import Request
+from lilya.responses import JSONResponse
+from lilya.testclient import TestClient
+from lilya.types import Receive, Scope, Send
+from lilya.uploads import FileSink, StreamSink
+
+TestClientFactory = Callable[..., TestClient]
+
+BODY = (
+    b"preamble\r\n"
+    b"--B\r\n"
+    b'Content-Disposition: form-data; name="field"\r\n'
+    b"\r\n"
+    b"value\r\n"
+    b"--B\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="data.bin"\r\n'
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n"
+    b"\r\n--A\r\r\n-\x00\xff" + b"x" * 100 + b"\r\n"
+    b"--B--\r\n"
+    b"epilogue"
+)
+
+
+def parse(chunks: typing.Iterable[bytes]) -> list[tuple[str, typing.Any]]:
+    parser = MultipartParser(b"B")
+    events: list[tuple[str, typing.Any]] = []
+
+    def on_part_data(data: bytes, start: int, end: int) -> None:
+        if events and events[-1][0] == "data":
+            events[-1] = ("data", events[-1][1] + data[start:end])
+        else:
+            events.append(("data", data[start:end]))
+
+    parser.set_callback("part_begin", lambda: events.append(("begin", None)))
+    parser.set_callback(
+        "headers_finished", lambda: events.append(("headers", dict(parser._headers)))
+    )
+    parser.set_callback("part_data", on_part_data)
+    parser.set_callback("part_end", lambda: events.append(("end", None)))
+    parser.set_callback("end", lambda: events.append(("done", None)))
+    for chunk in chunks:
+        parser.write(chunk)
+    parser.finalize()
+    return events
+
+
+def test_parts_do_not_depend_on_the_chunks() -> None:
+    expected = parse([BODY])
+
+    assert expected == [
+        ("begin", None),
+        ("headers", {"content-disposition": 'form-data; name="field"'}),
+        ("data", b"value"),
+        ("end", None),
+        ("begin", None),
+        (
+            "headers",
+            {
+                "content-disposition": 'form-data; name="file"; filename="data.bin"',
+                "content-type": "application/octet-stream",
+            },
+        ),
+        ("data", b"\r\n--A\r\r\n-\x00\xff" + b"x" * 100),
+        ("end", None),
+        ("done", None),
+    ]
+    for size in (1, 2, 3, 5, 7, 64):
+        chunks = [BODY[i : i + size] for i in range(0, len(BODY), size)]
+        assert parse(chunks) == expected
+
+
+def test_part_data_are_slices_of_the_written_chunk() -> None:
+    parser = MultipartParser(b"B")
+    received = []
+    parser.set_callback("part_data", lambda data, start, end: received.append((data, start, end)))
+
+    head = b'--B\r\nContent-Disposition: form-data; name="file"; filename="a"\r\n\r\n'
+    chunk = b"y" * 1024
+    parser.write(head)
+    parser.write(chunk)
+    parser.write(b"\r\n--B--\r\n")
+
+    data, start, end = received[0]
+    assert data is chunk
+    assert (start, end) == (0, 1024)
+
+
+async def upload_app(scope: Scope, receive: Receive, send: Send) -> None:
+    request = Request(scope, receive)
+    destination = scope["app_destination"]
+    form = await request.form(
+        upload_sink=lambda name, filename, headers: FileSink(destination / f"{name}-{filename}")
+    )
+    upload = form["file"]
+    response = JSONResponse(
+        {
+            "field": form["field"],
+            "size": upload.size,
+            "content": (await upload.read()).decode(),
+            "spooled": not isinstance(upload.file, FileSink),
+        }
+    )
+    await request.close()
+    await response(scope, receive, send)
+
+
+def test_files_are_written_to_the_sink(
+    tmp_path: Path, test_client_factory: TestClientFactory
+) -> None:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        scope["app_destination"] = tmp_path
+        await upload_app(scope, receive, send)
+
+    client = test_client_factory(app)
+    response = client.post(
+        "/", data={"field": "value"}, files={"file": ("report.txt", b"<report/>" * 1000)}
+    )
+
+    assert response.json() == {
+        "field": "value",
+        "size": 9000,
+        "content": "<report/>" * 1000,
+        "spooled": False,
+    }
+    assert (tmp_path / "file-report.txt").read_bytes() == b"<report/>" * 1000
+
+
+def test_files_are_written_to_a_file_descriptor(
+    tmp_path: Path, test_client_factory: TestClientFactory
+) -> None:
+    read_fd, write_fd = os.pipe()
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        async with request.form(upload_sink=lambda *args: FileSink(write_fd)) as form:
+            upload = form["file"]
+            with pytest.raises(io.UnsupportedOperation):
+                await upload.read()
+            response = JSONResponse({"size": upload.size})
+        await response(scope, receive, send)
+
+    client = test_client_factory(app)
+    response = client.post("/", files={"file": ("data.bin", b"\x00\r\n" * 100)})
+
+    assert response.json() == {"size": 300}
+    with os.fdopen(read_fd, "rb") as file:
+        assert file.read() == b"\x00\r\n" * 100
+
+
+def test_files_are_streamed_to_an_async_writer(test_client_factory: TestClientFactory) -> None:
+    received: list[tuple[str, str, bytes]] = []
+    closed = []
+
+    def sink(name: str, filename: str, headers: Header) -> StreamSink:
+        async def write(chunk: memoryview) -> None:
+            received.append((name, filename, bytes(chunk)))
+
+        async def close() -> None:
+            closed.append(filename)
+
+        return StreamSink(write, close=close)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        async with request.form(upload_sink=sink) as form:
+            response = JSONResponse(
+                {
+                    value.filename: value.size
+                    for _, value in form.multi_items()
+                    if isinstance(value, DataUpload)
+                }
+            )
+        await response(scope, receive, send)
+
+    client = test_client_factory(app)
+    response = client.post(
+        "/", files=[("a", ("one.txt", b"1" * 10)), ("b", ("two.txt", b"2" * 20))]
+    )
+
+    assert response.json() == {"one.txt": 10, "two.txt": 20}
+    assert b"".join(chunk for name, _, chunk in received if name == "a") == b"1" * 10
+    assert b"".join(chunk for name, _, chunk in received if name == "b") == b"2" * 20
+    assert sorted(closed) == ["one.txt", "two.txt"]
+
+
+def test_sinks_are_closed_on_errors(test_client_factory: TestClientFactory) -> None:
+    closed = []
+
+    def sink(name: str, filename: str, headers: Header) -> StreamSink:
+        async def write(chunk: memoryview) -> None: ...
+
+        async def close() -> None:
+            closed.append(filename)
+
+        return StreamSink(write, close=close)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        request = Request(scope, receive)
+        await request.form(max_files=1, upload_sink=sink)
+
+    client = test_client_factory(app)
+    with pytest.raises(Exception, match="Too many files"):
+        client.post("/", files=[("a", ("one.txt", b"1")), ("b", ("two.txt", b"2"))])
+
+    assert closed == ["one.txt"]
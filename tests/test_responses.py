@@ -1333,7 +1333,7 @@ async def test_eventstream_response_with_json_data():
 
     # Minimal JSON (no spaces)
     assert b"event: data\n" in body
-    assert b'data: {"value": 42}\n\n' in body
+    assert b'data: {"value":42}\n\n' in body
 
 
 async def test_eventstream_response_with_global_retry():
@@ -1460,7 +1460,7 @@ async def test_eventstream_response_json_dict_serialization():
 
     response = EventStreamResponse(gen())
     chunks = [chunk async for chunk in response.body_iterator]
-    assert b'data: {"nested": [1, 2, 3]}' in chunks[0]
+    assert b'data: {"nested":[1,2,3]}' in chunks[0]
 
 
 @pytest.mark.parametrize("anyio_backend", ["asyncio"])
@@ -0,0 +1,218 @@
+import datetime
+import io
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from lilya.apps import Lilya
+from lilya.caches.memory import InMemoryCache
+from lilya.encoders import Encoder, json_encode, json_encode_bytes
+from lilya.protocols.serializer import BytesSerializerProtocol
+from lilya.responses import EventStreamResponse, JSONResponse, NDJSONResponse
+from lilya.routing import Path
+from lilya.serializers import (
+    MAX_CACHED_ENCODERS,
+    AutoSerializerConfig,
+    CompactSerializer,
+    MsgspecSerializer,
+    MsgspecSerializerConfig,
+    ORJSONSerializer,
+    ORJSONSerializerConfig,
+    StandardSerializerConfig,
+    serializer,
+    setup_serializer,
+)
+from lilya.testclient import TestClient
+
+SERIALIZERS = [CompactSerializer, ORJSONSerializer, MsgspecSerializer]
+
+
+@dataclass
+class Item:
+    name: str
+    created_at: datetime.datetime
+
+
+class ItemEncoder(Encoder):
+    __type__ = Item
+
+    def serialize(self, obj: Item) -> dict:
+        return {"item": obj.name}
+
+
+class CountingSerializer(ORJSONSerializer):
+    calls = 0
+
+    @classmethod
+    def dumps_bytes(cls, obj, **kwargs):
+        cls.calls += 1
+        return super().dumps_bytes(obj, **kwargs)
+
+
+class CountingSerializerConfig(StandardSerializerConfig):
+    def get_serializer(self):
+        return CountingSerializer
+
+
+@pytest.fixture
+def bind_serializer():
+    previous = serializer._serializer
+    CountingSerializer.calls = 0
+
+    yield setup_serializer
+
+    serializer.bind_serializer(previous)
+
+
+@pytest.mark.parametrize("backend", SERIALIZERS)
+def test_serializers_implement_bytes_protocol(backend):
+    assert isinstance(backend, BytesSerializerProtocol)
+
+    data = backend.dumps_bytes({"name": "lilya", "tags": ["a", "ü"]})
+
+    assert isinstance(data, bytes)
+    assert backend.loads(data) == {"name": "lilya", "tags": ["a", "ü"]}
+    assert backend.dumps({"name": "lilya"}) == '{"name":"lilya"}'
+
+
+@pytest.mark.parametrize("backend", SERIALIZERS)
+def test_serializers_dump_and_load(backend):
+    buffer = io.StringIO()
+
+    backend.dump({"a": 1}, buffer)
+    buffer.seek(0)
+
+    assert backend.load(buffer) == {"a": 1}
+
+
+@pytest.mark.parametrize("backend", SERIALIZERS)
+def test_serializers_honour_json_kwargs(backend):
+    data = backend.dumps({"b": 1, "a": {"c": 2}}, sort_keys=True, indent=2)
+
+    assert data.index('"a"') < data.index('"b"')
+    assert "\n" in data
+
+
+@pytest.mark.parametrize("backend", SERIALIZERS)
+def test_serializers_use_lilya_encoders(backend):
+    value = {
+        "id": uuid.UUID(int=1),
+        "at": datetime.datetime(2025, 1, 1, 12, 0),
+        "tags": {"a"},
+    }
+
+    encoded = json_encode(value, json_encode_fn=backend.dumps_bytes, post_transform_fn=None)
+
+    assert backend.loads(encoded) == json_encode(value)
+
+
+@pytest.mark.parametrize("backend", [ORJSONSerializer, MsgspecSerializer])
+def test_registered_encoders_take_precedence_over_dataclasses(backend):
+    value = Item(name="lilya", created_at=datetime.datetime(2025, 1, 1))
+
+    encoded = json_encode(
+        value,
+        json_encode_fn=backend.dumps_bytes,
+        post_transform_fn=None,
+        with_encoders=[ItemEncoder()],
+    )
+
+    if backend is ORJSONSerializer:
+        assert backend.loads(encoded) == {"item": "lilya"}
+    else:
+        # msgspec serializes dataclasses natively and never calls the hook for them.
+        assert backend.loads(encoded) == {"name": "lilya", "created_at": "2025-01-01T00:00:00"}
+
+
+@pytest.mark.parametrize("backend", [ORJSONSerializer, MsgspecSerializer])
+def test_non_compact_options_fall_back_to_json(backend):
+    value = {"name": "ü", "at": datetime.date(2025, 1, 1)}
+
+    assert backend.dumps(value, default=str, separators=(",", ":")) == (
+        '{"name":"ü","at":"2025-01-01"}'
+    )
+    assert backend.dumps(value, default=str, separators=(", ", ": ")) == (
+        '{"name": "ü", "at": "2025-01-01"}'
+    )
+    assert backend.dumps_bytes(value, default=str, ensure_ascii=True) == (
+        b'{"name":"\\u00fc","at":"2025-01-01"}'
+    )
+
+
+def test_msgspec_encoders_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(MsgspecSerializer, "_encoders", {})
+
+    for _ in range(MAX_CACHED_ENCODERS * 2):
+        MsgspecSerializer.dumps_bytes({"a": 1}, default=lambda obj: obj)
+
+    assert len(MsgspecSerializer._encoders) == MAX_CACHED_ENCODERS
+
+
+def test_auto_serializer_config_prefers_orjson():
+    assert AutoSerializerConfig().get_serializer() is ORJSONSerializer
+
+
+@pytest.mark.parametrize(
+    "config,backend",
+    [
+        (ORJSONSerializerConfig(), ORJSONSerializer),
+        (MsgspecSerializerConfig(), MsgspecSerializer),
+        (AutoSerializerConfig(), ORJSONSerializer),
+    ],
+)
+def test_app_binds_builtin_serializer_configs(bind_serializer, config, backend):
+    Lilya(serializer_config=config)
+
+    assert serializer._serializer is backend
+
+
+def test_json_encode_bytes_uses_dumps_bytes(bind_serializer):
+    bind_serializer(CountingSerializerConfig())
+
+    assert json_encode_bytes({"a": [1, 2]}) == b'{"a":[1,2]}'
+    assert CountingSerializer.calls == 1
+
+
+def test_json_response_uses_dumps_bytes(bind_serializer):
+    bind_serializer(CountingSerializerConfig())
+
+    response = JSONResponse({"name": "lilya", "at": datetime.date(2025, 1, 1)})
+
+    assert response.body == b'{"name":"lilya","at":"2025-01-01"}'
+    assert CountingSerializer.calls == 1
+
+
+def test_ndjson_response_uses_dumps_bytes(bind_serializer):
+    bind_serializer(CountingSerializerConfig())
+
+    def home():
+        return NDJSONResponse([{"a": 1}, {"b": 2}])
+
+    client = TestClient(Lilya(routes=[Path("/", home)]))
+    response = client.get("/")
+
+    assert response.text == '{"a":1}\n{"b":2}'
+    assert CountingSerializer.calls == 2
+
+
+def test_event_stream_response_uses_dumps_bytes(bind_serializer):
+    bind_serializer(CountingSerializerConfig())
+
+    response = EventStreamResponse(iter(()))
+
+    assert response._encode_event({"event": "update", "data": {"a": 1}}) == (
+        b'event: update\ndata: {"a":1}\n\n'
+    )
+    assert CountingSerializer.calls == 1
+
+
+def test_in_memory_cache_uses_dumps_bytes(bind_serializer):
+    bind_serializer(CountingSerializerConfig())
+    cache = InMemoryCache()
+
+    cache.sync_set("key", {"a": [1, 2]})
+
+    assert cache._store["key"][0] == b'{"a":[1,2]}'
+    assert cache.sync_get("key") == {"a": [1, 2]}
+    assert CountingSerializer.calls == 1
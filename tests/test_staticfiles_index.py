@@ -0,0 +1,184 @@
+import gzip
+import os
+import time
+
+import anyio.to_thread
+import pytest
+
+from lilya import staticfiles
+from lilya.apps import Lilya
+from lilya.routing import Include
+from lilya.staticfiles import StaticFiles
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "app.css").write_text("body { color: red; }")
+    (tmp_path / "big.txt").write_text("x" * 4000)
+    return tmp_path
+
+
+@pytest.fixture
+def thread_hops(monkeypatch):
+    hops = []
+    run_sync = anyio.to_thread.run_sync
+
+    async def counting_run_sync(func, *args, **kwargs):
+        if func.__module__ == staticfiles.__name__:
+            hops.append(func.__name__)
+        return await run_sync(func, *args, **kwargs)
+
+    monkeypatch.setattr(staticfiles.anyio.to_thread, "run_sync", counting_run_sync)
+    return hops
+
+
+def test_index_serves_the_same_headers(static_dir, test_client_factory):
+    indexed = test_client_factory(StaticFiles(directory=static_dir, index=True))
+    plain = test_client_factory(StaticFiles(directory=static_dir))
+
+    for path in ("/css/app.css", "/big.txt"):
+        response = indexed.get(path)
+        expected = plain.get(path)
+
+        assert response.status_code == 200
+        assert response.content == expected.content
+        for header in ("content-type", "content-length", "etag", "last-modified", "accept-ranges"):
+            assert response.headers[header] == expected.headers[header]
+
+
+def test_index_serves_not_modified_without_thread_hops(
+    static_dir, test_client_factory, thread_hops
+):
+    client = test_client_factory(StaticFiles(directory=static_dir, index=True))
+
+    etag = client.get("/big.txt").headers["etag"]
+    assert thread_hops == ["_check_dirs", "build_index", "get_stat_result"]
+
+    response = client.get("/big.txt", headers={"if-none-match": etag})
+
+    assert response.status_code == 304
+    assert thread_hops == ["_check_dirs", "build_index", "get_stat_result"]
+
+
+def test_small_files_are_kept_in_memory(static_dir, test_client_factory, thread_hops):
+    app = StaticFiles(directory=static_dir, index=True, max_memory_file_size=1024)
+    client = test_client_factory(app)
+
+    assert client.get("/css/app.css").text == "body { color: red; }"
+    assert client.get("/css/app.css").text == "body { color: red; }"
+
+    assert thread_hops == ["_check_dirs", "build_index", "read_entry"]
+    assert app.memory_size == len("body { color: red; }")
+    # Too large to be kept in memory
+    assert client.get("/big.txt").text == "x" * 4000
+    assert app.entries[os.path.join("big.txt")].body is None
+
+
+def test_memory_size_is_bounded(static_dir, test_client_factory):
+    app = StaticFiles(
+        directory=static_dir, index=True, max_memory_file_size=8192, max_memory_size=4000
+    )
+    client = test_client_factory(app)
+
+    client.get("/css/app.css")
+    client.get("/big.txt")
+
+    assert app.entries[os.path.join("css", "app.css")].body is not None
+    assert app.entries["big.txt"].body is None
+    assert app.memory_size == len("body { color: red; }")
+
+
+def test_range_requests_are_served_from_the_file(static_dir, test_client_factory):
+    client = test_client_factory(
+        StaticFiles(directory=static_dir, index=True, max_memory_file_size=8192)
+    )
+    client.get("/big.txt")
+
+    response = client.get("/big.txt", headers={"range": "bytes=0-9"})
+
+    assert response.status_code == 206
+    assert response.content == b"x" * 10
+
+
+def test_unindexed_paths_fall_back_to_lookups(static_dir, test_client_factory):
+    (static_dir / "index.html").write_text("<h1>Home</h1>")
+    app = Lilya(routes=[Include("/", StaticFiles(directory=static_dir, index=True, html=True))])
+    client = test_client_factory(app)
+
+    (static_dir / "new.txt").write_text("new")
+
+    assert client.get("/").text == "<h1>Home</h1>"
+    assert client.get("/new.txt").text == "new"
+    assert client.get("/missing.txt").status_code == 404
+
+
+def test_outdated_entries_fall_back_to_lookups(static_dir, test_client_factory):
+    app = StaticFiles(directory=static_dir, index=True)
+    client = test_client_factory(Lilya(routes=[Include("/", app)]))
+    assert client.get("/big.txt").text == "x" * 4000
+
+    (static_dir / "big.txt").write_text("y" * 10)
+
+    response = client.get("/big.txt")
+    assert response.text == "y" * 10
+    assert response.headers["content-length"] == "10"
+    assert "big.txt" not in app.entries
+
+    (static_dir / "css" / "app.css").unlink()
+
+    assert client.get("/css/app.css").status_code == 404
+    assert os.path.join("css", "app.css") not in app.entries
+
+
+def test_index_of_several_directories(tmp_path, test_client_factory):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "app.css").write_text("first")
+    (second / "app.css").write_text("second")
+    (second / "other.css").write_text("other")
+    client = test_client_factory(StaticFiles(directory=[first, second], index=True))
+
+    assert client.get("/app.css").text == "first"
+    assert client.get("/other.css").text == "other"
+
+
+def test_watch_refreshes_the_index(static_dir, test_client_factory):
+    app = StaticFiles(
+        directory=static_dir, index=True, watch=True, watch_interval=0, max_memory_file_size=8192
+    )
+    client = test_client_factory(Lilya(routes=[Include("/", app)]))
+    assert client.get("/css/app.css").text == "body { color: red; }"
+
+    stylesheet = static_dir / "css" / "app.css"
+    stylesheet.write_text("body { color: blue; }")
+    mtime = time.time() + 10
+    os.utime(stylesheet, (mtime, mtime))
+
+    response = client.get("/css/app.css")
+    assert response.text == "body { color: blue; }"
+    assert response.headers["content-length"] == str(len("body { color: blue; }"))
+
+    stylesheet.unlink()
+    assert client.get("/css/app.css").status_code == 404
+
+
+def test_precompressed_siblings_from_the_index(static_dir, test_client_factory, thread_hops):
+    (static_dir / "css" / "app.css.gz").write_bytes(gzip.compress(b"gzipped"))
+    client = test_client_factory(
+        StaticFiles(directory=static_dir, index=True, precompressed=True, max_memory_file_size=64)
+    )
+
+    response = client.get("/css/app.css", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.content == b"gzipped"
+    assert thread_hops == ["_check_dirs", "build_index", "read_entry"]
+
+    response = client.get("/css/app.css", headers={"accept-encoding": "br"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "body { color: red; }"
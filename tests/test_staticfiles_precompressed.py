@@ -0,0 +1,137 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from lilya.staticfiles import (
+    ENCODING_SUFFIXES,
+    StaticFiles,
+    StaticManifest,
+    precompress_directory,
+)
+
+pytest.importorskip("brotli")
+pytest.importorskip("zstandard")
+
+CSS = "body { color: red; }\n" * 200
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "app.css").write_text(CSS)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" + b"x" * 2000)
+    (tmp_path / "small.txt").write_text("tiny")
+    return tmp_path
+
+
+def test_precompress_directory(static_dir):
+    manifest = precompress_directory(static_dir)
+
+    hashed = manifest.paths["css/app.css"]
+    assert hashed.startswith("css/app.") and hashed.endswith(".css")
+    assert (static_dir / hashed).read_text() == CSS
+    for suffix in (".gz", ".br", ".zst"):
+        assert (static_dir / f"css/app.css{suffix}").exists()
+        assert (static_dir / f"{hashed}{suffix}").exists()
+    assert gzip.decompress((static_dir / "css/app.css.gz").read_bytes()).decode() == CSS
+
+    # Already compressed media and small files are not precompressed
+    assert not (static_dir / "logo.png.gz").exists()
+    assert not (static_dir / "small.txt.gz").exists()
+
+    data = json.loads((static_dir / "manifest.json").read_text())
+    assert data == {"version": 1, "paths": manifest.paths}
+    assert StaticManifest.load(static_dir / "manifest.json").paths == manifest.paths
+
+
+def test_precompress_directory_again_refreshes_changed_files(static_dir):
+    previous = precompress_directory(static_dir, encodings=("zstd", "gzip"))
+    (static_dir / "css" / "app.css").write_text(CSS + "a { color: blue; }\n")
+
+    manifest = precompress_directory(static_dir, encodings=("gzip",))
+
+    old_hashed = previous.paths["css/app.css"]
+    new_hashed = manifest.paths["css/app.css"]
+    assert new_hashed != old_hashed
+    assert not (static_dir / old_hashed).exists()
+    assert not (static_dir / f"{old_hashed}.gz").exists()
+    assert not (static_dir / "css/app.css.zst").exists()
+    assert (static_dir / f"{new_hashed}.gz").exists()
+    # The hashed copies are not hashed again
+    assert set(manifest.paths) == {"css/app.css", "logo.png", "small.txt"}
+
+
+def test_precompress_directory_without_hashing(static_dir):
+    manifest = precompress_directory(static_dir, hash_files=False)
+
+    assert manifest.paths == {}
+    assert not (static_dir / "manifest.json").exists()
+    assert (static_dir / "css/app.css.br").exists()
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    [("gzip, br, zstd", "zstd"), ("gzip, br", "br"), ("gzip", "gzip"), ("br;q=0.5, gzip", "gzip")],
+)
+def test_serves_precompressed_siblings(static_dir, test_client_factory, accept_encoding, expected):
+    precompress_directory(static_dir, hash_files=False)
+    client = test_client_factory(StaticFiles(directory=static_dir, precompressed=True))
+
+    response = client.get("/css/app.css", headers={"accept-encoding": accept_encoding})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == expected
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == os.path.getsize(
+        static_dir / f"css/app.css{ENCODING_SUFFIXES[expected]}"
+    )
+    assert response.text == CSS
+
+
+def test_serves_the_file_without_acceptable_sibling(static_dir, test_client_factory):
+    precompress_directory(static_dir, encodings=("gzip",), hash_files=False)
+    client = test_client_factory(StaticFiles(directory=static_dir, precompressed=True))
+
+    response = client.get("/css/app.css", headers={"accept-encoding": "br"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == CSS
+
+    response = client.get("/logo.png", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_precompressed_siblings_are_not_served_by_default(static_dir, test_client_factory):
+    precompress_directory(static_dir, hash_files=False)
+    client = test_client_factory(StaticFiles(directory=static_dir))
+
+    response = client.get("/css/app.css", headers={"accept-encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_hashed_files_are_immutable(static_dir, test_client_factory):
+    manifest = precompress_directory(static_dir)
+    client = test_client_factory(
+        StaticFiles(directory=static_dir, precompressed=True, manifest="manifest.json")
+    )
+
+    response = client.get(f"/{manifest.paths['css/app.css']}", headers={"accept-encoding": "br"})
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["content-encoding"] == "br"
+    assert response.text == CSS
+
+    response = client.get("/css/app.css")
+    assert "cache-control" not in response.headers
+
+
+def test_manifest_get_path():
+    manifest = StaticManifest({"css/app.css": "css/app.1a2b3c4d5e6f.css"})
+
+    assert manifest.get_path("/css/app.css") == "css/app.1a2b3c4d5e6f.css"
+    assert manifest.get_path("js/app.js") == "js/app.js"
+    assert manifest.is_hashed("css/app.1a2b3c4d5e6f.css")
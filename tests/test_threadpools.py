@@ -0,0 +1,170 @@
+import threading
+
+import anyio
+import pytest
+
+from lilya.apps import Lilya
+from lilya.concurrency import (
+    ThreadPool,
+    configure_threadpool,
+    current_threadpool,
+    get_threadpool,
+    run_in_threadpool,
+    threadpool_stats,
+    threadpools,
+)
+from lilya.responses import PlainText
+from lilya.routing import Include, Path, WebSocketPath
+
+
+@pytest.fixture(autouse=True)
+def reset_threadpools():
+    default_size = threadpools["default"].size
+    names = set(threadpools)
+    yield
+    if threadpools["default"].size != default_size:
+        threadpools["default"].size = default_size
+    for name in set(threadpools) - names:
+        del threadpools[name]
+
+
+@pytest.mark.anyio
+async def test_pool_limits_the_threads_running_at_once():
+    pool = ThreadPool("limited", size=2)
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        anyio.from_thread.run(anyio.sleep, 0.05)
+        with lock:
+            running -= 1
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(6):
+            tg.start_soon(pool.run, work)
+
+    assert peak == 2
+    stats = pool.stats()
+    assert stats.calls == 6
+    assert stats.active == stats.waiting == 0
+    assert stats.max_wait_time > 0
+    assert stats.average_wait_time == stats.wait_time / 6
+
+
+@pytest.mark.anyio
+async def test_stats_report_active_and_waiting_calls():
+    pool = ThreadPool("stats", size=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(2)
+        return "done"
+
+    results = []
+
+    async def call():
+        results.append(await pool.run(block))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(call)
+        tg.start_soon(call)
+        await anyio.to_thread.run_sync(started.wait, 2)
+        await anyio.sleep(0.01)
+
+        stats = pool.stats()
+        assert (stats.size, stats.active, stats.waiting) == (1, 1, 1)
+
+        release.set()
+
+    assert results == ["done", "done"]
+    assert pool.stats().calls == 2
+
+
+@pytest.mark.anyio
+async def test_resizing_updates_the_running_limiter():
+    pool = ThreadPool("resized", size=1)
+    await pool.run(lambda: None)
+
+    pool.size = 5
+
+    assert pool.limiter.total_tokens == 5
+    with pytest.raises(ValueError):
+        pool.size = 0
+
+
+@pytest.mark.anyio
+async def test_run_in_threadpool_uses_the_current_pool():
+    pool = configure_threadpool("reports", size=3)
+
+    assert get_threadpool("reports") is pool
+    token = current_threadpool.set(pool)
+    try:
+        assert await run_in_threadpool(lambda a, b=0: a + b, 1, b=2) == 3
+    finally:
+        current_threadpool.reset(token)
+
+    assert pool.stats().calls == 1
+    assert threadpool_stats()["reports"] == pool.stats()
+
+
+@pytest.mark.anyio
+async def test_default_pool_shares_the_anyio_limiter():
+    limiter = anyio.to_thread.current_default_thread_limiter()
+
+    assert threadpools["default"].limiter is limiter
+    assert threadpools["default"].stats().size == limiter.total_tokens
+
+
+def test_routes_run_in_their_pool(test_client_factory):
+    pools = []
+
+    def record_pool(*args):
+        pool = current_threadpool.get()
+        pools.append(pool.name if pool is not None else None)
+
+    def handler():
+        record_pool()
+        return PlainText("ok")
+
+    async def websocket_handler(websocket):
+        record_pool()
+        await websocket.accept()
+        await websocket.close()
+
+    app = Lilya(
+        routes=[
+            Path("/", handler),
+            Path("/report", handler, threadpool="reports", before_request=[record_pool]),
+            Include("/admin", routes=[Path("/", handler)], threadpool="admin"),
+            WebSocketPath("/ws", websocket_handler, threadpool="sockets"),
+        ]
+    )
+    client = test_client_factory(app)
+
+    assert client.get("/report").text == "ok"
+    assert pools == ["reports", "reports"]
+    assert client.get("/admin/").text == "ok"
+    with client.websocket_connect("/ws"):
+        pass
+    assert pools == ["reports", "reports", "admin", "sockets"]
+    assert threadpools["reports"].stats().calls == 2
+
+    calls = threadpools["default"].stats().calls
+    pools.clear()
+    assert client.get("/").text == "ok"
+    assert pools == [None]
+    assert threadpools["default"].stats().calls == calls + 1
+
+
+def test_application_configures_the_pools():
+    Lilya(threadpool_size=8, threadpools={"reports": 2})
+
+    assert threadpools["default"].size == 8
+    assert threadpools["reports"].size == 2